@@ -0,0 +1,63 @@
+"""Handling unit nesting with closure table
+
+Revision ID: 20261019_0002
+Revises: 20260215_0001
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0002"
+down_revision = "20260215_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("handling_units") as batch_op:
+        batch_op.add_column(sa.Column("parent_hu_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_handling_units_parent_hu_id",
+            "handling_units",
+            ["parent_hu_id"],
+            ["id"],
+            ondelete="RESTRICT",
+        )
+        batch_op.create_index(
+            op.f("ix_handling_units_parent_hu_id"), ["parent_hu_id"], unique=False
+        )
+
+    op.create_table(
+        "handling_unit_closure",
+        sa.Column("ancestor_id", sa.Integer(), nullable=False),
+        sa.Column("descendant_id", sa.Integer(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ancestor_id"], ["handling_units.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["descendant_id"], ["handling_units.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id"),
+    )
+    op.create_index(
+        "ix_handling_unit_closure_descendant_depth",
+        "handling_unit_closure",
+        ["descendant_id", "depth"],
+        unique=False,
+    )
+    op.execute(
+        "INSERT INTO handling_unit_closure (ancestor_id, descendant_id, depth) "
+        "SELECT id, id, 0 FROM handling_units"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_handling_unit_closure_descendant_depth", table_name="handling_unit_closure")
+    op.drop_table("handling_unit_closure")
+
+    with op.batch_alter_table("handling_units") as batch_op:
+        batch_op.drop_index(op.f("ix_handling_units_parent_hu_id"))
+        batch_op.drop_constraint("fk_handling_units_parent_hu_id", type_="foreignkey")
+        batch_op.drop_column("parent_hu_id")
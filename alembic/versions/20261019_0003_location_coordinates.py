@@ -0,0 +1,32 @@
+"""Location coordinates
+
+Revision ID: 20261019_0003
+Revises: 20261019_0002
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0003"
+down_revision = "20261019_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("locations") as batch_op:
+        batch_op.add_column(sa.Column("x", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("y", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("z", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("locations") as batch_op:
+        batch_op.drop_column("z")
+        batch_op.drop_column("y")
+        batch_op.drop_column("x")
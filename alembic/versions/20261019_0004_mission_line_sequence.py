@@ -0,0 +1,48 @@
+"""Mission line sequence and route distance
+
+Revision ID: 20261019_0004
+Revises: 20261019_0003
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0004"
+down_revision = "20261019_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("mission_lines") as batch_op:
+        batch_op.add_column(sa.Column("sequence", sa.Integer(), server_default="0", nullable=False))
+    op.execute(
+        "UPDATE mission_lines SET sequence = ("
+        "SELECT COUNT(*) FROM mission_lines AS earlier "
+        "WHERE earlier.mission_id = mission_lines.mission_id AND earlier.id < mission_lines.id)"
+    )
+    op.create_index(
+        "ix_mission_lines_mission_sequence",
+        "mission_lines",
+        ["mission_id", "sequence"],
+        unique=False,
+    )
+
+    with op.batch_alter_table("missions") as batch_op:
+        batch_op.add_column(sa.Column("route_distance", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("route_distance_saved", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("missions") as batch_op:
+        batch_op.drop_column("route_distance_saved")
+        batch_op.drop_column("route_distance")
+
+    op.drop_index("ix_mission_lines_mission_sequence", table_name="mission_lines")
+    with op.batch_alter_table("mission_lines") as batch_op:
+        batch_op.drop_column("sequence")
@@ -0,0 +1,48 @@
+"""Change sequence for delta sync
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0006"
+down_revision = "20261019_0005"
+branch_labels = None
+depends_on = None
+
+TRACKED_TABLES = ("locations", "items", "handling_units", "executors", "inventory_positions")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_sequence",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("value", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Existing rows all get sequence 1, so a client syncing from 0 receives them once.
+    op.execute("INSERT INTO sync_sequence (id, value) VALUES (1, 1)")
+
+    for table in TRACKED_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(
+                sa.Column("change_seq", sa.BigInteger(), server_default="0", nullable=False)
+            )
+        op.execute(f"UPDATE {table} SET change_seq = 1")
+        op.create_index(f"ix_{table}_change_seq", table, ["change_seq"], unique=False)
+
+
+def downgrade() -> None:
+    for table in reversed(TRACKED_TABLES):
+        op.drop_index(f"ix_{table}_change_seq", table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column("change_seq")
+
+    op.drop_table("sync_sequence")
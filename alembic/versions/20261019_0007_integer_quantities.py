@@ -0,0 +1,54 @@
+"""Store quantities as integer milli-units
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0007"
+down_revision = "20261019_0006"
+branch_labels = None
+depends_on = None
+
+QTY_SCALE = 1000
+QUANTITY_COLUMNS = {
+    "mission_lines": ("qty", "qty_done"),
+    "inventory_positions": ("qty_on_hand", "qty_reserved"),
+    "inventory_movements": ("qty",),
+}
+
+
+def upgrade() -> None:
+    for table, columns in QUANTITY_COLUMNS.items():
+        # Scale first: the batch copy casts to BIGINT and would truncate fractions.
+        assignments = ", ".join(f"{column} = ROUND({column} * {QTY_SCALE})" for column in columns)
+        op.execute(f"UPDATE {table} SET {assignments}")
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.Numeric(precision=18, scale=3),
+                    type_=sa.BigInteger(),
+                    existing_nullable=False,
+                )
+
+
+def downgrade() -> None:
+    for table, columns in QUANTITY_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.BigInteger(),
+                    type_=sa.Numeric(precision=18, scale=3),
+                    existing_nullable=False,
+                )
+        assignments = ", ".join(f"{column} = {column} / {QTY_SCALE}.0" for column in columns)
+        op.execute(f"UPDATE {table} SET {assignments}")
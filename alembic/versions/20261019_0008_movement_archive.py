@@ -0,0 +1,59 @@
+"""Movement archive catalog
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0008"
+down_revision = "20261019_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "movement_archives",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("period", sa.String(length=7), nullable=False),
+        sa.Column("path", sa.String(length=500), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("first_movement_id", sa.Integer(), nullable=False),
+        sa.Column("last_movement_id", sa.Integer(), nullable=False),
+        sa.Column("first_executed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_executed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("period"),
+    )
+    op.create_index(
+        op.f("ix_movement_archives_last_executed_at"),
+        "movement_archives",
+        ["last_executed_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_inventory_movements_executed_at", "inventory_movements", ["executed_at"], unique=False
+    )
+    op.create_index(
+        "ix_inventory_movements_mission_line_id",
+        "inventory_movements",
+        ["mission_line_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inventory_movements_mission_line_id", table_name="inventory_movements")
+    op.drop_index("ix_inventory_movements_executed_at", table_name="inventory_movements")
+    op.drop_index(op.f("ix_movement_archives_last_executed_at"), table_name="movement_archives")
+    op.drop_table("movement_archives")
@@ -0,0 +1,71 @@
+"""Report aggregates
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 00:00:00
+
+The tables start empty with no watermarks; the refresh job folds the
+existing ledger in on its first runs.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0009"
+down_revision = "20261019_0008"
+branch_labels = None
+depends_on = None
+
+granularity = sa.Enum("hour", "day", name="report_granularity", native_enum=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "movement_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("granularity", granularity, nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("executor_id", sa.Integer(), nullable=True),
+        sa.Column("movement_type", sa.String(length=32), nullable=False),
+        sa.Column("location_type", sa.String(length=32), nullable=True),
+        sa.Column("movement_count", sa.Integer(), nullable=False),
+        sa.Column("qty", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_movement_stats_bucket", "movement_stats", ["granularity", "bucket_start"], unique=False
+    )
+    op.create_table(
+        "mission_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("granularity", granularity, nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("executor_id", sa.Integer(), nullable=True),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("cancelled_count", sa.Integer(), nullable=False),
+        sa.Column("timed_count", sa.Integer(), nullable=False),
+        sa.Column("cycle_seconds_sum", sa.Float(), nullable=False),
+        sa.Column("cycle_seconds_max", sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_mission_stats_bucket", "mission_stats", ["granularity", "bucket_start"], unique=False
+    )
+    op.create_table(
+        "report_watermarks",
+        sa.Column("name", sa.String(length=32), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("report_watermarks")
+    op.drop_index("ix_mission_stats_bucket", table_name="mission_stats")
+    op.drop_table("mission_stats")
+    op.drop_index("ix_movement_stats_bucket", table_name="movement_stats")
+    op.drop_table("movement_stats")
@@ -0,0 +1,52 @@
+"""Slotting statistics
+
+Revision ID: 20261019_0010
+Revises: 20261019_0009
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0010"
+down_revision = "20261019_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "item_pick_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("pick_count", sa.Integer(), nullable=False),
+        sa.Column("qty", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["item_id"], ["items.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("day", "item_id", name="uq_item_pick_stats_day_item"),
+    )
+    op.create_index(op.f("ix_item_pick_stats_day"), "item_pick_stats", ["day"], unique=False)
+    op.create_table(
+        "item_affinities",
+        sa.Column("item_a_id", sa.Integer(), nullable=False),
+        sa.Column("item_b_id", sa.Integer(), nullable=False),
+        sa.Column("copick_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["item_a_id"], ["items.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["item_b_id"], ["items.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("item_a_id", "item_b_id"),
+    )
+    op.create_index(
+        op.f("ix_item_affinities_item_b_id"), "item_affinities", ["item_b_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_item_affinities_item_b_id"), table_name="item_affinities")
+    op.drop_table("item_affinities")
+    op.drop_index(op.f("ix_item_pick_stats_day"), table_name="item_pick_stats")
+    op.drop_table("item_pick_stats")
@@ -0,0 +1,61 @@
+"""Location capacity
+
+Revision ID: 20261019_0011
+Revises: 20261019_0010
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0011"
+down_revision = "20261019_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("handling_units") as batch_op:
+        batch_op.add_column(
+            sa.Column("gross_weight_kg", sa.BigInteger(), server_default="0", nullable=False)
+        )
+
+    with op.batch_alter_table("locations") as batch_op:
+        batch_op.add_column(sa.Column("zone", sa.String(length=32), nullable=True))
+        batch_op.add_column(sa.Column("max_hu", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("max_weight_kg", sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column("hu_count", sa.Integer(), server_default="0", nullable=False))
+        batch_op.add_column(
+            sa.Column("load_kg", sa.BigInteger(), server_default="0", nullable=False)
+        )
+        batch_op.create_check_constraint("ck_locations_hu_count_non_negative", "hu_count >= 0")
+        batch_op.create_check_constraint("ck_locations_load_non_negative", "load_kg >= 0")
+        batch_op.create_index("ix_locations_zone_type", ["zone", "type"], unique=False)
+
+    op.execute(
+        """
+        UPDATE locations SET hu_count = (
+            SELECT COUNT(*) FROM handling_units
+            WHERE handling_units.location_id = locations.id AND handling_units.parent_hu_id IS NULL
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("locations") as batch_op:
+        batch_op.drop_index("ix_locations_zone_type")
+        batch_op.drop_constraint("ck_locations_load_non_negative", type_="check")
+        batch_op.drop_constraint("ck_locations_hu_count_non_negative", type_="check")
+        batch_op.drop_column("load_kg")
+        batch_op.drop_column("hu_count")
+        batch_op.drop_column("max_weight_kg")
+        batch_op.drop_column("max_hu")
+        batch_op.drop_column("zone")
+
+    with op.batch_alter_table("handling_units") as batch_op:
+        batch_op.drop_column("gross_weight_kg")
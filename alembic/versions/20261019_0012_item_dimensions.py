@@ -0,0 +1,66 @@
+"""Item dimensions and line payload
+
+Revision ID: 20261019_0012
+Revises: 20261019_0011
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0012"
+down_revision = "20261019_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("items") as batch_op:
+        batch_op.add_column(sa.Column("weight_kg", sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column("volume_l", sa.BigInteger(), nullable=True))
+
+    with op.batch_alter_table("handling_units") as batch_op:
+        batch_op.add_column(
+            sa.Column("tare_kg", sa.BigInteger(), server_default="0", nullable=False)
+        )
+
+    with op.batch_alter_table("mission_lines") as batch_op:
+        batch_op.add_column(
+            sa.Column("payload_kg", sa.BigInteger(), server_default="0", nullable=False)
+        )
+
+    # Items had no weight so far: a unit's gross weight is its own declared
+    # weight plus that of the units nested in it.
+    op.execute(
+        """
+        UPDATE handling_units SET tare_kg = gross_weight_kg - COALESCE((
+            SELECT SUM(nested.gross_weight_kg) FROM handling_units AS nested
+            WHERE nested.parent_hu_id = handling_units.id
+        ), 0)
+        """
+    )
+    op.execute(
+        """
+        UPDATE mission_lines SET payload_kg = COALESCE((
+            SELECT handling_units.gross_weight_kg FROM handling_units
+            WHERE handling_units.id = mission_lines.hu_id
+        ), 0)
+        WHERE item_id IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("mission_lines") as batch_op:
+        batch_op.drop_column("payload_kg")
+
+    with op.batch_alter_table("handling_units") as batch_op:
+        batch_op.drop_column("tare_kg")
+
+    with op.batch_alter_table("items") as batch_op:
+        batch_op.drop_column("volume_l")
+        batch_op.drop_column("weight_kg")
@@ -0,0 +1,34 @@
+"""Mission line reservations
+
+Revision ID: 20261019_0013
+Revises: 20261019_0012
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0013"
+down_revision = "20261019_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("mission_lines") as batch_op:
+        batch_op.add_column(
+            sa.Column("reserved_qty", sa.BigInteger(), server_default="0", nullable=False)
+        )
+        batch_op.create_check_constraint(
+            "ck_mission_lines_reserved_non_negative", "reserved_qty >= 0"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("mission_lines") as batch_op:
+        batch_op.drop_constraint("ck_mission_lines_reserved_non_negative", type_="check")
+        batch_op.drop_column("reserved_qty")
@@ -0,0 +1,65 @@
+"""Replenishment rules
+
+Revision ID: 20261019_0014
+Revises: 20261019_0013
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0014"
+down_revision = "20261019_0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "replenishment_rules",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("location_id", sa.Integer(), nullable=False),
+        sa.Column("min_qty", sa.BigInteger(), nullable=False),
+        sa.Column("max_qty", sa.BigInteger(), nullable=False),
+        sa.Column("priority", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("active", sa.Boolean(), server_default="1", nullable=False),
+        sa.Column("created_by_operator_id", sa.Integer(), nullable=False),
+        sa.Column("open_mission_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("change_seq", sa.BigInteger(), server_default="0", nullable=False),
+        sa.CheckConstraint("min_qty >= 0", name="ck_replenishment_rules_min_non_negative"),
+        sa.CheckConstraint("max_qty > min_qty", name="ck_replenishment_rules_max_above_min"),
+        sa.ForeignKeyConstraint(["item_id"], ["items.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["location_id"], ["locations.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["created_by_operator_id"], ["operators.id"], ondelete="RESTRICT"),
+        sa.ForeignKeyConstraint(["open_mission_id"], ["missions.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("item_id", "location_id", name="uq_replenishment_rules_item_location"),
+    )
+    op.create_index(op.f("ix_replenishment_rules_id"), "replenishment_rules", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_replenishment_rules_location_id"),
+        "replenishment_rules",
+        ["location_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_replenishment_rules_change_seq"),
+        "replenishment_rules",
+        ["change_seq"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_replenishment_rules_change_seq"), table_name="replenishment_rules")
+    op.drop_index(op.f("ix_replenishment_rules_location_id"), table_name="replenishment_rules")
+    op.drop_index(op.f("ix_replenishment_rules_id"), table_name="replenishment_rules")
+    op.drop_table("replenishment_rules")
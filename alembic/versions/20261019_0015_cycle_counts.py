@@ -0,0 +1,108 @@
+"""Cycle counts
+
+Revision ID: 20261019_0015
+Revises: 20261019_0014
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0015"
+down_revision = "20261019_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cycle_counts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("count_no", sa.String(length=64), nullable=False),
+        sa.Column("location_id", sa.Integer(), nullable=True),
+        sa.Column("zone", sa.String(length=32), nullable=True),
+        sa.Column(
+            "state",
+            sa.Enum("open", "posted", "cancelled", name="cycle_count_state", native_enum=False),
+            server_default="open",
+            nullable=False,
+        ),
+        sa.Column("created_by_operator_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("closed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            "location_id IS NOT NULL OR zone IS NOT NULL", name="ck_cycle_counts_scope"
+        ),
+        sa.ForeignKeyConstraint(["location_id"], ["locations.id"], ondelete="RESTRICT"),
+        sa.ForeignKeyConstraint(["created_by_operator_id"], ["operators.id"], ondelete="RESTRICT"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_cycle_counts_id"), "cycle_counts", ["id"], unique=False)
+    op.create_index(op.f("ix_cycle_counts_count_no"), "cycle_counts", ["count_no"], unique=True)
+    op.create_index(op.f("ix_cycle_counts_state"), "cycle_counts", ["state"], unique=False)
+    op.create_table(
+        "cycle_count_lines",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cycle_count_id", sa.Integer(), nullable=False),
+        sa.Column("hu_id", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("location_id", sa.Integer(), nullable=False),
+        sa.Column("counted_qty", sa.BigInteger(), nullable=False),
+        sa.Column("system_qty", sa.BigInteger(), nullable=False),
+        sa.Column("variance", sa.BigInteger(), nullable=False),
+        sa.Column("system_version", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "counted",
+                "posted",
+                "stale",
+                "rejected",
+                name="cycle_count_line_status",
+                native_enum=False,
+            ),
+            server_default="counted",
+            nullable=False,
+        ),
+        sa.Column("counted_by_executor_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "counted_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("idempotency_key", sa.String(length=128), nullable=True),
+        sa.Column("movement_id", sa.Integer(), nullable=True),
+        sa.CheckConstraint("counted_qty >= 0", name="ck_cycle_count_lines_counted_non_negative"),
+        sa.ForeignKeyConstraint(["cycle_count_id"], ["cycle_counts.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["hu_id"], ["handling_units.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["item_id"], ["items.id"], ondelete="RESTRICT"),
+        sa.ForeignKeyConstraint(["location_id"], ["locations.id"], ondelete="RESTRICT"),
+        sa.ForeignKeyConstraint(["counted_by_executor_id"], ["executors.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["movement_id"], ["inventory_movements.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "cycle_count_id", "hu_id", "item_id", name="uq_cycle_count_lines_count_hu_item"
+        ),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index(op.f("ix_cycle_count_lines_id"), "cycle_count_lines", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_cycle_count_lines_cycle_count_id"),
+        "cycle_count_lines",
+        ["cycle_count_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_cycle_count_lines_cycle_count_id"), table_name="cycle_count_lines")
+    op.drop_index(op.f("ix_cycle_count_lines_id"), table_name="cycle_count_lines")
+    op.drop_table("cycle_count_lines")
+    op.drop_index(op.f("ix_cycle_counts_state"), table_name="cycle_counts")
+    op.drop_index(op.f("ix_cycle_counts_count_no"), table_name="cycle_counts")
+    op.drop_index(op.f("ix_cycle_counts_id"), table_name="cycle_counts")
+    op.drop_table("cycle_counts")
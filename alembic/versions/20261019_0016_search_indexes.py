@@ -0,0 +1,61 @@
+"""Full-text search indexes
+
+Revision ID: 20261019_0016
+Revises: 20261019_0015
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0016"
+down_revision = "20261019_0015"
+branch_labels = None
+depends_on = None
+
+# index table -> (source table, indexed columns)
+SEARCH_INDEXES = {
+    "items_search": ("items", ("sku", "name")),
+    "locations_search": ("locations", ("code", "name")),
+    "handling_units_search": ("handling_units", ("hu_code",)),
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for table, (source, columns) in SEARCH_INDEXES.items():
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{column}" for column in columns)
+        old_values = ", ".join(f"old.{column}" for column in columns)
+        op.execute(
+            f"CREATE VIRTUAL TABLE {table} USING fts5("
+            f"{column_list}, content='{source}', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_ai AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {table} (rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_ad AFTER DELETE ON {source} BEGIN "
+            f"INSERT INTO {table} ({table}, rowid, {column_list}) "
+            f"VALUES ('delete', old.id, {old_values}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_au AFTER UPDATE OF {column_list} ON {source} BEGIN "
+            f"INSERT INTO {table} ({table}, rowid, {column_list}) "
+            f"VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {table} (rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        op.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for table in SEARCH_INDEXES:
+        for suffix in ("au", "ad", "ai"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {table}")
@@ -0,0 +1,30 @@
+"""Mission row version
+
+Revision ID: 20261019_0017
+Revises: 20261019_0016
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0017"
+down_revision = "20261019_0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("missions") as batch_op:
+        batch_op.add_column(sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+        batch_op.create_check_constraint("ck_missions_version_positive", "version >= 1")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("missions") as batch_op:
+        batch_op.drop_constraint("ck_missions_version_positive", type_="check")
+        batch_op.drop_column("version")
@@ -0,0 +1,45 @@
+"""Store executor payload limits as integer milli-units
+
+Revision ID: 20261019_0018
+Revises: 20261019_0017
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0018"
+down_revision = "20261019_0017"
+branch_labels = None
+depends_on = None
+
+QTY_SCALE = 1000
+
+
+def upgrade() -> None:
+    # Scale first: the batch copy casts to BIGINT and would truncate fractions.
+    op.execute(f"UPDATE executors SET max_payload_kg = ROUND(max_payload_kg * {QTY_SCALE})")
+    with op.batch_alter_table("executors") as batch_op:
+        batch_op.alter_column(
+            "max_payload_kg",
+            existing_type=sa.Numeric(precision=10, scale=2),
+            type_=sa.BigInteger(),
+            server_default=str(500 * QTY_SCALE),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("executors") as batch_op:
+        batch_op.alter_column(
+            "max_payload_kg",
+            existing_type=sa.BigInteger(),
+            type_=sa.Numeric(precision=10, scale=2),
+            server_default="500",
+            existing_nullable=False,
+        )
+    op.execute(f"UPDATE executors SET max_payload_kg = max_payload_kg / {QTY_SCALE}.0")
@@ -0,0 +1,45 @@
+"""Leave the payload of lines with an unweighed item unknown
+
+Revision ID: 20261019_0019
+Revises: 20261019_0018
+Create Date: 2026-10-19 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0019"
+down_revision = "20261019_0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("mission_lines") as batch_op:
+        batch_op.alter_column(
+            "payload_kg",
+            existing_type=sa.BigInteger(),
+            server_default=None,
+            nullable=True,
+        )
+    op.execute(
+        """
+        UPDATE mission_lines SET payload_kg = NULL
+        WHERE item_id IN (SELECT id FROM items WHERE weight_kg IS NULL)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("UPDATE mission_lines SET payload_kg = 0 WHERE payload_kg IS NULL")
+    with op.batch_alter_table("mission_lines") as batch_op:
+        batch_op.alter_column(
+            "payload_kg",
+            existing_type=sa.BigInteger(),
+            server_default="0",
+            nullable=False,
+        )
@@ -0,0 +1,130 @@
+"""Conditional GETs: strong ETags, ``304 Not Modified`` and an in-process response cache.
+
+The ETag of a collection page combines the highest ``change_seq`` of its
+table, which moves on every insert and update (rows of the cached tables are
+never deleted), with the query string. The ETag of a mission combines its id
+and ``version``. Both include the app version so a deploy that changes the
+payload never answers 304 to an old representation. The ETag is computed
+before anything is loaded, so a matching ``If-None-Match`` is answered
+without querying or serializing the body.
+
+With ``response_cache_size`` above zero, the serialized body of each
+collection page is kept in an LRU cache keyed by its ETag. An entry cannot
+go stale: once the table changes, its ETag is no longer produced and the
+entry ages out.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.api.v1.listing import page_body, page_headers
+from app.core.config import settings
+from app.db.change_tracking import ChangeTracked
+from app.repositories.listing import Page
+from app.repositories.sync import SyncRepository
+
+
+def make_etag(*parts: object) -> str:
+    key = "\x1f".join(str(part) for part in (settings.app_version, *parts))
+    return '"' + hashlib.blake2b(key.encode(), digest_size=12).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def query_key(request: Request) -> str:
+    return "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: dict[str, str]
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(etag)
+            self.hits += 1
+            return entry
+
+    def put(self, etag: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[etag] = entry
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache | None:
+    """The process-wide cache, ``None`` when ``response_cache_size`` is 0."""
+    global _cache
+    if settings.response_cache_size <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(settings.response_cache_size)
+        return _cache
+
+
+def conditional_page(
+    request: Request,
+    db: Session,
+    model: type[ChangeTracked],
+    schema: type[BaseModel],
+    load: Callable[[], Page],
+) -> Response:
+    """The page ``load`` returns, as 304 when the client holds it, or from the response cache."""
+    etag = make_etag(
+        model.__tablename__, SyncRepository(db).table_watermark(model), query_key(request)
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    cache = get_response_cache()
+    entry = cache.get(etag) if cache is not None else None
+    if entry is None:
+        page = load()
+        entry = CachedResponse(body=page_body(page, schema), headers=page_headers(page))
+        if cache is not None:
+            cache.put(etag, entry)
+    return Response(
+        entry.body, media_type="application/json", headers={**entry.headers, "ETag": etag}
+    )
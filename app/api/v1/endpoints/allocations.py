@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.rules.exceptions import RuleViolation
+from app.schemas.allocation import AllocationCreate, AllocationRead
+from app.services.allocation_service import AllocationDemand, AllocationService
+
+router = APIRouter(prefix="/allocations")
+
+
+@router.post("", response_model=AllocationRead, status_code=status.HTTP_201_CREATED)
+def create_allocation(payload: AllocationCreate, db: Session = Depends(get_db)) -> AllocationRead:
+    service = AllocationService(db)
+    try:
+        result = service.allocate(
+            [
+                AllocationDemand(
+                    item_id=demand.item_id, qty=demand.qty, to_location_id=demand.to_location_id
+                )
+                for demand in payload.demands
+            ],
+            strategy=payload.strategy,
+            created_by_operator_id=payload.created_by_operator_id,
+            priority=payload.priority,
+            allow_partial=payload.allow_partial,
+        )
+        db.commit()
+        return AllocationRead.model_validate(result)
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Invalid operator reference") from exc
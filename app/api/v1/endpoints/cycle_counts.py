@@ -0,0 +1,135 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.models.cycle_count import CycleCountLineStatus, CycleCountState
+from app.db.session import get_db
+from app.repositories.cycle_count import CycleCountRepository
+from app.rules.exceptions import RuleViolation
+from app.schemas.cycle_count import (
+    CycleCountCreate,
+    CycleCountLineRead,
+    CycleCountPost,
+    CycleCountPostingRead,
+    CycleCountRead,
+    CycleCountSubmissionCreate,
+    CycleCountSubmissionRead,
+)
+from app.services.cycle_count_service import CountedRow, CycleCountService
+
+router = APIRouter(prefix="/cycle-counts")
+
+
+@router.post("", response_model=CycleCountRead, status_code=status.HTTP_201_CREATED)
+def create_cycle_count(payload: CycleCountCreate, db: Session = Depends(get_db)) -> CycleCountRead:
+    service = CycleCountService(db)
+    try:
+        entity = service.create(
+            created_by_operator_id=payload.created_by_operator_id,
+            location_id=payload.location_id,
+            zone=payload.zone,
+        )
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Invalid operator reference") from exc
+    return CycleCountRead.model_validate(entity)
+
+
+@router.get("", response_model=list[CycleCountRead])
+def list_cycle_counts(
+    state: CycleCountState | None = None, db: Session = Depends(get_db)
+) -> list[CycleCountRead]:
+    return [
+        CycleCountRead.model_validate(entity)
+        for entity in CycleCountRepository(db).list(state=state)
+    ]
+
+
+@router.get("/{cycle_count_id}", response_model=CycleCountRead)
+def get_cycle_count(cycle_count_id: int, db: Session = Depends(get_db)) -> CycleCountRead:
+    entity = CycleCountRepository(db).get(cycle_count_id)
+    if entity is None:
+        raise HTTPException(status_code=404, detail="Cycle count not found")
+    return CycleCountRead.model_validate(entity)
+
+
+@router.get("/{cycle_count_id}/lines", response_model=list[CycleCountLineRead])
+def list_cycle_count_lines(
+    cycle_count_id: int,
+    status: CycleCountLineStatus | None = None,
+    db: Session = Depends(get_db),
+) -> list[CycleCountLineRead]:
+    repo = CycleCountRepository(db)
+    if repo.get(cycle_count_id) is None:
+        raise HTTPException(status_code=404, detail="Cycle count not found")
+    return [
+        CycleCountLineRead.model_validate(line)
+        for line in repo.list_lines(cycle_count_id, status=status)
+    ]
+
+
+@router.post("/{cycle_count_id}/submissions", response_model=CycleCountSubmissionRead)
+def submit_cycle_count(
+    cycle_count_id: int,
+    payload: CycleCountSubmissionCreate,
+    db: Session = Depends(get_db),
+) -> CycleCountSubmissionRead:
+    """Record counted rows in bulk; the response holds each line with its variance."""
+    service = CycleCountService(db)
+    try:
+        result = service.submit(
+            cycle_count_id,
+            [CountedRow(**row.model_dump()) for row in payload.rows],
+            executor_id=payload.executor_id,
+        )
+        db.commit()
+        return CycleCountSubmissionRead.model_validate(result)
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Cycle count submission conflict") from exc
+
+
+@router.post("/{cycle_count_id}/post", response_model=CycleCountPostingRead)
+def post_cycle_count(
+    cycle_count_id: int,
+    payload: CycleCountPost,
+    db: Session = Depends(get_db),
+) -> CycleCountPostingRead:
+    """Post approved variances as adjustments in one transaction and close the count."""
+    service = CycleCountService(db)
+    try:
+        result = service.post(
+            cycle_count_id,
+            line_ids=payload.line_ids,
+            executor_id=payload.executor_id,
+            reason=payload.reason,
+        )
+        db.commit()
+        return CycleCountPostingRead.model_validate(result)
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Stock changed while the count was posted; retry"
+        ) from exc
+
+
+@router.post("/{cycle_count_id}/cancel", response_model=CycleCountRead)
+def cancel_cycle_count(cycle_count_id: int, db: Session = Depends(get_db)) -> CycleCountRead:
+    service = CycleCountService(db)
+    try:
+        entity = service.cancel(cycle_count_id)
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return CycleCountRead.model_validate(entity)
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.db.maintenance import get_maintenance, read_pragmas
+from app.db.session import get_write_db
+from app.schemas.diagnostics import CheckpointStatsRead, SQLiteDiagnosticsRead
+
+router = APIRouter(prefix="/diagnostics")
+
+
+@router.get("/sqlite", response_model=SQLiteDiagnosticsRead)
+def sqlite_diagnostics(db: Session = Depends(get_write_db)) -> SQLiteDiagnosticsRead:
+    connection = db.connection()
+    if connection.dialect.name != "sqlite":
+        raise HTTPException(status_code=404, detail="Database is not SQLite")
+
+    database = connection.engine.url.database or ""
+    wal_path = Path(f"{database}-wal")
+    maintenance = get_maintenance()
+    return SQLiteDiagnosticsRead(
+        database=database,
+        wal_bytes=wal_path.stat().st_size if wal_path.exists() else 0,
+        pragmas=read_pragmas(connection),
+        checkpoint=CheckpointStatsRead.model_validate(maintenance.stats)
+        if maintenance is not None
+        else None,
+    )
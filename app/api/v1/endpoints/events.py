@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Header, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.events.broker import RESYNC, ChangeEvent, EventFilter, broker
+
+router = APIRouter(prefix="/events")
+
+
+def _event_filter(
+    topics: list[str] | None,
+    mission_ids: list[int] | None,
+    executor_ids: list[int] | None,
+    hu_ids: list[int] | None,
+    location_ids: list[int] | None,
+) -> EventFilter:
+    return EventFilter(
+        topics=frozenset(topics or ()),
+        mission_ids=frozenset(mission_ids or ()),
+        executor_ids=frozenset(executor_ids or ()),
+        hu_ids=frozenset(hu_ids or ()),
+        location_ids=frozenset(location_ids or ()),
+    )
+
+
+def _encode(change: ChangeEvent | str) -> dict:
+    if change == RESYNC:
+        return {"seq": broker.last_seq, "kind": RESYNC, "data": {}}
+    return {
+        "seq": change.seq,
+        "kind": change.kind,
+        "emitted_at": change.emitted_at.isoformat(),
+        "data": change.data,
+    }
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    topic: list[str] | None = Query(default=None),
+    mission_id: list[int] | None = Query(default=None),
+    executor_id: list[int] | None = Query(default=None),
+    hu_id: list[int] | None = Query(default=None),
+    location_id: list[int] | None = Query(default=None),
+    after_seq: int | None = Query(default=None, ge=0),
+    last_event_id: int | None = Header(default=None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    event_filter = _event_filter(topic, mission_id, executor_id, hu_id, location_id)
+    resume_from = last_event_id if last_event_id is not None else after_seq
+    subscription = broker.subscribe(event_filter, after_seq=resume_from)
+
+    async def body():
+        try:
+            yield f"retry: 3000\n\n: last_seq {broker.last_seq}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    change = await asyncio.wait_for(
+                        subscription.queue.get(), settings.event_heartbeat_seconds
+                    )
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                message = _encode(change)
+                # A resync carries the current sequence too, so the client resumes from there.
+                yield (
+                    f"id: {message['seq']}\nevent: {message['kind']}\n"
+                    f"data: {json.dumps(message)}\n\n"
+                )
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def events_websocket(
+    websocket: WebSocket,
+    topic: list[str] | None = Query(default=None),
+    mission_id: list[int] | None = Query(default=None),
+    executor_id: list[int] | None = Query(default=None),
+    hu_id: list[int] | None = Query(default=None),
+    location_id: list[int] | None = Query(default=None),
+    after_seq: int | None = Query(default=None, ge=0),
+) -> None:
+    await websocket.accept()
+    event_filter = _event_filter(topic, mission_id, executor_id, hu_id, location_id)
+    subscription = broker.subscribe(event_filter, after_seq=after_seq)
+    try:
+        while True:
+            try:
+                change = await asyncio.wait_for(
+                    subscription.queue.get(), settings.event_heartbeat_seconds
+                )
+            except TimeoutError:
+                await websocket.send_json({"seq": broker.last_seq, "kind": "heartbeat", "data": {}})
+                continue
+            await websocket.send_json(_encode(change))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
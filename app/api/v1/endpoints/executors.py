@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.db.models.executor import ExecutorType
+from app.api.v1.caching import conditional_page
+from app.api.v1.listing import list_query
+from app.db.models.executor import Executor
 from app.db.session import get_db
-from app.repositories.executor import ExecutorRepository
+from app.repositories.executor import EXECUTOR_LISTING, ExecutorRepository
+from app.repositories.listing import ListQuery
+from app.rules.exceptions import RuleViolation
 from app.schemas.executor import ExecutorCreate, ExecutorRead, ExecutorUpdate
 
 router = APIRouter(prefix="/executors")
@@ -28,16 +32,17 @@ def create_executor(payload: ExecutorCreate, db: Session = Depends(get_db)) -> E
         raise HTTPException(status_code=409, detail="Executor code already exists") from exc
 
 
-@router.get("", response_model=list[ExecutorRead])
+@router.get("", response_model=list[ExecutorRead], description=EXECUTOR_LISTING.describe())
 def list_executors(
+    request: Request,
+    query: ListQuery = Depends(list_query),
     db: Session = Depends(get_db),
-    executor_type: ExecutorType | None = Query(default=None),
-) -> list[ExecutorRead]:
+) -> Response:
     repo = ExecutorRepository(db)
-    items = repo.list()
-    if executor_type is not None:
-        items = [item for item in items if item.executor_type == executor_type]
-    return [ExecutorRead.model_validate(item) for item in items]
+    try:
+        return conditional_page(request, db, Executor, ExecutorRead, lambda: repo.list(query))
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
 
 @router.get("/{executor_id}", response_model=ExecutorRead)
@@ -50,7 +55,9 @@ def get_executor(executor_id: int, db: Session = Depends(get_db)) -> ExecutorRea
 
 
 @router.patch("/{executor_id}", response_model=ExecutorRead)
-def update_executor(executor_id: int, payload: ExecutorUpdate, db: Session = Depends(get_db)) -> ExecutorRead:
+def update_executor(
+    executor_id: int, payload: ExecutorUpdate, db: Session = Depends(get_db)
+) -> ExecutorRead:
     repo = ExecutorRepository(db)
     entity = repo.get(executor_id)
     if entity is None:
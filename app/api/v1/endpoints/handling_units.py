@@ -1,40 +1,71 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.api.v1.listing import list_query, render_page
 from app.db.session import get_db
-from app.repositories.handling_unit import HandlingUnitRepository
+from app.repositories.handling_unit import HANDLING_UNIT_LISTING, HandlingUnitRepository
+from app.repositories.listing import ListQuery
 from app.repositories.location import LocationRepository
-from app.schemas.handling_unit import HandlingUnitCreate, HandlingUnitRead, HandlingUnitUpdate
+from app.rules.exceptions import RuleViolation
+from app.schemas.handling_unit import (
+    HandlingUnitCreate,
+    HandlingUnitPackCommand,
+    HandlingUnitRead,
+    HandlingUnitUpdate,
+)
 
 router = APIRouter(prefix="/handling-units")
 
 
 @router.post("", response_model=HandlingUnitRead, status_code=status.HTTP_201_CREATED)
-def create_handling_unit(payload: HandlingUnitCreate, db: Session = Depends(get_db)) -> HandlingUnitRead:
+def create_handling_unit(
+    payload: HandlingUnitCreate, db: Session = Depends(get_db)
+) -> HandlingUnitRead:
     hu_repo = HandlingUnitRepository(db)
     location_repo = LocationRepository(db)
 
     if location_repo.get(payload.location_id) is None:
         raise HTTPException(status_code=404, detail="Location not found")
 
+    if payload.parent_hu_id is not None:
+        parent = hu_repo.get(payload.parent_hu_id)
+        if parent is None:
+            raise HTTPException(status_code=404, detail="Parent handling unit not found")
+        if parent.location_id != payload.location_id:
+            raise HTTPException(
+                status_code=400, detail="Nested handling unit must share its parent's location"
+            )
+
     try:
         entity = hu_repo.create(
             hu_code=payload.hu_code,
             location_id=payload.location_id,
             status=payload.status,
+            parent_hu_id=payload.parent_hu_id,
+            tare_kg=payload.tare_kg,
         )
         db.commit()
         return HandlingUnitRead.model_validate(entity)
     except IntegrityError as exc:
         db.rollback()
         raise HTTPException(status_code=409, detail="Handling unit code already exists") from exc
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
 
-@router.get("", response_model=list[HandlingUnitRead])
-def list_handling_units(db: Session = Depends(get_db)) -> list[HandlingUnitRead]:
+@router.get("", response_model=list[HandlingUnitRead], description=HANDLING_UNIT_LISTING.describe())
+def list_handling_units(
+    query: ListQuery = Depends(list_query),
+    db: Session = Depends(get_db),
+) -> Response:
     repo = HandlingUnitRepository(db)
-    return [HandlingUnitRead.model_validate(item) for item in repo.list()]
+    try:
+        page = repo.list(query)
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return render_page(page, HandlingUnitRead)
 
 
 @router.get("/{handling_unit_id}", response_model=HandlingUnitRead)
@@ -46,6 +77,30 @@ def get_handling_unit(handling_unit_id: int, db: Session = Depends(get_db)) -> H
     return HandlingUnitRead.model_validate(entity)
 
 
+@router.get("/{handling_unit_id}/contents", response_model=list[HandlingUnitRead])
+def list_handling_unit_contents(
+    handling_unit_id: int,
+    db: Session = Depends(get_db),
+) -> list[HandlingUnitRead]:
+    repo = HandlingUnitRepository(db)
+    if repo.get(handling_unit_id) is None:
+        raise HTTPException(status_code=404, detail="Handling unit not found")
+    return [
+        HandlingUnitRead.model_validate(item) for item in repo.list_descendants(handling_unit_id)
+    ]
+
+
+@router.get("/{handling_unit_id}/root", response_model=HandlingUnitRead)
+def get_handling_unit_root(
+    handling_unit_id: int, db: Session = Depends(get_db)
+) -> HandlingUnitRead:
+    repo = HandlingUnitRepository(db)
+    entity = repo.get_root(handling_unit_id)
+    if entity is None:
+        raise HTTPException(status_code=404, detail="Handling unit not found")
+    return HandlingUnitRead.model_validate(entity)
+
+
 @router.patch("/{handling_unit_id}", response_model=HandlingUnitRead)
 def update_handling_unit(
     handling_unit_id: int,
@@ -59,9 +114,69 @@ def update_handling_unit(
     if entity is None:
         raise HTTPException(status_code=404, detail="Handling unit not found")
 
-    if payload.location_id is not None and location_repo.get(payload.location_id) is None:
-        raise HTTPException(status_code=404, detail="Location not found")
+    if payload.location_id is not None:
+        if location_repo.get(payload.location_id) is None:
+            raise HTTPException(status_code=404, detail="Location not found")
+        if entity.parent_hu_id is not None and payload.location_id != entity.location_id:
+            raise HTTPException(
+                status_code=400, detail="Nested handling unit must be unpacked before relocation"
+            )
 
-    updated = hu_repo.update(entity, location_id=payload.location_id, status=payload.status)
-    db.commit()
+    try:
+        updated = hu_repo.update(entity, location_id=payload.location_id, status=payload.status)
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return HandlingUnitRead.model_validate(updated)
+
+
+@router.post("/{handling_unit_id}/pack", response_model=HandlingUnitRead)
+def pack_handling_unit(
+    handling_unit_id: int,
+    payload: HandlingUnitPackCommand,
+    db: Session = Depends(get_db),
+) -> HandlingUnitRead:
+    repo = HandlingUnitRepository(db)
+
+    entity = repo.get(handling_unit_id)
+    if entity is None:
+        raise HTTPException(status_code=404, detail="Handling unit not found")
+
+    parent = repo.get(payload.parent_hu_id)
+    if parent is None:
+        raise HTTPException(status_code=404, detail="Parent handling unit not found")
+
+    if repo.is_descendant(parent.id, ancestor_id=entity.id):
+        raise HTTPException(
+            status_code=400, detail="Handling unit cannot be packed into itself or its contents"
+        )
+    if parent.location_id != entity.location_id:
+        raise HTTPException(
+            status_code=400, detail="Nested handling unit must share its parent's location"
+        )
+
+    try:
+        updated = repo.attach(entity, parent)
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return HandlingUnitRead.model_validate(updated)
+
+
+@router.post("/{handling_unit_id}/unpack", response_model=HandlingUnitRead)
+def unpack_handling_unit(handling_unit_id: int, db: Session = Depends(get_db)) -> HandlingUnitRead:
+    repo = HandlingUnitRepository(db)
+
+    entity = repo.get(handling_unit_id)
+    if entity is None:
+        raise HTTPException(status_code=404, detail="Handling unit not found")
+
+    try:
+        updated = repo.detach(entity)
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     return HandlingUnitRead.model_validate(updated)
@@ -3,9 +3,14 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.db.write_queue import execute_write
 from app.repositories.inventory import InventoryPositionRepository
 from app.rules.exceptions import RuleViolation
-from app.schemas.inventory import InventoryAdjustmentCreate, InventoryMovementRead, InventoryPositionRead
+from app.schemas.inventory import (
+    InventoryAdjustmentCreate,
+    InventoryMovementRead,
+    InventoryPositionRead,
+)
 from app.services.inventory_service import InventoryService
 
 router = APIRouter(prefix="/inventory")
@@ -22,14 +27,15 @@ def list_inventory_positions(
     return [InventoryPositionRead.model_validate(item) for item in items]
 
 
-@router.post("/adjustments", response_model=InventoryMovementRead, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/adjustments", response_model=InventoryMovementRead, status_code=status.HTTP_201_CREATED
+)
 def create_inventory_adjustment(
     payload: InventoryAdjustmentCreate,
     db: Session = Depends(get_db),
 ) -> InventoryMovementRead:
-    service = InventoryService(db)
-    try:
-        movement = service.adjust_inventory(
+    def work(session: Session) -> InventoryMovementRead:
+        movement = InventoryService(session).adjust_inventory(
             hu_id=payload.hu_id,
             item_id=payload.item_id,
             qty_delta=payload.qty_delta,
@@ -37,11 +43,11 @@ def create_inventory_adjustment(
             executor_id=payload.executor_id,
             idempotency_key=payload.idempotency_key,
         )
-        db.commit()
         return InventoryMovementRead.model_validate(movement)
+
+    try:
+        return execute_write(db, work)
     except RuleViolation as exc:
-        db.rollback()
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     except IntegrityError as exc:
-        db.rollback()
         raise HTTPException(status_code=409, detail="Inventory adjustment conflict") from exc
@@ -1,16 +1,57 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.repositories.location import LocationRepository
-from app.schemas.location import LocationCreate, LocationRead, LocationUpdate
+from app.api.v1.caching import conditional_page
+from app.api.v1.listing import list_query
+from app.db.models.location import Location, LocationType
+from app.db.session import SessionLocal, get_db, get_read_db
+from app.repositories.listing import ListQuery
+from app.repositories.location import LOCATION_LISTING, LocationRepository
+from app.rules.exceptions import RuleViolation
+from app.schemas.location import (
+    LocationCreate,
+    LocationDistanceRead,
+    LocationFreeSlotsRead,
+    LocationRead,
+    LocationUpdate,
+    TravelMatrixRead,
+)
+from app.services.travel_service import (
+    TravelService,
+    get_travel_refresh_job,
+    refresh_travel_matrix,
+)
 
 router = APIRouter(prefix="/locations")
 
 
+_REQUIRED_FIELDS = ("name", "type", "active")
+
+
+def _refresh_travel_matrix(background_tasks: BackgroundTasks) -> None:
+    job = get_travel_refresh_job()
+    if job is not None:
+        job.mark_dirty()
+    else:
+        background_tasks.add_task(refresh_travel_matrix, SessionLocal)
+
+
 @router.post("", response_model=LocationRead, status_code=status.HTTP_201_CREATED)
-def create_location(payload: LocationCreate, db: Session = Depends(get_db)) -> LocationRead:
+def create_location(
+    payload: LocationCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> LocationRead:
     repo = LocationRepository(db)
     try:
         entity = repo.create(
@@ -18,18 +59,72 @@ def create_location(payload: LocationCreate, db: Session = Depends(get_db)) -> L
             name=payload.name,
             type=payload.type,
             active=payload.active,
+            x=payload.x,
+            y=payload.y,
+            z=payload.z,
+            zone=payload.zone,
+            max_hu=payload.max_hu,
+            max_weight_kg=payload.max_weight_kg,
         )
         db.commit()
-        return LocationRead.model_validate(entity)
     except IntegrityError as exc:
         db.rollback()
         raise HTTPException(status_code=409, detail="Location code already exists") from exc
 
+    if entity.x is not None and entity.y is not None:
+        _refresh_travel_matrix(background_tasks)
+    return LocationRead.model_validate(entity)
+
 
-@router.get("", response_model=list[LocationRead])
-def list_locations(db: Session = Depends(get_db)) -> list[LocationRead]:
+@router.get("", response_model=list[LocationRead], description=LOCATION_LISTING.describe())
+def list_locations(
+    request: Request,
+    query: ListQuery = Depends(list_query),
+    db: Session = Depends(get_db),
+) -> Response:
     repo = LocationRepository(db)
-    return [LocationRead.model_validate(item) for item in repo.list()]
+    try:
+        return conditional_page(request, db, Location, LocationRead, lambda: repo.list(query))
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+
+
+@router.get("/free-slots", response_model=list[LocationFreeSlotsRead])
+def list_free_slots(
+    zone: str | None = None,
+    types: list[LocationType] | None = Query(default=None, alias="type"),
+    db: Session = Depends(get_read_db),
+) -> list[LocationFreeSlotsRead]:
+    repo = LocationRepository(db)
+    return [
+        LocationFreeSlotsRead(
+            zone=row_zone,
+            type=location_type,
+            locations=locations,
+            open_locations=open_locations,
+            free_slots=free_slots,
+            unlimited_locations=unlimited_locations,
+        )
+        for (
+            row_zone,
+            location_type,
+            locations,
+            open_locations,
+            free_slots,
+            unlimited_locations,
+        ) in repo.free_slots(zone=zone, types=set(types) if types else None)
+    ]
+
+
+@router.post("/travel-matrix/rebuild", response_model=TravelMatrixRead)
+def rebuild_travel_matrix(db: Session = Depends(get_db)) -> TravelMatrixRead:
+    service = TravelService(db)
+    recomputed = service.rebuild_matrix()
+    return TravelMatrixRead(
+        generation=service.matrix.generation,
+        locations=service.matrix.size,
+        recomputed=recomputed,
+    )
 
 
 @router.get("/{location_id}", response_model=LocationRead)
@@ -41,18 +136,44 @@ def get_location(location_id: int, db: Session = Depends(get_db)) -> LocationRea
     return LocationRead.model_validate(entity)
 
 
+@router.get("/{location_id}/nearest", response_model=list[LocationDistanceRead])
+def list_nearest_locations(
+    location_id: int,
+    types: list[LocationType] | None = Query(default=None, alias="type"),
+    limit: int = Query(default=5, ge=1, le=100),
+    db: Session = Depends(get_db),
+) -> list[LocationDistanceRead]:
+    service = TravelService(db)
+    try:
+        nearest = service.nearest(location_id, types=set(types) if types else None, limit=limit)
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return [
+        LocationDistanceRead(location_id=item_id, distance=distance)
+        for item_id, distance in nearest
+    ]
+
+
 @router.patch("/{location_id}", response_model=LocationRead)
-def update_location(location_id: int, payload: LocationUpdate, db: Session = Depends(get_db)) -> LocationRead:
+def update_location(
+    location_id: int,
+    payload: LocationUpdate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> LocationRead:
     repo = LocationRepository(db)
     entity = repo.get(location_id)
     if entity is None:
         raise HTTPException(status_code=404, detail="Location not found")
 
-    updated = repo.update(
-        entity,
-        name=payload.name,
-        type=payload.type,
-        active=payload.active,
-    )
+    values = payload.model_dump(exclude_unset=True)
+    cleared = [field for field in _REQUIRED_FIELDS if field in values and values[field] is None]
+    if cleared:
+        raise HTTPException(status_code=400, detail=f"Cannot clear {', '.join(cleared)}")
+    updated = repo.update(entity, **values)
     db.commit()
+
+    geometry_fields = {"type", "active", "x", "y", "z"}
+    if geometry_fields & values.keys():
+        _refresh_travel_matrix(background_tasks)
     return LocationRead.model_validate(updated)
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.api.v1.caching import conditional_page
+from app.api.v1.listing import list_query
+from app.db.models.item import Item
 from app.db.session import get_db
-from app.repositories.item import ItemRepository
-from app.schemas.item import ItemCreate, ItemRead
+from app.repositories.item import ITEM_LISTING, ItemRepository
+from app.repositories.listing import ListQuery
+from app.rules.exceptions import RuleViolation
+from app.schemas.item import ItemCreate, ItemRead, ItemUpdate
+from app.services.inventory_service import InventoryService
 
 router = APIRouter(prefix="/materials")
 
@@ -13,7 +19,13 @@ router = APIRouter(prefix="/materials")
 def create_material(payload: ItemCreate, db: Session = Depends(get_db)) -> ItemRead:
     repo = ItemRepository(db)
     try:
-        entity = repo.create(sku=payload.sku, name=payload.name, uom=payload.uom)
+        entity = repo.create(
+            sku=payload.sku,
+            name=payload.name,
+            uom=payload.uom,
+            weight_kg=payload.weight_kg,
+            volume_l=payload.volume_l,
+        )
         db.commit()
         return ItemRead.model_validate(entity)
     except IntegrityError as exc:
@@ -21,10 +33,17 @@ def create_material(payload: ItemCreate, db: Session = Depends(get_db)) -> ItemR
         raise HTTPException(status_code=409, detail="Material SKU already exists") from exc
 
 
-@router.get("", response_model=list[ItemRead])
-def list_materials(db: Session = Depends(get_db)) -> list[ItemRead]:
+@router.get("", response_model=list[ItemRead], description=ITEM_LISTING.describe())
+def list_materials(
+    request: Request,
+    query: ListQuery = Depends(list_query),
+    db: Session = Depends(get_db),
+) -> Response:
     repo = ItemRepository(db)
-    return [ItemRead.model_validate(item) for item in repo.list()]
+    try:
+        return conditional_page(request, db, Item, ItemRead, lambda: repo.list(query))
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
 
 @router.get("/{material_id}", response_model=ItemRead)
@@ -34,3 +53,22 @@ def get_material(material_id: int, db: Session = Depends(get_db)) -> ItemRead:
     if entity is None:
         raise HTTPException(status_code=404, detail="Material not found")
     return ItemRead.model_validate(entity)
+
+
+@router.patch("/{material_id}", response_model=ItemRead)
+def update_material(
+    material_id: int, payload: ItemUpdate, db: Session = Depends(get_db)
+) -> ItemRead:
+    service = InventoryService(db)
+    try:
+        entity = service.update_item(
+            item_id=material_id,
+            name=payload.name,
+            weight_kg=payload.weight_kg,
+            volume_l=payload.volume_l,
+        )
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return ItemRead.model_validate(entity)
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.api.v1.caching import etag_matches, make_etag, not_modified
 from app.db.session import get_db
+from app.db.write_queue import execute_write
 from app.repositories.mission import MissionRepository
 from app.rules.exceptions import RuleViolation
 from app.schemas.inventory import InventoryMovementRead
 from app.schemas.mission import (
     MissionAssignCommand,
+    MissionAssignmentRead,
+    MissionAutoAssignCommand,
+    MissionAutoAssignRead,
     MissionCancelCommand,
     MissionCompleteCommand,
     MissionCreate,
@@ -30,7 +35,9 @@ def create_mission(payload: MissionCreate, db: Session = Depends(get_db)) -> Mis
         return MissionRead.model_validate(mission)
     except IntegrityError as exc:
         db.rollback()
-        raise HTTPException(status_code=409, detail="Mission number conflict or invalid references") from exc
+        raise HTTPException(
+            status_code=409, detail="Mission number conflict or invalid references"
+        ) from exc
 
 
 @router.get("", response_model=list[MissionRead])
@@ -39,17 +46,58 @@ def list_missions(db: Session = Depends(get_db)) -> list[MissionRead]:
     return [MissionRead.model_validate(item) for item in repo.list()]
 
 
+@router.post("/auto-assign", response_model=MissionAutoAssignRead)
+def auto_assign_missions(
+    payload: MissionAutoAssignCommand,
+    db: Session = Depends(get_db),
+) -> MissionAutoAssignRead:
+    def work(session: Session) -> MissionAutoAssignRead:
+        assigned, unassigned = MissionService(session).auto_assign(
+            mission_ids=payload.mission_ids,
+            executor_ids=payload.executor_ids,
+        )
+        return MissionAutoAssignRead(
+            assignments=[
+                MissionAssignmentRead(
+                    mission_id=mission.id, executor_id=mission.assigned_executor_id, cost=cost
+                )
+                for mission, cost in assigned
+            ],
+            unassigned_mission_ids=unassigned,
+        )
+
+    try:
+        return execute_write(db, work)
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+
+
 @router.get("/{mission_id}", response_model=MissionRead)
-def get_mission(mission_id: int, db: Session = Depends(get_db)) -> MissionRead:
+def get_mission(
+    mission_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+) -> MissionRead | Response:
     repo = MissionRepository(db)
+    version = repo.get_version(mission_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Mission not found")
+    etag = make_etag("mission", mission_id, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     mission = repo.get_with_lines(mission_id)
     if mission is None:
         raise HTTPException(status_code=404, detail="Mission not found")
+    response.headers["ETag"] = make_etag("mission", mission.id, mission.version)
     return MissionRead.model_validate(mission)
 
 
 @router.patch("/{mission_id}", response_model=MissionRead)
-def update_mission(mission_id: int, payload: MissionUpdate, db: Session = Depends(get_db)) -> MissionRead:
+def update_mission(
+    mission_id: int, payload: MissionUpdate, db: Session = Depends(get_db)
+) -> MissionRead:
     repo = MissionRepository(db)
     mission = repo.get_with_lines(mission_id)
     if mission is None:
@@ -67,13 +115,15 @@ def assign_mission(
     payload: MissionAssignCommand,
     db: Session = Depends(get_db),
 ) -> MissionRead:
-    service = MissionService(db)
-    try:
-        mission = service.assign(mission_id=mission_id, executor_id=payload.executor_id)
-        db.commit()
+    def work(session: Session) -> MissionRead:
+        mission = MissionService(session).assign(
+            mission_id=mission_id, executor_id=payload.executor_id
+        )
         return MissionRead.model_validate(mission)
+
+    try:
+        return execute_write(db, work)
     except RuleViolation as exc:
-        db.rollback()
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
 
@@ -83,13 +133,15 @@ def start_mission(
     payload: MissionStartCommand,
     db: Session = Depends(get_db),
 ) -> MissionRead:
-    service = MissionService(db)
-    try:
-        mission = service.start(mission_id=mission_id, executor_id=payload.executor_id)
-        db.commit()
+    def work(session: Session) -> MissionRead:
+        mission = MissionService(session).start(
+            mission_id=mission_id, executor_id=payload.executor_id
+        )
         return MissionRead.model_validate(mission)
+
+    try:
+        return execute_write(db, work)
     except RuleViolation as exc:
-        db.rollback()
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
 
@@ -99,16 +151,15 @@ def record_movement(
     payload: MissionRecordMovementCommand,
     db: Session = Depends(get_db),
 ) -> InventoryMovementRead:
-    service = MissionService(db)
-    try:
-        movement = service.record_movement(mission_id=mission_id, payload=payload)
-        db.commit()
+    def work(session: Session) -> InventoryMovementRead:
+        movement = MissionService(session).record_movement(mission_id=mission_id, payload=payload)
         return InventoryMovementRead.model_validate(movement)
+
+    try:
+        return execute_write(db, work)
     except RuleViolation as exc:
-        db.rollback()
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     except IntegrityError as exc:
-        db.rollback()
         raise HTTPException(status_code=409, detail="Movement conflict") from exc
 
 
@@ -118,13 +169,13 @@ def complete_mission(
     payload: MissionCompleteCommand,
     db: Session = Depends(get_db),
 ) -> MissionRead:
-    service = MissionService(db)
-    try:
-        mission = service.complete(mission_id=mission_id)
-        db.commit()
+    def work(session: Session) -> MissionRead:
+        mission = MissionService(session).complete(mission_id=mission_id)
         return MissionRead.model_validate(mission)
+
+    try:
+        return execute_write(db, work)
     except RuleViolation as exc:
-        db.rollback()
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
 
 
@@ -134,11 +185,11 @@ def cancel_mission(
     payload: MissionCancelCommand,
     db: Session = Depends(get_db),
 ) -> MissionRead:
-    service = MissionService(db)
-    try:
-        mission = service.cancel(mission_id=mission_id, reason=payload.reason)
-        db.commit()
+    def work(session: Session) -> MissionRead:
+        mission = MissionService(session).cancel(mission_id=mission_id, reason=payload.reason)
         return MissionRead.model_validate(mission)
+
+    try:
+        return execute_write(db, work)
     except RuleViolation as exc:
-        db.rollback()
         raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
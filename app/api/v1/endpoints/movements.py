@@ -1,14 +1,60 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db.session import get_db
-from app.repositories.inventory import InventoryMovementRepository
-from app.schemas.inventory import InventoryMovementRead
+from app.repositories.movement_archive import MovementArchiveRepository
+from app.rules.exceptions import RuleViolation
+from app.schemas.inventory import InventoryMovementRead, MovementArchiveRead, MovementArchiveRequest
+from app.services.ledger_archive_service import LedgerArchiveService
 
 router = APIRouter(prefix="/movements")
 
 
 @router.get("", response_model=list[InventoryMovementRead])
-def list_movements(db: Session = Depends(get_db)) -> list[InventoryMovementRead]:
-    repo = InventoryMovementRepository(db)
-    return [InventoryMovementRead.model_validate(item) for item in repo.list()]
+def list_movements(
+    executed_from: datetime | None = None,
+    executed_to: datetime | None = None,
+    include_archived: bool = False,
+    db: Session = Depends(get_db),
+) -> list[InventoryMovementRead]:
+    movements = LedgerArchiveService(db).list_movements(
+        executed_from=executed_from,
+        executed_to=executed_to,
+        include_archived=include_archived,
+    )
+    return [InventoryMovementRead.model_validate(item) for item in movements]
+
+
+@router.get("/archives", response_model=list[MovementArchiveRead])
+def list_movement_archives(db: Session = Depends(get_db)) -> list[MovementArchiveRead]:
+    return [
+        MovementArchiveRead.model_validate(item) for item in MovementArchiveRepository(db).list()
+    ]
+
+
+@router.post("/archive", response_model=list[MovementArchiveRead])
+def archive_movements(
+    payload: MovementArchiveRequest,
+    db: Session = Depends(get_db),
+) -> list[MovementArchiveRead]:
+    """Archive every closed month older than ``retain_months``, committing one month at a time."""
+    service = LedgerArchiveService(db)
+    retain_months = (
+        payload.retain_months
+        if payload.retain_months is not None
+        else settings.ledger_retain_months
+    )
+    archived = []
+    try:
+        for start, end in service.closed_periods(retain_months=retain_months):
+            entry = service.archive_period(start, end)
+            db.commit()
+            if entry is not None:
+                archived.append(MovementArchiveRead.model_validate(entry))
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return archived
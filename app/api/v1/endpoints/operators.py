@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.api.v1.listing import list_query, render_page
 from app.db.session import get_db
-from app.repositories.operator import OperatorRepository
+from app.repositories.listing import ListQuery
+from app.repositories.operator import OPERATOR_LISTING, OperatorRepository
+from app.rules.exceptions import RuleViolation
 from app.schemas.operator import OperatorCreate, OperatorRead, OperatorUpdate
 
 router = APIRouter(prefix="/operators")
@@ -21,10 +24,17 @@ def create_operator(payload: OperatorCreate, db: Session = Depends(get_db)) -> O
         raise HTTPException(status_code=409, detail="Operator code already exists") from exc
 
 
-@router.get("", response_model=list[OperatorRead])
-def list_operators(db: Session = Depends(get_db)) -> list[OperatorRead]:
+@router.get("", response_model=list[OperatorRead], description=OPERATOR_LISTING.describe())
+def list_operators(
+    query: ListQuery = Depends(list_query),
+    db: Session = Depends(get_db),
+) -> Response:
     repo = OperatorRepository(db)
-    return [OperatorRead.model_validate(item) for item in repo.list()]
+    try:
+        page = repo.list(query)
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return render_page(page, OperatorRead)
 
 
 @router.get("/{operator_id}", response_model=OperatorRead)
@@ -37,7 +47,9 @@ def get_operator(operator_id: int, db: Session = Depends(get_db)) -> OperatorRea
 
 
 @router.patch("/{operator_id}", response_model=OperatorRead)
-def update_operator(operator_id: int, payload: OperatorUpdate, db: Session = Depends(get_db)) -> OperatorRead:
+def update_operator(
+    operator_id: int, payload: OperatorUpdate, db: Session = Depends(get_db)
+) -> OperatorRead:
     repo = OperatorRepository(db)
     entity = repo.get(operator_id)
     if entity is None:
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import get_db
+from app.outbox import DispatcherStats, get_dispatcher
+from app.repositories.outbox import OutboxRepository
+from app.schemas.outbox import OutboxStatsRead
+
+router = APIRouter(prefix="/outbox")
+
+
+@router.get("/stats", response_model=OutboxStatsRead)
+def outbox_stats(db: Session = Depends(get_db)) -> OutboxStatsRead:
+    pending, oldest = OutboxRepository(db).pending_stats()
+    lag_seconds = None
+    if oldest is not None:
+        if oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        lag_seconds = max((datetime.now(tz=timezone.utc) - oldest).total_seconds(), 0.0)
+
+    dispatcher = get_dispatcher()
+    stats = dispatcher.stats if dispatcher is not None else DispatcherStats()
+    return OutboxStatsRead(
+        dispatcher_running=stats.running,
+        sink=settings.outbox_sink,
+        pending=pending,
+        oldest_pending_at=oldest,
+        lag_seconds=lag_seconds,
+        batches_sent=stats.batches_sent,
+        messages_sent=stats.messages_sent,
+        failures=stats.failures,
+        consecutive_failures=stats.consecutive_failures,
+        last_error=stats.last_error,
+        last_dispatched_at=stats.last_dispatched_at,
+    )
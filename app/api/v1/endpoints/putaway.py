@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.db.session import get_read_db
+from app.rules.exceptions import RuleViolation
+from app.schemas.putaway import PutawaySuggestRead, PutawaySuggestRequest
+from app.services.putaway_service import PutawayService
+
+router = APIRouter(prefix="/putaway")
+
+
+@router.post("/suggest", response_model=PutawaySuggestRead)
+def suggest_putaway(
+    payload: PutawaySuggestRequest,
+    db: Session = Depends(get_read_db),
+) -> PutawaySuggestRead:
+    try:
+        suggestion = PutawayService(db).suggest(
+            payload.hu_id,
+            limit=payload.limit,
+            location_types=set(payload.location_types) if payload.location_types else None,
+        )
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return PutawaySuggestRead.model_validate(suggestion)
@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.repositories.replenishment import ReplenishmentRepository
+from app.rules.exceptions import RuleViolation
+from app.schemas.replenishment import (
+    ReplenishmentEvaluate,
+    ReplenishmentRead,
+    ReplenishmentRuleCreate,
+    ReplenishmentRuleRead,
+    ReplenishmentRuleUpdate,
+)
+from app.services.replenishment_service import ReplenishmentService
+
+router = APIRouter(prefix="/replenishment")
+
+
+@router.post("/rules", response_model=ReplenishmentRuleRead, status_code=status.HTTP_201_CREATED)
+def create_replenishment_rule(
+    payload: ReplenishmentRuleCreate, db: Session = Depends(get_db)
+) -> ReplenishmentRuleRead:
+    service = ReplenishmentService(db)
+    try:
+        entity = service.create_rule(**payload.model_dump())
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Invalid operator reference or duplicate rule"
+        ) from exc
+    return ReplenishmentRuleRead.model_validate(entity)
+
+
+@router.get("/rules", response_model=list[ReplenishmentRuleRead])
+def list_replenishment_rules(
+    item_id: int | None = None,
+    location_id: int | None = None,
+    db: Session = Depends(get_db),
+) -> list[ReplenishmentRuleRead]:
+    rules = ReplenishmentRepository(db).list(item_id=item_id, location_id=location_id)
+    return [ReplenishmentRuleRead.model_validate(rule) for rule in rules]
+
+
+@router.patch("/rules/{rule_id}", response_model=ReplenishmentRuleRead)
+def update_replenishment_rule(
+    rule_id: int, payload: ReplenishmentRuleUpdate, db: Session = Depends(get_db)
+) -> ReplenishmentRuleRead:
+    service = ReplenishmentService(db)
+    try:
+        entity = service.update_rule(rule_id, **payload.model_dump())
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return ReplenishmentRuleRead.model_validate(entity)
+
+
+@router.post("/evaluate", response_model=ReplenishmentRead)
+def evaluate_replenishment(
+    payload: ReplenishmentEvaluate, db: Session = Depends(get_db)
+) -> ReplenishmentRead:
+    """Check rules against current stock now instead of waiting for a movement to touch them."""
+    service = ReplenishmentService(db)
+    try:
+        result = service.evaluate(payload.rule_ids)
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return ReplenishmentRead.model_validate(result)
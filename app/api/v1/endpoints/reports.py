@@ -0,0 +1,81 @@
+from dataclasses import asdict
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.report import ReportGranularity
+from app.db.session import get_db
+from app.rules.exceptions import RuleViolation
+from app.schemas.report import MissionReportRow, MovementReportRow, ReportStatusRead
+from app.services.report_service import ReportService, get_report_job
+
+router = APIRouter(prefix="/reports")
+
+
+def _status(db: Session) -> ReportStatusRead:
+    job = get_report_job()
+    return ReportStatusRead(
+        job_running=job is not None and job.running,
+        last_error=job.last_error if job is not None else None,
+        **asdict(ReportService(db).status()),
+    )
+
+
+@router.get("/movements", response_model=list[MovementReportRow])
+def movement_report(
+    granularity: ReportGranularity = ReportGranularity.HOUR,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    group_by: list[Literal["executor_id", "movement_type", "location_type"]] = Query(default=[]),
+    executor_id: int | None = None,
+    db: Session = Depends(get_db),
+) -> list[MovementReportRow]:
+    rows = ReportService(db).movement_report(
+        granularity=granularity, start=start, end=end, group_by=group_by, executor_id=executor_id
+    )
+    return [MovementReportRow(**row) for row in rows]
+
+
+@router.get("/missions", response_model=list[MissionReportRow])
+def mission_report(
+    granularity: ReportGranularity = ReportGranularity.HOUR,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    by_executor: bool = False,
+    executor_id: int | None = None,
+    db: Session = Depends(get_db),
+) -> list[MissionReportRow]:
+    rows = ReportService(db).mission_report(
+        granularity=granularity,
+        start=start,
+        end=end,
+        by_executor=by_executor,
+        executor_id=executor_id,
+    )
+    return [MissionReportRow(**row) for row in rows]
+
+
+@router.get("/status", response_model=ReportStatusRead)
+def report_status(db: Session = Depends(get_db)) -> ReportStatusRead:
+    return _status(db)
+
+
+@router.post("/refresh", response_model=ReportStatusRead)
+def refresh(db: Session = Depends(get_db)) -> ReportStatusRead:
+    """Fold pending rows now instead of waiting for the background job."""
+    service = ReportService(db)
+    while True:
+        try:
+            result = service.refresh(batch_size=settings.report_batch_size)
+            db.commit()
+        except RuleViolation as exc:
+            db.rollback()
+            raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+        if (
+            result.movements < settings.report_batch_size
+            and result.mission_events < settings.report_batch_size
+        ):
+            return _status(db)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.repositories.executor import ExecutorRepository
 from app.repositories.handling_unit import HandlingUnitRepository
 from app.repositories.location import LocationRepository
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/rules")
 @router.post("/validate-assignment", response_model=RuleValidationResponse)
 def validate_assignment(
     payload: RuleValidateAssignmentRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> RuleValidationResponse:
     missions = MissionRepository(db)
     executors = ExecutorRepository(db)
@@ -40,7 +40,7 @@ def validate_assignment(
 @router.post("/validate-movement", response_model=RuleValidationResponse)
 def validate_movement_rule(
     payload: RuleValidateMovementRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> RuleValidationResponse:
     missions = MissionRepository(db)
     executors = ExecutorRepository(db)
@@ -58,7 +58,9 @@ def validate_movement_rule(
     if source is None or destination is None:
         return RuleValidationResponse(allowed=False, reason="Mission line locations not found")
 
-    handling_unit = handling_units.get(mission_line.hu_id) if mission_line.hu_id is not None else None
+    handling_unit = (
+        handling_units.get(mission_line.hu_id) if mission_line.hu_id is not None else None
+    )
 
     try:
         validate_movement(
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.db.search import SearchKind
+from app.db.session import get_read_db
+from app.rules.exceptions import RuleViolation
+from app.schemas.search import SearchHitRead, SearchRead
+from app.services.search_service import SearchService
+
+router = APIRouter(prefix="/search")
+
+
+@router.get("", response_model=SearchRead)
+def search(
+    q: str = Query(
+        min_length=1, max_length=128, description="Partial code or name; every term must match."
+    ),
+    kinds: list[SearchKind] | None = Query(default=None, alias="kind"),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_read_db),
+) -> SearchRead:
+    try:
+        result = SearchService(db).search(
+            q, kinds=set(kinds) if kinds else None, limit=limit, offset=offset
+        )
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return SearchRead(
+        hits=[SearchHitRead.model_validate(hit, from_attributes=True) for hit in result.hits],
+        has_more=result.has_more,
+    )
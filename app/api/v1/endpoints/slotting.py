@@ -0,0 +1,116 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import get_db
+from app.rules.exceptions import RuleViolation
+from app.schemas.mission import MissionRead
+from app.schemas.slotting import (
+    ItemAffinityRead,
+    ItemVelocityRead,
+    SlottingMissionCreate,
+    SlottingRefreshRead,
+    SlottingSuggestionRead,
+)
+from app.services.slotting_service import SlottingService
+
+router = APIRouter(prefix="/slotting")
+
+
+@router.get("/velocity", response_model=list[ItemVelocityRead])
+def item_velocity(
+    window_days: int | None = Query(default=None, ge=1),
+    db: Session = Depends(get_db),
+) -> list[ItemVelocityRead]:
+    velocities = SlottingService(db).velocities(
+        window_days=window_days or settings.slotting_window_days
+    )
+    return [ItemVelocityRead.model_validate(velocity) for velocity in velocities]
+
+
+@router.get("/affinity", response_model=list[ItemAffinityRead])
+def item_affinity(
+    item_id: int | None = None,
+    limit: int = Query(default=50, ge=1, le=1000),
+    db: Session = Depends(get_db),
+) -> list[ItemAffinityRead]:
+    return [
+        ItemAffinityRead(item_a_id=item_a_id, item_b_id=item_b_id, copick_count=count)
+        for item_a_id, item_b_id, count in SlottingService(db).affinities(
+            item_id=item_id, limit=limit
+        )
+    ]
+
+
+@router.get("/suggestions", response_model=list[SlottingSuggestionRead])
+def slotting_suggestions(
+    window_days: int | None = Query(default=None, ge=1),
+    abc_class: list[Literal["A", "B", "C"]] = Query(default=["A"]),
+    limit: int | None = Query(default=None, ge=1),
+    db: Session = Depends(get_db),
+) -> list[SlottingSuggestionRead]:
+    try:
+        suggestions = SlottingService(db).suggest(
+            window_days=window_days or settings.slotting_window_days,
+            classes=set(abc_class),
+            limit=limit,
+        )
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return [SlottingSuggestionRead.model_validate(suggestion) for suggestion in suggestions]
+
+
+@router.post("/missions", response_model=list[MissionRead], status_code=status.HTTP_201_CREATED)
+def create_slotting_missions(
+    payload: SlottingMissionCreate,
+    db: Session = Depends(get_db),
+) -> list[MissionRead]:
+    service = SlottingService(db)
+    try:
+        if payload.moves is None:
+            suggestions = service.suggest(
+                window_days=payload.window_days or settings.slotting_window_days,
+                limit=payload.limit,
+            )
+            moves = [(suggestion.hu_id, suggestion.to_location_id) for suggestion in suggestions]
+        else:
+            moves = [(move.hu_id, move.to_location_id) for move in payload.moves]
+        missions = service.create_missions(
+            moves,
+            created_by_operator_id=payload.created_by_operator_id,
+            priority=payload.priority,
+        )
+        db.commit()
+        return [MissionRead.model_validate(mission) for mission in missions]
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Invalid operator or location reference"
+        ) from exc
+
+
+@router.post("/refresh", response_model=SlottingRefreshRead)
+def refresh_slotting_statistics(db: Session = Depends(get_db)) -> SlottingRefreshRead:
+    """Fold pending picks and completions now instead of waiting for the nightly job."""
+    service = SlottingService(db)
+    total = SlottingRefreshRead(picks=0, completions=0)
+    while True:
+        try:
+            result = service.refresh(batch_size=settings.slotting_batch_size)
+            db.commit()
+        except RuleViolation as exc:
+            db.rollback()
+            raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+        total.picks += result.picks
+        total.completions += result.completions
+        if (
+            result.picks < settings.slotting_batch_size
+            and result.completions < settings.slotting_batch_size
+        ):
+            return total
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.schemas.sync import SyncRead
+from app.services.sync_service import SyncService
+
+router = APIRouter(prefix="/sync")
+
+
+@router.get("", response_model=SyncRead)
+def sync_changes(
+    since: int = Query(default=0, ge=0),
+    limit: int = Query(default=5000, ge=1, le=50000),
+    db: Session = Depends(get_db),
+) -> SyncRead:
+    changes = SyncService(db).changes_since(since, limit=limit)
+    return SyncRead(
+        since=changes.since,
+        watermark=changes.watermark,
+        has_more=changes.has_more,
+        reset=changes.reset,
+        **changes.rows,
+    )
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.api.v1.listing import list_query, render_page
 from app.db.models.executor import ExecutorType
 from app.db.session import get_db
-from app.repositories.executor import ExecutorRepository
+from app.repositories.executor import EXECUTOR_LISTING, ExecutorRepository
+from app.repositories.listing import ListQuery
+from app.rules.exceptions import RuleViolation
 from app.schemas.executor import ExecutorCreate, ExecutorRead, ExecutorUpdate
 
 router = APIRouter(prefix="/vehicles")
@@ -28,11 +31,17 @@ def create_vehicle(payload: ExecutorCreate, db: Session = Depends(get_db)) -> Ex
         raise HTTPException(status_code=409, detail="Vehicle code already exists") from exc
 
 
-@router.get("", response_model=list[ExecutorRead])
-def list_vehicles(db: Session = Depends(get_db)) -> list[ExecutorRead]:
+@router.get("", response_model=list[ExecutorRead], description=EXECUTOR_LISTING.describe())
+def list_vehicles(
+    query: ListQuery = Depends(list_query),
+    db: Session = Depends(get_db),
+) -> Response:
     repo = ExecutorRepository(db)
-    items = [item for item in repo.list() if item.executor_type == ExecutorType.AGV]
-    return [ExecutorRead.model_validate(item) for item in items]
+    try:
+        page = repo.list(query, executor_type=ExecutorType.AGV)
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return render_page(page, ExecutorRead)
 
 
 @router.get("/{vehicle_id}", response_model=ExecutorRead)
@@ -45,7 +54,9 @@ def get_vehicle(vehicle_id: int, db: Session = Depends(get_db)) -> ExecutorRead:
 
 
 @router.patch("/{vehicle_id}", response_model=ExecutorRead)
-def update_vehicle(vehicle_id: int, payload: ExecutorUpdate, db: Session = Depends(get_db)) -> ExecutorRead:
+def update_vehicle(
+    vehicle_id: int, payload: ExecutorUpdate, db: Session = Depends(get_db)
+) -> ExecutorRead:
     repo = ExecutorRepository(db)
     entity = repo.get(vehicle_id)
     if entity is None or entity.executor_type != ExecutorType.AGV:
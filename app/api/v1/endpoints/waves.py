@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db, get_read_db
+from app.rules.exceptions import RuleViolation
+from app.schemas.wave import WavePlanCommand, WavePlanRead, WaveRead, WaveReleaseCommand
+from app.services.mission_service import MissionService
+from app.services.wave_service import WaveService
+
+router = APIRouter(prefix="/waves")
+
+
+@router.post("/plan", response_model=WavePlanRead)
+def plan_waves(payload: WavePlanCommand, db: Session = Depends(get_read_db)) -> WavePlanRead:
+    service = WaveService(db)
+    try:
+        waves, consolidated = service.plan(
+            mission_ids=payload.mission_ids,
+            capacity_kg=float(payload.capacity_kg) if payload.capacity_kg is not None else None,
+            max_lines=payload.max_lines,
+        )
+    except RuleViolation as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    return WavePlanRead(
+        waves=[WaveRead.model_validate(wave) for wave in waves],
+        consolidated_mission_ids=consolidated,
+    )
+
+
+@router.post("/release", response_model=WavePlanRead, status_code=status.HTTP_201_CREATED)
+def release_waves(payload: WaveReleaseCommand, db: Session = Depends(get_db)) -> WavePlanRead:
+    service = WaveService(db)
+    try:
+        waves, consolidated = service.plan(
+            mission_ids=payload.mission_ids,
+            capacity_kg=float(payload.capacity_kg) if payload.capacity_kg is not None else None,
+            max_lines=payload.max_lines,
+        )
+        missions = service.release(
+            waves, consolidated, created_by_operator_id=payload.created_by_operator_id
+        )
+        assigned_ids: list[int] = []
+        if payload.assign and missions:
+            assigned, _ = MissionService(db).auto_assign(
+                mission_ids=[mission.id for mission in missions]
+            )
+            assigned_ids = [mission.id for mission, _ in assigned]
+        db.commit()
+    except RuleViolation as exc:
+        db.rollback()
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Wave release conflict or invalid references"
+        ) from exc
+    return WavePlanRead(
+        waves=[WaveRead.model_validate(wave) for wave in waves],
+        consolidated_mission_ids=consolidated,
+        assigned_mission_ids=assigned_ids,
+    )
@@ -0,0 +1,76 @@
+"""Query parameters and response of paginated list endpoints.
+
+See :mod:`app.repositories.listing` for the query model.
+"""
+
+from functools import cache
+
+from fastapi import Query, Request, Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.repositories.listing import ListQuery, Page
+
+RESERVED_PARAMS = frozenset({"sort", "limit", "cursor", "fields", "count"})
+
+
+def list_query(
+    request: Request,
+    sort: str | None = Query(
+        default=None, description="Comma-separated fields, `-` in front for descending."
+    ),
+    limit: int = Query(default=500, ge=1, le=5000),
+    cursor: str | None = Query(default=None, description="`X-Next-Cursor` of the previous page."),
+    fields: str | None = Query(default=None, description="Comma-separated fields to return."),
+    count: bool = Query(
+        default=False, description="Return the number of matching rows in `X-Total-Count`."
+    ),
+) -> ListQuery:
+    filters: dict[str, list[str]] = {}
+    for key, value in request.query_params.multi_items():
+        if key not in RESERVED_PARAMS:
+            filters.setdefault(key, []).append(value)
+    return ListQuery(
+        filters=filters,
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+        fields=[name.strip() for name in fields.split(",") if name.strip()] if fields else None,
+        count=count,
+    )
+
+
+def page_headers(page: Page) -> dict[str, str]:
+    headers = {}
+    if page.next_cursor is not None:
+        headers["X-Next-Cursor"] = page.next_cursor
+    if page.total is not None:
+        headers["X-Total-Count"] = str(page.total)
+        headers["X-Total-Count-Exact"] = "true" if page.total_exact else "false"
+    return headers
+
+
+@cache
+def _list_adapter(schema: type) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+def page_body(page: Page, schema: type[BaseModel]) -> bytes:
+    """JSON array of the page as ``schema`` objects.
+
+    When the query selects fields, each object holds only those fields.
+    """
+    if page.fields is None:
+        return _list_adapter(schema).dump_json([schema.model_validate(row) for row in page.rows])
+    include = set(page.fields)
+    return _list_adapter(dict).dump_json(
+        [
+            schema.model_construct(**row).model_dump(mode="json", include=include)
+            for row in page.rows
+        ]
+    )
+
+
+def render_page(page: Page, schema: type[BaseModel]) -> Response:
+    return Response(
+        page_body(page, schema), media_type="application/json", headers=page_headers(page)
+    )
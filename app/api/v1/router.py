@@ -1,5 +1,9 @@
 from fastapi import APIRouter
 
+from app.api.v1.endpoints.allocations import router as allocations_router
+from app.api.v1.endpoints.cycle_counts import router as cycle_counts_router
+from app.api.v1.endpoints.diagnostics import router as diagnostics_router
+from app.api.v1.endpoints.events import router as events_router
 from app.api.v1.endpoints.executors import router as executors_router
 from app.api.v1.endpoints.handling_units import router as handling_units_router
 from app.api.v1.endpoints.health import router as health_router
@@ -9,9 +13,17 @@ from app.api.v1.endpoints.materials import router as materials_router
 from app.api.v1.endpoints.missions import router as missions_router
 from app.api.v1.endpoints.movements import router as movements_router
 from app.api.v1.endpoints.operators import router as operators_router
+from app.api.v1.endpoints.outbox import router as outbox_router
+from app.api.v1.endpoints.putaway import router as putaway_router
+from app.api.v1.endpoints.replenishment import router as replenishment_router
+from app.api.v1.endpoints.reports import router as reports_router
 from app.api.v1.endpoints.requests import router as requests_router
 from app.api.v1.endpoints.rules import router as rules_router
+from app.api.v1.endpoints.search import router as search_router
+from app.api.v1.endpoints.slotting import router as slotting_router
+from app.api.v1.endpoints.sync import router as sync_router
 from app.api.v1.endpoints.vehicles import router as vehicles_router
+from app.api.v1.endpoints.waves import router as waves_router
 
 api_router = APIRouter()
 api_router.include_router(health_router, tags=["Health"])
@@ -26,3 +38,15 @@ api_router.include_router(missions_router, tags=["Mission"])
 api_router.include_router(requests_router, tags=["Request"])
 api_router.include_router(movements_router, tags=["Movement"])
 api_router.include_router(rules_router, tags=["Rules"])
+api_router.include_router(waves_router, tags=["Wave"])
+api_router.include_router(events_router, tags=["Event"])
+api_router.include_router(outbox_router, tags=["Outbox"])
+api_router.include_router(sync_router, tags=["Sync"])
+api_router.include_router(diagnostics_router, tags=["Diagnostics"])
+api_router.include_router(reports_router, tags=["Report"])
+api_router.include_router(slotting_router, tags=["Slotting"])
+api_router.include_router(putaway_router, tags=["Putaway"])
+api_router.include_router(allocations_router, tags=["Allocation"])
+api_router.include_router(replenishment_router, tags=["Replenishment"])
+api_router.include_router(cycle_counts_router, tags=["Cycle Count"])
+api_router.include_router(search_router, tags=["Search"])
@@ -0,0 +1,3 @@
+from app.archive.movements import read_movement_archive, write_movement_archive
+
+__all__ = ["read_movement_archive", "write_movement_archive"]
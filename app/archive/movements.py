@@ -0,0 +1,144 @@
+"""Columnar archive files for closed ledger periods.
+
+One file holds one month of movements as a compressed NumPy ``.npz``: one
+array per column, ``-1`` for missing ids, ``executed_at`` as UTC epoch
+microseconds, and text columns as a UTF-8 byte buffer plus offsets (the same
+layout Arrow uses), so a file loads without pickling and without padding
+every string to its maximum width.
+"""
+
+import os
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from pathlib import Path
+
+import numpy as np
+
+from app.db.models.inventory import InventoryMovement, InventoryMovementType
+
+ID_COLUMNS = (
+    "id",
+    "mission_line_id",
+    "item_id",
+    "from_location_id",
+    "to_location_id",
+    "from_hu_id",
+    "to_hu_id",
+    "qty",
+    "executed_by_executor_id",
+)
+TEXT_COLUMNS = ("movement_type", "idempotency_key", "reason")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Rows are returned with naive UTC timestamps, as SQLite hands back DateTime columns.
+_NAIVE_EPOCH = _EPOCH.replace(tzinfo=None)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return (
+        value.replace(tzinfo=timezone.utc)
+        if value.tzinfo is None
+        else value.astimezone(timezone.utc)
+    )
+
+
+def _to_micros(value: datetime) -> int:
+    delta = _as_utc(value) - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _pack_text(values: list[str | None]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    encoded = [value.encode("utf-8") if value is not None else b"" for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    present = np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+    return data, offsets, present
+
+
+def _unpack_text(data: np.ndarray, offsets: np.ndarray, present: np.ndarray) -> list[str | None]:
+    raw = data.tobytes()
+    return [
+        raw[offsets[i] : offsets[i + 1]].decode("utf-8") if present[i] else None
+        for i in range(present.size)
+    ]
+
+
+def write_movement_archive(path: Path, movements: Iterable[InventoryMovement | dict]) -> int:
+    """Write ``movements`` to ``path`` atomically. Returns the number of rows written.
+
+    Movements are entities or rows read back by :func:`read_movement_archive`.
+    """
+    columns: dict[str, list] = {name: [] for name in (*ID_COLUMNS, "executed_at", *TEXT_COLUMNS)}
+    for movement in movements:
+        field = movement.__getitem__ if isinstance(movement, dict) else partial(getattr, movement)
+        for name in ID_COLUMNS:
+            value = field(name)
+            columns[name].append(-1 if value is None else value)
+        columns["executed_at"].append(_to_micros(field("executed_at")))
+        columns["movement_type"].append(field("movement_type").value)
+        columns["idempotency_key"].append(field("idempotency_key"))
+        columns["reason"].append(field("reason"))
+
+    arrays = {
+        name: np.asarray(columns[name], dtype=np.int64) for name in (*ID_COLUMNS, "executed_at")
+    }
+    for name in TEXT_COLUMNS:
+        data, offsets, present = _pack_text(columns[name])
+        arrays[f"{name}.data"] = data
+        arrays[f"{name}.offsets"] = offsets
+        arrays[f"{name}.present"] = present
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as handle:
+        np.savez_compressed(handle, **arrays)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    return int(arrays["id"].size)
+
+
+@lru_cache(maxsize=8)
+def _load(path: str, mtime_ns: int) -> dict[str, np.ndarray]:
+    with np.load(path) as archive:
+        return {name: archive[name] for name in archive.files}
+
+
+def read_movement_archive(
+    path: Path,
+    *,
+    executed_from: datetime | None = None,
+    executed_to: datetime | None = None,
+) -> list[dict]:
+    """Rows of an archive file shaped like ``InventoryMovement``, filtered on ``executed_at``."""
+    arrays = _load(str(path), path.stat().st_mtime_ns)
+    executed_at = arrays["executed_at"]
+    keep = np.ones(executed_at.size, dtype=bool)
+    if executed_from is not None:
+        keep &= executed_at >= _to_micros(executed_from)
+    if executed_to is not None:
+        keep &= executed_at < _to_micros(executed_to)
+    rows = np.flatnonzero(keep)
+    if rows.size == 0:
+        return []
+
+    columns = {name: arrays[name][rows].tolist() for name in ID_COLUMNS}
+    micros = executed_at[rows].tolist()
+    texts = {
+        name: _unpack_text(
+            arrays[f"{name}.data"], arrays[f"{name}.offsets"], arrays[f"{name}.present"]
+        )
+        for name in TEXT_COLUMNS
+    }
+    result = []
+    for position, row in enumerate(rows.tolist()):
+        record = {name: columns[name][position] for name in ID_COLUMNS}
+        record.update({name: None for name in ID_COLUMNS if record[name] == -1})
+        record["executed_at"] = _NAIVE_EPOCH + timedelta(microseconds=micros[position])
+        record["movement_type"] = InventoryMovementType(texts["movement_type"][row])
+        record["idempotency_key"] = texts["idempotency_key"][row]
+        record["reason"] = texts["reason"][row]
+        result.append(record)
+    return result
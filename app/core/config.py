@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -5,6 +7,49 @@ class Settings(BaseSettings):
     app_name: str = "Warehouse Management System API"
     app_version: str = "0.1.0"
     database_url: str = "sqlite:///./wms.db"
+    database_read_url: str | None = None
+    database_read_pool_size: int = 8
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size: int = 268435456
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    sqlite_page_size: int = 4096
+    sqlite_checkpoint_interval_seconds: float = 30.0
+    sqlite_wal_truncate_bytes: int = 67108864
+    sqlite_optimize_interval_seconds: float = 3600.0
+    travel_matrix_dir: str = "./var/travel-matrix"
+    travel_vertical_weight: float = 1.0
+    travel_refresh_seconds: float | None = 5.0
+    assignment_priority_weight: float = 10.0
+    event_replay_size: int = 10000
+    event_queue_size: int = 1000
+    event_heartbeat_seconds: float = 15.0
+    outbox_sink: str = "none"
+    outbox_sink_target: str = "./var/outbox/messages.jsonl"
+    outbox_batch_size: int = 500
+    outbox_poll_seconds: float = 1.0
+    outbox_retention_hours: float | None = 168.0
+    write_queue_enabled: bool = False
+    write_queue_max_batch: int = 64
+    ledger_archive_dir: str = "./var/ledger-archive"
+    ledger_retain_months: int = 3
+    ledger_archive_interval_hours: float | None = None
+    report_refresh_seconds: float | None = 60.0
+    report_batch_size: int = 5000
+    slotting_window_days: int = 90
+    slotting_a_share: float = 0.8
+    slotting_b_share: float = 0.95
+    slotting_batch_size: int = 10000
+    slotting_refresh_hours: float | None = 24.0
+    replenishment_interval_seconds: float | None = 5.0
+    search_window: int = 500
+    response_cache_size: int = 0
+    export_dir: str = "./var/export"
+    export_chunk_size: int = 10000
+    export_rows_per_file: int = 1000000
+    export_compression: Literal["zstd", "snappy", "gzip", "none"] = "zstd"
+    export_workers: int = 1
+    export_interval_minutes: float | None = None
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -0,0 +1,31 @@
+"""Fixed-point quantities.
+
+Quantities are stored and computed as integer milli-units (``1.5`` is
+``1500``). Decimal values only exist at the API boundary, where the schemas
+convert them exactly in both directions.
+"""
+
+from decimal import Decimal, InvalidOperation
+
+QTY_SCALE = 1000
+QTY_DECIMALS = 3
+
+
+def to_milli(value: Decimal | int | str) -> int:
+    """Exact conversion to milli-units; raises ``ValueError`` for finer precision."""
+    try:
+        scaled = Decimal(str(value)).scaleb(QTY_DECIMALS)
+    except InvalidOperation as exc:
+        raise ValueError(f"Invalid quantity: {value!r}") from exc
+    if not scaled.is_finite() or scaled != scaled.to_integral_value():
+        raise ValueError(f"Quantity supports at most {QTY_DECIMALS} decimal places")
+    return int(scaled)
+
+
+def from_milli(value: int) -> Decimal:
+    return Decimal(value).scaleb(-QTY_DECIMALS)
+
+
+def scale_milli(qty: int, per_unit: int) -> int:
+    """Milli-unit ``qty`` times a milli-unit ``per_unit`` measure, in milli-units (rounded down)."""
+    return qty * per_unit // QTY_SCALE
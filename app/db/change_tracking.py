@@ -0,0 +1,58 @@
+"""Change sequence numbers for delta sync.
+
+Every row of a :class:`ChangeTracked` table carries ``change_seq``, the value
+of a global counter at the time it was last inserted or updated. Clients keep
+the highest value they have seen and ask only for rows above it.
+
+Numbers are allocated in ``before_flush`` by incrementing the counter row, so
+the allocating transaction takes SQLite's write lock before writing the rows
+and holds it until commit. Sequence order therefore matches commit order and a
+reader can never observe seq N+1 committed while N is still in flight. Bulk
+UPDATE statements bypass the flush and must set ``change_seq`` themselves via
+:func:`next_change_seq`.
+"""
+
+from sqlalchemy import BigInteger, event, insert, update
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.db.models.sync import SyncSequence
+
+_SEQUENCE_ROW = 1
+
+
+class ChangeTracked:
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0", index=True
+    )
+
+
+def next_change_seq(db: Session, count: int = 1) -> int:
+    """Reserve ``count`` consecutive numbers and return the highest."""
+    connection = db.connection()
+    statement = (
+        update(SyncSequence)
+        .where(SyncSequence.id == _SEQUENCE_ROW)
+        .values(value=SyncSequence.value + count)
+        .returning(SyncSequence.value)
+    )
+    value = connection.execute(statement).scalar()
+    if value is None:
+        connection.execute(insert(SyncSequence).values(id=_SEQUENCE_ROW, value=count))
+        value = count
+    return value
+
+
+@event.listens_for(Session, "before_flush")
+def _stamp_change_seq(session: Session, flush_context, instances) -> None:
+    changed = [entity for entity in session.new if isinstance(entity, ChangeTracked)]
+    changed += [
+        entity
+        for entity in session.dirty
+        if isinstance(entity, ChangeTracked)
+        and session.is_modified(entity, include_collections=False)
+    ]
+    if not changed:
+        return
+    last = next_change_seq(session, len(changed))
+    for offset, entity in enumerate(changed, start=last - len(changed) + 1):
+        entity.change_seq = offset
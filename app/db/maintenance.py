@@ -0,0 +1,163 @@
+"""Background WAL checkpointing and statistics upkeep for SQLite.
+
+SQLite's automatic checkpoint runs on the committing connection and gives up
+whenever a reader is active, so under a steady stream of movement writes the
+WAL file can keep growing. This thread runs a PASSIVE checkpoint on a timer,
+which never blocks writers. When the WAL has grown past
+``sqlite_wal_truncate_bytes`` it runs a TRUNCATE checkpoint instead, which
+waits for readers to finish and resets the file to zero bytes. ``PRAGMA
+optimize`` is run periodically so the query planner statistics stay current.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CheckpointStats:
+    running: bool = False
+    checkpoints: int = 0
+    truncations: int = 0
+    busy: int = 0
+    failures: int = 0
+    last_mode: str | None = None
+    last_checkpoint_at: datetime | None = None
+    last_wal_frames: int | None = None
+    last_checkpointed_frames: int | None = None
+    last_wal_bytes_before: int | None = None
+    last_wal_bytes_after: int | None = None
+    last_optimize_at: datetime | None = None
+    last_error: str | None = None
+
+
+class SQLiteMaintenance:
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        interval_seconds: float,
+        truncate_bytes: int,
+        optimize_interval_seconds: float,
+    ) -> None:
+        self.engine = engine
+        self.interval_seconds = interval_seconds
+        self.truncate_bytes = truncate_bytes
+        self.optimize_interval_seconds = optimize_interval_seconds
+        self.stats = CheckpointStats()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_optimize = time.monotonic()
+
+    @property
+    def wal_path(self) -> Path:
+        return Path(f"{self.engine.url.database}-wal")
+
+    def wal_bytes(self) -> int:
+        try:
+            return self.wal_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="sqlite-maintenance", daemon=True
+            )
+            self._thread.start()
+            self.stats.running = True
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.stats.running = False
+
+    def checkpoint(self, mode: str | None = None) -> tuple[int, int, int]:
+        """Run one checkpoint; PASSIVE unless the WAL is over the truncate threshold.
+
+        Returns SQLite's ``(busy, wal_frames, checkpointed_frames)``.
+        """
+        before = self.wal_bytes()
+        mode = mode or ("TRUNCATE" if before >= self.truncate_bytes else "PASSIVE")
+        with self.engine.connect() as connection:
+            busy, wal_frames, checkpointed = connection.exec_driver_sql(
+                f"PRAGMA wal_checkpoint({mode});"
+            ).one()
+
+        self.stats.checkpoints += 1
+        self.stats.truncations += mode == "TRUNCATE" and not busy
+        self.stats.busy += bool(busy)
+        self.stats.last_mode = mode
+        self.stats.last_checkpoint_at = datetime.now(tz=timezone.utc)
+        self.stats.last_wal_frames = wal_frames
+        self.stats.last_checkpointed_frames = checkpointed
+        self.stats.last_wal_bytes_before = before
+        self.stats.last_wal_bytes_after = self.wal_bytes()
+        return busy, wal_frames, checkpointed
+
+    def optimize(self) -> None:
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA optimize;")
+        self.stats.last_optimize_at = datetime.now(tz=timezone.utc)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.checkpoint()
+                if time.monotonic() - self._last_optimize >= self.optimize_interval_seconds:
+                    self.optimize()
+                    self._last_optimize = time.monotonic()
+            except Exception as exc:
+                self.stats.failures += 1
+                self.stats.last_error = f"{type(exc).__name__}: {exc}"
+                logger.warning("SQLite maintenance failed: %s", exc)
+
+
+DIAGNOSTIC_PRAGMAS = (
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "page_size",
+    "page_count",
+    "freelist_count",
+    "wal_autocheckpoint",
+    "busy_timeout",
+)
+
+
+def read_pragmas(connection: Connection) -> dict[str, int | str]:
+    return {
+        name: connection.exec_driver_sql(f"PRAGMA {name};").scalar() for name in DIAGNOSTIC_PRAGMAS
+    }
+
+
+_maintenance: SQLiteMaintenance | None = None
+
+
+def get_maintenance() -> SQLiteMaintenance | None:
+    return _maintenance
+
+
+def start_maintenance(maintenance: SQLiteMaintenance) -> None:
+    global _maintenance
+    _maintenance = maintenance
+    maintenance.start()
+
+
+def stop_maintenance() -> None:
+    global _maintenance
+    if _maintenance is not None:
+        _maintenance.stop()
+        _maintenance = None
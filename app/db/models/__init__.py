@@ -1,24 +1,51 @@
+from app.db.models.cycle_count import (
+    CycleCount,
+    CycleCountLine,
+    CycleCountLineStatus,
+    CycleCountState,
+)
 from app.db.models.executor import Executor, ExecutorType
-from app.db.models.handling_unit import HandlingUnit
+from app.db.models.handling_unit import HandlingUnit, HandlingUnitClosure
 from app.db.models.inventory import InventoryMovement, InventoryMovementType, InventoryPosition
 from app.db.models.item import Item
 from app.db.models.location import Location, LocationType
 from app.db.models.mission import Mission, MissionLine, MissionState, MissionType
+from app.db.models.movement_archive import MovementArchive
 from app.db.models.operator import Operator
+from app.db.models.outbox import OutboxMessage
+from app.db.models.replenishment import ReplenishmentRule
+from app.db.models.report import MissionStat, MovementStat, ReportGranularity, ReportWatermark
+from app.db.models.slotting import ItemAffinity, ItemPickStat
+from app.db.models.sync import SyncSequence
 
 __all__ = [
+    "CycleCount",
+    "CycleCountLine",
+    "CycleCountLineStatus",
+    "CycleCountState",
     "Executor",
     "ExecutorType",
     "HandlingUnit",
+    "HandlingUnitClosure",
     "InventoryMovement",
     "InventoryMovementType",
     "InventoryPosition",
     "Item",
+    "ItemAffinity",
+    "ItemPickStat",
     "Location",
     "LocationType",
     "Mission",
     "MissionLine",
+    "MissionStat",
     "MissionState",
     "MissionType",
+    "MovementArchive",
+    "MovementStat",
     "Operator",
+    "OutboxMessage",
+    "ReplenishmentRule",
+    "ReportGranularity",
+    "ReportWatermark",
+    "SyncSequence",
 ]
@@ -0,0 +1,114 @@
+from datetime import datetime
+from enum import StrEnum
+
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    Enum,
+    ForeignKey,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class CycleCountState(StrEnum):
+    OPEN = "open"
+    POSTED = "posted"
+    CANCELLED = "cancelled"
+
+
+class CycleCountLineStatus(StrEnum):
+    COUNTED = "counted"
+    POSTED = "posted"
+    # The position changed since it was counted, or holds more reserved
+    # stock than was counted; the line needs a recount.
+    STALE = "stale"
+    REJECTED = "rejected"
+
+
+class CycleCount(Base):
+    """A count of the stock at one location or at every location of a zone."""
+
+    __tablename__ = "cycle_counts"
+    __table_args__ = (
+        CheckConstraint(
+            "location_id IS NOT NULL OR zone IS NOT NULL", name="ck_cycle_counts_scope"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    count_no: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    location_id: Mapped[int | None] = mapped_column(
+        ForeignKey("locations.id", ondelete="RESTRICT"), nullable=True
+    )
+    zone: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    state: Mapped[CycleCountState] = mapped_column(
+        Enum(CycleCountState, name="cycle_count_state", native_enum=False),
+        nullable=False,
+        default=CycleCountState.OPEN,
+        server_default=CycleCountState.OPEN.value,
+        index=True,
+    )
+    created_by_operator_id: Mapped[int] = mapped_column(
+        ForeignKey("operators.id", ondelete="RESTRICT"), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    closed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class CycleCountLine(Base):
+    """One counted ``(hu_id, item_id)``.
+
+    ``system_qty`` and ``system_version`` are the position at count time.
+    """
+
+    __tablename__ = "cycle_count_lines"
+    __table_args__ = (
+        UniqueConstraint(
+            "cycle_count_id", "hu_id", "item_id", name="uq_cycle_count_lines_count_hu_item"
+        ),
+        CheckConstraint("counted_qty >= 0", name="ck_cycle_count_lines_counted_non_negative"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    cycle_count_id: Mapped[int] = mapped_column(
+        ForeignKey("cycle_counts.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    hu_id: Mapped[int] = mapped_column(
+        ForeignKey("handling_units.id", ondelete="CASCADE"), nullable=False
+    )
+    item_id: Mapped[int] = mapped_column(
+        ForeignKey("items.id", ondelete="RESTRICT"), nullable=False
+    )
+    location_id: Mapped[int] = mapped_column(
+        ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False
+    )
+    # Quantities are integer milli-units, see app.core.quantity.
+    counted_qty: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    system_qty: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    variance: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # 0 when the position did not exist.
+    system_version: Mapped[int] = mapped_column(nullable=False)
+    status: Mapped[CycleCountLineStatus] = mapped_column(
+        Enum(CycleCountLineStatus, name="cycle_count_line_status", native_enum=False),
+        nullable=False,
+        default=CycleCountLineStatus.COUNTED,
+        server_default=CycleCountLineStatus.COUNTED.value,
+    )
+    counted_by_executor_id: Mapped[int | None] = mapped_column(
+        ForeignKey("executors.id", ondelete="SET NULL"), nullable=True
+    )
+    counted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    idempotency_key: Mapped[str | None] = mapped_column(String(128), unique=True, nullable=True)
+    movement_id: Mapped[int | None] = mapped_column(
+        ForeignKey("inventory_movements.id", ondelete="SET NULL"), nullable=True
+    )
@@ -1,11 +1,11 @@
 from datetime import datetime
-from decimal import Decimal
 from enum import StrEnum
 
-from sqlalchemy import Boolean, DateTime, Enum, Numeric, String, func
+from sqlalchemy import BigInteger, Boolean, DateTime, Enum, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.change_tracking import ChangeTracked
 
 
 class ExecutorType(StrEnum):
@@ -13,7 +13,7 @@ class ExecutorType(StrEnum):
     AGV = "agv"
 
 
-class Executor(Base):
+class Executor(ChangeTracked, Base):
     __tablename__ = "executors"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -25,8 +25,8 @@ class Executor(Base):
         default=ExecutorType.HUMAN,
         server_default=ExecutorType.HUMAN.value,
     )
-    max_payload_kg: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2), nullable=False, default=Decimal("500"), server_default="500"
+    max_payload_kg: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=500_000, server_default="500000"
     )
     active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default="1")
     last_seen_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -1,10 +1,11 @@
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, func
+from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.change_tracking import ChangeTracked
 
 
 class HandlingUnitStatus(StrEnum):
@@ -13,23 +14,36 @@ class HandlingUnitStatus(StrEnum):
     BLOCKED = "blocked"
 
 
-class HandlingUnit(Base):
+class HandlingUnit(ChangeTracked, Base):
     __tablename__ = "handling_units"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     hu_code: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
-    location_id: Mapped[int] = mapped_column(ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False)
+    location_id: Mapped[int] = mapped_column(
+        ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False
+    )
+    parent_hu_id: Mapped[int | None] = mapped_column(
+        ForeignKey("handling_units.id", ondelete="RESTRICT"), nullable=True, index=True
+    )
     status: Mapped[HandlingUnitStatus] = mapped_column(
         Enum(HandlingUnitStatus, name="handling_unit_status", native_enum=False),
         nullable=False,
         default=HandlingUnitStatus.OPEN,
         server_default=HandlingUnitStatus.OPEN.value,
     )
+    # Integer milli-kg, see app.core.quantity. The gross weight is the tare plus
+    # the stock in the unit and in every unit nested in it.
+    tare_kg: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    gross_weight_kg: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
     location = relationship("Location", back_populates="handling_units")
+    parent = relationship("HandlingUnit", remote_side=[id], back_populates="children")
+    children = relationship("HandlingUnit", back_populates="parent")
     positions = relationship("InventoryPosition", back_populates="handling_unit")
     mission_lines = relationship("MissionLine", back_populates="handling_unit")
     movement_source_hus = relationship(
@@ -42,3 +56,18 @@ class HandlingUnit(Base):
         back_populates="to_handling_unit",
         foreign_keys="InventoryMovement.to_hu_id",
     )
+
+
+class HandlingUnitClosure(Base):
+    """Transitive closure of the HU nesting tree, including a depth-0 row per HU."""
+
+    __tablename__ = "handling_unit_closure"
+    __table_args__ = (Index("ix_handling_unit_closure_descendant_depth", "descendant_id", "depth"),)
+
+    ancestor_id: Mapped[int] = mapped_column(
+        ForeignKey("handling_units.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        ForeignKey("handling_units.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(nullable=False)
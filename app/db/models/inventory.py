@@ -1,11 +1,21 @@
 from datetime import datetime
-from decimal import Decimal
 from enum import StrEnum
 
-from sqlalchemy import CheckConstraint, DateTime, Enum, ForeignKey, Numeric, String, UniqueConstraint, func
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.change_tracking import ChangeTracked
 
 
 class InventoryMovementType(StrEnum):
@@ -13,7 +23,7 @@ class InventoryMovementType(StrEnum):
     ADJUSTMENT = "adjustment"
 
 
-class InventoryPosition(Base):
+class InventoryPosition(ChangeTracked, Base):
     __tablename__ = "inventory_positions"
     __table_args__ = (
         UniqueConstraint("hu_id", "item_id", name="uq_inventory_positions_hu_item"),
@@ -27,13 +37,18 @@ class InventoryPosition(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    hu_id: Mapped[int] = mapped_column(ForeignKey("handling_units.id", ondelete="CASCADE"), nullable=False)
-    item_id: Mapped[int] = mapped_column(ForeignKey("items.id", ondelete="RESTRICT"), nullable=False)
-    qty_on_hand: Mapped[Decimal] = mapped_column(
-        Numeric(18, 3), nullable=False, default=Decimal("0"), server_default="0"
+    hu_id: Mapped[int] = mapped_column(
+        ForeignKey("handling_units.id", ondelete="CASCADE"), nullable=False
     )
-    qty_reserved: Mapped[Decimal] = mapped_column(
-        Numeric(18, 3), nullable=False, default=Decimal("0"), server_default="0"
+    item_id: Mapped[int] = mapped_column(
+        ForeignKey("items.id", ondelete="RESTRICT"), nullable=False
+    )
+    # Quantities are integer milli-units, see app.core.quantity.
+    qty_on_hand: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+    qty_reserved: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
     )
     version: Mapped[int] = mapped_column(nullable=False, default=1, server_default="1")
     updated_at: Mapped[datetime] = mapped_column(
@@ -48,6 +63,8 @@ class InventoryMovement(Base):
     __tablename__ = "inventory_movements"
     __table_args__ = (
         CheckConstraint("qty > 0", name="ck_inventory_movements_qty_positive"),
+        Index("ix_inventory_movements_executed_at", "executed_at"),
+        Index("ix_inventory_movements_mission_line_id", "mission_line_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -75,7 +92,7 @@ class InventoryMovement(Base):
     to_hu_id: Mapped[int | None] = mapped_column(
         ForeignKey("handling_units.id", ondelete="RESTRICT"), nullable=True
     )
-    qty: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False)
+    qty: Mapped[int] = mapped_column(BigInteger, nullable=False)
     executed_by_executor_id: Mapped[int | None] = mapped_column(
         ForeignKey("executors.id", ondelete="SET NULL"), nullable=True
     )
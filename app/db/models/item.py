@@ -1,18 +1,22 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import BigInteger, DateTime, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.change_tracking import ChangeTracked
 
 
-class Item(Base):
+class Item(ChangeTracked, Base):
     __tablename__ = "items"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     sku: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     uom: Mapped[str] = mapped_column(String(32), nullable=False, default="ea", server_default="ea")
+    # Per unit of ``uom`` in milli-kg and milli-litres, see app.core.quantity.
+    weight_kg: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    volume_l: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -1,10 +1,21 @@
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import Boolean, DateTime, Enum, String, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    Enum,
+    Float,
+    Index,
+    String,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.change_tracking import ChangeTracked
 
 
 class LocationType(StrEnum):
@@ -14,8 +25,13 @@ class LocationType(StrEnum):
     DOCK = "dock"
 
 
-class Location(Base):
+class Location(ChangeTracked, Base):
     __tablename__ = "locations"
+    __table_args__ = (
+        CheckConstraint("hu_count >= 0", name="ck_locations_hu_count_non_negative"),
+        CheckConstraint("load_kg >= 0", name="ck_locations_load_non_negative"),
+        Index("ix_locations_zone_type", "zone", "type"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     code: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
@@ -26,7 +42,19 @@ class Location(Base):
         default=LocationType.BULK,
         server_default=LocationType.BULK.value,
     )
+    zone: Mapped[str | None] = mapped_column(String(32), nullable=True)
     active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default="1")
+    x: Mapped[float | None] = mapped_column(Float, nullable=True)
+    y: Mapped[float | None] = mapped_column(Float, nullable=True)
+    z: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Capacity limits; NULL means unlimited. Weights are integer milli-kg, see
+    # app.core.quantity.
+    max_hu: Mapped[int | None] = mapped_column(nullable=True)
+    max_weight_kg: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    # Occupancy counters, maintained by HandlingUnitRepository in the same
+    # transaction as the move: top-level units here and their gross weight.
+    hu_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    load_kg: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
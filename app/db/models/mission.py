@@ -1,8 +1,17 @@
 from datetime import datetime
-from decimal import Decimal
 from enum import StrEnum
 
-from sqlalchemy import CheckConstraint, DateTime, Enum, ForeignKey, Numeric, String, func
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -25,6 +34,7 @@ class Mission(Base):
     __tablename__ = "missions"
     __table_args__ = (
         CheckConstraint("priority >= 0", name="ck_missions_priority_non_negative"),
+        CheckConstraint("version >= 1", name="ck_missions_version_positive"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -52,10 +62,19 @@ class Mission(Base):
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     cancel_reason: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    route_distance: Mapped[float | None] = mapped_column(Float, nullable=True)
+    route_distance_saved: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Bumped on every change to the mission or its lines, see app.db.versioning.
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default="1")
 
     created_by_operator = relationship("Operator", back_populates="missions")
     assigned_executor = relationship("Executor", back_populates="assigned_missions")
-    lines = relationship("MissionLine", back_populates="mission", cascade="all, delete-orphan")
+    lines = relationship(
+        "MissionLine",
+        back_populates="mission",
+        cascade="all, delete-orphan",
+        order_by="(MissionLine.sequence, MissionLine.id)",
+    )
 
 
 class MissionLine(Base):
@@ -64,6 +83,7 @@ class MissionLine(Base):
         CheckConstraint("qty > 0", name="ck_mission_lines_qty_positive"),
         CheckConstraint("qty_done >= 0", name="ck_mission_lines_qty_done_non_negative"),
         CheckConstraint("qty_done <= qty", name="ck_mission_lines_qty_done_le_qty"),
+        CheckConstraint("reserved_qty >= 0", name="ck_mission_lines_reserved_non_negative"),
         CheckConstraint(
             "item_id IS NOT NULL OR hu_id IS NOT NULL",
             name="ck_mission_lines_item_or_hu_present",
@@ -72,24 +92,36 @@ class MissionLine(Base):
             "from_location_id != to_location_id",
             name="ck_mission_lines_source_destination_different",
         ),
+        Index("ix_mission_lines_mission_sequence", "mission_id", "sequence"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    mission_id: Mapped[int] = mapped_column(ForeignKey("missions.id", ondelete="CASCADE"), nullable=False)
+    mission_id: Mapped[int] = mapped_column(
+        ForeignKey("missions.id", ondelete="CASCADE"), nullable=False
+    )
     from_location_id: Mapped[int] = mapped_column(
         ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False
     )
     to_location_id: Mapped[int] = mapped_column(
         ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False
     )
-    item_id: Mapped[int | None] = mapped_column(ForeignKey("items.id", ondelete="RESTRICT"), nullable=True)
+    item_id: Mapped[int | None] = mapped_column(
+        ForeignKey("items.id", ondelete="RESTRICT"), nullable=True
+    )
     hu_id: Mapped[int | None] = mapped_column(
         ForeignKey("handling_units.id", ondelete="RESTRICT"), nullable=True
     )
-    qty: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False)
-    qty_done: Mapped[Decimal] = mapped_column(
-        Numeric(18, 3), nullable=False, default=Decimal("0"), server_default="0"
+    # Quantities are integer milli-units, see app.core.quantity.
+    qty: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    qty_done: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    # Stock still reserved for the line at (hu_id, item_id) by the allocator.
+    reserved_qty: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
     )
+    # Weight of the full line qty in milli-kg, fixed when the line is created;
+    # NULL when the item had no weight then.
+    payload_kg: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    sequence: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
 
     mission = relationship("Mission", back_populates="lines")
     from_location = relationship(
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class MovementArchive(Base):
+    """Catalog entry for one closed month of movements moved out of ``inventory_movements``."""
+
+    __tablename__ = "movement_archives"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    period: Mapped[str] = mapped_column(String(7), unique=True, nullable=False)
+    path: Mapped[str] = mapped_column(String(500), nullable=False)
+    row_count: Mapped[int] = mapped_column(nullable=False)
+    first_movement_id: Mapped[int] = mapped_column(nullable=False)
+    last_movement_id: Mapped[int] = mapped_column(nullable=False)
+    first_executed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_executed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
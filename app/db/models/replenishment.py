@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.db.change_tracking import ChangeTracked
+
+
+class ReplenishmentRule(ChangeTracked, Base):
+    """Min/max thresholds of one item at one PICK location.
+
+    ``open_mission_id`` is the last replenishment mission created for the
+    rule; no new one is created while it is still open.
+    """
+
+    __tablename__ = "replenishment_rules"
+    __table_args__ = (
+        UniqueConstraint("item_id", "location_id", name="uq_replenishment_rules_item_location"),
+        CheckConstraint("min_qty >= 0", name="ck_replenishment_rules_min_non_negative"),
+        CheckConstraint("max_qty > min_qty", name="ck_replenishment_rules_max_above_min"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id", ondelete="CASCADE"), nullable=False)
+    location_id: Mapped[int] = mapped_column(
+        ForeignKey("locations.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    # Integer milli-units, see app.core.quantity.
+    min_qty: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    max_qty: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    priority: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default="1")
+    created_by_operator_id: Mapped[int] = mapped_column(
+        ForeignKey("operators.id", ondelete="RESTRICT"), nullable=False
+    )
+    open_mission_id: Mapped[int | None] = mapped_column(
+        ForeignKey("missions.id", ondelete="SET NULL"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -0,0 +1,69 @@
+from datetime import datetime
+from enum import StrEnum
+
+from sqlalchemy import BigInteger, DateTime, Enum, Float, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ReportGranularity(StrEnum):
+    HOUR = "hour"
+    DAY = "day"
+
+
+class MovementStat(Base):
+    """Movements and units moved per time bucket, executor, movement type and location type.
+
+    ``location_type`` is the type of the destination location, or of the source
+    for movements that only remove stock.
+    """
+
+    __tablename__ = "movement_stats"
+    __table_args__ = (Index("ix_movement_stats_bucket", "granularity", "bucket_start"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    granularity: Mapped[ReportGranularity] = mapped_column(
+        Enum(ReportGranularity, name="report_granularity", native_enum=False), nullable=False
+    )
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    executor_id: Mapped[int | None] = mapped_column(nullable=True)
+    movement_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    location_type: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    movement_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Integer milli-units, see app.core.quantity.
+    qty: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class MissionStat(Base):
+    """Finished missions and their cycle time per bucket and executor.
+
+    The cycle time runs from ``started_at`` to ``completed_at``.
+    """
+
+    __tablename__ = "mission_stats"
+    __table_args__ = (Index("ix_mission_stats_bucket", "granularity", "bucket_start"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    granularity: Mapped[ReportGranularity] = mapped_column(
+        Enum(ReportGranularity, name="report_granularity", native_enum=False), nullable=False
+    )
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    executor_id: Mapped[int | None] = mapped_column(nullable=True)
+    completed_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    cancelled_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    timed_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    cycle_seconds_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    cycle_seconds_max: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+
+class ReportWatermark(Base):
+    """Last source row folded into the aggregates, per source.
+
+    The sources are ``movements`` and ``mission_events``.
+    """
+
+    __tablename__ = "report_watermarks"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ItemPickStat(Base):
+    """Picks (item movements of type ``move``) of one item on one UTC day."""
+
+    __tablename__ = "item_pick_stats"
+    __table_args__ = (UniqueConstraint("day", "item_id", name="uq_item_pick_stats_day_item"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    day: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id", ondelete="CASCADE"), nullable=False)
+    pick_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Integer milli-units, see app.core.quantity.
+    qty: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class ItemAffinity(Base):
+    """Number of completed missions that moved both items; ``item_a_id < item_b_id``."""
+
+    __tablename__ = "item_affinities"
+
+    item_a_id: Mapped[int] = mapped_column(
+        ForeignKey("items.id", ondelete="CASCADE"), primary_key=True
+    )
+    item_b_id: Mapped[int] = mapped_column(
+        ForeignKey("items.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    copick_count: Mapped[int] = mapped_column(nullable=False, default=0)
@@ -0,0 +1,13 @@
+from sqlalchemy import BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SyncSequence(Base):
+    """Single-row counter that hands out change sequence numbers."""
+
+    __tablename__ = "sync_sequence"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
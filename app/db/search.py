@@ -0,0 +1,57 @@
+"""Full-text search indexes over item, location and handling unit codes.
+
+Each searchable table has an FTS5 table over its code and name columns,
+created by migration ``20261019_0016``. The FTS tables are external-content
+tables: they store only the trigram index, read the text from the source
+table, and are kept in sync by triggers on INSERT, DELETE and on UPDATE of the
+indexed columns, so the frequent updates of counters and ``change_seq`` never
+touch the index. A migration that rebuilds a source table in batch mode drops
+its triggers and has to create them again.
+
+The trigram tokenizer matches any substring of at least three characters,
+case-insensitively, so a partial code typed on a scanner matches wherever it
+occurs in the code.
+"""
+
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class SearchKind(StrEnum):
+    ITEM = "item"
+    LOCATION = "location"
+    HANDLING_UNIT = "handling_unit"
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    kind: SearchKind
+    table: str
+    source: str
+    code_column: str
+    name_column: str | None
+
+
+SEARCH_INDEXES = (
+    SearchIndex(SearchKind.ITEM, "items_search", "items", "sku", "name"),
+    SearchIndex(SearchKind.LOCATION, "locations_search", "locations", "code", "name"),
+    SearchIndex(
+        SearchKind.HANDLING_UNIT, "handling_units_search", "handling_units", "hu_code", None
+    ),
+)
+
+# Shortest substring the trigram tokenizer can match.
+MIN_TERM_LENGTH = 3
+
+# FTS5 keeps each index in shadow tables named after it.
+_SHADOW_SUFFIXES = ("", "_data", "_idx", "_docsize", "_config", "_content")
+
+
+def is_search_table(name: str) -> bool:
+    """Whether ``name`` is an FTS table or one of its shadow tables.
+
+    The ORM metadata does not describe these tables.
+    """
+    return any(
+        name == f"{index.table}{suffix}" for index in SEARCH_INDEXES for suffix in _SHADOW_SUFFIXES
+    )
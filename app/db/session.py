@@ -1,9 +1,13 @@
 from collections.abc import Generator
 
-from sqlalchemy import create_engine, event
+from fastapi import Request
+from sqlalchemy import Engine, create_engine, event, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.db import versioning  # noqa: F401  registers the mission version listener
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
 connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
 
@@ -11,18 +15,81 @@ engine = create_engine(settings.database_url, connect_args=connect_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _apply_performance_profile(cursor) -> None:
+    cursor.execute(f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib};")
+    cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size};")
+    cursor.execute(f"PRAGMA temp_store={settings.sqlite_temp_store};")
+
+
 @event.listens_for(engine, "connect")
 def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:  # noqa: ANN001, ARG001
     cursor = dbapi_connection.cursor()
+    # Only takes effect while the database file is still empty.
+    cursor.execute(f"PRAGMA page_size={settings.sqlite_page_size};")
     cursor.execute("PRAGMA foreign_keys=ON;")
     cursor.execute("PRAGMA journal_mode=WAL;")
     cursor.execute("PRAGMA busy_timeout=5000;")
+    cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous};")
+    _apply_performance_profile(cursor)
     cursor.close()
 
 
-def get_db() -> Generator[Session, None, None]:
+def _create_read_engine() -> Engine:
+    """Engine for read-only sessions.
+
+    ``database_read_url`` points reads at a replica. Without it, file-based
+    SQLite databases are reopened with ``mode=ro`` and ``query_only`` so readers
+    get their own pooled connections and can never take the write lock; any
+    other database shares the write engine.
+    """
+    if settings.database_read_url:
+        return create_engine(settings.database_read_url, pool_size=settings.database_read_pool_size)
+
+    url = make_url(settings.database_url)
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return engine
+
+    read_url = url.set(
+        database=f"file:{url.database}", query={**url.query, "mode": "ro", "uri": "true"}
+    )
+    read_engine = create_engine(
+        read_url,
+        connect_args={"check_same_thread": False},
+        pool_size=settings.database_read_pool_size,
+    )
+
+    @event.listens_for(read_engine, "connect")
+    def _set_read_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA query_only=ON;")
+        cursor.execute("PRAGMA busy_timeout=5000;")
+        _apply_performance_profile(cursor)
+        cursor.close()
+
+    return read_engine
+
+
+read_engine = _create_read_engine()
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+
+def get_write_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """Session on the read engine, for endpoints that never write."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_db(request: Request) -> Generator[Session, None, None]:
+    """Read session for safe HTTP methods, write session for everything else."""
+    yield from (get_read_db() if request.method in READ_METHODS else get_write_db())
@@ -0,0 +1,60 @@
+"""Row versions of missions, for conditional GETs of a mission.
+
+``Mission.version`` starts at 1 and is bumped in ``before_flush`` whenever the
+mission or one of its lines is added, changed or removed through the ORM, so
+an ETag built from it changes with every change to the mission's payload.
+Bulk statements on missions or lines bypass the flush and bump the version
+themselves through :meth:`~app.repositories.mission.MissionRepository.bump_versions`.
+"""
+
+from sqlalchemy import event, inspect, update
+from sqlalchemy.orm import Session
+
+from app.db.models.mission import Mission, MissionLine
+
+
+def _line_mission_ids(session: Session) -> set[int]:
+    mission_ids = set()
+    for entity in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(entity, MissionLine):
+            continue
+        if entity in session.dirty and not session.is_modified(entity, include_collections=False):
+            continue
+        # A line moved to another mission changes both.
+        mission_ids.update(
+            value for value in inspect(entity).attrs.mission_id.history.deleted if value is not None
+        )
+        mission_id = entity.mission_id
+        if mission_id is None:
+            # A new line attached through ``Mission.lines``; reading the
+            # loaded value never lazy-loads inside the flush.
+            mission = inspect(entity).attrs.mission.loaded_value
+            mission_id = getattr(mission, "id", None)
+        if mission_id is not None:
+            mission_ids.add(mission_id)
+    return mission_ids
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_mission_versions(session: Session, flush_context, instances) -> None:
+    missions = {
+        entity
+        for entity in session.dirty
+        if isinstance(entity, Mission) and session.is_modified(entity, include_collections=False)
+    }
+    unloaded = []
+    for mission_id in _line_mission_ids(session):
+        mission = session.identity_map.get(session.identity_key(Mission, mission_id))
+        if mission is None:
+            unloaded.append(mission_id)
+        elif mission not in session.new:
+            missions.add(mission)
+    for mission in missions:
+        mission.version = Mission.version + 1
+    if unloaded:
+        session.execute(
+            update(Mission)
+            .where(Mission.id.in_(unloaded))
+            .values(version=Mission.version + 1)
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,195 @@
+"""Single-writer pipeline with group commit, for SQLite deployments.
+
+SQLite allows one writer at a time. When many request threads write
+concurrently they queue on ``busy_timeout`` and each pays for its own commit
+(an fsync of the WAL). With the write queue enabled, mutating work is handed
+to one dedicated thread instead. The thread takes every job that is waiting,
+runs each inside its own SAVEPOINT so a failing job only undoes itself, and
+commits the whole group in one transaction. Each caller's future resolves
+with its own result or exception once the group is durable.
+
+Jobs run on the writer thread with the writer's session, so they must return
+plain data (a response schema, ids) rather than ORM instances.
+"""
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.events.broker import discard_staged_since, staged_mark
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class WriteQueueStats:
+    groups_committed: int = 0
+    jobs_committed: int = 0
+    jobs_failed: int = 0
+    largest_group: int = 0
+    commit_failures: int = 0
+
+
+@dataclass
+class _WriteJob:
+    work: Callable[[Session], Any]
+    future: Future
+
+
+class WriteQueue:
+    def __init__(self, session_factory: sessionmaker[Session], *, max_batch: int = 64) -> None:
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.stats = WriteQueueStats()
+        self._jobs: queue.Queue[_WriteJob | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def backlog(self) -> int:
+        return self._jobs.qsize()
+
+    def submit(self, work: Callable[[Session], T]) -> "Future[T]":
+        if self._thread is None:
+            raise RuntimeError("Write queue is not running")
+        future: Future[T] = Future()
+        self._jobs.put(_WriteJob(work=work, future=future))
+        return future
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Finish the jobs already queued, then stop the writer thread."""
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            group = [job]
+            stopping = False
+            while len(group) < self.max_batch:
+                try:
+                    queued = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if queued is None:
+                    stopping = True
+                    break
+                group.append(queued)
+            self._commit_group(group)
+            if stopping:
+                return
+
+    def _commit_group(self, group: list[_WriteJob]) -> None:
+        outcomes: list[tuple[_WriteJob, bool, Any]] = []
+        with self.session_factory() as db:
+            try:
+                self._begin(db)
+                for job in group:
+                    if not job.future.set_running_or_notify_cancel():
+                        continue
+                    mark = staged_mark(db)
+                    try:
+                        with db.begin_nested():
+                            result = job.work(db)
+                        outcomes.append((job, True, result))
+                    except Exception as exc:
+                        discard_staged_since(db, mark)
+                        outcomes.append((job, False, exc))
+                db.commit()
+            except Exception as exc:
+                db.rollback()
+                self.stats.commit_failures += 1
+                if len(group) > 1:
+                    logger.warning(
+                        "Group commit of %d jobs failed, retrying one by one: %s", len(group), exc
+                    )
+                    for job in group:
+                        retry: Future = Future()
+                        self._commit_group([_WriteJob(work=job.work, future=retry)])
+                        self._forward(retry, job.future)
+                elif not group[0].future.done():
+                    group[0].future.set_exception(exc)
+                return
+
+        self.stats.groups_committed += 1
+        self.stats.largest_group = max(self.stats.largest_group, len(group))
+        for job, succeeded, value in outcomes:
+            if succeeded:
+                self.stats.jobs_committed += 1
+                job.future.set_result(value)
+            else:
+                self.stats.jobs_failed += 1
+                job.future.set_exception(value)
+
+    @staticmethod
+    def _begin(db: Session) -> None:
+        # pysqlite only opens a transaction implicitly before DML, so the
+        # outermost SAVEPOINT would otherwise start (and its RELEASE commit)
+        # the transaction. IMMEDIATE also takes the write lock up front.
+        connection = db.connection()
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    @staticmethod
+    def _forward(source: Future, target: Future) -> None:
+        if target.done():
+            return
+        if source.exception() is not None:
+            target.set_exception(source.exception())
+        else:
+            target.set_result(source.result())
+
+
+_write_queue: WriteQueue | None = None
+
+
+def get_write_queue() -> WriteQueue | None:
+    return _write_queue
+
+
+def start_write_queue(write_queue: WriteQueue) -> None:
+    global _write_queue
+    _write_queue = write_queue
+    write_queue.start()
+
+
+def stop_write_queue() -> None:
+    global _write_queue
+    if _write_queue is not None:
+        _write_queue.stop()
+        _write_queue = None
+
+
+def execute_write(db: Session, work: Callable[[Session], T]) -> T:
+    """Run ``work`` and commit it, through the write queue when it is enabled.
+
+    Without the queue ``work`` runs on ``db`` in the calling thread and is
+    committed or rolled back here. Exceptions raised by ``work`` propagate to
+    the caller either way.
+    """
+    write_queue = get_write_queue()
+    if write_queue is not None:
+        return write_queue.submit(work).result()
+    try:
+        result = work(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return result
@@ -0,0 +1,3 @@
+from app.events.broker import RESYNC, ChangeEvent, EventBroker, EventFilter, broker, stage_event
+
+__all__ = ["RESYNC", "ChangeEvent", "EventBroker", "EventFilter", "broker", "stage_event"]
@@ -0,0 +1,199 @@
+"""In-process change feed.
+
+Services stage events on the SQLAlchemy session with :func:`stage_event`.
+They are published to the broker only after the session commits and are
+dropped on rollback, so subscribers never see uncommitted changes.
+
+The broker fans out to asyncio subscribers through bounded queues. A
+subscriber that falls behind is not allowed to slow down writers: its queue
+is cleared and it receives a ``resync`` marker instead, after which it should
+reload state and continue. Recent events are kept in a replay buffer so a
+reconnecting client can resume from the last sequence number it saw.
+
+The broker lives in one process; each worker runs its own feed, numbered
+from 1 since the process started. A client resuming from a sequence number
+this feed has not reached yet saw it before a restart or on another worker,
+so it gets a ``resync`` marker rather than silence until the counter catches up.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+_PENDING_KEY = "pending_change_events"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    seq: int
+    kind: str
+    data: dict
+    mission_ids: frozenset[int] = frozenset()
+    executor_ids: frozenset[int] = frozenset()
+    hu_ids: frozenset[int] = frozenset()
+    location_ids: frozenset[int] = frozenset()
+    emitted_at: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
+
+    @property
+    def topic(self) -> str:
+        return self.kind.split(".", 1)[0]
+
+
+RESYNC = "resync"
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    topics: frozenset[str] = frozenset()
+    mission_ids: frozenset[int] = frozenset()
+    executor_ids: frozenset[int] = frozenset()
+    hu_ids: frozenset[int] = frozenset()
+    location_ids: frozenset[int] = frozenset()
+
+    def matches(self, change: ChangeEvent) -> bool:
+        if self.topics and change.topic not in self.topics:
+            return False
+        if self.mission_ids and not self.mission_ids & change.mission_ids:
+            return False
+        if self.executor_ids and not self.executor_ids & change.executor_ids:
+            return False
+        if self.hu_ids and not self.hu_ids & change.hu_ids:
+            return False
+        if self.location_ids and not self.location_ids & change.location_ids:
+            return False
+        return True
+
+
+class Subscription:
+    def __init__(self, broker: "EventBroker", event_filter: EventFilter, maxsize: int) -> None:
+        self.broker = broker
+        self.filter = event_filter
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[ChangeEvent | str] = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, change: ChangeEvent | str) -> None:
+        """Runs on the subscriber's loop."""
+        try:
+            self.queue.put_nowait(change)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+    async def __aiter__(self) -> AsyncIterator[ChangeEvent | str]:
+        while True:
+            yield await self.queue.get()
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class EventBroker:
+    def __init__(self, *, replay_size: int, queue_size: int) -> None:
+        self._last_seq = 0
+        self._lock = threading.Lock()
+        self._replay: deque[ChangeEvent] = deque(maxlen=replay_size)
+        self._subscriptions: set[Subscription] = set()
+        self.queue_size = queue_size
+
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            return self._last_seq
+
+    def publish(self, kind: str, data: dict, **keys: frozenset[int]) -> ChangeEvent:
+        """Thread-safe; callable from request threads or the event loop."""
+        with self._lock:
+            self._last_seq += 1
+            change = ChangeEvent(seq=self._last_seq, kind=kind, data=data, **keys)
+            self._replay.append(change)
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if subscription.filter.matches(change):
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.offer, change)
+                except RuntimeError:
+                    self.unsubscribe(subscription)
+        return change
+
+    def subscribe(self, event_filter: EventFilter, *, after_seq: int | None = None) -> Subscription:
+        """Register a subscriber on the running loop, replaying events newer than ``after_seq``.
+
+        If ``after_seq`` is older than the replay buffer, or newer than the
+        last event of this feed, the subscriber gets a ``resync`` marker first,
+        since some events can no longer be delivered.
+        """
+        subscription = Subscription(self, event_filter, self.queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+            if after_seq is not None:
+                oldest = self._replay[0].seq if self._replay else self._last_seq + 1
+                if after_seq > self._last_seq or oldest > after_seq + 1:
+                    subscription.offer(RESYNC)
+                for change in self._replay:
+                    if change.seq > after_seq and event_filter.matches(change):
+                        subscription.offer(change)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+
+broker = EventBroker(replay_size=settings.event_replay_size, queue_size=settings.event_queue_size)
+
+
+def stage_event(
+    db: Session,
+    kind: str,
+    data: dict,
+    *,
+    mission_ids: set[int | None] | None = None,
+    executor_ids: set[int | None] | None = None,
+    hu_ids: set[int | None] | None = None,
+    location_ids: set[int | None] | None = None,
+) -> None:
+    """Queue an event on the session; it is published when the session commits."""
+    keys = {
+        "mission_ids": mission_ids,
+        "executor_ids": executor_ids,
+        "hu_ids": hu_ids,
+        "location_ids": location_ids,
+    }
+    keys = {
+        name: frozenset(value for value in ids if value is not None)
+        for name, ids in keys.items()
+        if ids
+    }
+    db.info.setdefault(_PENDING_KEY, []).append((kind, data, keys))
+
+
+def staged_mark(db: Session) -> int:
+    """Position in the session's staged events, for :func:`discard_staged_since`."""
+    return len(db.info.get(_PENDING_KEY, ()))
+
+
+def discard_staged_since(db: Session, mark: int) -> None:
+    """Drop events staged after ``mark``, e.g. when a SAVEPOINT is rolled back."""
+    del db.info.get(_PENDING_KEY, [])[mark:]
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_staged(session: Session) -> None:
+    for kind, data, keys in session.info.pop(_PENDING_KEY, []):
+        broker.publish(kind, data, **keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_staged(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,28 @@
+from app.core.quantity import from_milli
+from app.db.models.inventory import InventoryMovement
+from app.db.models.mission import Mission
+
+
+def mission_payload(mission: Mission) -> dict:
+    return {
+        "mission_id": mission.id,
+        "mission_no": mission.mission_no,
+        "state": mission.state.value,
+        "priority": mission.priority,
+        "assigned_executor_id": mission.assigned_executor_id,
+    }
+
+
+def movement_payload(movement: InventoryMovement) -> dict:
+    return {
+        "movement_id": movement.id,
+        "movement_type": movement.movement_type.value,
+        "mission_line_id": movement.mission_line_id,
+        "item_id": movement.item_id,
+        "from_location_id": movement.from_location_id,
+        "to_location_id": movement.to_location_id,
+        "from_hu_id": movement.from_hu_id,
+        "to_hu_id": movement.to_hu_id,
+        "qty": str(from_milli(movement.qty)),
+        "executed_by_executor_id": movement.executed_by_executor_id,
+    }
@@ -0,0 +1,24 @@
+from app.export.datasets import DATASETS, Dataset
+from app.export.exporter import (
+    ExportJob,
+    ExportResult,
+    export_all,
+    export_dataset,
+    get_export_job,
+    read_watermark,
+    start_export_job,
+    stop_export_job,
+)
+
+__all__ = [
+    "DATASETS",
+    "Dataset",
+    "ExportJob",
+    "ExportResult",
+    "export_all",
+    "export_dataset",
+    "get_export_job",
+    "read_watermark",
+    "start_export_job",
+    "stop_export_job",
+]
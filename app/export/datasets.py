@@ -0,0 +1,146 @@
+"""Datasets exported for analytics.
+
+Each dataset is read in keyset order on a monotonic watermark column, so an
+export can resume from the last value it wrote:
+
+* ``movements``: the append-only ledger, by ``id``.
+* ``positions``: inventory positions, by ``change_seq``. A position appears
+  once per export run in which it changed; the latest state of a position is
+  the row with the highest ``change_seq``.
+* ``mission_events``: mission transitions recorded in the outbox, by ``id``.
+  The outbox purge keeps mission rows above its watermark, also before the
+  first export.
+
+Quantities are exported as integer milli-units (``*_milli`` columns).
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import ColumnElement, Select, select
+
+from app.db.models.inventory import InventoryMovement, InventoryPosition
+from app.db.models.outbox import OutboxMessage
+
+# Column kinds understood by the writers.
+INT = "int"
+TEXT = "text"
+TIMESTAMP = "timestamp"
+
+
+@dataclass(frozen=True)
+class Dataset:
+    name: str
+    watermark: ColumnElement
+    columns: tuple[tuple[str, str], ...]
+    select: Callable[[], Select]
+    watermark_field: str = "id"
+    transform: Callable[[tuple], tuple] | None = None
+
+    @property
+    def watermark_index(self) -> int:
+        return [name for name, _ in self.columns].index(self.watermark_field)
+
+    def after(self, watermark: int, limit: int) -> Select:
+        return self.select().where(self.watermark > watermark).order_by(self.watermark).limit(limit)
+
+
+def _mission_event(row: tuple) -> tuple:
+    event_id, topic, mission_id, created_at, payload = row
+    return (
+        event_id,
+        topic,
+        mission_id,
+        payload.get("mission_no"),
+        payload.get("state"),
+        payload.get("priority"),
+        payload.get("assigned_executor_id"),
+        payload.get("cancel_reason"),
+        created_at,
+    )
+
+
+MOVEMENTS = Dataset(
+    name="movements",
+    watermark=InventoryMovement.id,
+    columns=(
+        ("id", INT),
+        ("mission_line_id", INT),
+        ("movement_type", TEXT),
+        ("item_id", INT),
+        ("from_location_id", INT),
+        ("to_location_id", INT),
+        ("from_hu_id", INT),
+        ("to_hu_id", INT),
+        ("qty_milli", INT),
+        ("executed_by_executor_id", INT),
+        ("executed_at", TIMESTAMP),
+        ("reason", TEXT),
+    ),
+    select=lambda: select(
+        InventoryMovement.id,
+        InventoryMovement.mission_line_id,
+        InventoryMovement.movement_type,
+        InventoryMovement.item_id,
+        InventoryMovement.from_location_id,
+        InventoryMovement.to_location_id,
+        InventoryMovement.from_hu_id,
+        InventoryMovement.to_hu_id,
+        InventoryMovement.qty,
+        InventoryMovement.executed_by_executor_id,
+        InventoryMovement.executed_at,
+        InventoryMovement.reason,
+    ),
+)
+
+POSITIONS = Dataset(
+    name="positions",
+    watermark=InventoryPosition.change_seq,
+    columns=(
+        ("id", INT),
+        ("hu_id", INT),
+        ("item_id", INT),
+        ("qty_on_hand_milli", INT),
+        ("qty_reserved_milli", INT),
+        ("version", INT),
+        ("updated_at", TIMESTAMP),
+        ("change_seq", INT),
+    ),
+    select=lambda: select(
+        InventoryPosition.id,
+        InventoryPosition.hu_id,
+        InventoryPosition.item_id,
+        InventoryPosition.qty_on_hand,
+        InventoryPosition.qty_reserved,
+        InventoryPosition.version,
+        InventoryPosition.updated_at,
+        InventoryPosition.change_seq,
+    ),
+    watermark_field="change_seq",
+)
+
+MISSION_EVENTS = Dataset(
+    name="mission_events",
+    watermark=OutboxMessage.id,
+    columns=(
+        ("id", INT),
+        ("topic", TEXT),
+        ("mission_id", INT),
+        ("mission_no", TEXT),
+        ("state", TEXT),
+        ("priority", INT),
+        ("assigned_executor_id", INT),
+        ("cancel_reason", TEXT),
+        ("recorded_at", TIMESTAMP),
+    ),
+    select=lambda: select(
+        OutboxMessage.id,
+        OutboxMessage.topic,
+        OutboxMessage.aggregate_id,
+        OutboxMessage.created_at,
+        OutboxMessage.payload,
+    ).where(OutboxMessage.aggregate_type == "mission"),
+    transform=_mission_event,
+)
+
+DATASETS = {dataset.name: dataset for dataset in (MOVEMENTS, POSITIONS, MISSION_EVENTS)}
@@ -0,0 +1,233 @@
+"""Incremental columnar export for analytics.
+
+Each dataset is exported into ``<export_dir>/<dataset>/`` as Parquet part
+files named ``part-<first>-<last>.parquet`` after the watermark range they
+cover, next to ``_watermark.json`` holding the last exported watermark.
+Rows are read in keyset order in chunks of ``chunk_size``, each chunk in its
+own short read transaction, so memory stays bounded and no long snapshot pins
+the SQLite WAL. A part is renamed into place before the watermark advances;
+an interrupted run leaves only a temporary file and the next run re-reads
+from the previous watermark, so parts never overlap.
+
+Exports read through the read engine and run from the CLI
+(``python -m app.export``) or an optional background job, never from a
+request. With ``workers > 1`` datasets are exported in parallel processes.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.export.datasets import DATASETS, Dataset
+from app.export.parquet import ParquetPartWriter
+
+logger = logging.getLogger(__name__)
+
+_STATE_FILE = "_watermark.json"
+
+
+@dataclass
+class ExportResult:
+    dataset: str
+    rows: int = 0
+    files: int = 0
+    watermark: int = 0
+
+
+def read_watermark(directory: Path) -> int:
+    try:
+        return int(json.loads((directory / _STATE_FILE).read_text())["watermark"])
+    except FileNotFoundError:
+        return 0
+
+
+def _write_watermark(directory: Path, watermark: int) -> None:
+    state = {"watermark": watermark, "updated_at": datetime.now(tz=timezone.utc).isoformat()}
+    tmp_path = directory / f".{_STATE_FILE}.tmp"
+    tmp_path.write_text(json.dumps(state))
+    os.replace(tmp_path, directory / _STATE_FILE)
+
+
+def export_dataset(
+    session_factory: sessionmaker[Session],
+    dataset: Dataset,
+    directory: Path,
+    *,
+    chunk_size: int,
+    rows_per_file: int,
+    compression: str,
+) -> ExportResult:
+    target = directory / dataset.name
+    target.mkdir(parents=True, exist_ok=True)
+    result = ExportResult(dataset=dataset.name, watermark=read_watermark(target))
+    watermark_index = dataset.watermark_index
+    writer: ParquetPartWriter | None = None
+    first = last = result.watermark
+
+    def commit_part() -> None:
+        nonlocal writer
+        writer.commit(target / f"part-{first:012d}-{last:012d}.parquet")
+        _write_watermark(target, last)
+        result.rows += writer.rows
+        result.files += 1
+        result.watermark = last
+        writer = None
+
+    try:
+        while True:
+            with session_factory() as db:
+                rows = [tuple(row) for row in db.execute(dataset.after(last, chunk_size)).all()]
+            if not rows:
+                break
+            if dataset.transform is not None:
+                rows = [dataset.transform(row) for row in rows]
+            if writer is None:
+                writer = ParquetPartWriter(target, dataset.columns, compression=compression)
+                first = rows[0][watermark_index]
+            writer.write(rows)
+            last = rows[-1][watermark_index]
+            if writer.rows >= rows_per_file:
+                commit_part()
+        if writer is not None:
+            commit_part()
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    return result
+
+
+def _export_in_subprocess(
+    name: str, directory: str, chunk_size: int, rows_per_file: int, compression: str
+) -> ExportResult:
+    from app.db.session import ReadSessionLocal
+
+    return export_dataset(
+        ReadSessionLocal,
+        DATASETS[name],
+        Path(directory),
+        chunk_size=chunk_size,
+        rows_per_file=rows_per_file,
+        compression=compression,
+    )
+
+
+def export_all(
+    session_factory: sessionmaker[Session],
+    directory: Path,
+    *,
+    datasets: Iterable[str] | None = None,
+    chunk_size: int,
+    rows_per_file: int,
+    compression: str,
+    workers: int = 1,
+) -> list[ExportResult]:
+    names = list(datasets) if datasets is not None else list(DATASETS)
+    unknown = sorted(set(names) - set(DATASETS))
+    if unknown:
+        raise ValueError(f"Unknown export datasets: {', '.join(unknown)}")
+    if workers <= 1 or len(names) == 1:
+        return [
+            export_dataset(
+                session_factory,
+                DATASETS[name],
+                directory,
+                chunk_size=chunk_size,
+                rows_per_file=rows_per_file,
+                compression=compression,
+            )
+            for name in names
+        ]
+
+    # Spawned workers build their own engines instead of inheriting pooled connections.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(names)), mp_context=context) as pool:
+        futures = [
+            pool.submit(
+                _export_in_subprocess, name, str(directory), chunk_size, rows_per_file, compression
+            )
+            for name in names
+        ]
+        return [future.result() for future in futures]
+
+
+class ExportJob:
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        directory: Path,
+        *,
+        interval_seconds: float,
+        chunk_size: int,
+        rows_per_file: int,
+        compression: str,
+        workers: int = 1,
+    ) -> None:
+        self.session_factory = session_factory
+        self.directory = directory
+        self.interval_seconds = interval_seconds
+        self.options = {
+            "chunk_size": chunk_size,
+            "rows_per_file": rows_per_file,
+            "compression": compression,
+            "workers": workers,
+        }
+        self.last_error: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="analytics-export", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                for result in export_all(self.session_factory, self.directory, **self.options):
+                    if result.rows:
+                        logger.info(
+                            "Exported %d %s rows up to %d",
+                            result.rows,
+                            result.dataset,
+                            result.watermark,
+                        )
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.warning("Analytics export failed: %s", exc)
+
+
+_job: ExportJob | None = None
+
+
+def get_export_job() -> ExportJob | None:
+    return _job
+
+
+def start_export_job(job: ExportJob) -> None:
+    global _job
+    _job = job
+    job.start()
+
+
+def stop_export_job() -> None:
+    global _job
+    if _job is not None:
+        _job.stop()
+        _job = None
@@ -0,0 +1,54 @@
+"""Parquet part files, written with pyarrow (the ``analytics`` extra)."""
+
+import os
+from pathlib import Path
+
+from app.export.datasets import INT, TEXT, TIMESTAMP
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:  # pragma: no cover - depends on the install
+        raise RuntimeError(
+            "Parquet export requires pyarrow; install the 'analytics' extra"
+        ) from exc
+    return pyarrow, pyarrow.parquet
+
+
+class ParquetPartWriter:
+    """Append record batches to a temporary Parquet file, renamed into place by :meth:`commit`."""
+
+    def __init__(
+        self, directory: Path, columns: tuple[tuple[str, str], ...], *, compression: str
+    ) -> None:
+        pa, pq = _require_pyarrow()
+        types = {INT: pa.int64(), TEXT: pa.string(), TIMESTAMP: pa.timestamp("us", tz="UTC")}
+        self._pa = pa
+        self.schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        self.kinds = [kind for _, kind in columns]
+        directory.mkdir(parents=True, exist_ok=True)
+        self.tmp_path = directory / f".part.{os.getpid()}.tmp"
+        self._writer = pq.ParquetWriter(self.tmp_path, self.schema, compression=compression)
+        self.rows = 0
+
+    def write(self, rows: list[tuple]) -> None:
+        arrays = []
+        for index, (field, kind) in enumerate(zip(self.schema, self.kinds)):
+            values = [row[index] for row in rows]
+            if kind == TEXT:
+                values = [None if value is None else str(value) for value in values]
+            arrays.append(self._pa.array(values, type=field.type))
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.rows += len(rows)
+
+    def commit(self, path: Path) -> None:
+        self._writer.close()
+        with open(self.tmp_path, "rb") as handle:
+            os.fsync(handle.fileno())
+        os.replace(self.tmp_path, path)
+
+    def abort(self) -> None:
+        self._writer.close()
+        self.tmp_path.unlink(missing_ok=True)
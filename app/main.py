@@ -1,7 +1,121 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.db.maintenance import SQLiteMaintenance, start_maintenance, stop_maintenance
+from app.db.session import ReadSessionLocal, SessionLocal, engine
+from app.db.write_queue import WriteQueue, start_write_queue, stop_write_queue
+from app.export import ExportJob, start_export_job, stop_export_job
+from app.outbox import OutboxDispatcher, build_sink, start_dispatcher, stop_dispatcher
+from app.services.ledger_archive_service import (
+    LedgerArchiveJob,
+    start_archive_job,
+    stop_archive_job,
+)
+from app.services.replenishment_service import (
+    ReplenishmentJob,
+    start_replenishment_job,
+    stop_replenishment_job,
+)
+from app.services.report_service import ReportRefreshJob, start_report_job, stop_report_job
+from app.services.retention import outbox_read_marks
+from app.services.slotting_service import SlottingRefreshJob, start_slotting_job, stop_slotting_job
+from app.services.travel_service import (
+    TravelRefreshJob,
+    start_travel_refresh_job,
+    stop_travel_refresh_job,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    if engine.dialect.name == "sqlite" and engine.url.database not in (None, "", ":memory:"):
+        start_maintenance(
+            SQLiteMaintenance(
+                engine,
+                interval_seconds=settings.sqlite_checkpoint_interval_seconds,
+                truncate_bytes=settings.sqlite_wal_truncate_bytes,
+                optimize_interval_seconds=settings.sqlite_optimize_interval_seconds,
+            )
+        )
+    if settings.travel_refresh_seconds is not None:
+        start_travel_refresh_job(
+            TravelRefreshJob(SessionLocal, interval_seconds=settings.travel_refresh_seconds)
+        )
+    if settings.write_queue_enabled:
+        start_write_queue(WriteQueue(SessionLocal, max_batch=settings.write_queue_max_batch))
+    sink = build_sink(settings.outbox_sink, settings.outbox_sink_target)
+    retention = settings.outbox_retention_hours
+    if sink is not None or retention is not None:
+        start_dispatcher(
+            OutboxDispatcher(
+                SessionLocal,
+                sink,
+                batch_size=settings.outbox_batch_size,
+                poll_seconds=settings.outbox_poll_seconds,
+                retention=timedelta(hours=retention) if retention is not None else None,
+                keep_after=partial(outbox_read_marks, export_dir=Path(settings.export_dir)),
+            )
+        )
+    if settings.ledger_archive_interval_hours is not None:
+        start_archive_job(
+            LedgerArchiveJob(
+                SessionLocal,
+                interval_seconds=settings.ledger_archive_interval_hours * 3600,
+                retain_months=settings.ledger_retain_months,
+            )
+        )
+    if settings.report_refresh_seconds is not None:
+        start_report_job(
+            ReportRefreshJob(
+                SessionLocal,
+                interval_seconds=settings.report_refresh_seconds,
+                batch_size=settings.report_batch_size,
+            )
+        )
+    if settings.slotting_refresh_hours is not None:
+        start_slotting_job(
+            SlottingRefreshJob(
+                SessionLocal,
+                interval_seconds=settings.slotting_refresh_hours * 3600,
+                batch_size=settings.slotting_batch_size,
+            )
+        )
+    if settings.replenishment_interval_seconds is not None:
+        start_replenishment_job(
+            ReplenishmentJob(SessionLocal, interval_seconds=settings.replenishment_interval_seconds)
+        )
+    if settings.export_interval_minutes is not None:
+        start_export_job(
+            ExportJob(
+                ReadSessionLocal,
+                Path(settings.export_dir),
+                interval_seconds=settings.export_interval_minutes * 60,
+                chunk_size=settings.export_chunk_size,
+                rows_per_file=settings.export_rows_per_file,
+                compression=settings.export_compression,
+                workers=settings.export_workers,
+            )
+        )
+    try:
+        yield
+    finally:
+        stop_export_job()
+        stop_replenishment_job()
+        stop_report_job()
+        stop_slotting_job()
+        stop_archive_job()
+        stop_dispatcher()
+        stop_write_queue()
+        stop_travel_refresh_job()
+        stop_maintenance()
 
 
 def create_app() -> FastAPI:
@@ -11,7 +125,9 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
     app.include_router(api_router, prefix="/api/v1")
     return app
 
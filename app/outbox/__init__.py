@@ -0,0 +1,22 @@
+from app.outbox.dispatcher import (
+    DispatcherStats,
+    OutboxDispatcher,
+    get_dispatcher,
+    start_dispatcher,
+    stop_dispatcher,
+)
+from app.outbox.sinks import FileSink, HttpSink, LocalQueueSink, OutboxSink, SinkFull, build_sink
+
+__all__ = [
+    "DispatcherStats",
+    "FileSink",
+    "HttpSink",
+    "LocalQueueSink",
+    "OutboxDispatcher",
+    "OutboxSink",
+    "SinkFull",
+    "build_sink",
+    "get_dispatcher",
+    "start_dispatcher",
+    "stop_dispatcher",
+]
@@ -0,0 +1,174 @@
+"""Background delivery of outbox messages.
+
+Messages are written by the repositories in the same transaction as the
+change they describe. The dispatcher runs in its own thread with its own
+sessions, so request handlers never wait on a sink. It reads pending rows in
+id order, hands the batch to the sink and only then marks the rows
+dispatched; a crash between the two re-delivers the batch (at-least-once).
+A failing or full sink makes the dispatcher back off exponentially, leaving
+messages in the table rather than buffering them in memory.
+
+Dispatched rows are purged after ``retention``. Without a sink the
+dispatcher only purges, and rows go once they are older than ``retention``
+whether dispatched or not, so the table stays bounded in the default setup.
+``keep_after`` reports, per aggregate type, the last id every other reader of
+the table (the export, report and slotting refreshes) has consumed; the purge
+leaves newer rows of that type alone.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models.outbox import OutboxMessage
+from app.outbox.sinks import OutboxSink
+from app.repositories.outbox import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+_MAX_BACKOFF_SECONDS = 60.0
+_PURGE_INTERVAL_SECONDS = 300.0
+
+
+@dataclass
+class DispatcherStats:
+    running: bool = False
+    batches_sent: int = 0
+    messages_sent: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_error: str | None = None
+    last_dispatched_at: datetime | None = None
+
+
+def encode_message(message: OutboxMessage) -> dict:
+    return {
+        "id": message.id,
+        "topic": message.topic,
+        "aggregate_type": message.aggregate_type,
+        "aggregate_id": message.aggregate_id,
+        "created_at": message.created_at.isoformat() if message.created_at else None,
+        "payload": message.payload,
+    }
+
+
+class OutboxDispatcher:
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        sink: OutboxSink | None,
+        *,
+        batch_size: int,
+        poll_seconds: float,
+        retention: timedelta | None = None,
+        keep_after: Callable[[Session], Mapping[str, int]] | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.sink = sink
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.retention = retention
+        self.keep_after = keep_after
+        self.stats = DispatcherStats()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_purge = 0.0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+        self.stats.running = True
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.stats.running = False
+
+    def dispatch_once(self) -> int:
+        """Deliver one batch. Returns the number of messages delivered."""
+        if self.sink is None:
+            return 0
+        with self.session_factory() as db:
+            outbox = OutboxRepository(db)
+            messages = outbox.list_pending(self.batch_size)
+            if not messages:
+                return 0
+            message_ids = [message.id for message in messages]
+            try:
+                self.sink.send([encode_message(message) for message in messages])
+            except Exception as exc:
+                db.rollback()
+                outbox.mark_failed(message_ids, f"{type(exc).__name__}: {exc}")
+                db.commit()
+                raise
+            outbox.mark_dispatched(message_ids)
+            db.commit()
+
+        self.stats.batches_sent += 1
+        self.stats.messages_sent += len(message_ids)
+        self.stats.last_dispatched_at = datetime.now(tz=timezone.utc)
+        return len(message_ids)
+
+    def purge(self) -> int:
+        if self.retention is None:
+            return 0
+        with self.session_factory() as db:
+            keep_after = self.keep_after(db) if self.keep_after is not None else None
+            purged = OutboxRepository(db).purge_dispatched(
+                datetime.now(tz=timezone.utc) - self.retention,
+                undelivered=self.sink is None,
+                keep_after=keep_after,
+            )
+            db.commit()
+        return purged
+
+    def _run(self) -> None:
+        delay = self.poll_seconds
+        while not self._stop.is_set():
+            try:
+                sent = self.dispatch_once()
+                self.stats.consecutive_failures = 0
+                delay = 0.0 if sent == self.batch_size else self.poll_seconds
+                if time.monotonic() - self._last_purge > _PURGE_INTERVAL_SECONDS:
+                    self.purge()
+                    self._last_purge = time.monotonic()
+            except Exception as exc:
+                self.stats.failures += 1
+                self.stats.consecutive_failures += 1
+                self.stats.last_error = f"{type(exc).__name__}: {exc}"
+                delay = min(
+                    self.poll_seconds * 2**self.stats.consecutive_failures, _MAX_BACKOFF_SECONDS
+                )
+                logger.warning("Outbox dispatch failed, retrying in %.1fs: %s", delay, exc)
+            if delay:
+                self._stop.wait(delay)
+
+
+_dispatcher: OutboxDispatcher | None = None
+
+
+def get_dispatcher() -> OutboxDispatcher | None:
+    return _dispatcher
+
+
+def start_dispatcher(dispatcher: OutboxDispatcher) -> None:
+    global _dispatcher
+    _dispatcher = dispatcher
+    dispatcher.start()
+
+
+def stop_dispatcher() -> None:
+    global _dispatcher
+    if _dispatcher is not None:
+        _dispatcher.stop()
+        _dispatcher = None
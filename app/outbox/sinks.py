@@ -0,0 +1,86 @@
+"""Destinations the outbox dispatcher delivers batches to.
+
+A sink receives a list of message dicts and either accepts the whole batch or
+raises. Raising leaves the batch pending, so it is retried on the next poll;
+receivers must therefore tolerate duplicates and deduplicate on ``id``.
+"""
+
+import json
+import os
+import queue
+import urllib.request
+from pathlib import Path
+from typing import Protocol
+
+
+class SinkFull(Exception):
+    pass
+
+
+class OutboxSink(Protocol):
+    def send(self, messages: list[dict]) -> None: ...
+
+
+class FileSink:
+    """Appends one JSON document per line and fsyncs before acknowledging."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def send(self, messages: list[dict]) -> None:
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.writelines(
+                json.dumps(message, separators=(",", ":")) + "\n" for message in messages
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+
+
+class HttpSink:
+    """POSTs the batch as a JSON array; any non-2xx response fails the batch."""
+
+    def __init__(self, url: str, *, timeout: float = 10.0) -> None:
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, messages: list[dict]) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(messages, separators=(",", ":")).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            if not 200 <= response.status < 300:
+                raise RuntimeError(f"Sink responded with HTTP {response.status}")
+
+
+class LocalQueueSink:
+    """In-process bounded queue for consumers running in the same process.
+
+    When the consumer falls behind the batch is rejected instead of growing
+    the queue, and the dispatcher backs off until there is room again.
+    """
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.queue: queue.Queue[dict] = queue.Queue(maxsize=maxsize)
+
+    def send(self, messages: list[dict]) -> None:
+        free = self.queue.maxsize - self.queue.qsize()
+        if len(messages) > free:
+            raise SinkFull(f"Queue has room for {free} of {len(messages)} messages")
+        for message in messages:
+            self.queue.put_nowait(message)
+
+
+def build_sink(kind: str, target: str) -> OutboxSink | None:
+    if kind == "none":
+        return None
+    if kind == "file":
+        return FileSink(target)
+    if kind == "http":
+        return HttpSink(target)
+    if kind == "queue":
+        return LocalQueueSink(int(target) if target else 10000)
+    raise ValueError(f"Unknown outbox sink: {kind}")
@@ -0,0 +1,17 @@
+from app.planning.assignment import FORBIDDEN, assignment_costs, solve_assignment
+from app.planning.sequencing import path_length, sequence_stops
+from app.planning.travel_matrix import LocationGeometry, TravelMatrix, get_travel_matrix
+from app.planning.waves import Wave, plan_waves
+
+__all__ = [
+    "FORBIDDEN",
+    "LocationGeometry",
+    "TravelMatrix",
+    "Wave",
+    "assignment_costs",
+    "get_travel_matrix",
+    "path_length",
+    "plan_waves",
+    "sequence_stops",
+    "solve_assignment",
+]
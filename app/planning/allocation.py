@@ -0,0 +1,52 @@
+"""Source selection for item demands.
+
+Given the positions an item can be taken from, in FIFO order (oldest
+``updated_at`` first), choose the ones to draw a quantity from:
+
+* ``fifo``: oldest stock first.
+* ``fewest_hus``: the smallest single position that covers the demand,
+  otherwise the largest positions first.
+* ``least_travel``: positions nearest the destination first, FIFO on ties.
+"""
+
+from enum import StrEnum
+
+import numpy as np
+
+
+class AllocationStrategy(StrEnum):
+    FIFO = "fifo"
+    FEWEST_HUS = "fewest_hus"
+    LEAST_TRAVEL = "least_travel"
+
+
+def allocation_order(
+    strategy: AllocationStrategy,
+    available: np.ndarray,
+    qty: int,
+    distances: np.ndarray | None = None,
+) -> np.ndarray:
+    """Indices into ``available`` (FIFO ordered, all positive) in the order to draw from."""
+    available = np.asarray(available, dtype=np.int64)
+    if strategy == AllocationStrategy.FEWEST_HUS:
+        covering = np.flatnonzero(available >= qty)
+        if covering.size:
+            return covering[np.argmin(available[covering])][None]
+        return np.argsort(-available, kind="stable")
+    if strategy == AllocationStrategy.LEAST_TRAVEL and distances is not None:
+        distances = np.asarray(distances, dtype=np.float64)
+        return np.argsort(np.where(np.isfinite(distances), distances, np.inf), kind="stable")
+    return np.arange(available.size)
+
+
+def take(available: np.ndarray, order: np.ndarray, qty: int) -> list[tuple[int, int]]:
+    """``(index, qty)`` drawn along ``order`` until ``qty`` is covered or the stock runs out."""
+    if qty <= 0 or order.size == 0:
+        return []
+    drawn = np.asarray(available, dtype=np.int64)[order]
+    covered = np.cumsum(drawn)
+    count = min(int(np.searchsorted(covered, qty)) + 1, order.size)
+    picks = drawn[:count].copy()
+    if covered[count - 1] > qty:
+        picks[-1] -= covered[count - 1] - qty
+    return list(zip(order[:count].tolist(), picks.tolist(), strict=True))
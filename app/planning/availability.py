@@ -0,0 +1,101 @@
+"""In-memory index of the stock available for allocation, per item.
+
+For every item the index holds the positions with unreserved stock
+(``qty_on_hand - qty_reserved``), sorted oldest ``updated_at`` first, as
+arrays together with the location of their handling unit and whether that
+unit can be picked from. It is fed from ``change_seq``: each sync applies
+only the positions and handling units changed since the last one, and the
+arrays of an item are rebuilt on first use after one of its positions or
+units changed.
+"""
+
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+
+@dataclass
+class ItemStock:
+    position_ids: np.ndarray
+    hu_ids: np.ndarray
+    location_ids: np.ndarray
+    available: np.ndarray
+    pickable: np.ndarray
+
+
+class AvailabilityIndex:
+    def __init__(self) -> None:
+        self.positions_watermark = 0
+        self.units_watermark = 0
+        self._positions: dict[int, dict[int, tuple[int, int, datetime]]] = {}
+        self._units: dict[int, tuple[int, bool]] = {}
+        self._unit_items: dict[int, set[int]] = {}
+        self._stock: dict[int, ItemStock] = {}
+        self._lock = threading.Lock()
+
+    def apply_positions(self, changes: Iterable[tuple[int, int, int, int, datetime, int]]) -> int:
+        """Apply ``(position_id, item_id, hu_id, available, updated_at, change_seq)`` rows."""
+        applied = 0
+        with self._lock:
+            for position_id, item_id, hu_id, available, updated_at, change_seq in changes:
+                positions = self._positions.setdefault(item_id, {})
+                if available > 0:
+                    positions[position_id] = (hu_id, available, updated_at)
+                    self._unit_items.setdefault(hu_id, set()).add(item_id)
+                else:
+                    positions.pop(position_id, None)
+                self._stock.pop(item_id, None)
+                self.positions_watermark = max(self.positions_watermark, change_seq)
+                applied += 1
+        return applied
+
+    def apply_units(self, changes: Iterable[tuple[int, int, bool, int]]) -> int:
+        """Apply ``(hu_id, location_id, pickable, change_seq)`` rows."""
+        applied = 0
+        with self._lock:
+            for hu_id, location_id, pickable, change_seq in changes:
+                self._units[hu_id] = (location_id, pickable)
+                for item_id in self._unit_items.get(hu_id, ()):
+                    self._stock.pop(item_id, None)
+                self.units_watermark = max(self.units_watermark, change_seq)
+                applied += 1
+        return applied
+
+    def stock(self, item_id: int) -> ItemStock | None:
+        """Available positions of ``item_id`` in FIFO order, ``None`` if there are none."""
+        with self._lock:
+            stock = self._stock.get(item_id)
+            if stock is None:
+                positions = self._positions.get(item_id)
+                if not positions:
+                    return None
+                ordered = sorted(positions.items(), key=lambda entry: (entry[1][2], entry[0]))
+                units = [self._units.get(hu_id, (-1, False)) for _, (hu_id, _, _) in ordered]
+                stock = ItemStock(
+                    position_ids=np.array(
+                        [position_id for position_id, _ in ordered], dtype=np.int64
+                    ),
+                    hu_ids=np.array([hu_id for _, (hu_id, _, _) in ordered], dtype=np.int64),
+                    location_ids=np.array(
+                        [location_id for location_id, _ in units], dtype=np.int64
+                    ),
+                    available=np.array(
+                        [available for _, (_, available, _) in ordered], dtype=np.int64
+                    ),
+                    pickable=np.array([pickable for _, pickable in units], dtype=bool),
+                )
+                self._stock[item_id] = stock
+            return stock
+
+
+_availability_index: AvailabilityIndex | None = None
+
+
+def get_availability_index() -> AvailabilityIndex:
+    global _availability_index
+    if _availability_index is None:
+        _availability_index = AvailabilityIndex()
+    return _availability_index
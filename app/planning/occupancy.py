@@ -0,0 +1,102 @@
+"""In-memory mirror of the location occupancy counters.
+
+``locations.hu_count`` and ``locations.load_kg`` are maintained in the same
+transaction as every handling unit move, together with the ``max_hu`` and
+``max_weight_kg`` limits. The index copies them into arrays aligned with the
+travel matrix rows, so planners can read the occupancy and capacity of every
+candidate location in one vectorized lookup. It is fed from
+``locations.change_seq``: each sync applies only the locations changed since
+the last one, which keeps it current with moves made by any worker.
+"""
+
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+# ``capacity`` value of a location without a ``max_hu`` limit.
+UNLIMITED = -1
+
+
+@dataclass
+class OccupancyArrays:
+    counts: np.ndarray
+    capacity: np.ndarray
+    load: np.ndarray
+    max_load: np.ndarray
+
+
+class OccupancyIndex:
+    def __init__(self) -> None:
+        self.watermark = 0
+        self.ids: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.arrays = self._empty(0)
+        self._locations: dict[int, tuple[int, int, int, float]] = {}
+        self._lock = threading.Lock()
+
+    def apply(self, changes: Iterable[tuple[int, int, int | None, int, int | None, int]]) -> int:
+        """Apply ``(location_id, hu_count, max_hu, load_kg, max_weight_kg, change_seq)`` rows."""
+        applied = 0
+        with self._lock:
+            for location_id, hu_count, max_hu, load_kg, max_weight_kg, change_seq in changes:
+                values = (
+                    hu_count,
+                    UNLIMITED if max_hu is None else max_hu,
+                    load_kg,
+                    np.inf if max_weight_kg is None else float(max_weight_kg),
+                )
+                self._locations[location_id] = values
+                row = int(self._rows(np.array([location_id]))[0]) if self.ids.size else -1
+                if row >= 0:
+                    self._set(row, values)
+                self.watermark = max(self.watermark, change_seq)
+                applied += 1
+        return applied
+
+    def aligned(self, ids: np.ndarray) -> OccupancyArrays:
+        """Arrays for the sorted location ``ids`` (the travel matrix rows).
+
+        The arrays are realigned first if the ids changed.
+        """
+        with self._lock:
+            if self.ids.shape != ids.shape or not np.array_equal(self.ids, ids):
+                self.ids = np.array(ids, dtype=np.int64)
+                self.arrays = self._empty(self.ids.shape[0])
+                if self._locations and self.ids.size:
+                    located = np.fromiter(
+                        self._locations, dtype=np.int64, count=len(self._locations)
+                    )
+                    for location_id, row in zip(
+                        located.tolist(), self._rows(located).tolist(), strict=True
+                    ):
+                        if row >= 0:
+                            self._set(row, self._locations[location_id])
+            return self.arrays
+
+    def _rows(self, location_ids: np.ndarray) -> np.ndarray:
+        positions = np.minimum(np.searchsorted(self.ids, location_ids), max(self.ids.size - 1, 0))
+        return np.where(self.ids[positions] == location_ids, positions, -1)
+
+    def _set(self, row: int, values: tuple[int, int, int, float]) -> None:
+        arrays = self.arrays
+        arrays.counts[row], arrays.capacity[row], arrays.load[row], arrays.max_load[row] = values
+
+    @staticmethod
+    def _empty(size: int) -> OccupancyArrays:
+        return OccupancyArrays(
+            counts=np.zeros(size, dtype=np.int64),
+            capacity=np.full(size, UNLIMITED, dtype=np.int64),
+            load=np.zeros(size, dtype=np.int64),
+            max_load=np.full(size, np.inf),
+        )
+
+
+_occupancy_index: OccupancyIndex | None = None
+
+
+def get_occupancy_index() -> OccupancyIndex:
+    global _occupancy_index
+    if _occupancy_index is None:
+        _occupancy_index = OccupancyIndex()
+    return _occupancy_index
@@ -0,0 +1,48 @@
+"""Ranking of putaway destinations for an inbound handling unit."""
+
+import numpy as np
+
+from app.planning.slotting import CLASS_A, CLASS_B
+
+# Cost added for a location type that does not suit the velocity class, and
+# per occupied share of a location, in the same unit as travel distance.
+TYPE_MISMATCH_COST = 25.0
+OCCUPANCY_COST = 5.0
+
+
+def putaway_costs(
+    *,
+    travel: np.ndarray,
+    proximity: np.ndarray,
+    is_pick: np.ndarray,
+    occupancy: np.ndarray,
+    abc_class: str | None,
+) -> np.ndarray:
+    """Cost per candidate location; lower is better.
+
+    Every candidate pays the travel distance from the handling unit's current
+    location and a penalty for how full it already is. Fast movers (A) pay
+    the distance from the candidate to the nearest dock or staging area and a
+    penalty outside PICK locations, so they land close to outbound. Slow
+    movers (C, or no pick history) pay the penalty for PICK locations instead,
+    keeping forward slots free. B items pay half the dock distance and no
+    type penalty.
+    """
+    costs = np.asarray(travel, dtype=np.float64) + OCCUPANCY_COST * np.asarray(
+        occupancy, dtype=np.float64
+    )
+    if abc_class == CLASS_A:
+        costs += proximity + np.where(is_pick, 0.0, TYPE_MISMATCH_COST)
+    elif abc_class == CLASS_B:
+        costs += 0.5 * proximity
+    else:
+        costs += np.where(is_pick, TYPE_MISMATCH_COST, 0.0)
+    return costs
+
+
+def best_candidates(costs: np.ndarray, feasible: np.ndarray, limit: int) -> np.ndarray:
+    """Indices of the ``limit`` cheapest feasible candidates, cheapest first."""
+    indices = np.flatnonzero(feasible)
+    if indices.size > limit:
+        indices = indices[np.argpartition(costs[indices], limit - 1)[:limit]]
+    return indices[np.argsort(costs[indices], kind="stable")]
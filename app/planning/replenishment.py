@@ -0,0 +1,102 @@
+"""Incremental triggers for min/max replenishment.
+
+The registry maps every active ``(item_id, location_id)`` rule to its id.
+Writers call :func:`touch` for the stock they take out of a location: a dict
+lookup that, when a rule watches the pair, queues the rule id on the session.
+Queued ids move to the pending set when the session commits and are dropped
+on rollback, so the evaluator only ever sees committed stock and never scans
+``inventory_positions``. Rules are fed from ``change_seq``; a rule that is new
+or whose thresholds changed becomes pending by itself, so the first sync of a
+process evaluates every rule once.
+"""
+
+import threading
+from collections.abc import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_TOUCHED_KEY = "replenishment_touched"
+
+
+class ReplenishmentTriggers:
+    def __init__(self) -> None:
+        self.watermark = 0
+        self._rules: dict[int, tuple[int, int, int, int, bool]] = {}
+        self._keys: dict[tuple[int, int], int] = {}
+        self._locations: dict[int, int] = {}
+        self._pending: set[int] = set()
+        self._lock = threading.Lock()
+
+    def apply(self, changes: Iterable[tuple[int, int, int, int, int, bool, int]]) -> int:
+        """Apply ``(rule_id, item_id, location_id, min_qty, max_qty, active, change_seq)`` rows."""
+        applied = 0
+        with self._lock:
+            for rule_id, item_id, location_id, min_qty, max_qty, active, change_seq in changes:
+                values = (item_id, location_id, min_qty, max_qty, active)
+                previous = self._rules.get(rule_id)
+                if previous != values:
+                    if previous is not None and previous[4]:
+                        self._unwatch(rule_id, previous[0], previous[1])
+                    self._rules[rule_id] = values
+                    if active:
+                        self._keys[(item_id, location_id)] = rule_id
+                        self._locations[location_id] = self._locations.get(location_id, 0) + 1
+                        self._pending.add(rule_id)
+                self.watermark = max(self.watermark, change_seq)
+                applied += 1
+        return applied
+
+    def rule_for(self, item_id: int, location_id: int) -> int | None:
+        return self._keys.get((item_id, location_id))
+
+    def watches_location(self, location_id: int) -> bool:
+        return location_id in self._locations
+
+    def mark(self, rule_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._pending.update(rule_ids)
+
+    def drain(self) -> list[int]:
+        """Pending rule ids, in id order; the set is emptied."""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        return sorted(pending)
+
+    def _unwatch(self, rule_id: int, item_id: int, location_id: int) -> None:
+        if self._keys.get((item_id, location_id)) == rule_id:
+            del self._keys[(item_id, location_id)]
+        remaining = self._locations.get(location_id, 0) - 1
+        if remaining > 0:
+            self._locations[location_id] = remaining
+        else:
+            self._locations.pop(location_id, None)
+
+
+_replenishment_triggers: ReplenishmentTriggers | None = None
+
+
+def get_replenishment_triggers() -> ReplenishmentTriggers:
+    global _replenishment_triggers
+    if _replenishment_triggers is None:
+        _replenishment_triggers = ReplenishmentTriggers()
+    return _replenishment_triggers
+
+
+def touch(db: Session, item_id: int, location_id: int) -> None:
+    """Queue the rule watching ``(item_id, location_id)``, if any, for evaluation after commit."""
+    rule_id = get_replenishment_triggers().rule_for(item_id, location_id)
+    if rule_id is not None:
+        db.info.setdefault(_TOUCHED_KEY, set()).add(rule_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_touched(session: Session) -> None:
+    touched = session.info.pop(_TOUCHED_KEY, None)
+    if touched:
+        get_replenishment_triggers().mark(touched)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_touched(session: Session) -> None:
+    session.info.pop(_TOUCHED_KEY, None)
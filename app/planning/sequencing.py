@@ -0,0 +1,87 @@
+"""Open-path stop sequencing: nearest-neighbour construction plus 2-opt."""
+
+import numpy as np
+
+_SEEDS = 6
+
+
+def path_length(distances: np.ndarray, order: np.ndarray) -> float:
+    order = np.asarray(order)
+    if order.size < 2:
+        return 0.0
+    return float(distances[order[:-1], order[1:]].sum())
+
+
+def nearest_neighbour(distances: np.ndarray, start: int = 0) -> np.ndarray:
+    size = distances.shape[0]
+    order = np.empty(size, dtype=np.int64)
+    visited = np.zeros(size, dtype=bool)
+    current = start
+    for position in range(size):
+        order[position] = current
+        visited[current] = True
+        if position == size - 1:
+            break
+        remaining = np.where(visited, np.inf, distances[current])
+        current = int(np.argmin(remaining))
+    return order
+
+
+def two_opt(distances: np.ndarray, order: np.ndarray, *, max_passes: int = 50) -> np.ndarray:
+    """Improve an open path by segment reversal; ``order[0]`` stays fixed.
+
+    For each segment start the gain of every possible segment end is computed
+    in one vectorized step, and the best improving reversal is applied.
+    """
+    order = np.asarray(order, dtype=np.int64).copy()
+    size = order.size
+    if size < 4:
+        return order
+
+    for _ in range(max_passes):
+        improved = False
+        for first in range(1, size - 1):
+            before = order[first - 1]
+            head = order[first]
+            ends = order[first + 1 :]
+            after = np.append(order[first + 2 :], -1)
+            has_after = after >= 0
+            safe_after = np.where(has_after, after, 0)
+
+            removed = distances[before, head] + np.where(
+                has_after, distances[ends, safe_after], 0.0
+            )
+            added = distances[before, ends] + np.where(has_after, distances[head, safe_after], 0.0)
+            gains = removed - added
+            best = int(np.argmax(gains))
+            if gains[best] > 1e-9:
+                last = first + 1 + best
+                order[first : last + 1] = order[first : last + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    return order
+
+
+def sequence_stops(distances: np.ndarray, *, fixed_start: bool = False) -> np.ndarray:
+    """Visit order for the stops of ``distances``.
+
+    With ``fixed_start`` stop 0 is the executor's position and is kept first;
+    otherwise a few stops are tried as the nearest-neighbour seed and the
+    shortest resulting path is kept.
+    """
+    size = distances.shape[0]
+    if size < 3:
+        return np.arange(size)
+    if fixed_start:
+        return two_opt(distances, nearest_neighbour(distances, 0))
+
+    seeds = np.unique(np.linspace(0, size - 1, num=min(size, _SEEDS)).astype(np.int64))
+    best_order = None
+    best_length = np.inf
+    for seed in seeds:
+        order = two_opt(distances, nearest_neighbour(distances, int(seed)))
+        length = path_length(distances, order)
+        if length < best_length:
+            best_order, best_length = order, length
+    return best_order
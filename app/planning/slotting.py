@@ -0,0 +1,69 @@
+"""Velocity classification, co-pick affinity and forward-slot ranking."""
+
+import numpy as np
+
+CLASS_A = "A"
+CLASS_B = "B"
+CLASS_C = "C"
+
+
+def abc_classes(
+    velocities: np.ndarray, *, a_share: float = 0.8, b_share: float = 0.95
+) -> np.ndarray:
+    """ABC class per item from its share of total picks.
+
+    Items are ranked by velocity; the fastest items covering ``a_share`` of all
+    picks are A, the next ones up to ``b_share`` are B and the rest C. An item
+    is classed by the cumulative share *before* it, so the item that crosses a
+    threshold still belongs to the faster class. Items without picks are C.
+    """
+    velocities = np.asarray(velocities, dtype=np.float64)
+    classes = np.full(velocities.size, CLASS_C, dtype="<U1")
+    total = velocities.sum()
+    if total <= 0:
+        return classes
+    order = np.argsort(-velocities, kind="stable")
+    before = (np.cumsum(velocities[order]) - velocities[order]) / total
+    ranked = np.where(before < a_share, CLASS_A, np.where(before < b_share, CLASS_B, CLASS_C))
+    ranked[velocities[order] <= 0] = CLASS_C
+    classes[order] = ranked
+    return classes
+
+
+def copick_pairs(order_ids: np.ndarray, item_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Item pairs picked together in one order and how many orders contain each pair.
+
+    Returns ``(pairs, counts)`` with ``pairs[:, 0] < pairs[:, 1]``. Each order
+    contributes every pair of its distinct items once. Pairs are generated by
+    comparing each row of the order-sorted table with the row ``k`` places
+    further on for ``k`` up to the largest order size, so the work is
+    vectorized per offset rather than per order.
+    """
+    rows = np.unique(
+        np.column_stack([np.asarray(order_ids), np.asarray(item_ids)]).astype(np.int64), axis=0
+    )
+    if rows.shape[0] < 2:
+        return np.zeros((0, 2), dtype=np.int64), np.zeros(0, dtype=np.int64)
+    orders, items = rows[:, 0], rows[:, 1]
+    _, sizes = np.unique(orders, return_counts=True)
+
+    found = []
+    for offset in range(1, int(sizes.max())):
+        same = orders[offset:] == orders[:-offset]
+        if not same.any():
+            break
+        found.append(np.column_stack([items[:-offset][same], items[offset:][same]]))
+    if not found:
+        return np.zeros((0, 2), dtype=np.int64), np.zeros(0, dtype=np.int64)
+    pairs = np.sort(np.concatenate(found), axis=1)
+    return np.unique(pairs, axis=0, return_counts=True)
+
+
+def slot_proximity(distances: np.ndarray) -> np.ndarray:
+    """Distance from each forward slot (row) to its nearest anchor (column).
+
+    The distance is ``inf`` when there are no anchors.
+    """
+    if distances.shape[1] == 0:
+        return np.full(distances.shape[0], np.inf)
+    return np.asarray(distances, dtype=np.float64).min(axis=1)
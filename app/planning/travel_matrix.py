@@ -0,0 +1,303 @@
+"""All-pairs travel distances between locations, memory-mapped from disk.
+
+The matrix is a raw float32 file next to a small ``.npz`` index holding the
+location ids (sorted), coordinates, type codes and active flags. Every worker
+maps the same file read-only, so the matrix is shared through the page cache
+instead of being copied into each process. A rebuild writes a new generation
+file and atomically swaps the index; processes still mapping the previous
+generation keep a consistent view until they reload.
+
+A generation file is never written after it is published, and the previous
+one is kept until the next publish so a worker that read the old index can
+still map it. Rebuilds and refreshes hold an exclusive ``flock`` on a lock
+file in the matrix directory, so workers refreshing at the same time publish
+one generation after the other instead of writing the same file.
+"""
+
+import fcntl
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.core.config import settings
+from app.db.models.location import LocationType
+
+LOCATION_TYPE_CODES = {location_type: code for code, location_type in enumerate(LocationType)}
+
+_INDEX_FILE = "travel_index.npz"
+_LOCK_FILE = "travel_matrix.lock"
+_ROW_CHUNK = 1024
+
+
+@dataclass(frozen=True)
+class LocationGeometry:
+    ids: np.ndarray
+    coords: np.ndarray
+    types: np.ndarray
+    active: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> "LocationGeometry":
+        """Build from ``(id, x, y, z, type, active)`` rows, sorted by id."""
+        rows = sorted(rows, key=lambda row: row[0])
+        ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        coords = np.array([(row[1], row[2], row[3] or 0.0) for row in rows], dtype=np.float64)
+        types = np.fromiter(
+            (LOCATION_TYPE_CODES[LocationType(row[4])] for row in rows),
+            dtype=np.uint8,
+            count=len(rows),
+        )
+        active = np.fromiter((bool(row[5]) for row in rows), dtype=bool, count=len(rows))
+        return cls(ids=ids, coords=coords.reshape(len(rows), 3), types=types, active=active)
+
+
+def travel_distances(
+    origins: np.ndarray, targets: np.ndarray, vertical_weight: float = 1.0
+) -> np.ndarray:
+    """Rectilinear (aisle grid) distance between every origin and every target."""
+    weights = np.array([1.0, 1.0, vertical_weight])
+    return (
+        (np.abs(origins[:, None, :] - targets[None, :, :]) * weights).sum(axis=2).astype(np.float32)
+    )
+
+
+class TravelMatrix:
+    def __init__(self, directory: Path, vertical_weight: float = 1.0) -> None:
+        self.directory = Path(directory)
+        self.vertical_weight = vertical_weight
+        self.generation = 0
+        self.geometry = LocationGeometry.from_rows([])
+        self.distances: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._index_mtime: int | None = None
+        self._type_index: dict[frozenset[LocationType], np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return int(self.geometry.ids.shape[0])
+
+    def load(self) -> bool:
+        """(Re)map the current generation from disk if the index changed. Returns True if loaded."""
+        index_path = self.directory / _INDEX_FILE
+        try:
+            mtime = index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._index_mtime:
+            return True
+
+        with np.load(index_path) as index:
+            geometry = LocationGeometry(
+                ids=index["ids"],
+                coords=index["coords"],
+                types=index["types"],
+                active=index["active"],
+            )
+            generation = int(index["generation"])
+        self._install(
+            geometry, generation, self._open_matrix(generation, geometry.ids.shape[0], "r")
+        )
+        self._index_mtime = mtime
+        return True
+
+    def index_of(self, location_ids: np.ndarray) -> np.ndarray:
+        """Matrix row for each location id, or -1 for ids without coordinates."""
+        location_ids = np.asarray(location_ids, dtype=np.int64)
+        positions = np.searchsorted(self.geometry.ids, location_ids)
+        positions = np.minimum(positions, max(self.size - 1, 0))
+        found = self.size > 0 and self.geometry.ids[positions] == location_ids
+        return np.where(found, positions, -1)
+
+    def distance(self, from_location_id: int, to_location_id: int) -> float | None:
+        rows = self.index_of(np.array([from_location_id, to_location_id]))
+        if (rows < 0).any():
+            return None
+        return float(self.distances[rows[0], rows[1]])
+
+    def nearest(
+        self,
+        location_id: int,
+        *,
+        types: set[LocationType] | None = None,
+        limit: int = 1,
+        active_only: bool = True,
+    ) -> list[tuple[int, float]]:
+        row = int(self.index_of(np.array([location_id]))[0])
+        if row < 0:
+            return []
+        candidates = self.candidates(types, active_only=active_only)
+        candidates = candidates[candidates != row]
+        if candidates.size == 0:
+            return []
+        costs = np.asarray(self.distances[row, candidates])
+        limit = min(limit, candidates.size)
+        best = np.argpartition(costs, limit - 1)[:limit]
+        best = best[np.argsort(costs[best], kind="stable")]
+        return [(int(self.geometry.ids[candidates[i]]), float(costs[i])) for i in best]
+
+    def nearest_to_point(
+        self,
+        point: tuple[float, float, float],
+        *,
+        types: set[LocationType] | None = None,
+        limit: int = 1,
+        active_only: bool = True,
+    ) -> list[tuple[int, float]]:
+        candidates = self.candidates(types, active_only=active_only)
+        if candidates.size == 0:
+            return []
+        origin = np.array([point], dtype=np.float64)
+        costs = travel_distances(origin, self.geometry.coords[candidates], self.vertical_weight)[0]
+        limit = min(limit, candidates.size)
+        best = np.argpartition(costs, limit - 1)[:limit]
+        best = best[np.argsort(costs[best], kind="stable")]
+        return [(int(self.geometry.ids[candidates[i]]), float(costs[i])) for i in best]
+
+    def candidates(
+        self, types: set[LocationType] | None, *, active_only: bool = True
+    ) -> np.ndarray:
+        """Matrix rows of locations of the given types, cached per type set."""
+        key = frozenset(types or LocationType)
+        if not active_only:
+            codes = [LOCATION_TYPE_CODES[location_type] for location_type in key]
+            return np.flatnonzero(np.isin(self.geometry.types, codes))
+        cached = self._type_index.get(key)
+        if cached is None:
+            codes = [LOCATION_TYPE_CODES[location_type] for location_type in key]
+            cached = np.flatnonzero(self.geometry.active & np.isin(self.geometry.types, codes))
+            self._type_index[key] = cached
+        return cached
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the matrix against other threads of this process and against other processes."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / _LOCK_FILE, "a") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def rebuild(self, geometry: LocationGeometry) -> None:
+        """Recompute every pair and publish it as a new generation."""
+        with self._exclusive():
+            # Another worker may have published since this one last loaded.
+            self.load()
+            self._publish(geometry, reuse=np.full(geometry.ids.shape[0], -1, dtype=np.int64))
+
+    def refresh(self, geometry: LocationGeometry) -> int:
+        """Bring the matrix in line with ``geometry``, recomputing only changed locations.
+
+        Returns the number of locations whose distances were recomputed.
+        """
+        with self._exclusive():
+            self.load()
+            old = self.geometry
+            old_rows = self.index_of(geometry.ids)
+            unchanged = old_rows >= 0
+            unchanged[unchanged] = (
+                old.coords[old_rows[unchanged]] == geometry.coords[unchanged]
+            ).all(axis=1)
+            reuse = np.where(unchanged, old_rows, -1)
+            stale = int((~unchanged).sum())
+
+            if stale == 0 and geometry.ids.shape[0] == old.ids.shape[0]:
+                if not (
+                    np.array_equal(old.types, geometry.types)
+                    and np.array_equal(old.active, geometry.active)
+                ):
+                    self._write_index(geometry, self.generation)
+                    self._install(geometry, self.generation, self.distances)
+                return 0
+
+            self._publish(geometry, reuse=reuse)
+            return stale
+
+    def _publish(self, geometry: LocationGeometry, *, reuse: np.ndarray) -> None:
+        size = geometry.ids.shape[0]
+        generation = self.generation + 1
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        if size:
+            matrix = self._open_matrix(generation, size, "w+")
+            kept = np.flatnonzero(reuse >= 0)
+            fresh = np.flatnonzero(reuse < 0)
+            for start in range(0, size, _ROW_CHUNK):
+                rows = np.arange(start, min(start + _ROW_CHUNK, size))
+                block = np.empty((rows.size, size), dtype=np.float32)
+                kept_rows = reuse[rows] >= 0
+                if kept_rows.any() and kept.size:
+                    source_rows = reuse[rows[kept_rows]]
+                    block[np.ix_(np.flatnonzero(kept_rows), kept)] = self.distances[
+                        np.ix_(source_rows, reuse[kept])
+                    ]
+                if fresh.size:
+                    block[:, fresh] = travel_distances(
+                        geometry.coords[rows], geometry.coords[fresh], self.vertical_weight
+                    )
+                if (~kept_rows).any():
+                    block[~kept_rows] = travel_distances(
+                        geometry.coords[rows[~kept_rows]], geometry.coords, self.vertical_weight
+                    )
+                matrix[start : start + rows.size] = block
+            matrix.flush()
+            del matrix
+
+        previous = self.generation
+        self._write_index(geometry, generation)
+        self._install(geometry, generation, self._open_matrix(generation, size, "r"))
+        for path in self.directory.glob("travel_matrix.*.f32"):
+            if int(path.suffixes[0][1:]) < previous:
+                path.unlink(missing_ok=True)
+
+    def _install(self, geometry: LocationGeometry, generation: int, distances: np.ndarray) -> None:
+        self.geometry = geometry
+        self.generation = generation
+        self.distances = distances
+        self._type_index = {}
+
+    def _write_index(self, geometry: LocationGeometry, generation: int) -> None:
+        index_path = self.directory / _INDEX_FILE
+        tmp_path = self.directory / f".{_INDEX_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as handle:
+            np.savez(
+                handle,
+                ids=geometry.ids,
+                coords=geometry.coords,
+                types=geometry.types,
+                active=geometry.active,
+                generation=np.int64(generation),
+            )
+        os.replace(tmp_path, index_path)
+        self._index_mtime = index_path.stat().st_mtime_ns
+
+    def _matrix_path(self, generation: int) -> Path:
+        return self.directory / f"travel_matrix.{generation}.f32"
+
+    def _open_matrix(self, generation: int, size: int, mode: str) -> np.ndarray:
+        if size == 0:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.memmap(
+            self._matrix_path(generation), dtype=np.float32, mode=mode, shape=(size, size)
+        )
+
+
+_travel_matrix: TravelMatrix | None = None
+
+
+def get_travel_matrix() -> TravelMatrix:
+    """Process-wide matrix, remapped lazily when another worker publishes a new generation."""
+    global _travel_matrix
+    if _travel_matrix is None:
+        _travel_matrix = TravelMatrix(
+            Path(settings.travel_matrix_dir), settings.travel_vertical_weight
+        )
+    _travel_matrix.load()
+    return _travel_matrix
@@ -0,0 +1,49 @@
+"""Vectorized matching of counted stock against inventory positions.
+
+A counted row and a position are matched on ``(hu_id, item_id)``, packed
+into one int64 key so the whole submission is matched with one sort and one
+binary search instead of a lookup per row.
+"""
+
+import numpy as np
+
+
+def pack_keys(hu_ids: np.ndarray, item_ids: np.ndarray) -> np.ndarray:
+    return (np.asarray(hu_ids, dtype=np.int64) << 32) | np.asarray(item_ids, dtype=np.int64)
+
+
+def duplicate_rows(hu_ids: np.ndarray, item_ids: np.ndarray) -> np.ndarray:
+    """Indices of rows repeating an earlier ``(hu_id, item_id)``."""
+    keys = pack_keys(hu_ids, item_ids)
+    _, first = np.unique(keys, return_index=True)
+    repeated = np.ones(keys.size, dtype=bool)
+    repeated[first] = False
+    return np.flatnonzero(repeated)
+
+
+def match_positions(
+    hu_ids: np.ndarray,
+    item_ids: np.ndarray,
+    position_hu_ids: np.ndarray,
+    position_item_ids: np.ndarray,
+) -> np.ndarray:
+    """Index into the positions of every counted row.
+
+    The index is ``-1`` where the unit holds no position of the item.
+    """
+    if np.asarray(position_hu_ids).size == 0:
+        return np.full(np.asarray(hu_ids).size, -1, dtype=np.int64)
+    keys = pack_keys(position_hu_ids, position_item_ids)
+    order = np.argsort(keys, kind="stable")
+    ordered = keys[order]
+    wanted = pack_keys(hu_ids, item_ids)
+    slots = np.minimum(np.searchsorted(ordered, wanted), ordered.size - 1)
+    return np.where(ordered[slots] == wanted, order[slots], -1)
+
+
+def gather(values: np.ndarray, rows: np.ndarray, missing: int = 0) -> np.ndarray:
+    """``values[rows]`` with ``missing`` where ``rows`` is ``-1``."""
+    values = np.asarray(values, dtype=np.int64)
+    if values.size == 0:
+        return np.full(rows.size, missing, dtype=np.int64)
+    return np.where(rows >= 0, values[np.maximum(rows, 0)], missing)
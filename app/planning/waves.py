@@ -0,0 +1,69 @@
+"""Greedy capacity-bounded clustering of pick lines into waves."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.planning.travel_matrix import travel_distances
+
+
+@dataclass
+class Wave:
+    priority: int
+    line_ids: list[int]
+    payload: float
+    route_distance: float | None
+    mission_id: int | None = None
+
+
+def plan_waves(
+    coords: np.ndarray,
+    payloads: np.ndarray,
+    priorities: np.ndarray,
+    *,
+    capacity: float,
+    max_lines: int,
+    vertical_weight: float = 1.0,
+) -> list[np.ndarray]:
+    """Group line indices into waves.
+
+    Lines are clustered within a priority tier, highest tier first. Each wave
+    is seeded with the oldest open line of the tier and grown with the lines
+    whose sources are closest to the seed, until ``max_lines`` or ``capacity``
+    is reached. Distances from the seed to every open line are computed in one
+    vectorized step per wave. Lines without coordinates (NaN) are only grouped
+    with each other.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    payloads = np.asarray(payloads, dtype=np.float64)
+    priorities = np.asarray(priorities)
+    located = ~np.isnan(coords).any(axis=1)
+
+    waves: list[np.ndarray] = []
+    for tier in np.unique(priorities)[::-1]:
+        for pool_mask in (located, ~located):
+            pool = np.flatnonzero((priorities == tier) & pool_mask)
+            while pool.size:
+                seed = pool[0]
+                if located[seed]:
+                    distances = travel_distances(
+                        coords[seed][None, :], coords[pool], vertical_weight
+                    )[0]
+                else:
+                    distances = np.arange(pool.size, dtype=np.float32)
+                distances[0] = -1.0
+
+                take = min(max_lines, pool.size)
+                nearest = np.arange(pool.size)
+                if take < pool.size:
+                    nearest = np.argpartition(distances, take - 1)[:take]
+                nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+                loaded = np.cumsum(payloads[pool[nearest]])
+                fits = max(int(np.searchsorted(loaded, capacity, side="right")), 1)
+                chosen = nearest[:fits]
+
+                waves.append(pool[chosen])
+                keep = np.ones(pool.size, dtype=bool)
+                keep[chosen] = False
+                pool = pool[keep]
+    return waves
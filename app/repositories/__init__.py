@@ -4,7 +4,12 @@ from app.repositories.inventory import InventoryMovementRepository, InventoryPos
 from app.repositories.item import ItemRepository
 from app.repositories.location import LocationRepository
 from app.repositories.mission import MissionRepository
+from app.repositories.movement_archive import MovementArchiveRepository
 from app.repositories.operator import OperatorRepository
+from app.repositories.outbox import OutboxRepository
+from app.repositories.report import ReportRepository
+from app.repositories.slotting import SlottingRepository
+from app.repositories.sync import SyncRepository
 
 __all__ = [
     "ExecutorRepository",
@@ -14,5 +19,10 @@ __all__ = [
     "ItemRepository",
     "LocationRepository",
     "MissionRepository",
+    "MovementArchiveRepository",
     "OperatorRepository",
+    "OutboxRepository",
+    "ReportRepository",
+    "SlottingRepository",
+    "SyncRepository",
 ]
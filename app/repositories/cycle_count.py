@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, select, update
+
+from app.db.models.cycle_count import (
+    CycleCount,
+    CycleCountLine,
+    CycleCountLineStatus,
+    CycleCountState,
+)
+from app.repositories.base import BaseRepository
+
+
+class CycleCountRepository(BaseRepository):
+    def create(
+        self,
+        *,
+        count_no: str,
+        created_by_operator_id: int,
+        location_id: int | None = None,
+        zone: str | None = None,
+    ) -> CycleCount:
+        entity = CycleCount(
+            count_no=count_no,
+            location_id=location_id,
+            zone=zone,
+            created_by_operator_id=created_by_operator_id,
+            state=CycleCountState.OPEN,
+        )
+        self.db.add(entity)
+        self.db.flush()
+        self.db.refresh(entity)
+        return entity
+
+    def get(self, cycle_count_id: int) -> CycleCount | None:
+        return self.db.get(CycleCount, cycle_count_id)
+
+    def list(self, *, state: CycleCountState | None = None) -> list[CycleCount]:
+        statement = select(CycleCount).order_by(CycleCount.id)
+        if state is not None:
+            statement = statement.where(CycleCount.state == state)
+        return list(self.db.scalars(statement).all())
+
+    def close(self, cycle_count: CycleCount, state: CycleCountState) -> CycleCount:
+        cycle_count.state = state
+        cycle_count.closed_at = datetime.now(tz=timezone.utc)
+        self.db.flush()
+        self.db.refresh(cycle_count)
+        return cycle_count
+
+    def list_lines(
+        self,
+        cycle_count_id: int,
+        *,
+        status: CycleCountLineStatus | None = None,
+        line_ids: list[int] | None = None,
+        hu_ids: list[int] | None = None,
+    ) -> list[CycleCountLine]:
+        statement = select(CycleCountLine).where(CycleCountLine.cycle_count_id == cycle_count_id)
+        if status is not None:
+            statement = statement.where(CycleCountLine.status == status)
+        if line_ids is not None:
+            statement = statement.where(CycleCountLine.id.in_(line_ids))
+        if hu_ids is not None:
+            statement = statement.where(CycleCountLine.hu_id.in_(hu_ids))
+        return list(self.db.scalars(statement.order_by(CycleCountLine.id)).all())
+
+    def line_keys(
+        self, cycle_count_id: int
+    ) -> dict[tuple[int, int], tuple[int, CycleCountLineStatus]]:
+        """``(hu_id, item_id) -> (line id, status)`` of the lines counted so far."""
+        statement = select(
+            CycleCountLine.hu_id, CycleCountLine.item_id, CycleCountLine.id, CycleCountLine.status
+        ).where(CycleCountLine.cycle_count_id == cycle_count_id)
+        return {
+            (hu_id, item_id): (line_id, status)
+            for hu_id, item_id, line_id, status in self.db.execute(statement)
+        }
+
+    def existing_idempotency_keys(self, keys: list[str]) -> set[str]:
+        if not keys:
+            return set()
+        statement = select(CycleCountLine.idempotency_key).where(
+            CycleCountLine.idempotency_key.in_(keys)
+        )
+        return set(self.db.scalars(statement).all())
+
+    def insert_lines(self, lines: list[dict]) -> None:
+        """Bulk insert; each dict holds the line columns."""
+        if lines:
+            self.db.execute(insert(CycleCountLine), lines)
+
+    def update_lines(self, lines: list[dict]) -> None:
+        """Bulk update by primary key; each dict holds ``id`` and the columns to set."""
+        if lines:
+            self.db.execute(update(CycleCountLine), lines)
+
+    def set_status(self, line_ids: list[int], status: CycleCountLineStatus) -> None:
+        if line_ids:
+            self.db.execute(
+                update(CycleCountLine)
+                .where(CycleCountLine.id.in_(line_ids))
+                .values(status=status)
+                .execution_options(synchronize_session=False)
+            )
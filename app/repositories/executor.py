@@ -1,10 +1,28 @@
+from __future__ import annotations
+
 from datetime import datetime
-from decimal import Decimal
 
 from sqlalchemy import select
 
 from app.db.models.executor import Executor, ExecutorType
 from app.repositories.base import BaseRepository
+from app.repositories.listing import Listing, ListQuery, Page, paginate
+
+EXECUTOR_LISTING = Listing(
+    Executor,
+    fields=(
+        "id",
+        "code",
+        "name",
+        "executor_type",
+        "max_payload_kg",
+        "active",
+        "last_seen_at",
+        "created_at",
+    ),
+    filters=("code", "name", "executor_type", "active"),
+    sorts=("id", "code", "name", "executor_type"),
+)
 
 
 class ExecutorRepository(BaseRepository):
@@ -14,7 +32,7 @@ class ExecutorRepository(BaseRepository):
         code: str,
         name: str,
         executor_type: ExecutorType,
-        max_payload_kg: Decimal,
+        max_payload_kg: int,
         active: bool = True,
     ) -> Executor:
         entity = Executor(
@@ -32,8 +50,15 @@ class ExecutorRepository(BaseRepository):
     def get(self, executor_id: int) -> Executor | None:
         return self.db.get(Executor, executor_id)
 
-    def list(self) -> list[Executor]:
-        return list(self.db.scalars(select(Executor).order_by(Executor.id)).all())
+    def list(self, query: ListQuery, *, executor_type: ExecutorType | None = None) -> Page:
+        conditions = [Executor.executor_type == executor_type] if executor_type is not None else []
+        return paginate(self.db, EXECUTOR_LISTING, query, *conditions)
+
+    def list_active(self, executor_ids: list[int] | None = None) -> list[Executor]:
+        statement = select(Executor).where(Executor.active.is_(True)).order_by(Executor.id)
+        if executor_ids is not None:
+            statement = statement.where(Executor.id.in_(executor_ids))
+        return list(self.db.scalars(statement).all())
 
     def update(
         self,
@@ -41,7 +66,7 @@ class ExecutorRepository(BaseRepository):
         *,
         name: str | None = None,
         executor_type: ExecutorType | None = None,
-        max_payload_kg: Decimal | None = None,
+        max_payload_kg: int | None = None,
         active: bool | None = None,
         last_seen_at: datetime | None = None,
     ) -> Executor:
@@ -1,7 +1,29 @@
-from sqlalchemy import select
+from __future__ import annotations
 
-from app.db.models.handling_unit import HandlingUnit, HandlingUnitStatus
+from sqlalchemy import delete, exists, insert, literal, select, true, update
+from sqlalchemy.orm import aliased
+
+from app.db.change_tracking import next_change_seq
+from app.db.models.handling_unit import HandlingUnit, HandlingUnitClosure, HandlingUnitStatus
 from app.repositories.base import BaseRepository
+from app.repositories.listing import Listing, ListQuery, Page, paginate
+from app.repositories.location import LocationRepository
+
+HANDLING_UNIT_LISTING = Listing(
+    HandlingUnit,
+    fields=(
+        "id",
+        "hu_code",
+        "location_id",
+        "parent_hu_id",
+        "status",
+        "tare_kg",
+        "gross_weight_kg",
+        "created_at",
+    ),
+    filters=("hu_code", "location_id", "parent_hu_id", "status"),
+    sorts=("id", "hu_code", "location_id", "status", "gross_weight_kg"),
+)
 
 
 class HandlingUnitRepository(BaseRepository):
@@ -11,18 +33,60 @@ class HandlingUnitRepository(BaseRepository):
         hu_code: str,
         location_id: int,
         status: HandlingUnitStatus = HandlingUnitStatus.OPEN,
+        parent_hu_id: int | None = None,
+        tare_kg: int = 0,
     ) -> HandlingUnit:
-        entity = HandlingUnit(hu_code=hu_code, location_id=location_id, status=status)
+        entity = HandlingUnit(
+            hu_code=hu_code,
+            location_id=location_id,
+            status=status,
+            tare_kg=tare_kg,
+            gross_weight_kg=tare_kg,
+        )
         self.db.add(entity)
         self.db.flush()
+        self.db.execute(
+            insert(HandlingUnitClosure).values(
+                ancestor_id=entity.id, descendant_id=entity.id, depth=0
+            )
+        )
+        if parent_hu_id is not None:
+            self._link(entity.id, parent_hu_id)
+            self._add_weight_above(entity.id, tare_kg)
+            entity.parent_hu_id = parent_hu_id
+            self.db.flush()
+        LocationRepository(self.db).adjust_occupancy(
+            location_id, units=1 if parent_hu_id is None else 0, weight_kg=tare_kg
+        )
         self.db.refresh(entity)
         return entity
 
     def get(self, handling_unit_id: int) -> HandlingUnit | None:
         return self.db.get(HandlingUnit, handling_unit_id)
 
-    def list(self) -> list[HandlingUnit]:
-        return list(self.db.scalars(select(HandlingUnit).order_by(HandlingUnit.id)).all())
+    def list(self, query: ListQuery) -> Page:
+        return paginate(self.db, HANDLING_UNIT_LISTING, query)
+
+    def locations_of(self, handling_unit_ids: list[int]) -> dict[int, int]:
+        """``hu_id -> location_id`` of the given units that exist."""
+        statement = select(HandlingUnit.id, HandlingUnit.location_id).where(
+            HandlingUnit.id.in_(handling_unit_ids)
+        )
+        return {hu_id: location_id for hu_id, location_id in self.db.execute(statement).all()}
+
+    def list_changed_since(self, change_seq: int) -> list[tuple[int, int, HandlingUnitStatus, int]]:
+        """``(id, location_id, status, change_seq)`` of units changed after ``change_seq``."""
+        statement = (
+            select(
+                HandlingUnit.id,
+                HandlingUnit.location_id,
+                HandlingUnit.status,
+                HandlingUnit.change_seq,
+            )
+            .where(HandlingUnit.change_seq > change_seq)
+            .order_by(HandlingUnit.change_seq, HandlingUnit.id)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
 
     def update(
         self,
@@ -31,10 +95,150 @@ class HandlingUnitRepository(BaseRepository):
         location_id: int | None = None,
         status: HandlingUnitStatus | None = None,
     ) -> HandlingUnit:
-        if location_id is not None:
-            handling_unit.location_id = location_id
+        if location_id is not None and location_id != handling_unit.location_id:
+            self.move_tree(handling_unit.id, location_id)
         if status is not None:
             handling_unit.status = status
         self.db.flush()
         self.db.refresh(handling_unit)
         return handling_unit
+
+    def get_root(self, handling_unit_id: int) -> HandlingUnit | None:
+        statement = (
+            select(HandlingUnit)
+            .join(HandlingUnitClosure, HandlingUnitClosure.ancestor_id == HandlingUnit.id)
+            .where(HandlingUnitClosure.descendant_id == handling_unit_id)
+            .order_by(HandlingUnitClosure.depth.desc())
+            .limit(1)
+        )
+        return self.db.scalar(statement)
+
+    def list_descendants(self, handling_unit_id: int) -> list[HandlingUnit]:
+        statement = (
+            select(HandlingUnit)
+            .join(HandlingUnitClosure, HandlingUnitClosure.descendant_id == HandlingUnit.id)
+            .where(
+                HandlingUnitClosure.ancestor_id == handling_unit_id, HandlingUnitClosure.depth > 0
+            )
+            .order_by(HandlingUnitClosure.depth, HandlingUnit.id)
+        )
+        return list(self.db.scalars(statement).all())
+
+    def is_descendant(self, handling_unit_id: int, ancestor_id: int) -> bool:
+        statement = select(
+            exists().where(
+                HandlingUnitClosure.ancestor_id == ancestor_id,
+                HandlingUnitClosure.descendant_id == handling_unit_id,
+            )
+        )
+        return bool(self.db.scalar(statement))
+
+    def attach(self, handling_unit: HandlingUnit, parent: HandlingUnit) -> HandlingUnit:
+        """Nest a unit in ``parent``; both must already be at the same location."""
+        if handling_unit.parent_hu_id is not None:
+            self._add_weight_above(handling_unit.id, -handling_unit.gross_weight_kg)
+            self._unlink(handling_unit.id)
+        else:
+            LocationRepository(self.db).adjust_occupancy(handling_unit.location_id, units=-1)
+        self._link(handling_unit.id, parent.id)
+        self._add_weight_above(handling_unit.id, handling_unit.gross_weight_kg)
+        handling_unit.parent_hu_id = parent.id
+        self.db.flush()
+        self.db.refresh(handling_unit)
+        return handling_unit
+
+    def detach(self, handling_unit: HandlingUnit) -> HandlingUnit:
+        if handling_unit.parent_hu_id is not None:
+            self._add_weight_above(handling_unit.id, -handling_unit.gross_weight_kg)
+            self._unlink(handling_unit.id)
+            handling_unit.parent_hu_id = None
+            self.db.flush()
+            LocationRepository(self.db).adjust_occupancy(handling_unit.location_id, units=1)
+            self.db.refresh(handling_unit)
+        return handling_unit
+
+    def move_tree(self, handling_unit_id: int, location_id: int) -> int:
+        """Move a unit and its contents.
+
+        Its slot and weight are carried between the location counters.
+        """
+        handling_unit = self.get(handling_unit_id)
+        if handling_unit is not None and handling_unit.location_id != location_id:
+            units = 1 if handling_unit.parent_hu_id is None else 0
+            locations = LocationRepository(self.db)
+            locations.adjust_occupancy(
+                handling_unit.location_id, units=-units, weight_kg=-handling_unit.gross_weight_kg
+            )
+            locations.adjust_occupancy(
+                location_id, units=units, weight_kg=handling_unit.gross_weight_kg
+            )
+        subtree = select(HandlingUnitClosure.descendant_id).where(
+            HandlingUnitClosure.ancestor_id == handling_unit_id
+        )
+        statement = (
+            update(HandlingUnit)
+            .where(HandlingUnit.id.in_(subtree))
+            .values(location_id=location_id, change_seq=next_change_seq(self.db))
+            .execution_options(synchronize_session="fetch")
+        )
+        return self.db.execute(statement).rowcount
+
+    def add_weight(
+        self, handling_unit: HandlingUnit, weight_kg: int, *, enforce_limits: bool = True
+    ) -> None:
+        """Add stock weight to a unit, the units it is nested in and the load of its location."""
+        if not weight_kg:
+            return
+        self._add_weight_above(handling_unit.id, weight_kg, include_self=True)
+        LocationRepository(self.db).adjust_occupancy(
+            handling_unit.location_id, weight_kg=weight_kg, enforce_limits=enforce_limits
+        )
+
+    def _add_weight_above(
+        self, handling_unit_id: int, weight_kg: int, *, include_self: bool = False
+    ) -> None:
+        """Add ``weight_kg`` to the gross weight of every unit the given one is nested in."""
+        if not weight_kg:
+            return
+        ancestors = select(HandlingUnitClosure.ancestor_id).where(
+            HandlingUnitClosure.descendant_id == handling_unit_id,
+            HandlingUnitClosure.depth >= (0 if include_self else 1),
+        )
+        self.db.execute(
+            update(HandlingUnit)
+            .where(HandlingUnit.id.in_(ancestors))
+            .values(
+                gross_weight_kg=HandlingUnit.gross_weight_kg + weight_kg,
+                change_seq=next_change_seq(self.db),
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+
+    def _link(self, handling_unit_id: int, parent_hu_id: int) -> None:
+        above = aliased(HandlingUnitClosure)
+        below = aliased(HandlingUnitClosure)
+        paths = (
+            select(above.ancestor_id, below.descendant_id, above.depth + below.depth + literal(1))
+            .join(below, true())
+            .where(above.descendant_id == parent_hu_id, below.ancestor_id == handling_unit_id)
+        )
+        self.db.execute(
+            insert(HandlingUnitClosure).from_select(
+                ["ancestor_id", "descendant_id", "depth"], paths
+            )
+        )
+
+    def _unlink(self, handling_unit_id: int) -> None:
+        subtree = select(HandlingUnitClosure.descendant_id).where(
+            HandlingUnitClosure.ancestor_id == handling_unit_id
+        )
+        ancestors = select(HandlingUnitClosure.ancestor_id).where(
+            HandlingUnitClosure.descendant_id == handling_unit_id,
+            HandlingUnitClosure.depth > 0,
+        )
+        self.db.execute(
+            delete(HandlingUnitClosure).where(
+                HandlingUnitClosure.descendant_id.in_(subtree),
+                HandlingUnitClosure.ancestor_id.in_(ancestors),
+            )
+        )
@@ -1,9 +1,19 @@
-from decimal import Decimal
+from __future__ import annotations
 
-from sqlalchemy import and_, select, update
+from collections.abc import Iterator
+from datetime import datetime
 
+from sqlalchemy import and_, bindparam, delete, func, insert, select, update
+
+from app.core.quantity import scale_milli
+from app.db.change_tracking import next_change_seq
+from app.db.models.handling_unit import HandlingUnit, HandlingUnitClosure
 from app.db.models.inventory import InventoryMovement, InventoryMovementType, InventoryPosition
+from app.db.models.item import Item
+from app.events.payloads import movement_payload
 from app.repositories.base import BaseRepository
+from app.repositories.handling_unit import HandlingUnitRepository
+from app.repositories.outbox import OutboxRepository
 
 
 class InventoryPositionRepository(BaseRepository):
@@ -29,8 +39,154 @@ class InventoryPositionRepository(BaseRepository):
             statement = statement.where(InventoryPosition.item_id == item_id)
         return list(self.db.scalars(statement).all())
 
-    def create(self, *, hu_id: int, item_id: int, qty_on_hand: Decimal = Decimal("0")) -> InventoryPosition:
-        entity = InventoryPosition(hu_id=hu_id, item_id=item_id, qty_on_hand=qty_on_hand, qty_reserved=Decimal("0"))
+    def list_item_ids_in_tree(self, hu_id: int) -> list[int]:
+        """Items stocked in ``hu_id`` or any unit nested in it."""
+        subtree = select(HandlingUnitClosure.descendant_id).where(
+            HandlingUnitClosure.ancestor_id == hu_id
+        )
+        statement = (
+            select(InventoryPosition.item_id)
+            .where(InventoryPosition.hu_id.in_(subtree), InventoryPosition.qty_on_hand > 0)
+            .distinct()
+        )
+        return list(self.db.scalars(statement).all())
+
+    def list_for_units(self, hu_ids: list[int]) -> list[tuple]:
+        """Positions in the given units.
+
+        Each row is ``(id, hu_id, item_id, qty_on_hand, qty_reserved, version)``.
+        """
+        statement = select(
+            InventoryPosition.id,
+            InventoryPosition.hu_id,
+            InventoryPosition.item_id,
+            InventoryPosition.qty_on_hand,
+            InventoryPosition.qty_reserved,
+            InventoryPosition.version,
+        ).where(InventoryPosition.hu_id.in_(hu_ids))
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def list_available_changed_since(self, change_seq: int) -> list[tuple]:
+        """Positions changed after ``change_seq``.
+
+        Each row is ``(id, item_id, hu_id, qty_on_hand - qty_reserved, updated_at, change_seq)``.
+        """
+        statement = (
+            select(
+                InventoryPosition.id,
+                InventoryPosition.item_id,
+                InventoryPosition.hu_id,
+                InventoryPosition.qty_on_hand - InventoryPosition.qty_reserved,
+                InventoryPosition.updated_at,
+                InventoryPosition.change_seq,
+            )
+            .where(InventoryPosition.change_seq > change_seq)
+            .order_by(InventoryPosition.change_seq, InventoryPosition.id)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def reserve(self, reservations: list[tuple[int, int, int]]) -> bool:
+        """Add ``(hu_id, item_id, qty)`` to ``qty_reserved`` in one statement.
+
+        A negative ``qty`` releases a reservation. Each row applies only while
+        the reservation stays within the stock on hand; returns ``False`` if any
+        did not, and the caller must roll back. ``updated_at`` is kept, so
+        reserving does not change the FIFO age.
+        """
+        if not reservations:
+            return True
+        table = InventoryPosition.__table__
+        last = next_change_seq(self.db, len(reservations))
+        statement = (
+            update(table)
+            .where(
+                table.c.hu_id == bindparam("b_hu_id"),
+                table.c.item_id == bindparam("b_item_id"),
+                table.c.qty_reserved + bindparam("b_qty") >= 0,
+                table.c.qty_reserved + bindparam("b_qty") <= table.c.qty_on_hand,
+            )
+            .values(
+                qty_reserved=table.c.qty_reserved + bindparam("b_qty"),
+                updated_at=table.c.updated_at,
+                change_seq=bindparam("b_change_seq"),
+            )
+        )
+        result = self.db.execute(
+            statement,
+            [
+                {"b_hu_id": hu_id, "b_item_id": item_id, "b_qty": qty, "b_change_seq": change_seq}
+                for (hu_id, item_id, qty), change_seq in zip(
+                    reservations, range(last - len(reservations) + 1, last + 1), strict=True
+                )
+            ],
+        )
+        return result.rowcount == len(reservations)
+
+    def apply_counts(self, counts: list[tuple[int, int, int]]) -> bool:
+        """Add ``qty_delta`` to each ``(position_id, expected_version, qty_delta)`` at once.
+
+        Each row applies only while the position is still at ``expected_version``
+        and keeps its reserved stock; returns ``False`` if any did not, and the
+        caller must roll back. Weights are left to the caller.
+        """
+        if not counts:
+            return True
+        table = InventoryPosition.__table__
+        last = next_change_seq(self.db, len(counts))
+        statement = (
+            update(table)
+            .where(
+                table.c.id == bindparam("b_id"),
+                table.c.version == bindparam("b_version"),
+                table.c.qty_on_hand + bindparam("b_qty") >= table.c.qty_reserved,
+            )
+            .values(
+                qty_on_hand=table.c.qty_on_hand + bindparam("b_qty"),
+                version=table.c.version + 1,
+                change_seq=bindparam("b_change_seq"),
+            )
+        )
+        result = self.db.execute(
+            statement,
+            [
+                {
+                    "b_id": position_id,
+                    "b_version": version,
+                    "b_qty": qty,
+                    "b_change_seq": change_seq,
+                }
+                for (position_id, version, qty), change_seq in zip(
+                    counts, range(last - len(counts) + 1, last + 1), strict=True
+                )
+            ],
+        )
+        return result.rowcount == len(counts)
+
+    def create_many(self, positions: list[tuple[int, int, int]]) -> None:
+        """Insert ``(hu_id, item_id, qty_on_hand)`` positions in one statement."""
+        if not positions:
+            return
+        last = next_change_seq(self.db, len(positions))
+        self.db.execute(
+            insert(InventoryPosition),
+            [
+                {
+                    "hu_id": hu_id,
+                    "item_id": item_id,
+                    "qty_on_hand": qty,
+                    "qty_reserved": 0,
+                    "change_seq": change_seq,
+                }
+                for (hu_id, item_id, qty), change_seq in zip(
+                    positions, range(last - len(positions) + 1, last + 1), strict=True
+                )
+            ],
+        )
+
+    def create(self, *, hu_id: int, item_id: int, qty_on_hand: int = 0) -> InventoryPosition:
+        entity = InventoryPosition(
+            hu_id=hu_id, item_id=item_id, qty_on_hand=qty_on_hand, qty_reserved=0
+        )
         self.db.add(entity)
         self.db.flush()
         self.db.refresh(entity)
@@ -41,24 +197,51 @@ class InventoryPositionRepository(BaseRepository):
         *,
         position_id: int,
         expected_version: int,
-        qty_delta: Decimal,
+        qty_delta: int,
+        qty_reserved_delta: int = 0,
     ) -> bool:
+        """Apply ``qty_delta`` if the position is still at ``expected_version``.
+
+        Stock reserved for other mission lines cannot be taken; a line consuming
+        its own reservation releases it with ``qty_reserved_delta``.
+
+        The stock weight change is carried to the handling unit, the units it is
+        nested in and the load of its location in the same transaction.
+        """
         statement = (
             update(InventoryPosition)
             .where(
                 and_(
                     InventoryPosition.id == position_id,
                     InventoryPosition.version == expected_version,
-                    (InventoryPosition.qty_on_hand + qty_delta) >= 0,
+                    (InventoryPosition.qty_on_hand + qty_delta)
+                    >= (InventoryPosition.qty_reserved + qty_reserved_delta),
                 )
             )
             .values(
                 qty_on_hand=InventoryPosition.qty_on_hand + qty_delta,
+                qty_reserved=InventoryPosition.qty_reserved + qty_reserved_delta,
                 version=InventoryPosition.version + 1,
+                change_seq=next_change_seq(self.db),
+            )
+            .returning(
+                InventoryPosition.hu_id, InventoryPosition.item_id, InventoryPosition.qty_on_hand
             )
         )
-        result = self.db.execute(statement)
-        return result.rowcount == 1
+        row = self.db.execute(statement).first()
+        if row is None:
+            return False
+        hu_id, item_id, qty_on_hand = row
+        item = self.db.get(Item, item_id)
+        if item is not None and item.weight_kg:
+            # Weigh the position before and after, so repeated partial moves never drift.
+            weight_delta = scale_milli(qty_on_hand, item.weight_kg) - scale_milli(
+                qty_on_hand - qty_delta, item.weight_kg
+            )
+            HandlingUnitRepository(self.db).add_weight(
+                self.db.get(HandlingUnit, hu_id), weight_delta
+            )
+        return True
 
 
 class InventoryMovementRepository(BaseRepository):
@@ -67,7 +250,7 @@ class InventoryMovementRepository(BaseRepository):
         *,
         movement_type: InventoryMovementType,
         item_id: int | None,
-        qty: Decimal,
+        qty: int,
         mission_line_id: int | None = None,
         from_location_id: int | None = None,
         to_location_id: int | None = None,
@@ -93,12 +276,122 @@ class InventoryMovementRepository(BaseRepository):
         self.db.add(entity)
         self.db.flush()
         self.db.refresh(entity)
+        OutboxRepository(self.db).add(
+            topic="movement.created",
+            aggregate_type="inventory_movement",
+            aggregate_id=entity.id,
+            payload={
+                **movement_payload(entity),
+                "executed_at": entity.executed_at.isoformat(),
+                "reason": reason,
+            },
+        )
         return entity
 
+    def create_many(self, movements: list[dict]) -> dict[str, int]:
+        """Bulk :meth:`create`.
+
+        Each dict holds the movement columns and a unique ``idempotency_key``.
+        Returns the id of each created movement by idempotency key.
+        """
+        if not movements:
+            return {}
+        table = InventoryMovement.__table__
+        self.db.execute(insert(table), movements)
+        statement = (
+            select(table)
+            .where(
+                table.c.idempotency_key.in_([movement["idempotency_key"] for movement in movements])
+            )
+            .order_by(table.c.id)
+        )
+        created = self.db.execute(statement).all()
+        OutboxRepository(self.db).add_many(
+            [
+                {
+                    "topic": "movement.created",
+                    "aggregate_type": "inventory_movement",
+                    "aggregate_id": movement.id,
+                    "payload": {
+                        **movement_payload(movement),
+                        "executed_at": movement.executed_at.isoformat(),
+                        "reason": movement.reason,
+                    },
+                }
+                for movement in created
+            ]
+        )
+        return {movement.idempotency_key: movement.id for movement in created}
+
+    def existing_idempotency_keys(self, keys: list[str]) -> set[str]:
+        if not keys:
+            return set()
+        statement = select(InventoryMovement.idempotency_key).where(
+            InventoryMovement.idempotency_key.in_(keys)
+        )
+        return set(self.db.scalars(statement).all())
+
     def get_by_idempotency_key(self, idempotency_key: str) -> InventoryMovement | None:
-        statement = select(InventoryMovement).where(InventoryMovement.idempotency_key == idempotency_key)
+        statement = select(InventoryMovement).where(
+            InventoryMovement.idempotency_key == idempotency_key
+        )
         return self.db.scalar(statement)
 
-    def list(self) -> list[InventoryMovement]:
+    def list(
+        self,
+        *,
+        executed_from: datetime | None = None,
+        executed_to: datetime | None = None,
+    ) -> list[InventoryMovement]:
         statement = select(InventoryMovement).order_by(InventoryMovement.id)
+        if executed_from is not None:
+            statement = statement.where(InventoryMovement.executed_at >= executed_from)
+        if executed_to is not None:
+            statement = statement.where(InventoryMovement.executed_at < executed_to)
         return list(self.db.scalars(statement).all())
+
+    def oldest_executed_at(self) -> datetime | None:
+        return self.db.scalar(select(func.min(InventoryMovement.executed_at)))
+
+    def max_id(self) -> int:
+        return self.db.scalar(select(func.max(InventoryMovement.id))) or 0
+
+    def iter_between(
+        self, start: datetime, end: datetime, *, up_to_id: int, chunk_size: int = 5000
+    ) -> Iterator[InventoryMovement]:
+        statement = (
+            select(InventoryMovement)
+            .where(
+                InventoryMovement.executed_at >= start,
+                InventoryMovement.executed_at < end,
+                InventoryMovement.id <= up_to_id,
+            )
+            .order_by(InventoryMovement.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        return iter(self.db.scalars(statement))
+
+    def delete_between(self, start: datetime, end: datetime, *, up_to_id: int) -> int:
+        statement = delete(InventoryMovement).where(
+            InventoryMovement.executed_at >= start,
+            InventoryMovement.executed_at < end,
+            InventoryMovement.id <= up_to_id,
+        )
+        return self.db.execute(statement.execution_options(synchronize_session=False)).rowcount
+
+    def last_location_by_executor(self, executor_ids: list[int]) -> dict[int, int]:
+        latest = (
+            select(func.max(InventoryMovement.id))
+            .where(
+                InventoryMovement.executed_by_executor_id.in_(executor_ids),
+                InventoryMovement.to_location_id.is_not(None),
+            )
+            .group_by(InventoryMovement.executed_by_executor_id)
+        )
+        statement = select(
+            InventoryMovement.executed_by_executor_id, InventoryMovement.to_location_id
+        ).where(InventoryMovement.id.in_(latest))
+        return {
+            executor_id: location_id
+            for executor_id, location_id in self.db.execute(statement).all()
+        }
@@ -1,12 +1,30 @@
+from __future__ import annotations
+
 from sqlalchemy import select
 
 from app.db.models.item import Item
 from app.repositories.base import BaseRepository
+from app.repositories.listing import Listing, ListQuery, Page, paginate
+
+ITEM_LISTING = Listing(
+    Item,
+    fields=("id", "sku", "name", "uom", "weight_kg", "volume_l", "created_at"),
+    filters=("sku", "name", "uom"),
+    sorts=("id", "sku", "name"),
+)
 
 
 class ItemRepository(BaseRepository):
-    def create(self, *, sku: str, name: str, uom: str = "ea") -> Item:
-        entity = Item(sku=sku, name=name, uom=uom)
+    def create(
+        self,
+        *,
+        sku: str,
+        name: str,
+        uom: str = "ea",
+        weight_kg: int | None = None,
+        volume_l: int | None = None,
+    ) -> Item:
+        entity = Item(sku=sku, name=name, uom=uom, weight_kg=weight_kg, volume_l=volume_l)
         self.db.add(entity)
         self.db.flush()
         self.db.refresh(entity)
@@ -15,5 +33,28 @@ class ItemRepository(BaseRepository):
     def get(self, item_id: int) -> Item | None:
         return self.db.get(Item, item_id)
 
-    def list(self) -> list[Item]:
-        return list(self.db.scalars(select(Item).order_by(Item.id)).all())
+    def list(self, query: ListQuery) -> Page:
+        return paginate(self.db, ITEM_LISTING, query)
+
+    def weights(self, item_ids: list[int]) -> dict[int, int | None]:
+        """``item_id -> weight_kg`` of the given items that exist."""
+        statement = select(Item.id, Item.weight_kg).where(Item.id.in_(item_ids))
+        return {item_id: weight_kg for item_id, weight_kg in self.db.execute(statement).all()}
+
+    def update(
+        self,
+        item: Item,
+        *,
+        name: str | None = None,
+        weight_kg: int | None = None,
+        volume_l: int | None = None,
+    ) -> Item:
+        if name is not None:
+            item.name = name
+        if weight_kg is not None:
+            item.weight_kg = weight_kg
+        if volume_l is not None:
+            item.volume_l = volume_l
+        self.db.flush()
+        self.db.refresh(item)
+        return item
@@ -0,0 +1,223 @@
+"""Filtering, sorting and keyset pagination of list queries.
+
+A :class:`Listing` names, per model, the columns a client may select, filter
+on and sort by. :func:`paginate` turns a :class:`ListQuery` into one SELECT
+with the matching WHERE and ORDER BY clauses and reads one page of it, so a
+list endpoint never loads more than a page of its table.
+
+Filters are ``field=value``, repeated for IN, or ``field__op=value`` with
+``op`` one of :data:`OPERATORS`; values are parsed with the column's Python
+type. ``sort`` is a comma-separated list of fields, ``-`` in front for
+descending; ``id`` is always appended as the tiebreaker so the order is
+total. Pages are cut by keyset rather than offset: the cursor holds the sort
+values of the last row and the next page starts strictly after them, which
+costs the same on every page and never skips or repeats rows when rows are
+inserted meanwhile. Sortable columns must be NOT NULL, since NULLs do not
+compare, and must not be DateTime: SQLite server defaults store timestamps
+without the microseconds SQLAlchemy binds, so equal values compare unequal.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.rules.exceptions import RuleViolation
+
+OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte", "prefix")
+
+# A count past this many rows is reported as an estimate.
+COUNT_CAP = 10000
+
+
+@dataclass(frozen=True)
+class Listing:
+    model: type
+    fields: tuple[str, ...]
+    filters: tuple[str, ...]
+    sorts: tuple[str, ...]
+    default_sort: str = "id"
+
+    def describe(self) -> str:
+        return (
+            f"Filter on {', '.join(self.filters)} (`field=value`, repeat for IN, "
+            f"or `field__op=value` with op one of {', '.join(OPERATORS)}). "
+            f"Sort by {', '.join(self.sorts)} (`-` for descending). "
+            "The next page cursor is returned in `X-Next-Cursor`."
+        )
+
+
+@dataclass
+class ListQuery:
+    filters: dict[str, list[str]] = field(default_factory=dict)
+    sort: str | None = None
+    limit: int = 500
+    cursor: str | None = None
+    fields: list[str] | None = None
+    count: bool = False
+
+
+@dataclass
+class Page:
+    # Entities, or dicts of ``fields`` when the query selects fields.
+    rows: list
+    fields: list[str] | None = None
+    next_cursor: str | None = None
+    total: int | None = None
+    total_exact: bool = True
+
+
+def _adapter(column) -> TypeAdapter:
+    return TypeAdapter(column.type.python_type)
+
+
+def _parse(column, name: str, raw: Any) -> Any:
+    try:
+        return _adapter(column).validate_python(raw)
+    except ValidationError as exc:
+        raise RuleViolation(f"Invalid value for {name}: {raw!r}") from exc
+
+
+def _condition(listing: Listing, key: str, values: list[str]):
+    name, _, op = key.partition("__")
+    op = op or "eq"
+    if name not in listing.filters:
+        raise RuleViolation(f"Cannot filter on {name!r}; allowed: {', '.join(listing.filters)}")
+    if op not in OPERATORS:
+        raise RuleViolation(f"Unknown filter operator {op!r}; allowed: {', '.join(OPERATORS)}")
+    column = getattr(listing.model, name)
+    if op == "prefix":
+        return or_(*(column.startswith(value, autoescape=True) for value in values))
+    parsed = [_parse(column, key, value) for value in values]
+    if op == "eq":
+        return column == parsed[0] if len(parsed) == 1 else column.in_(parsed)
+    if len(parsed) > 1:
+        raise RuleViolation(f"{key} takes a single value")
+    value = parsed[0]
+    return {
+        "ne": column != value,
+        "gt": column > value,
+        "gte": column >= value,
+        "lt": column < value,
+        "lte": column <= value,
+    }[op]
+
+
+def _sort_keys(listing: Listing, sort: str | None) -> list[tuple[str, bool]]:
+    keys: list[tuple[str, bool]] = []
+    for part in (sort or listing.default_sort).split(","):
+        part = part.strip()
+        name = part.lstrip("-")
+        if name not in listing.sorts:
+            raise RuleViolation(f"Cannot sort by {name!r}; allowed: {', '.join(listing.sorts)}")
+        keys.append((name, part.startswith("-")))
+    if all(name != "id" for name, _ in keys):
+        keys.append(("id", False))
+    return keys
+
+
+def _encode_cursor(listing: Listing, keys: list[tuple[str, bool]], values: list[Any]) -> str:
+    dumped = [
+        _adapter(getattr(listing.model, name)).dump_python(value, mode="json")
+        for (name, _), value in zip(keys, values, strict=True)
+    ]
+    payload = json.dumps(
+        {"sort": [[name, desc] for name, desc in keys], "after": dumped}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(listing: Listing, keys: list[tuple[str, bool]], cursor: str) -> list[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        sort, after = payload["sort"], payload["after"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise RuleViolation("Invalid cursor") from exc
+    if [tuple(key) for key in sort] != keys or len(after) != len(keys):
+        raise RuleViolation("Cursor does not match the requested sort")
+    return [
+        _parse(getattr(listing.model, name), "cursor", value)
+        for (name, _), value in zip(keys, after)
+    ]
+
+
+def _after(listing: Listing, keys: list[tuple[str, bool]], values: list[Any]):
+    """Rows strictly past ``values`` in the order of ``keys``."""
+    clauses = []
+    for position, (name, desc) in enumerate(keys):
+        column = getattr(listing.model, name)
+        equal = [
+            getattr(listing.model, key) == value for (key, _), value in zip(keys[:position], values)
+        ]
+        past = column < values[position] if desc else column > values[position]
+        clauses.append(and_(*equal, past))
+    return or_(*clauses)
+
+
+def _count(db: Session, listing: Listing, conditions: list) -> tuple[int, bool]:
+    """Number of matching rows, counted up to :data:`COUNT_CAP`.
+
+    Past the cap the count is estimated from the id range.
+    """
+    capped = select(listing.model.id).where(*conditions).limit(COUNT_CAP).subquery()
+    total = db.scalar(select(func.count()).select_from(capped)) or 0
+    if total < COUNT_CAP:
+        return total, True
+    if conditions:
+        return total, False
+    first, last = db.execute(select(func.min(listing.model.id), func.max(listing.model.id))).one()
+    return max(total, last - first + 1), False
+
+
+def paginate(db: Session, listing: Listing, query: ListQuery, *conditions) -> Page:
+    """One page of ``listing.model`` for ``query``, further restricted by ``conditions``."""
+    conditions = [
+        *conditions,
+        *(_condition(listing, key, values) for key, values in query.filters.items()),
+    ]
+    keys = _sort_keys(listing, query.sort)
+
+    fields = query.fields
+    if fields is not None:
+        unknown = [name for name in fields if name not in listing.fields]
+        if unknown:
+            raise RuleViolation(
+                f"Unknown fields {', '.join(unknown)}; allowed: {', '.join(listing.fields)}"
+            )
+        selected = list(dict.fromkeys([*fields, *(name for name, _ in keys)]))
+        statement = select(*(getattr(listing.model, name) for name in selected))
+    else:
+        statement = select(listing.model)
+
+    statement = statement.where(*conditions)
+    if query.cursor is not None:
+        statement = statement.where(
+            _after(listing, keys, _decode_cursor(listing, keys, query.cursor))
+        )
+    order = [getattr(listing.model, name) for name, _ in keys]
+    statement = statement.order_by(
+        *(column.desc() if desc else column.asc() for column, (_, desc) in zip(order, keys))
+    ).limit(query.limit + 1)
+
+    if fields is not None:
+        rows: list = [dict(row) for row in db.execute(statement).mappings()]
+    else:
+        rows = list(db.scalars(statement).all())
+
+    page = Page(rows=rows[: query.limit], fields=fields)
+    if len(rows) > query.limit:
+        last = page.rows[-1]
+        values = [last[name] if fields is not None else getattr(last, name) for name, _ in keys]
+        page.next_cursor = _encode_cursor(listing, keys, values)
+    if fields is not None:
+        page.rows = [{name: row[name] for name in fields} for row in page.rows]
+    if query.count:
+        page.total, page.total_exact = _count(db, listing, conditions)
+    return page
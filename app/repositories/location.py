@@ -1,7 +1,34 @@
-from sqlalchemy import select
+from __future__ import annotations
 
+from sqlalchemy import case, func, or_, select, update
+
+from app.db.change_tracking import next_change_seq
 from app.db.models.location import Location, LocationType
 from app.repositories.base import BaseRepository
+from app.repositories.listing import Listing, ListQuery, Page, paginate
+from app.rules.exceptions import RuleViolation
+
+LOCATION_LISTING = Listing(
+    Location,
+    fields=(
+        "id",
+        "code",
+        "name",
+        "type",
+        "active",
+        "x",
+        "y",
+        "z",
+        "zone",
+        "max_hu",
+        "max_weight_kg",
+        "hu_count",
+        "load_kg",
+        "created_at",
+    ),
+    filters=("code", "name", "type", "zone", "active", "hu_count"),
+    sorts=("id", "code", "name", "type", "hu_count", "load_kg"),
+)
 
 
 class LocationRepository(BaseRepository):
@@ -12,8 +39,25 @@ class LocationRepository(BaseRepository):
         name: str,
         type: LocationType = LocationType.BULK,
         active: bool = True,
+        x: float | None = None,
+        y: float | None = None,
+        z: float | None = None,
+        zone: str | None = None,
+        max_hu: int | None = None,
+        max_weight_kg: int | None = None,
     ) -> Location:
-        entity = Location(code=code, name=name, type=type, active=active)
+        entity = Location(
+            code=code,
+            name=name,
+            type=type,
+            active=active,
+            x=x,
+            y=y,
+            z=z,
+            zone=zone,
+            max_hu=max_hu,
+            max_weight_kg=max_weight_kg,
+        )
         self.db.add(entity)
         self.db.flush()
         self.db.refresh(entity)
@@ -22,23 +66,128 @@ class LocationRepository(BaseRepository):
     def get(self, location_id: int) -> Location | None:
         return self.db.get(Location, location_id)
 
-    def list(self) -> list[Location]:
-        return list(self.db.scalars(select(Location).order_by(Location.id)).all())
+    def list(self, query: ListQuery) -> Page:
+        return paginate(self.db, LOCATION_LISTING, query)
 
-    def update(
-        self,
-        location: Location,
-        *,
-        name: str | None = None,
-        type: LocationType | None = None,
-        active: bool | None = None,
-    ) -> Location:
-        if name is not None:
-            location.name = name
-        if type is not None:
-            location.type = type
-        if active is not None:
-            location.active = active
+    def list_ids(
+        self, *, types: set[LocationType] | None = None, zone: str | None = None
+    ) -> list[int]:
+        statement = select(Location.id).order_by(Location.id)
+        if types is not None:
+            statement = statement.where(Location.type.in_(types))
+        if zone is not None:
+            statement = statement.where(Location.zone == zone)
+        return list(self.db.scalars(statement).all())
+
+    def list_geometry(self) -> list[tuple]:
+        statement = (
+            select(Location.id, Location.x, Location.y, Location.z, Location.type, Location.active)
+            .where(Location.x.is_not(None), Location.y.is_not(None))
+            .order_by(Location.id)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def update(self, location: Location, **values: object) -> Location:
+        """Set the given columns; ``None`` clears a nullable one."""
+        for field, value in values.items():
+            setattr(location, field, value)
         self.db.flush()
         self.db.refresh(location)
         return location
+
+    def adjust_occupancy(
+        self,
+        location_id: int,
+        *,
+        units: int = 0,
+        weight_kg: int = 0,
+        enforce_limits: bool = True,
+    ) -> None:
+        """Add to the occupancy counters in one conditional UPDATE.
+
+        Increments only apply while they stay within the location's limits, so
+        two transactions cannot both take its last slot; raises ``RuleViolation``
+        409 otherwise. ``enforce_limits=False`` is for corrections of what is
+        already there.
+        """
+        if not units and not weight_kg:
+            return
+        statement = (
+            update(Location)
+            .where(Location.id == location_id)
+            .values(
+                hu_count=Location.hu_count + units,
+                load_kg=Location.load_kg + weight_kg,
+                change_seq=next_change_seq(self.db),
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        if units > 0 and enforce_limits:
+            statement = statement.where(
+                or_(Location.max_hu.is_(None), Location.hu_count + units <= Location.max_hu)
+            )
+        if weight_kg > 0 and enforce_limits:
+            statement = statement.where(
+                or_(
+                    Location.max_weight_kg.is_(None),
+                    Location.load_kg + weight_kg <= Location.max_weight_kg,
+                )
+            )
+        if self.db.execute(statement).rowcount != 1:
+            raise RuleViolation("Location capacity exceeded", status_code=409)
+
+    def list_occupancy_changed_since(self, change_seq: int) -> list[tuple]:
+        """Locations changed after ``change_seq``.
+
+        Each row is ``(id, hu_count, max_hu, load_kg, max_weight_kg, change_seq)``.
+        """
+        statement = (
+            select(
+                Location.id,
+                Location.hu_count,
+                Location.max_hu,
+                Location.load_kg,
+                Location.max_weight_kg,
+                Location.change_seq,
+            )
+            .where(Location.change_seq > change_seq)
+            .order_by(Location.change_seq, Location.id)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def free_slots(
+        self, *, zone: str | None = None, types: set[LocationType] | None = None
+    ) -> list[tuple]:
+        """Per ``(zone, type)`` of active locations: ``(zone, type, locations, open_locations,
+        free_slots, unlimited_locations)``.
+
+        Reads the occupancy counters only; ``free_slots`` counts the remaining
+        slots of locations with a ``max_hu`` limit.
+        """
+        limited = Location.max_hu.is_not(None)
+        statement = (
+            select(
+                Location.zone,
+                Location.type,
+                func.count(),
+                func.sum(case((or_(~limited, Location.hu_count < Location.max_hu), 1), else_=0)),
+                func.sum(
+                    case(
+                        (
+                            limited & (Location.hu_count < Location.max_hu),
+                            Location.max_hu - Location.hu_count,
+                        ),
+                        else_=0,
+                    )
+                ),
+                func.sum(case((~limited, 1), else_=0)),
+            )
+            .where(Location.active.is_(True))
+            .group_by(Location.zone, Location.type)
+            .order_by(Location.zone, Location.type)
+        )
+        if zone is not None:
+            statement = statement.where(Location.zone == zone)
+        if types:
+            statement = statement.where(Location.type.in_(types))
+        return [tuple(row) for row in self.db.execute(statement).all()]
@@ -1,12 +1,18 @@
+from __future__ import annotations
+
 from datetime import datetime, timezone
-from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, func, insert, select, update
 from sqlalchemy.orm import selectinload
 
+from app.core.quantity import scale_milli
+from app.db.models.handling_unit import HandlingUnit
 from app.db.models.inventory import InventoryMovement
+from app.db.models.item import Item
 from app.db.models.mission import Mission, MissionLine, MissionState, MissionType
+from app.events.payloads import mission_payload
 from app.repositories.base import BaseRepository
+from app.repositories.outbox import OutboxRepository
 
 
 class MissionRepository(BaseRepository):
@@ -29,30 +35,68 @@ class MissionRepository(BaseRepository):
         self.db.add(mission)
         self.db.flush()
 
-        for line in lines:
+        for sequence, line in enumerate(self._with_payloads(lines)):
             mission_line = MissionLine(
                 mission_id=mission.id,
                 from_location_id=line["from_location_id"],
                 to_location_id=line["to_location_id"],
                 item_id=line.get("item_id"),
                 hu_id=line.get("hu_id"),
-                qty=Decimal(str(line["qty"])),
-                qty_done=Decimal("0"),
+                qty=line["qty"],
+                qty_done=0,
+                payload_kg=line["payload_kg"],
+                sequence=sequence,
             )
             self.db.add(mission_line)
 
         self.db.flush()
         self.db.refresh(mission)
+        self._record_transition(mission, "mission.created")
         return self.get_with_lines(mission.id) or mission
 
+    def _with_payloads(self, lines: list[dict]) -> list[dict]:
+        """Lines with ``payload_kg``: item weight times qty, or the gross weight of a moved unit.
+
+        The payload stays ``None`` for an item without a weight.
+        """
+        item_ids = {line["item_id"] for line in lines if line.get("item_id") is not None}
+        hu_ids = {
+            line["hu_id"]
+            for line in lines
+            if line.get("item_id") is None and line.get("hu_id") is not None
+        }
+        weights = {
+            item_id: weight_kg
+            for item_id, weight_kg in self.db.execute(
+                select(Item.id, Item.weight_kg).where(Item.id.in_(item_ids))
+            )
+        }
+        gross = {
+            hu_id: gross_weight_kg
+            for hu_id, gross_weight_kg in self.db.execute(
+                select(HandlingUnit.id, HandlingUnit.gross_weight_kg).where(
+                    HandlingUnit.id.in_(hu_ids)
+                )
+            )
+        }
+        return [{**line, "payload_kg": self._payload(line, weights, gross)} for line in lines]
+
+    @staticmethod
+    def _payload(line: dict, weights: dict, gross: dict) -> int | None:
+        if line.get("item_id") is None:
+            return gross.get(line.get("hu_id"), 0)
+        weight_kg = weights.get(line["item_id"])
+        return None if weight_kg is None else scale_milli(line["qty"], weight_kg)
+
     def get(self, mission_id: int) -> Mission | None:
         return self.db.get(Mission, mission_id)
 
+    def get_version(self, mission_id: int) -> int | None:
+        return self.db.scalar(select(Mission.version).where(Mission.id == mission_id))
+
     def get_with_lines(self, mission_id: int) -> Mission | None:
         statement = (
-            select(Mission)
-            .options(selectinload(Mission.lines))
-            .where(Mission.id == mission_id)
+            select(Mission).options(selectinload(Mission.lines)).where(Mission.id == mission_id)
         )
         return self.db.scalar(statement)
 
@@ -60,6 +104,187 @@ class MissionRepository(BaseRepository):
         statement = select(Mission).options(selectinload(Mission.lines)).order_by(Mission.id)
         return list(self.db.scalars(statement).all())
 
+    def list_by_state(
+        self, state: MissionState, mission_ids: list[int] | None = None
+    ) -> list[Mission]:
+        statement = (
+            select(Mission)
+            .options(selectinload(Mission.lines))
+            .where(Mission.state == state)
+            .order_by(Mission.id)
+        )
+        if mission_ids is not None:
+            statement = statement.where(Mission.id.in_(mission_ids))
+        return list(self.db.scalars(statement).all())
+
+    def list_with_lines(self, mission_ids: list[int]) -> list[Mission]:
+        statement = (
+            select(Mission)
+            .options(selectinload(Mission.lines))
+            .where(Mission.id.in_(mission_ids))
+            .order_by(Mission.id)
+            .execution_options(populate_existing=True)
+        )
+        return list(self.db.scalars(statement).all())
+
+    def list_pending_item_lines(self, mission_ids: list[int] | None = None) -> list[tuple]:
+        """Open lines of draft item missions.
+
+        Each row is ``(line_id, mission_id, from_location_id, payload_open, priority)``.
+
+        ``payload_open`` is the milli-kg share of the cached line payload still to move,
+        taking a unit of an item without a weight as 1 kg like
+        :func:`~app.rules.movement_rules.line_payload`.
+        """
+        statement = (
+            select(
+                MissionLine.id,
+                MissionLine.mission_id,
+                MissionLine.from_location_id,
+                func.coalesce(MissionLine.payload_kg, MissionLine.qty)
+                * (MissionLine.qty - MissionLine.qty_done)
+                // MissionLine.qty,
+                Mission.priority,
+            )
+            .join(Mission, MissionLine.mission_id == Mission.id)
+            .where(Mission.state == MissionState.DRAFT, Mission.type == MissionType.MOVE_ITEM)
+            .order_by(MissionLine.id)
+        )
+        if mission_ids is not None:
+            statement = statement.where(Mission.id.in_(mission_ids))
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def create_many(self, missions: list[dict]) -> list[Mission]:
+        entities = [Mission(state=MissionState.DRAFT, **values) for values in missions]
+        self.db.add_all(entities)
+        self.db.flush()
+        return entities
+
+    def create_many_with_lines(self, missions: list[dict]) -> list[Mission]:
+        """Bulk :meth:`create`; each dict holds the mission columns and its ``lines``."""
+        if not missions:
+            return []
+        entities = self.create_many(
+            [{key: value for key, value in values.items() if key != "lines"} for values in missions]
+        )
+        self.db.execute(
+            insert(MissionLine),
+            [
+                {"mission_id": mission.id, "qty_done": 0, "sequence": sequence, **line}
+                for mission, values in zip(entities, missions, strict=True)
+                for sequence, line in enumerate(self._with_payloads(values["lines"]))
+            ],
+        )
+        created = self.list_with_lines([mission.id for mission in entities])
+        self.record_created(created)
+        return created
+
+    def record_created(self, missions: list[Mission]) -> None:
+        """Write the ``mission.created`` outbox messages of missions created in bulk.
+
+        ``missions`` come with their lines loaded; the message lists their ids.
+        """
+        OutboxRepository(self.db).add_many(
+            [
+                self._transition_message(
+                    "mission.created",
+                    {
+                        **mission_payload(mission),
+                        "line_ids": [line.id for line in mission.lines],
+                        "started_at": None,
+                        "completed_at": None,
+                        "cancel_reason": None,
+                    },
+                )
+                for mission in missions
+            ]
+        )
+
+    def bump_versions(self, mission_ids: list[int]) -> None:
+        """Bump ``version`` of missions changed by a bulk statement.
+
+        Bulk statements bypass the flush hook that bumps it otherwise.
+        """
+        if mission_ids:
+            self.db.execute(
+                update(Mission)
+                .where(Mission.id.in_(mission_ids))
+                .values(version=Mission.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+
+    def move_lines(self, lines: list[dict]) -> bool:
+        """Bulk re-home lines: each dict holds ``id``, ``mission_id`` and ``sequence``.
+
+        Each line moves only while its current mission is still a draft;
+        returns ``False`` if any did not, and the caller must roll back.
+        """
+        if not lines:
+            return True
+        previous = self.db.scalars(
+            select(MissionLine.mission_id).where(MissionLine.id.in_([line["id"] for line in lines]))
+        ).all()
+        table = MissionLine.__table__
+        statement = (
+            update(table)
+            .where(
+                table.c.id == bindparam("b_id"),
+                table.c.mission_id.in_(
+                    select(Mission.id).where(Mission.state == MissionState.DRAFT)
+                ),
+            )
+            .values(mission_id=bindparam("b_mission_id"), sequence=bindparam("b_sequence"))
+        )
+        result = self.db.execute(
+            statement,
+            [
+                {
+                    "b_id": line["id"],
+                    "b_mission_id": line["mission_id"],
+                    "b_sequence": line["sequence"],
+                }
+                for line in lines
+            ],
+        )
+        if result.rowcount != len(lines):
+            return False
+        self.bump_versions(sorted({*previous, *(line["mission_id"] for line in lines)}))
+        return True
+
+    def cancel_many(self, mission_ids: list[int], reason: str) -> bool:
+        """Cancel draft missions in one statement; ``False`` if any is no longer a draft."""
+        if not mission_ids:
+            return True
+        statement = (
+            update(Mission)
+            .where(Mission.id.in_(mission_ids), Mission.state == MissionState.DRAFT)
+            .values(state=MissionState.CANCELLED, cancel_reason=reason, version=Mission.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.execute(statement).rowcount != len(set(mission_ids)):
+            return False
+        OutboxRepository(self.db).add_many(
+            [
+                self._transition_message(
+                    "mission.cancelled",
+                    {
+                        "mission_id": mission_id,
+                        "state": MissionState.CANCELLED.value,
+                        "cancel_reason": reason,
+                    },
+                )
+                for mission_id in mission_ids
+            ]
+        )
+        return True
+
+    def list_busy_executor_ids(self) -> set[int]:
+        statement = select(Mission.assigned_executor_id).where(
+            Mission.state.in_([MissionState.ASSIGNED, MissionState.IN_PROGRESS]),
+            Mission.assigned_executor_id.is_not(None),
+        )
+        return set(self.db.scalars(statement).all())
+
     def update_priority(self, mission: Mission, priority: int) -> Mission:
         mission.priority = priority
         self.db.flush()
@@ -71,6 +296,77 @@ class MissionRepository(BaseRepository):
         mission.state = MissionState.ASSIGNED
         self.db.flush()
         self.db.refresh(mission)
+        self._record_transition(mission, "mission.assigned")
+        return mission
+
+    def assign_many(self, assignments: list[tuple[int, int]]) -> bool:
+        """Assign each ``(mission_id, executor_id)`` in one statement.
+
+        Each row applies only while the mission is still an unassigned draft and
+        the executor has no assigned or started mission; returns ``False`` if any
+        did not, and the caller must roll back.
+        """
+        if not assignments:
+            return True
+        table = Mission.__table__
+        busy = table.alias("busy")
+        statement = (
+            update(table)
+            .where(
+                table.c.id == bindparam("b_id"),
+                table.c.state == MissionState.DRAFT,
+                table.c.assigned_executor_id.is_(None),
+                ~exists().where(
+                    busy.c.assigned_executor_id == bindparam("b_executor_id"),
+                    busy.c.state.in_([MissionState.ASSIGNED, MissionState.IN_PROGRESS]),
+                ),
+            )
+            .values(
+                assigned_executor_id=bindparam("b_executor_id"),
+                state=MissionState.ASSIGNED,
+                version=table.c.version + 1,
+            )
+        )
+        result = self.db.execute(
+            statement,
+            [
+                {"b_id": mission_id, "b_executor_id": executor_id}
+                for mission_id, executor_id in assignments
+            ],
+        )
+        if result.rowcount != len(assignments):
+            return False
+        OutboxRepository(self.db).add_many(
+            [
+                self._transition_message(
+                    "mission.assigned",
+                    {
+                        "mission_id": mission_id,
+                        "state": MissionState.ASSIGNED.value,
+                        "assigned_executor_id": executor_id,
+                    },
+                )
+                for mission_id, executor_id in assignments
+            ]
+        )
+        return True
+
+    def set_route(
+        self,
+        mission: Mission,
+        line_ids: list[int],
+        *,
+        route_distance: float | None,
+        route_distance_saved: float | None,
+    ) -> Mission:
+        positions = {line_id: sequence for sequence, line_id in enumerate(line_ids)}
+        for line in mission.lines:
+            line.sequence = positions[line.id]
+        mission.route_distance = route_distance
+        mission.route_distance_saved = route_distance_saved
+        self.db.flush()
+        self.db.expire(mission, ["lines"])
+        self.db.refresh(mission)
         return mission
 
     def start(self, mission: Mission) -> Mission:
@@ -78,6 +374,7 @@ class MissionRepository(BaseRepository):
         mission.started_at = datetime.now(tz=timezone.utc)
         self.db.flush()
         self.db.refresh(mission)
+        self._record_transition(mission, "mission.started")
         return mission
 
     def complete(self, mission: Mission) -> Mission:
@@ -85,6 +382,7 @@ class MissionRepository(BaseRepository):
         mission.completed_at = datetime.now(tz=timezone.utc)
         self.db.flush()
         self.db.refresh(mission)
+        self._record_transition(mission, "mission.completed")
         return mission
 
     def cancel(self, mission: Mission, reason: str) -> Mission:
@@ -92,13 +390,50 @@ class MissionRepository(BaseRepository):
         mission.cancel_reason = reason
         self.db.flush()
         self.db.refresh(mission)
+        self._record_transition(mission, "mission.cancelled")
         return mission
 
+    def _record_transition(self, mission: Mission, topic: str) -> None:
+        payload = {
+            **mission_payload(mission),
+            "started_at": mission.started_at.isoformat() if mission.started_at else None,
+            "completed_at": mission.completed_at.isoformat() if mission.completed_at else None,
+            "cancel_reason": mission.cancel_reason,
+        }
+        OutboxRepository(self.db).add(**self._transition_message(topic, payload))
+
+    @staticmethod
+    def _transition_message(topic: str, payload: dict) -> dict:
+        return {
+            "topic": topic,
+            "aggregate_type": "mission",
+            "aggregate_id": payload["mission_id"],
+            "payload": payload,
+        }
+
+    def release_reservations(self, mission: Mission) -> list[tuple[int, int, int]]:
+        """Clear the reservations held by the mission's lines.
+
+        Returns them as ``(hu_id, item_id, -qty)``.
+        """
+        released = [
+            (line.hu_id, line.item_id, -line.reserved_qty)
+            for line in mission.lines
+            if line.reserved_qty > 0
+        ]
+        for line in mission.lines:
+            line.reserved_qty = 0
+        self.db.flush()
+        return released
+
     def get_line(self, mission_line_id: int) -> MissionLine | None:
         return self.db.get(MissionLine, mission_line_id)
 
-    def increment_line_done(self, mission_line: MissionLine, qty_delta: Decimal) -> MissionLine:
-        mission_line.qty_done = Decimal(str(mission_line.qty_done)) + Decimal(str(qty_delta))
+    def increment_line_done(
+        self, mission_line: MissionLine, qty_delta: int, *, released: int = 0
+    ) -> MissionLine:
+        mission_line.qty_done += qty_delta
+        mission_line.reserved_qty -= released
         self.db.flush()
         self.db.refresh(mission_line)
         return mission_line
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.db.models.movement_archive import MovementArchive
+from app.repositories.base import BaseRepository
+
+
+class MovementArchiveRepository(BaseRepository):
+    def add(
+        self,
+        *,
+        period: str,
+        path: str,
+        row_count: int,
+        first_movement_id: int,
+        last_movement_id: int,
+        first_executed_at: datetime,
+        last_executed_at: datetime,
+    ) -> MovementArchive:
+        entity = MovementArchive(
+            period=period,
+            path=path,
+            row_count=row_count,
+            first_movement_id=first_movement_id,
+            last_movement_id=last_movement_id,
+            first_executed_at=first_executed_at,
+            last_executed_at=last_executed_at,
+        )
+        self.db.add(entity)
+        self.db.flush()
+        self.db.refresh(entity)
+        return entity
+
+    def merge(
+        self,
+        entity: MovementArchive,
+        *,
+        path: str,
+        row_count: int,
+        first_movement_id: int,
+        last_movement_id: int,
+        first_executed_at: datetime,
+        last_executed_at: datetime,
+    ) -> MovementArchive:
+        """Point ``entity`` at the file that adds ``row_count`` movements to its archive."""
+        entity.path = path
+        entity.row_count += row_count
+        entity.first_movement_id = min(entity.first_movement_id, first_movement_id)
+        entity.last_movement_id = max(entity.last_movement_id, last_movement_id)
+        entity.first_executed_at = min(entity.first_executed_at, first_executed_at)
+        entity.last_executed_at = max(entity.last_executed_at, last_executed_at)
+        self.db.flush()
+        self.db.refresh(entity)
+        return entity
+
+    def get_by_period(self, period: str) -> MovementArchive | None:
+        return self.db.scalar(select(MovementArchive).where(MovementArchive.period == period))
+
+    def list(self) -> list[MovementArchive]:
+        return list(self.db.scalars(select(MovementArchive).order_by(MovementArchive.period)).all())
+
+    def list_overlapping(
+        self,
+        *,
+        executed_from: datetime | None = None,
+        executed_to: datetime | None = None,
+    ) -> list[MovementArchive]:
+        statement = select(MovementArchive).order_by(MovementArchive.first_movement_id)
+        if executed_from is not None:
+            statement = statement.where(MovementArchive.last_executed_at >= executed_from)
+        if executed_to is not None:
+            statement = statement.where(MovementArchive.first_executed_at < executed_to)
+        return list(self.db.scalars(statement).all())
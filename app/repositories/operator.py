@@ -1,7 +1,15 @@
-from sqlalchemy import select
+from __future__ import annotations
 
 from app.db.models.operator import Operator
 from app.repositories.base import BaseRepository
+from app.repositories.listing import Listing, ListQuery, Page, paginate
+
+OPERATOR_LISTING = Listing(
+    Operator,
+    fields=("id", "code", "name", "active", "created_at"),
+    filters=("code", "name", "active"),
+    sorts=("id", "code", "name"),
+)
 
 
 class OperatorRepository(BaseRepository):
@@ -15,10 +23,12 @@ class OperatorRepository(BaseRepository):
     def get(self, operator_id: int) -> Operator | None:
         return self.db.get(Operator, operator_id)
 
-    def list(self) -> list[Operator]:
-        return list(self.db.scalars(select(Operator).order_by(Operator.id)).all())
+    def list(self, query: ListQuery) -> Page:
+        return paginate(self.db, OPERATOR_LISTING, query)
 
-    def update(self, operator: Operator, *, name: str | None = None, active: bool | None = None) -> Operator:
+    def update(
+        self, operator: Operator, *, name: str | None = None, active: bool | None = None
+    ) -> Operator:
         if name is not None:
             operator.name = name
         if active is not None:
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, delete, func, insert, not_, select, update
+
+from app.db.models.outbox import OutboxMessage
+from app.repositories.base import BaseRepository
+
+
+class OutboxRepository(BaseRepository):
+    def add(self, *, topic: str, aggregate_type: str, aggregate_id: int, payload: dict) -> None:
+        self.db.execute(
+            insert(OutboxMessage).values(
+                topic=topic,
+                aggregate_type=aggregate_type,
+                aggregate_id=aggregate_id,
+                payload=payload,
+            )
+        )
+
+    def add_many(self, messages: list[dict]) -> None:
+        """Each dict holds ``topic``, ``aggregate_type``, ``aggregate_id`` and ``payload``."""
+        if messages:
+            self.db.execute(insert(OutboxMessage), messages)
+
+    def list_pending(self, limit: int) -> list[OutboxMessage]:
+        statement = (
+            select(OutboxMessage)
+            .where(OutboxMessage.dispatched_at.is_(None))
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+        )
+        return list(self.db.scalars(statement).all())
+
+    def mark_dispatched(self, message_ids: list[int]) -> None:
+        self.db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(message_ids))
+            .values(
+                dispatched_at=datetime.now(tz=timezone.utc), attempts=OutboxMessage.attempts + 1
+            )
+        )
+
+    def mark_failed(self, message_ids: list[int], error: str) -> None:
+        self.db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(message_ids))
+            .values(attempts=OutboxMessage.attempts + 1, last_error=error[:2000])
+        )
+
+    def pending_stats(self) -> tuple[int, datetime | None]:
+        statement = select(func.count(OutboxMessage.id), func.min(OutboxMessage.created_at)).where(
+            OutboxMessage.dispatched_at.is_(None)
+        )
+        count, oldest = self.db.execute(statement).one()
+        return int(count), oldest
+
+    def purge_dispatched(
+        self,
+        before: datetime,
+        *,
+        undelivered: bool = False,
+        keep_after: Mapping[str, int] | None = None,
+    ) -> int:
+        """Delete rows dispatched before ``before``.
+
+        With ``undelivered`` rows created before ``before`` go too, dispatched
+        or not, for when no sink is configured to deliver them. ``keep_after``
+        maps an aggregate type to the last id a reader has consumed; rows of
+        that type with a higher id are kept however old.
+        """
+        if undelivered:
+            statement = delete(OutboxMessage).where(OutboxMessage.created_at < before)
+        else:
+            statement = delete(OutboxMessage).where(
+                OutboxMessage.dispatched_at.is_not(None), OutboxMessage.dispatched_at < before
+            )
+        for aggregate_type, last_id in (keep_after or {}).items():
+            unread = and_(
+                OutboxMessage.aggregate_type == aggregate_type, OutboxMessage.id > last_id
+            )
+            statement = statement.where(not_(unread))
+        return self.db.execute(statement).rowcount
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from sqlalchemy import func, select, update
+
+from app.db.change_tracking import next_change_seq
+from app.db.models.handling_unit import HandlingUnit
+from app.db.models.inventory import InventoryPosition
+from app.db.models.mission import Mission, MissionState
+from app.db.models.replenishment import ReplenishmentRule
+from app.repositories.base import BaseRepository
+
+
+class ReplenishmentRepository(BaseRepository):
+    def create(
+        self,
+        *,
+        item_id: int,
+        location_id: int,
+        min_qty: int,
+        max_qty: int,
+        created_by_operator_id: int,
+        priority: int = 0,
+        active: bool = True,
+    ) -> ReplenishmentRule:
+        entity = ReplenishmentRule(
+            item_id=item_id,
+            location_id=location_id,
+            min_qty=min_qty,
+            max_qty=max_qty,
+            created_by_operator_id=created_by_operator_id,
+            priority=priority,
+            active=active,
+        )
+        self.db.add(entity)
+        self.db.flush()
+        self.db.refresh(entity)
+        return entity
+
+    def get(self, rule_id: int) -> ReplenishmentRule | None:
+        return self.db.get(ReplenishmentRule, rule_id)
+
+    def get_by_item_location(self, item_id: int, location_id: int) -> ReplenishmentRule | None:
+        statement = select(ReplenishmentRule).where(
+            ReplenishmentRule.item_id == item_id, ReplenishmentRule.location_id == location_id
+        )
+        return self.db.scalar(statement)
+
+    def list(
+        self,
+        *,
+        item_id: int | None = None,
+        location_id: int | None = None,
+        rule_ids: list[int] | None = None,
+    ) -> list[ReplenishmentRule]:
+        statement = select(ReplenishmentRule).order_by(ReplenishmentRule.id)
+        if item_id is not None:
+            statement = statement.where(ReplenishmentRule.item_id == item_id)
+        if location_id is not None:
+            statement = statement.where(ReplenishmentRule.location_id == location_id)
+        if rule_ids is not None:
+            statement = statement.where(ReplenishmentRule.id.in_(rule_ids))
+        return list(self.db.scalars(statement).all())
+
+    def update(
+        self,
+        rule: ReplenishmentRule,
+        *,
+        min_qty: int | None = None,
+        max_qty: int | None = None,
+        priority: int | None = None,
+        active: bool | None = None,
+    ) -> ReplenishmentRule:
+        if min_qty is not None:
+            rule.min_qty = min_qty
+        if max_qty is not None:
+            rule.max_qty = max_qty
+        if priority is not None:
+            rule.priority = priority
+        if active is not None:
+            rule.active = active
+        self.db.flush()
+        self.db.refresh(rule)
+        return rule
+
+    def list_changed_since(self, change_seq: int) -> list[tuple]:
+        """Rules changed after ``change_seq``.
+
+        Each row is ``(id, item_id, location_id, min_qty, max_qty, active, change_seq)``.
+        """
+        statement = (
+            select(
+                ReplenishmentRule.id,
+                ReplenishmentRule.item_id,
+                ReplenishmentRule.location_id,
+                ReplenishmentRule.min_qty,
+                ReplenishmentRule.max_qty,
+                ReplenishmentRule.active,
+                ReplenishmentRule.change_seq,
+            )
+            .where(ReplenishmentRule.change_seq > change_seq)
+            .order_by(ReplenishmentRule.change_seq, ReplenishmentRule.id)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def stock_at(self, keys: list[tuple[int, int]]) -> dict[tuple[int, int], int]:
+        """Stock on hand per ``(item_id, location_id)``, counting units nested at the location."""
+        if not keys:
+            return {}
+        statement = (
+            select(
+                InventoryPosition.item_id,
+                HandlingUnit.location_id,
+                func.sum(InventoryPosition.qty_on_hand),
+            )
+            .join(HandlingUnit, HandlingUnit.id == InventoryPosition.hu_id)
+            .where(
+                InventoryPosition.item_id.in_({item_id for item_id, _ in keys}),
+                HandlingUnit.location_id.in_({location_id for _, location_id in keys}),
+            )
+            .group_by(InventoryPosition.item_id, HandlingUnit.location_id)
+        )
+        totals = {
+            (item_id, location_id): int(qty)
+            for item_id, location_id, qty in self.db.execute(statement).all()
+        }
+        return {key: totals.get(key, 0) for key in keys}
+
+    def open_mission_ids(self, mission_ids: list[int]) -> set[int]:
+        """The ``mission_ids`` that are not completed or cancelled."""
+        if not mission_ids:
+            return set()
+        statement = select(Mission.id).where(
+            Mission.id.in_(mission_ids),
+            Mission.state.in_(
+                {MissionState.DRAFT, MissionState.ASSIGNED, MissionState.IN_PROGRESS}
+            ),
+        )
+        return set(self.db.scalars(statement).all())
+
+    def claim_open_mission(self, rule_id: int, *, expected: int | None, mission_id: int) -> bool:
+        """Point the rule at ``mission_id``.
+
+        Returns False if another evaluation replaced ``expected`` first.
+        """
+        current = (
+            ReplenishmentRule.open_mission_id.is_(None)
+            if expected is None
+            else ReplenishmentRule.open_mission_id == expected
+        )
+        statement = (
+            update(ReplenishmentRule)
+            .where(ReplenishmentRule.id == rule_id, current)
+            .values(open_mission_id=mission_id, change_seq=next_change_seq(self.db))
+        )
+        return self.db.execute(statement).rowcount == 1
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import func, null, select, update
+from sqlalchemy.orm import aliased
+
+from app.db.models.inventory import InventoryMovement
+from app.db.models.location import Location
+from app.db.models.outbox import OutboxMessage
+from app.db.models.report import MissionStat, MovementStat, ReportGranularity, ReportWatermark
+from app.repositories.base import BaseRepository
+
+MOVEMENT_DIMENSIONS = ("executor_id", "movement_type", "location_type")
+MOVEMENT_KEY = ("granularity", "bucket_start", *MOVEMENT_DIMENSIONS)
+MISSION_KEY = ("granularity", "bucket_start", "executor_id")
+MISSION_TOPICS = ("mission.completed", "mission.cancelled")
+
+
+def _as_utc(value: datetime) -> datetime:
+    return (
+        value.replace(tzinfo=timezone.utc)
+        if value.tzinfo is None
+        else value.astimezone(timezone.utc)
+    )
+
+
+class ReportRepository(BaseRepository):
+    def get_watermark(self, name: str) -> int:
+        return (
+            self.db.scalar(select(ReportWatermark.value).where(ReportWatermark.name == name)) or 0
+        )
+
+    def advance_watermark(self, name: str, *, expected: int, value: int) -> bool:
+        """Move ``name`` from ``expected`` to ``value``; False if another refresh moved it first."""
+        if expected == 0 and self.db.get(ReportWatermark, name) is None:
+            self.db.add(ReportWatermark(name=name, value=value))
+            self.db.flush()
+            return True
+        statement = (
+            update(ReportWatermark)
+            .where(ReportWatermark.name == name, ReportWatermark.value == expected)
+            .values(value=value)
+        )
+        return self.db.execute(statement).rowcount == 1
+
+    def latest_movement_id(self) -> int:
+        return self.db.scalar(select(func.max(InventoryMovement.id))) or 0
+
+    def latest_mission_event_id(self) -> int:
+        statement = select(func.max(OutboxMessage.id)).where(
+            OutboxMessage.aggregate_type == "mission", OutboxMessage.topic.in_(MISSION_TOPICS)
+        )
+        return self.db.scalar(statement) or 0
+
+    def movements_after(self, after_id: int, limit: int) -> list[tuple]:
+        """``(id, executed_at, executor_id, movement_type, qty, location_type)`` in id order."""
+        destination = aliased(Location)
+        source = aliased(Location)
+        statement = (
+            select(
+                InventoryMovement.id,
+                InventoryMovement.executed_at,
+                InventoryMovement.executed_by_executor_id,
+                InventoryMovement.movement_type,
+                InventoryMovement.qty,
+                func.coalesce(destination.type, source.type),
+            )
+            .outerjoin(destination, InventoryMovement.to_location_id == destination.id)
+            .outerjoin(source, InventoryMovement.from_location_id == source.id)
+            .where(InventoryMovement.id > after_id)
+            .order_by(InventoryMovement.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def mission_events_after(self, after_id: int, limit: int) -> list[tuple]:
+        """Mission completions and cancellations in id order.
+
+        Each row is ``(id, topic, payload, created_at)``.
+        """
+        statement = (
+            select(
+                OutboxMessage.id,
+                OutboxMessage.topic,
+                OutboxMessage.payload,
+                OutboxMessage.created_at,
+            )
+            .where(
+                OutboxMessage.id > after_id,
+                OutboxMessage.aggregate_type == "mission",
+                OutboxMessage.topic.in_(MISSION_TOPICS),
+            )
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def merge_movement_stats(self, deltas: dict[tuple, list[int]]) -> None:
+        """Add ``[movement_count, qty]`` to the rows keyed by :data:`MOVEMENT_KEY`."""
+        initial = {"movement_count": 0, "qty": 0}
+        for row, (count, qty) in self._merge(MovementStat, MOVEMENT_KEY, deltas, initial):
+            row.movement_count += count
+            row.qty += qty
+        self.db.flush()
+
+    def merge_mission_stats(self, deltas: dict[tuple, list]) -> None:
+        """Add deltas to rows keyed by :data:`MISSION_KEY`.
+
+        Each delta is ``[completed, cancelled, timed, cycle_sum, cycle_max]``.
+        """
+        initial = {
+            "completed_count": 0,
+            "cancelled_count": 0,
+            "timed_count": 0,
+            "cycle_seconds_sum": 0.0,
+        }
+        merged = self._merge(MissionStat, MISSION_KEY, deltas, initial)
+        for row, (completed, cancelled, timed, cycle_sum, cycle_max) in merged:
+            row.completed_count += completed
+            row.cancelled_count += cancelled
+            row.timed_count += timed
+            row.cycle_seconds_sum += cycle_sum
+            if cycle_max is not None:
+                row.cycle_seconds_max = max(row.cycle_seconds_max or 0.0, cycle_max)
+        self.db.flush()
+
+    def _merge(self, model: type, key: tuple[str, ...], deltas: dict[tuple, list], initial: dict):
+        """Pair each delta with its stats row, creating missing rows.
+
+        Bucket starts in ``deltas`` are UTC-aware.
+        """
+        buckets = {(granularity, bucket_start) for granularity, bucket_start, *_ in deltas}
+        existing = {}
+        for granularity in {granularity for granularity, _ in buckets}:
+            starts = [bucket_start for g, bucket_start in buckets if g == granularity]
+            statement = select(model).where(
+                model.granularity == granularity, model.bucket_start.in_(starts)
+            )
+            for row in self.db.scalars(statement):
+                values = [getattr(row, name) for name in key]
+                values[1] = _as_utc(values[1])
+                existing[tuple(values)] = row
+        for values, delta in deltas.items():
+            row = existing.get(values)
+            if row is None:
+                row = model(**dict(zip(key, values)), **initial)
+                self.db.add(row)
+            yield row, delta
+
+    def movement_report(
+        self,
+        *,
+        granularity: ReportGranularity,
+        start: datetime | None,
+        end: datetime | None,
+        group_by: list[str],
+        executor_id: int | None = None,
+    ) -> list[tuple]:
+        """``(bucket_start, *group_by, movement_count, qty)`` per bucket."""
+        dimensions = [getattr(MovementStat, name) for name in group_by]
+        statement = (
+            select(
+                MovementStat.bucket_start,
+                *dimensions,
+                func.sum(MovementStat.movement_count),
+                func.sum(MovementStat.qty),
+            )
+            .where(MovementStat.granularity == granularity)
+            .group_by(MovementStat.bucket_start, *dimensions)
+            .order_by(MovementStat.bucket_start, *dimensions)
+        )
+        if start is not None:
+            statement = statement.where(MovementStat.bucket_start >= start)
+        if end is not None:
+            statement = statement.where(MovementStat.bucket_start < end)
+        if executor_id is not None:
+            statement = statement.where(MovementStat.executor_id == executor_id)
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def mission_report(
+        self,
+        *,
+        granularity: ReportGranularity,
+        start: datetime | None,
+        end: datetime | None,
+        by_executor: bool,
+        executor_id: int | None = None,
+    ) -> list[tuple]:
+        """Mission report rows.
+
+        Each row is ``(bucket_start, executor_id | None, completed, cancelled, timed,
+        cycle_sum, cycle_max)``.
+        """
+        executor = MissionStat.executor_id if by_executor else None
+        statement = (
+            select(
+                MissionStat.bucket_start,
+                executor if executor is not None else null(),
+                func.sum(MissionStat.completed_count),
+                func.sum(MissionStat.cancelled_count),
+                func.sum(MissionStat.timed_count),
+                func.sum(MissionStat.cycle_seconds_sum),
+                func.max(MissionStat.cycle_seconds_max),
+            )
+            .where(MissionStat.granularity == granularity)
+            .group_by(MissionStat.bucket_start, *([executor] if executor is not None else []))
+            .order_by(MissionStat.bucket_start, *([executor] if executor is not None else []))
+        )
+        if start is not None:
+            statement = statement.where(MissionStat.bucket_start >= start)
+        if end is not None:
+            statement = statement.where(MissionStat.bucket_start < end)
+        if executor_id is not None:
+            statement = statement.where(MissionStat.executor_id == executor_id)
+        return [tuple(row) for row in self.db.execute(statement).all()]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from app.db.search import SearchIndex
+from app.repositories.base import BaseRepository
+
+
+class SearchRepository(BaseRepository):
+    def available(self) -> bool:
+        """The FTS5 indexes only exist on SQLite."""
+        return self.db.get_bind().dialect.name == "sqlite"
+
+    def matches(
+        self, index: SearchIndex, match: str, *, limit: int
+    ) -> list[tuple[int, str, str | None]]:
+        """``(id, code, name)`` of the first ``limit`` rows matching the FTS5 query ``match``.
+
+        No ORDER BY: FTS5 then stops after ``limit`` hits instead of visiting
+        every match of a common term.
+        """
+        name = index.name_column or "NULL"
+        statement = text(
+            f"SELECT rowid, {index.code_column}, {name} FROM {index.table} "
+            f"WHERE {index.table} MATCH :match LIMIT :limit"
+        )
+        return [tuple(row) for row in self.db.execute(statement, {"match": match, "limit": limit})]
+
+    def by_code(self, index: SearchIndex, code: str) -> tuple[int, str, str | None] | None:
+        name = index.name_column or "NULL"
+        statement = text(
+            f"SELECT id, {index.code_column}, {name} FROM {index.source} "
+            f"WHERE {index.code_column} = :code"
+        )
+        row = self.db.execute(statement, {"code": code}).first()
+        return tuple(row) if row is not None else None
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import func, or_, select
+
+from app.db.models.handling_unit import HandlingUnit, HandlingUnitClosure
+from app.db.models.inventory import InventoryMovement, InventoryMovementType, InventoryPosition
+from app.db.models.location import Location
+from app.db.models.mission import MissionLine
+from app.db.models.outbox import OutboxMessage
+from app.db.models.slotting import ItemAffinity, ItemPickStat
+from app.repositories.base import BaseRepository
+
+
+class SlottingRepository(BaseRepository):
+    def picks_after(self, after_id: int, limit: int) -> list[tuple]:
+        """``(id, executed_at, item_id, qty)`` of item moves in id order."""
+        statement = (
+            select(
+                InventoryMovement.id,
+                InventoryMovement.executed_at,
+                InventoryMovement.item_id,
+                InventoryMovement.qty,
+            )
+            .where(
+                InventoryMovement.id > after_id,
+                InventoryMovement.movement_type == InventoryMovementType.MOVE,
+                InventoryMovement.item_id.is_not(None),
+            )
+            .order_by(InventoryMovement.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def completions_after(self, after_id: int, limit: int) -> list[tuple[int, int]]:
+        """``(outbox id, mission_id)`` of mission completions in id order."""
+        statement = (
+            select(OutboxMessage.id, OutboxMessage.aggregate_id)
+            .where(
+                OutboxMessage.id > after_id,
+                OutboxMessage.aggregate_type == "mission",
+                OutboxMessage.topic == "mission.completed",
+            )
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def mission_items(self, mission_ids: list[int]) -> list[tuple[int, int]]:
+        statement = select(MissionLine.mission_id, MissionLine.item_id).where(
+            MissionLine.mission_id.in_(mission_ids), MissionLine.item_id.is_not(None)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def merge_pick_stats(self, deltas: dict[tuple[datetime, int], list[int]]) -> None:
+        """Add ``[pick_count, qty]`` to the ``(day, item_id)`` rows, creating missing ones."""
+        days = {day for day, _ in deltas}
+        statement = select(ItemPickStat).where(
+            ItemPickStat.day.in_(days), ItemPickStat.item_id.in_({item_id for _, item_id in deltas})
+        )
+        existing = {
+            (row.day.replace(tzinfo=None), row.item_id): row for row in self.db.scalars(statement)
+        }
+        for (day, item_id), (count, qty) in deltas.items():
+            row = existing.get((day.replace(tzinfo=None), item_id))
+            if row is None:
+                self.db.add(ItemPickStat(day=day, item_id=item_id, pick_count=count, qty=qty))
+            else:
+                row.pick_count += count
+                row.qty += qty
+        self.db.flush()
+
+    def merge_affinities(self, deltas: dict[tuple[int, int], int]) -> None:
+        for (item_a_id, item_b_id), count in deltas.items():
+            row = self.db.get(ItemAffinity, (item_a_id, item_b_id))
+            if row is None:
+                self.db.add(
+                    ItemAffinity(item_a_id=item_a_id, item_b_id=item_b_id, copick_count=count)
+                )
+            else:
+                row.copick_count += count
+        self.db.flush()
+
+    def velocities(self, since: datetime) -> list[tuple[int, int, int]]:
+        """``(item_id, pick_count, qty)`` summed over days from ``since``."""
+        statement = (
+            select(
+                ItemPickStat.item_id, func.sum(ItemPickStat.pick_count), func.sum(ItemPickStat.qty)
+            )
+            .where(ItemPickStat.day >= since)
+            .group_by(ItemPickStat.item_id)
+            .order_by(ItemPickStat.item_id)
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def affinities(
+        self, item_ids: list[int] | None = None, *, min_count: int = 1
+    ) -> list[tuple[int, int, int]]:
+        """``(item_a_id, item_b_id, copick_count)`` strongest first."""
+        statement = (
+            select(ItemAffinity.item_a_id, ItemAffinity.item_b_id, ItemAffinity.copick_count)
+            .where(ItemAffinity.copick_count >= min_count)
+            .order_by(
+                ItemAffinity.copick_count.desc(), ItemAffinity.item_a_id, ItemAffinity.item_b_id
+            )
+        )
+        if item_ids is not None:
+            statement = statement.where(
+                or_(ItemAffinity.item_a_id.in_(item_ids), ItemAffinity.item_b_id.in_(item_ids))
+            )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def holdings(self, item_ids: list[int]) -> list[tuple[int, int, int, int]]:
+        """``(item_id, root_hu_id, location_id, qty_on_hand)`` of stocked positions, largest first.
+
+        Stock in a nested handling unit is reported on its top-level unit, the
+        one that would be moved.
+        """
+        statement = (
+            select(
+                InventoryPosition.item_id,
+                HandlingUnit.id,
+                HandlingUnit.location_id,
+                InventoryPosition.qty_on_hand,
+            )
+            .join(HandlingUnitClosure, HandlingUnitClosure.descendant_id == InventoryPosition.hu_id)
+            .join(HandlingUnit, HandlingUnit.id == HandlingUnitClosure.ancestor_id)
+            .where(
+                InventoryPosition.item_id.in_(item_ids),
+                InventoryPosition.qty_on_hand > 0,
+                HandlingUnit.parent_hu_id.is_(None),
+            )
+            .order_by(
+                InventoryPosition.item_id, InventoryPosition.qty_on_hand.desc(), HandlingUnit.id
+            )
+        )
+        return [tuple(row) for row in self.db.execute(statement).all()]
+
+    def full_location_ids(self) -> set[int]:
+        """Locations without a free slot.
+
+        A location without a ``max_hu`` limit is full once it holds a unit.
+        """
+        statement = select(Location.id).where(
+            Location.hu_count >= func.coalesce(Location.max_hu, 1)
+        )
+        return set(self.db.scalars(statement).all())
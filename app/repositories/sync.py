@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from sqlalchemy import func, select
+
+from app.db.change_tracking import ChangeTracked
+from app.db.models.sync import SyncSequence
+from app.repositories.base import BaseRepository
+
+
+class SyncRepository(BaseRepository):
+    def current_watermark(self) -> int:
+        return self.db.scalar(select(SyncSequence.value).where(SyncSequence.id == 1)) or 0
+
+    def table_watermark(self, model: type[ChangeTracked]) -> int:
+        """Highest ``change_seq`` of the table; moves on every insert and update of its rows."""
+        return self.db.scalar(select(func.max(model.change_seq))) or 0
+
+    def page_boundary(self, model: type[ChangeTracked], *, since: int, limit: int) -> int | None:
+        """``change_seq`` of the first row past ``limit`` rows newer than ``since``, if any."""
+        statement = (
+            select(model.change_seq)
+            .where(model.change_seq > since)
+            .order_by(model.change_seq)
+            .offset(limit)
+            .limit(1)
+        )
+        return self.db.scalar(statement)
+
+    def first_change(self, model: type[ChangeTracked], *, since: int) -> int | None:
+        statement = (
+            select(model.change_seq)
+            .where(model.change_seq > since)
+            .order_by(model.change_seq)
+            .limit(1)
+        )
+        return self.db.scalar(statement)
+
+    def changed_between(self, model: type[ChangeTracked], *, since: int, upto: int) -> list:
+        statement = (
+            select(model)
+            .where(model.change_seq > since, model.change_seq <= upto)
+            .order_by(model.change_seq, model.id)
+        )
+        return list(self.db.scalars(statement).all())
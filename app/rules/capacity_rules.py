@@ -0,0 +1,20 @@
+from app.db.models.location import Location
+from app.rules.exceptions import RuleViolation
+
+
+def validate_location_capacity(location: Location, *, units: int, weight_kg: int) -> None:
+    """Check that ``location`` can take ``units`` more top-level units.
+
+    The units weigh ``weight_kg`` milli-kg together. Reads only the location's
+    occupancy counters, never the handling units at it.
+    """
+    if units > 0 and location.max_hu is not None and location.hu_count + units > location.max_hu:
+        raise RuleViolation(
+            f"Location {location.code} has no free handling unit slot", status_code=409
+        )
+    if (
+        weight_kg > 0
+        and location.max_weight_kg is not None
+        and location.load_kg + weight_kg > location.max_weight_kg
+    ):
+        raise RuleViolation(f"Location {location.code} weight capacity exceeded", status_code=409)
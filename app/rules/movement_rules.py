@@ -1,11 +1,43 @@
-from decimal import Decimal
-
+from app.core.quantity import QTY_SCALE
 from app.db.models.executor import Executor, ExecutorType
 from app.db.models.handling_unit import HandlingUnit, HandlingUnitStatus
 from app.db.models.location import Location
 from app.db.models.mission import Mission, MissionLine, MissionState
+from app.rules.capacity_rules import validate_location_capacity
 from app.rules.exceptions import RuleViolation
 
+HUMAN_PAYLOAD_LIMIT_MILLI = 500 * QTY_SCALE
+
+
+def executor_payload_limit(executor: Executor) -> int:
+    """Milli-kg the executor may carry: its own maximum, capped for humans."""
+    if executor.executor_type == ExecutorType.HUMAN:
+        return min(executor.max_payload_kg, HUMAN_PAYLOAD_LIMIT_MILLI)
+    return executor.max_payload_kg
+
+
+def line_payload(mission_line: MissionLine, qty: int) -> int:
+    """Milli-kg share of the line's cached payload carried by ``qty``.
+
+    A line whose item had no weight counts each unit as 1 kg, so executor
+    limits still hold for it.
+    """
+    if mission_line.payload_kg is None:
+        return qty
+    return mission_line.payload_kg * qty // mission_line.qty
+
+
+def movement_payload_kg(
+    mission_line: MissionLine, qty: int, handling_unit: HandlingUnit | None
+) -> int:
+    """Milli-kg an executor carries for ``qty`` of the line.
+
+    For a unit move this is the unit's gross weight.
+    """
+    if mission_line.item_id is None and handling_unit is not None:
+        return handling_unit.gross_weight_kg
+    return line_payload(mission_line, qty)
+
 
 def validate_movement(
     *,
@@ -14,7 +46,7 @@ def validate_movement(
     executor: Executor,
     source_location: Location,
     destination_location: Location,
-    qty: Decimal,
+    qty: int,
     handling_unit: HandlingUnit | None,
 ) -> None:
     if mission.state != MissionState.IN_PROGRESS:
@@ -26,17 +58,17 @@ def validate_movement(
     if qty <= 0:
         raise RuleViolation("Movement qty must be positive")
 
-    remaining_qty = Decimal(str(mission_line.qty)) - Decimal(str(mission_line.qty_done))
-    if qty > remaining_qty:
+    if qty > mission_line.qty - mission_line.qty_done:
         raise RuleViolation("Movement qty exceeds remaining mission line qty")
 
     if not executor.active:
         raise RuleViolation("Executor is inactive")
 
-    if executor.executor_type == ExecutorType.HUMAN and qty > Decimal("500"):
+    payload_kg = movement_payload_kg(mission_line, qty, handling_unit)
+    if executor.executor_type == ExecutorType.HUMAN and payload_kg > HUMAN_PAYLOAD_LIMIT_MILLI:
         raise RuleViolation("Human executor cannot carry payload above 500kg")
 
-    if qty > Decimal(str(executor.max_payload_kg)):
+    if payload_kg > executor.max_payload_kg:
         raise RuleViolation("Payload exceeds executor max payload")
 
     if not source_location.active or not destination_location.active:
@@ -45,8 +77,18 @@ def validate_movement(
     if source_location.id == destination_location.id:
         raise RuleViolation("Source and destination must be different")
 
+    # Location loads only count weighed items, so an unknown payload adds none.
+    if mission_line.item_id is not None and mission_line.payload_kg is not None:
+        validate_location_capacity(destination_location, units=0, weight_kg=payload_kg)
+
     if handling_unit is not None:
         if handling_unit.location_id != source_location.id:
             raise RuleViolation("Handling unit is not at source location")
         if handling_unit.status in {HandlingUnitStatus.BLOCKED, HandlingUnitStatus.SEALED}:
             raise RuleViolation("Blocked or sealed handling unit cannot be moved")
+        if mission_line.item_id is None and handling_unit.parent_hu_id is not None:
+            raise RuleViolation("Nested handling unit must be unpacked before it can be moved")
+        if mission_line.item_id is None:
+            validate_location_capacity(
+                destination_location, units=1, weight_kg=handling_unit.gross_weight_kg
+            )
@@ -0,0 +1,12 @@
+from app.db.models.location import Location, LocationType
+from app.rules.exceptions import RuleViolation
+
+
+def validate_replenishment_rule(location: Location, *, min_qty: int, max_qty: int) -> None:
+    """Check that ``location`` is a PICK location and that ``0 <= min_qty < max_qty``."""
+    if location.type != LocationType.PICK:
+        raise RuleViolation(f"Location {location.code} is not a PICK location")
+    if min_qty < 0:
+        raise RuleViolation("min_qty must not be negative")
+    if max_qty <= min_qty:
+        raise RuleViolation("max_qty must be greater than min_qty")
@@ -1,10 +1,29 @@
+from app.schemas.diagnostics import CheckpointStatsRead, SQLiteDiagnosticsRead
 from app.schemas.executor import ExecutorCreate, ExecutorRead, ExecutorUpdate
-from app.schemas.handling_unit import HandlingUnitCreate, HandlingUnitRead, HandlingUnitUpdate
-from app.schemas.inventory import InventoryAdjustmentCreate, InventoryMovementRead, InventoryPositionRead
+from app.schemas.handling_unit import (
+    HandlingUnitCreate,
+    HandlingUnitPackCommand,
+    HandlingUnitRead,
+    HandlingUnitUpdate,
+)
+from app.schemas.inventory import (
+    InventoryAdjustmentCreate,
+    InventoryMovementRead,
+    InventoryPositionRead,
+)
 from app.schemas.item import ItemCreate, ItemRead
-from app.schemas.location import LocationCreate, LocationRead, LocationUpdate
+from app.schemas.location import (
+    LocationCreate,
+    LocationDistanceRead,
+    LocationRead,
+    LocationUpdate,
+    TravelMatrixRead,
+)
 from app.schemas.mission import (
     MissionAssignCommand,
+    MissionAssignmentRead,
+    MissionAutoAssignCommand,
+    MissionAutoAssignRead,
     MissionCancelCommand,
     MissionCompleteCommand,
     MissionCreate,
@@ -16,17 +35,22 @@ from app.schemas.mission import (
     MissionUpdate,
 )
 from app.schemas.operator import OperatorCreate, OperatorRead, OperatorUpdate
+from app.schemas.outbox import OutboxStatsRead
 from app.schemas.rules import (
     RuleValidateAssignmentRequest,
     RuleValidateMovementRequest,
     RuleValidationResponse,
 )
+from app.schemas.sync import SyncRead
+from app.schemas.wave import WavePlanCommand, WavePlanRead, WaveRead, WaveReleaseCommand
 
 __all__ = [
+    "CheckpointStatsRead",
     "ExecutorCreate",
     "ExecutorRead",
     "ExecutorUpdate",
     "HandlingUnitCreate",
+    "HandlingUnitPackCommand",
     "HandlingUnitRead",
     "HandlingUnitUpdate",
     "InventoryAdjustmentCreate",
@@ -35,9 +59,13 @@ __all__ = [
     "ItemCreate",
     "ItemRead",
     "LocationCreate",
+    "LocationDistanceRead",
     "LocationRead",
     "LocationUpdate",
     "MissionAssignCommand",
+    "MissionAssignmentRead",
+    "MissionAutoAssignCommand",
+    "MissionAutoAssignRead",
     "MissionCancelCommand",
     "MissionCompleteCommand",
     "MissionCreate",
@@ -50,7 +78,15 @@ __all__ = [
     "OperatorCreate",
     "OperatorRead",
     "OperatorUpdate",
+    "OutboxStatsRead",
     "RuleValidateAssignmentRequest",
     "RuleValidateMovementRequest",
     "RuleValidationResponse",
+    "SQLiteDiagnosticsRead",
+    "SyncRead",
+    "TravelMatrixRead",
+    "WavePlanCommand",
+    "WavePlanRead",
+    "WaveRead",
+    "WaveReleaseCommand",
 ]
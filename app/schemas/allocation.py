@@ -0,0 +1,38 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.planning.allocation import AllocationStrategy
+from app.schemas.common import Quantity, StoredQuantity
+from app.schemas.mission import MissionRead
+
+
+class AllocationDemandCreate(BaseModel):
+    item_id: int
+    qty: Quantity = Field(gt=0)
+    to_location_id: int
+
+
+class AllocationCreate(BaseModel):
+    created_by_operator_id: int
+    strategy: AllocationStrategy = AllocationStrategy.FIFO
+    priority: int = Field(default=0, ge=0)
+    allow_partial: bool = Field(
+        default=False,
+        description="Allocate what is available and report the rest instead of failing.",
+    )
+    demands: list[AllocationDemandCreate] = Field(min_length=1)
+
+
+class AllocationShortageRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    item_id: int
+    to_location_id: int
+    qty_requested: StoredQuantity
+    qty_short: StoredQuantity
+
+
+class AllocationRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    missions: list[MissionRead]
+    shortages: list[AllocationShortageRead]
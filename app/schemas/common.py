@@ -1,6 +1,10 @@
 from datetime import datetime
+from decimal import Decimal
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, BeforeValidator, ConfigDict, PlainSerializer, WithJsonSchema
+
+from app.core.quantity import from_milli, to_milli
 
 
 class ORMModel(BaseModel):
@@ -9,3 +13,22 @@ class ORMModel(BaseModel):
 
 class TimestampsMixin(BaseModel):
     created_at: datetime
+
+
+def _parse_quantity(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, (Decimal, int, float, str)):
+        raise ValueError("Quantity must be a number")
+    return to_milli(value)
+
+
+# Request quantity: accepts a decimal number and holds integer milli-units, which
+# ``model_dump()`` passes on unchanged to services and repositories.
+Quantity = Annotated[
+    int,
+    BeforeValidator(_parse_quantity),
+    PlainSerializer(from_milli, return_type=Decimal, when_used="json"),
+    WithJsonSchema({"anyOf": [{"type": "number"}, {"type": "string"}]}, mode="validation"),
+]
+
+# Stored quantity read from the ORM in milli-units, serialized as a decimal.
+StoredQuantity = Annotated[int, PlainSerializer(from_milli, return_type=Decimal)]
@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.db.models.cycle_count import CycleCountLineStatus, CycleCountState
+from app.schemas.common import Quantity, StoredQuantity
+
+
+class CycleCountCreate(BaseModel):
+    created_by_operator_id: int
+    location_id: int | None = None
+    zone: str | None = Field(default=None, min_length=1, max_length=32)
+
+
+class CycleCountRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    count_no: str
+    location_id: int | None
+    zone: str | None
+    state: CycleCountState
+    created_by_operator_id: int
+    created_at: datetime
+    closed_at: datetime | None
+
+
+class CountedRowCreate(BaseModel):
+    hu_id: int
+    item_id: int
+    qty: Quantity = Field(ge=0)
+    idempotency_key: str | None = Field(default=None, min_length=1, max_length=128)
+
+
+class CycleCountSubmissionCreate(BaseModel):
+    executor_id: int | None = None
+    rows: list[CountedRowCreate] = Field(min_length=1, max_length=20000)
+
+
+class CycleCountLineRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    cycle_count_id: int
+    hu_id: int
+    item_id: int
+    location_id: int
+    counted_qty: StoredQuantity
+    system_qty: StoredQuantity
+    variance: StoredQuantity
+    status: CycleCountLineStatus
+    counted_by_executor_id: int | None
+    counted_at: datetime
+    idempotency_key: str | None
+    movement_id: int | None
+
+
+class CycleCountSubmissionRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    lines: list[CycleCountLineRead]
+    duplicates: int = Field(
+        description="Rows skipped because their idempotency_key was already submitted."
+    )
+
+
+class CycleCountPost(BaseModel):
+    line_ids: list[int] | None = Field(
+        default=None,
+        description=(
+            "Approved lines; every counted line when omitted. Other counted lines are rejected."
+        ),
+    )
+    executor_id: int | None = None
+    reason: str | None = Field(default=None, min_length=1, max_length=500)
+
+
+class CycleCountPostingRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    cycle_count: CycleCountRead
+    posted: int
+    movements: int
+    stale: int
+    rejected: int
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CheckpointStatsRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    running: bool
+    checkpoints: int
+    truncations: int
+    busy: int
+    failures: int
+    last_mode: str | None
+    last_checkpoint_at: datetime | None
+    last_wal_frames: int | None
+    last_checkpointed_frames: int | None
+    last_wal_bytes_before: int | None
+    last_wal_bytes_after: int | None
+    last_optimize_at: datetime | None
+    last_error: str | None
+
+
+class SQLiteDiagnosticsRead(BaseModel):
+    database: str
+    wal_bytes: int
+    pragmas: dict[str, int | str]
+    checkpoint: CheckpointStatsRead | None
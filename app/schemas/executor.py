@@ -1,23 +1,24 @@
 from datetime import datetime
-from decimal import Decimal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.quantity import QTY_SCALE
 from app.db.models.executor import ExecutorType
+from app.schemas.common import Quantity, StoredQuantity
 
 
 class ExecutorCreate(BaseModel):
     code: str = Field(min_length=1, max_length=64)
     name: str = Field(min_length=1, max_length=255)
     executor_type: ExecutorType = ExecutorType.HUMAN
-    max_payload_kg: Decimal = Field(default=Decimal("500"), gt=0)
+    max_payload_kg: Quantity = Field(default=500 * QTY_SCALE, gt=0)
     active: bool = True
 
 
 class ExecutorUpdate(BaseModel):
     name: str | None = Field(default=None, min_length=1, max_length=255)
     executor_type: ExecutorType | None = None
-    max_payload_kg: Decimal | None = Field(default=None, gt=0)
+    max_payload_kg: Quantity | None = Field(default=None, gt=0)
     active: bool | None = None
     last_seen_at: datetime | None = None
 
@@ -29,7 +30,7 @@ class ExecutorRead(BaseModel):
     code: str
     name: str
     executor_type: ExecutorType
-    max_payload_kg: Decimal
+    max_payload_kg: StoredQuantity
     active: bool
     last_seen_at: datetime | None
     created_at: datetime
@@ -3,12 +3,15 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.db.models.handling_unit import HandlingUnitStatus
+from app.schemas.common import Quantity, StoredQuantity
 
 
 class HandlingUnitCreate(BaseModel):
     hu_code: str = Field(min_length=1, max_length=64)
     location_id: int
     status: HandlingUnitStatus = HandlingUnitStatus.OPEN
+    parent_hu_id: int | None = None
+    tare_kg: Quantity = Field(default=0, ge=0)
 
 
 class HandlingUnitUpdate(BaseModel):
@@ -22,5 +25,12 @@ class HandlingUnitRead(BaseModel):
     id: int
     hu_code: str
     location_id: int
+    parent_hu_id: int | None
     status: HandlingUnitStatus
+    tare_kg: StoredQuantity
+    gross_weight_kg: StoredQuantity
     created_at: datetime
+
+
+class HandlingUnitPackCommand(BaseModel):
+    parent_hu_id: int
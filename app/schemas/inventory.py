@@ -1,9 +1,9 @@
 from datetime import datetime
-from decimal import Decimal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.db.models.inventory import InventoryMovementType
+from app.schemas.common import Quantity, StoredQuantity
 
 
 class InventoryPositionRead(BaseModel):
@@ -12,8 +12,8 @@ class InventoryPositionRead(BaseModel):
     id: int
     hu_id: int
     item_id: int
-    qty_on_hand: Decimal
-    qty_reserved: Decimal
+    qty_on_hand: StoredQuantity
+    qty_reserved: StoredQuantity
     version: int
     updated_at: datetime
 
@@ -21,7 +21,7 @@ class InventoryPositionRead(BaseModel):
 class InventoryAdjustmentCreate(BaseModel):
     hu_id: int
     item_id: int
-    qty_delta: Decimal
+    qty_delta: Quantity
     reason: str = Field(min_length=1, max_length=500)
     executor_id: int | None = None
     idempotency_key: str | None = Field(default=None, min_length=1, max_length=128)
@@ -38,8 +38,25 @@ class InventoryMovementRead(BaseModel):
     to_location_id: int | None
     from_hu_id: int | None
     to_hu_id: int | None
-    qty: Decimal
+    qty: StoredQuantity
     executed_by_executor_id: int | None
     executed_at: datetime
     idempotency_key: str | None
     reason: str | None
+
+
+class MovementArchiveRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    period: str
+    row_count: int
+    first_movement_id: int
+    last_movement_id: int
+    first_executed_at: datetime
+    last_executed_at: datetime
+    archived_at: datetime
+
+
+class MovementArchiveRequest(BaseModel):
+    retain_months: int | None = Field(default=None, ge=0)
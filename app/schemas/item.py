@@ -2,11 +2,21 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.common import Quantity, StoredQuantity
+
 
 class ItemCreate(BaseModel):
     sku: str = Field(min_length=1, max_length=64)
     name: str = Field(min_length=1, max_length=255)
     uom: str = Field(default="ea", min_length=1, max_length=32)
+    weight_kg: Quantity | None = Field(default=None, ge=0)
+    volume_l: Quantity | None = Field(default=None, ge=0)
+
+
+class ItemUpdate(BaseModel):
+    name: str | None = Field(default=None, min_length=1, max_length=255)
+    weight_kg: Quantity | None = Field(default=None, ge=0)
+    volume_l: Quantity | None = Field(default=None, ge=0)
 
 
 class ItemRead(BaseModel):
@@ -16,4 +26,6 @@ class ItemRead(BaseModel):
     sku: str
     name: str
     uom: str
+    weight_kg: StoredQuantity | None
+    volume_l: StoredQuantity | None
     created_at: datetime
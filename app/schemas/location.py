@@ -3,6 +3,7 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.db.models.location import LocationType
+from app.schemas.common import Quantity, StoredQuantity
 
 
 class LocationCreate(BaseModel):
@@ -10,12 +11,24 @@ class LocationCreate(BaseModel):
     name: str = Field(min_length=1, max_length=255)
     type: LocationType = LocationType.BULK
     active: bool = True
+    x: float | None = None
+    y: float | None = None
+    z: float | None = None
+    zone: str | None = Field(default=None, min_length=1, max_length=32)
+    max_hu: int | None = Field(default=None, ge=0)
+    max_weight_kg: Quantity | None = Field(default=None, gt=0)
 
 
 class LocationUpdate(BaseModel):
     name: str | None = Field(default=None, min_length=1, max_length=255)
     type: LocationType | None = None
     active: bool | None = None
+    x: float | None = None
+    y: float | None = None
+    z: float | None = None
+    zone: str | None = Field(default=None, min_length=1, max_length=32)
+    max_hu: int | None = Field(default=None, ge=0)
+    max_weight_kg: Quantity | None = Field(default=None, gt=0)
 
 
 class LocationRead(BaseModel):
@@ -26,4 +39,32 @@ class LocationRead(BaseModel):
     name: str
     type: LocationType
     active: bool
+    x: float | None
+    y: float | None
+    z: float | None
+    zone: str | None
+    max_hu: int | None
+    max_weight_kg: StoredQuantity | None
+    hu_count: int
+    load_kg: StoredQuantity
     created_at: datetime
+
+
+class LocationFreeSlotsRead(BaseModel):
+    zone: str | None
+    type: LocationType
+    locations: int
+    open_locations: int
+    free_slots: int
+    unlimited_locations: int
+
+
+class LocationDistanceRead(BaseModel):
+    location_id: int
+    distance: float
+
+
+class TravelMatrixRead(BaseModel):
+    generation: int
+    locations: int
+    recomputed: int
@@ -1,9 +1,9 @@
 from datetime import datetime
-from decimal import Decimal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.db.models.mission import MissionState, MissionType
+from app.schemas.common import Quantity, StoredQuantity
 
 
 class MissionLineCreate(BaseModel):
@@ -11,7 +11,7 @@ class MissionLineCreate(BaseModel):
     to_location_id: int
     item_id: int | None = None
     hu_id: int | None = None
-    qty: Decimal = Field(gt=0)
+    qty: Quantity = Field(gt=0)
 
 
 class MissionLineRead(BaseModel):
@@ -23,8 +23,11 @@ class MissionLineRead(BaseModel):
     to_location_id: int
     item_id: int | None
     hu_id: int | None
-    qty: Decimal
-    qty_done: Decimal
+    qty: StoredQuantity
+    qty_done: StoredQuantity
+    reserved_qty: StoredQuantity
+    payload_kg: StoredQuantity | None
+    sequence: int
 
 
 class MissionCreate(BaseModel):
@@ -53,6 +56,9 @@ class MissionRead(BaseModel):
     started_at: datetime | None
     completed_at: datetime | None
     cancel_reason: str | None
+    route_distance: float | None
+    route_distance_saved: float | None
+    version: int
     lines: list[MissionLineRead]
 
 
@@ -60,13 +66,29 @@ class MissionAssignCommand(BaseModel):
     executor_id: int
 
 
+class MissionAutoAssignCommand(BaseModel):
+    mission_ids: list[int] | None = None
+    executor_ids: list[int] | None = None
+
+
+class MissionAssignmentRead(BaseModel):
+    mission_id: int
+    executor_id: int
+    cost: float
+
+
+class MissionAutoAssignRead(BaseModel):
+    assignments: list[MissionAssignmentRead]
+    unassigned_mission_ids: list[int]
+
+
 class MissionStartCommand(BaseModel):
     executor_id: int
 
 
 class MissionRecordMovementCommand(BaseModel):
     mission_line_id: int
-    qty: Decimal = Field(gt=0)
+    qty: Quantity = Field(gt=0)
     executor_id: int
     from_hu_id: int | None = None
     to_hu_id: int | None = None
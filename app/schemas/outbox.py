@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class OutboxStatsRead(BaseModel):
+    dispatcher_running: bool
+    sink: str
+    pending: int
+    oldest_pending_at: datetime | None
+    lag_seconds: float | None
+    batches_sent: int
+    messages_sent: int
+    failures: int
+    consecutive_failures: int
+    last_error: str | None
+    last_dispatched_at: datetime | None
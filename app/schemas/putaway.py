@@ -0,0 +1,30 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.db.models.location import LocationType
+
+
+class PutawaySuggestRequest(BaseModel):
+    hu_id: int
+    limit: int = Field(default=5, ge=1, le=100)
+    location_types: list[LocationType] | None = None
+
+
+class PutawayCandidateRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    location_id: int
+    location_type: LocationType
+    cost: float
+    travel_distance: float
+    outbound_distance: float
+    occupied: int
+    capacity: int
+
+
+class PutawaySuggestRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    hu_id: int
+    from_location_id: int
+    abc_class: str | None
+    candidates: list[PutawayCandidateRead]
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.allocation import AllocationShortageRead
+from app.schemas.common import Quantity, StoredQuantity
+from app.schemas.mission import MissionRead
+
+
+class ReplenishmentRuleCreate(BaseModel):
+    item_id: int
+    location_id: int = Field(description="PICK location to keep stocked.")
+    min_qty: Quantity = Field(ge=0)
+    max_qty: Quantity = Field(gt=0)
+    priority: int = Field(default=0, ge=0)
+    active: bool = True
+    created_by_operator_id: int
+
+
+class ReplenishmentRuleUpdate(BaseModel):
+    min_qty: Quantity | None = Field(default=None, ge=0)
+    max_qty: Quantity | None = Field(default=None, gt=0)
+    priority: int | None = Field(default=None, ge=0)
+    active: bool | None = None
+
+
+class ReplenishmentRuleRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    item_id: int
+    location_id: int
+    min_qty: StoredQuantity
+    max_qty: StoredQuantity
+    priority: int
+    active: bool
+    created_by_operator_id: int
+    open_mission_id: int | None
+    created_at: datetime
+
+
+class ReplenishmentEvaluate(BaseModel):
+    rule_ids: list[int] | None = Field(
+        default=None,
+        description="Rules to evaluate; every rule when omitted.",
+    )
+
+
+class ReplenishmentRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    evaluated: int
+    missions: list[MissionRead]
+    shortages: list[AllocationShortageRead]
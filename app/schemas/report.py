@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.schemas.common import StoredQuantity
+
+
+class MovementReportRow(BaseModel):
+    bucket_start: datetime
+    executor_id: int | None = None
+    movement_type: str | None = None
+    location_type: str | None = None
+    movement_count: int
+    qty: StoredQuantity
+
+
+class MissionReportRow(BaseModel):
+    bucket_start: datetime
+    executor_id: int | None
+    completed_count: int
+    cancelled_count: int
+    avg_cycle_seconds: float | None
+    max_cycle_seconds: float | None
+
+
+class ReportStatusRead(BaseModel):
+    job_running: bool
+    last_error: str | None
+    movements_watermark: int
+    latest_movement_id: int
+    mission_events_watermark: int
+    latest_mission_event_id: int
@@ -1,7 +1,7 @@
-from decimal import Decimal
-
 from pydantic import BaseModel, Field
 
+from app.schemas.common import Quantity
+
 
 class RuleValidateAssignmentRequest(BaseModel):
     mission_id: int
@@ -12,7 +12,7 @@ class RuleValidateMovementRequest(BaseModel):
     mission_id: int
     mission_line_id: int
     executor_id: int
-    qty: Decimal = Field(gt=0)
+    qty: Quantity = Field(gt=0)
 
 
 class RuleValidationResponse(BaseModel):
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+from app.db.search import SearchKind
+
+
+class SearchHitRead(BaseModel):
+    kind: SearchKind
+    id: int
+    code: str
+    name: str | None
+    score: int
+
+
+class SearchRead(BaseModel):
+    hits: list[SearchHitRead]
+    has_more: bool
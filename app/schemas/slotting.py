@@ -0,0 +1,55 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.common import StoredQuantity
+
+
+class ItemVelocityRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    item_id: int
+    rank: int
+    pick_count: int
+    qty: StoredQuantity
+    picks_per_day: float
+    abc_class: str
+
+
+class ItemAffinityRead(BaseModel):
+    item_a_id: int
+    item_b_id: int
+    copick_count: int
+
+
+class SlottingSuggestionRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    item_id: int
+    abc_class: str
+    picks_per_day: float
+    hu_id: int
+    from_location_id: int
+    to_location_id: int
+    current_distance: float | None
+    target_distance: float
+    partner_item_id: int | None
+
+
+class SlottingMove(BaseModel):
+    hu_id: int
+    to_location_id: int
+
+
+class SlottingMissionCreate(BaseModel):
+    created_by_operator_id: int
+    priority: int = Field(default=0, ge=0)
+    moves: list[SlottingMove] | None = Field(
+        default=None,
+        description="Relocations to create; the current suggestions when omitted.",
+    )
+    window_days: int | None = Field(default=None, ge=1)
+    limit: int | None = Field(default=None, ge=1)
+
+
+class SlottingRefreshRead(BaseModel):
+    picks: int
+    completions: int
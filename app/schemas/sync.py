@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+from app.schemas.executor import ExecutorRead
+from app.schemas.handling_unit import HandlingUnitRead
+from app.schemas.inventory import InventoryPositionRead
+from app.schemas.item import ItemRead
+from app.schemas.location import LocationRead
+
+
+class SyncRead(BaseModel):
+    since: int
+    watermark: int
+    has_more: bool
+    reset: bool
+    locations: list[LocationRead]
+    materials: list[ItemRead]
+    handling_units: list[HandlingUnitRead]
+    executors: list[ExecutorRead]
+    inventory_positions: list[InventoryPositionRead]
@@ -0,0 +1,30 @@
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class WavePlanCommand(BaseModel):
+    mission_ids: list[int] | None = None
+    capacity_kg: Decimal | None = Field(default=None, gt=0)
+    max_lines: int = Field(default=50, ge=1, le=1000)
+
+
+class WaveReleaseCommand(WavePlanCommand):
+    created_by_operator_id: int
+    assign: bool = False
+
+
+class WaveRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    priority: int
+    line_ids: list[int]
+    payload: float
+    route_distance: float | None
+    mission_id: int | None
+
+
+class WavePlanRead(BaseModel):
+    waves: list[WaveRead]
+    consolidated_mission_ids: list[int]
+    assigned_mission_ids: list[int] = []
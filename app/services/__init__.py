@@ -1,4 +1,6 @@
 from app.services.inventory_service import InventoryService
 from app.services.mission_service import MissionService
+from app.services.travel_service import TravelService
+from app.services.wave_service import WaveService
 
-__all__ = ["InventoryService", "MissionService"]
+__all__ = ["InventoryService", "MissionService", "TravelService", "WaveService"]
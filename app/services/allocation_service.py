@@ -0,0 +1,203 @@
+"""Stock allocation: turn item demands into ready-to-run MOVE_ITEM missions.
+
+A demand asks for ``qty`` of an item at a destination location. Sources come
+from the in-memory :class:`~app.planning.availability.AvailabilityIndex`,
+brought up to date with the positions and handling units changed since its
+last sync, and are chosen per demand by an
+:class:`~app.planning.allocation.AllocationStrategy`. The chosen stock is
+reserved in one statement and the lines are created as one draft mission per
+destination, each line holding its reservation until it is picked or the
+mission is cancelled.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.db.models.handling_unit import HandlingUnitStatus
+from app.db.models.location import LocationType
+from app.db.models.mission import Mission, MissionType
+from app.events.broker import stage_event
+from app.events.payloads import mission_payload
+from app.planning.allocation import AllocationStrategy, allocation_order, take
+from app.planning.availability import AvailabilityIndex, get_availability_index
+from app.planning.travel_matrix import TravelMatrix, get_travel_matrix
+from app.repositories.handling_unit import HandlingUnitRepository
+from app.repositories.inventory import InventoryPositionRepository
+from app.repositories.location import LocationRepository
+from app.repositories.mission import MissionRepository
+from app.rules.exceptions import RuleViolation
+
+
+@dataclass
+class AllocationDemand:
+    item_id: int
+    qty: int
+    to_location_id: int
+
+
+@dataclass
+class AllocationShortage:
+    item_id: int
+    to_location_id: int
+    qty_requested: int
+    qty_short: int
+
+
+@dataclass
+class AllocationResult:
+    missions: list[Mission] = field(default_factory=list)
+    shortages: list[AllocationShortage] = field(default_factory=list)
+
+
+class AllocationService:
+    def __init__(
+        self,
+        db: Session,
+        matrix: TravelMatrix | None = None,
+        index: AvailabilityIndex | None = None,
+    ) -> None:
+        self.db = db
+        self.positions = InventoryPositionRepository(db)
+        self.handling_units = HandlingUnitRepository(db)
+        self.locations = LocationRepository(db)
+        self.missions = MissionRepository(db)
+        self.matrix = matrix or get_travel_matrix()
+        self.index = index or get_availability_index()
+
+    def sync_index(self) -> int:
+        """Apply position and handling unit changes since the index's watermarks.
+
+        Returns the number of changes applied.
+        """
+        units = self.handling_units.list_changed_since(self.index.units_watermark)
+        applied = self.index.apply_units(
+            (hu_id, location_id, status == HandlingUnitStatus.OPEN, change_seq)
+            for hu_id, location_id, status, change_seq in units
+        )
+        return applied + self.index.apply_positions(
+            self.positions.list_available_changed_since(self.index.positions_watermark)
+        )
+
+    def allocate(
+        self,
+        demands: list[AllocationDemand],
+        *,
+        strategy: AllocationStrategy = AllocationStrategy.FIFO,
+        created_by_operator_id: int,
+        priority: int = 0,
+        allow_partial: bool = False,
+        source_types: set[LocationType] | None = None,
+        mission_prefix: str = "ALLOC",
+    ) -> AllocationResult:
+        """Reserve sources for ``demands`` and create one draft mission per destination.
+
+        Without ``allow_partial`` a demand that cannot be covered fails the
+        whole allocation with a 409. ``source_types`` limits the sources to
+        locations of those types.
+        """
+        for location_id in sorted({demand.to_location_id for demand in demands}):
+            location = self.locations.get(location_id)
+            if location is None:
+                raise RuleViolation(f"Location {location_id} not found", status_code=404)
+            if not location.active:
+                raise RuleViolation(f"Location {location_id} is inactive")
+
+        source_ids = None
+        if source_types is not None:
+            source_ids = np.array(self.locations.list_ids(types=source_types), dtype=np.int64)
+
+        self.sync_index()
+        remaining: dict[int, np.ndarray] = {}
+        lines: dict[int, list[dict]] = defaultdict(list)
+        reserved: dict[tuple[int, int], int] = defaultdict(int)
+        result = AllocationResult()
+
+        for demand in demands:
+            allocated = 0
+            stock = self.index.stock(demand.item_id)
+            if stock is not None:
+                available = remaining.setdefault(demand.item_id, stock.available.copy())
+                eligible = (
+                    (available > 0) & stock.pickable & (stock.location_ids != demand.to_location_id)
+                )
+                if source_ids is not None:
+                    eligible &= np.isin(stock.location_ids, source_ids)
+                candidates = np.flatnonzero(eligible)
+                distances = None
+                if strategy == AllocationStrategy.LEAST_TRAVEL and candidates.size:
+                    distances = self._travel(stock.location_ids[candidates], demand.to_location_id)
+                order = allocation_order(strategy, available[candidates], demand.qty, distances)
+                for index, qty in take(available[candidates], order, demand.qty):
+                    row = int(candidates[index])
+                    available[row] -= qty
+                    allocated += qty
+                    hu_id = int(stock.hu_ids[row])
+                    reserved[(hu_id, demand.item_id)] += qty
+                    lines[demand.to_location_id].append(
+                        {
+                            "from_location_id": int(stock.location_ids[row]),
+                            "to_location_id": demand.to_location_id,
+                            "item_id": demand.item_id,
+                            "hu_id": hu_id,
+                            "qty": qty,
+                            "reserved_qty": qty,
+                        }
+                    )
+            if allocated < demand.qty:
+                result.shortages.append(
+                    AllocationShortage(
+                        item_id=demand.item_id,
+                        to_location_id=demand.to_location_id,
+                        qty_requested=demand.qty,
+                        qty_short=demand.qty - allocated,
+                    )
+                )
+
+        if result.shortages and not allow_partial:
+            short = sorted({shortage.item_id for shortage in result.shortages})
+            raise RuleViolation(f"Insufficient available stock for items {short}", status_code=409)
+        if not self.positions.reserve(
+            [(hu_id, item_id, qty) for (hu_id, item_id), qty in reserved.items()]
+        ):
+            raise RuleViolation("Available stock changed during allocation; retry", status_code=409)
+
+        result.missions = self.missions.create_many_with_lines(
+            [
+                {
+                    "mission_no": f"{mission_prefix}-{uuid4().hex[:12].upper()}",
+                    "type": MissionType.MOVE_ITEM,
+                    "priority": priority,
+                    "created_by_operator_id": created_by_operator_id,
+                    "lines": destination_lines,
+                }
+                for destination_lines in lines.values()
+            ]
+        )
+        for mission in result.missions:
+            stage_event(
+                self.db,
+                "mission.created",
+                mission_payload(mission),
+                mission_ids={mission.id},
+                hu_ids={line.hu_id for line in mission.lines},
+                location_ids={line.from_location_id for line in mission.lines},
+            )
+        return result
+
+    def _travel(self, location_ids: np.ndarray, to_location_id: int) -> np.ndarray:
+        """Distance from each source location to the destination.
+
+        The distance is ``inf`` where either location has no coordinates.
+        """
+        matrix = self.matrix
+        destination = int(matrix.index_of(np.array([to_location_id]))[0])
+        rows = matrix.index_of(location_ids)
+        travel = np.full(location_ids.size, np.inf)
+        known = rows >= 0
+        if destination >= 0 and known.any():
+            travel[known] = matrix.distances[rows[known], destination]
+        return travel
@@ -0,0 +1,381 @@
+"""Cycle counts: bulk counted stock, set-based variances and bulk adjustments.
+
+A count covers one location or every location of a zone. Counters submit
+``(hu_id, item_id, qty)`` rows in bulk; a submission is validated and
+matched against ``inventory_positions`` as arrays (see
+:mod:`app.planning.variance`), so it costs a handful of statements however
+many rows it holds. Each line keeps the quantity and version of its position
+at count time, and a row with an already seen ``idempotency_key`` is skipped.
+
+Posting turns the approved non-zero variances into ``ADJUSTMENT`` movements
+in one transaction. A position that changed since it was counted, or whose
+unit moved, is not overwritten: its line is marked stale and needs a recount.
+Every movement carries the idempotency key ``cycle-count-line:<id>``, so a
+line never posts twice.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.quantity import scale_milli
+from app.db.models.cycle_count import (
+    CycleCount,
+    CycleCountLine,
+    CycleCountLineStatus,
+    CycleCountState,
+)
+from app.db.models.inventory import InventoryMovementType
+from app.events.broker import stage_event
+from app.planning.replenishment import touch
+from app.planning.variance import duplicate_rows, gather, match_positions
+from app.repositories.cycle_count import CycleCountRepository
+from app.repositories.handling_unit import HandlingUnitRepository
+from app.repositories.inventory import InventoryMovementRepository, InventoryPositionRepository
+from app.repositories.item import ItemRepository
+from app.repositories.location import LocationRepository
+from app.rules.exceptions import RuleViolation
+
+
+@dataclass
+class CountedRow:
+    hu_id: int
+    item_id: int
+    qty: int
+    idempotency_key: str | None = None
+
+
+@dataclass
+class SubmissionResult:
+    lines: list[CycleCountLine] = field(default_factory=list)
+    duplicates: int = 0
+
+
+@dataclass
+class PostingResult:
+    cycle_count: CycleCount
+    posted: int = 0
+    movements: int = 0
+    stale: int = 0
+    rejected: int = 0
+
+
+def movement_key(line_id: int) -> str:
+    return f"cycle-count-line:{line_id}"
+
+
+class CycleCountService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.counts = CycleCountRepository(db)
+        self.locations = LocationRepository(db)
+        self.handling_units = HandlingUnitRepository(db)
+        self.items = ItemRepository(db)
+        self.positions = InventoryPositionRepository(db)
+        self.movements = InventoryMovementRepository(db)
+
+    def create(
+        self,
+        *,
+        created_by_operator_id: int,
+        location_id: int | None = None,
+        zone: str | None = None,
+    ) -> CycleCount:
+        if location_id is None and zone is None:
+            raise RuleViolation("A cycle count needs a location_id or a zone")
+        if location_id is not None and self.locations.get(location_id) is None:
+            raise RuleViolation("Location not found", status_code=404)
+        if location_id is None and not self.locations.list_ids(zone=zone):
+            raise RuleViolation(f"Zone {zone} has no locations", status_code=404)
+        return self.counts.create(
+            count_no=f"CC-{uuid4().hex[:12].upper()}",
+            created_by_operator_id=created_by_operator_id,
+            location_id=location_id,
+            zone=zone if location_id is None else None,
+        )
+
+    def scope(self, cycle_count: CycleCount) -> np.ndarray:
+        """Ids of the locations the count covers, sorted."""
+        if cycle_count.location_id is not None:
+            return np.array([cycle_count.location_id], dtype=np.int64)
+        return np.array(self.locations.list_ids(zone=cycle_count.zone), dtype=np.int64)
+
+    def submit(
+        self,
+        cycle_count_id: int,
+        rows: list[CountedRow],
+        *,
+        executor_id: int | None = None,
+    ) -> SubmissionResult:
+        """Record counted rows and their variances. The caller commits.
+
+        Recounting a ``(hu_id, item_id)`` already counted in this count replaces
+        its line.
+        """
+        cycle_count = self._open(cycle_count_id)
+        keys = [row.idempotency_key for row in rows if row.idempotency_key]
+        if len(set(keys)) != len(keys):
+            raise RuleViolation("Rows repeat an idempotency_key")
+        seen = self.counts.existing_idempotency_keys(keys)
+        fresh = [row for row in rows if row.idempotency_key not in seen]
+        result = SubmissionResult(duplicates=len(rows) - len(fresh))
+        if not fresh:
+            return result
+
+        hu_ids = np.array([row.hu_id for row in fresh], dtype=np.int64)
+        item_ids = np.array([row.item_id for row in fresh], dtype=np.int64)
+        counted = np.array([row.qty for row in fresh], dtype=np.int64)
+        repeated = duplicate_rows(hu_ids, item_ids)
+        if repeated.size:
+            row = fresh[int(repeated[0])]
+            raise RuleViolation(f"Handling unit {row.hu_id} item {row.item_id} is counted twice")
+
+        unique_hus = np.unique(hu_ids).tolist()
+        units = self.handling_units.locations_of(unique_hus)
+        row_locations = np.array(
+            [units.get(hu_id, -1) for hu_id in hu_ids.tolist()], dtype=np.int64
+        )
+        unknown = np.flatnonzero(row_locations < 0)
+        if unknown.size:
+            raise RuleViolation(
+                f"Handling unit {int(hu_ids[unknown[0]])} not found", status_code=404
+            )
+        outside = np.flatnonzero(~np.isin(row_locations, self.scope(cycle_count)))
+        if outside.size:
+            raise RuleViolation(
+                f"{outside.size} rows count handling units outside the count's locations, "
+                f"e.g. {int(hu_ids[outside[0]])}"
+            )
+        known_items = self.items.weights(np.unique(item_ids).tolist())
+        missing_items = np.flatnonzero(~np.isin(item_ids, np.fromiter(known_items, dtype=np.int64)))
+        if missing_items.size:
+            raise RuleViolation(
+                f"Item {int(item_ids[missing_items[0]])} not found", status_code=404
+            )
+
+        _, position_hus, position_items, on_hand, _, position_versions = self._position_columns(
+            unique_hus
+        )
+        matched = match_positions(hu_ids, item_ids, position_hus, position_items)
+        system = gather(on_hand, matched)
+        versions = gather(position_versions, matched)
+        variances = counted - system
+        counted_at = datetime.now(tz=timezone.utc)
+
+        existing = self.counts.line_keys(cycle_count.id)
+        inserts: list[dict] = []
+        updates: list[dict] = []
+        for index, row in enumerate(fresh):
+            values = {
+                "location_id": int(row_locations[index]),
+                "counted_qty": row.qty,
+                "system_qty": int(system[index]),
+                "variance": int(variances[index]),
+                "system_version": int(versions[index]),
+                "status": CycleCountLineStatus.COUNTED,
+                "counted_by_executor_id": executor_id,
+                "counted_at": counted_at,
+                "idempotency_key": row.idempotency_key,
+            }
+            line = existing.get((row.hu_id, row.item_id))
+            if line is None:
+                inserts.append(
+                    {
+                        "cycle_count_id": cycle_count.id,
+                        "hu_id": row.hu_id,
+                        "item_id": row.item_id,
+                        **values,
+                    }
+                )
+            else:
+                updates.append({"id": line[0], **values})
+        self.counts.insert_lines(inserts)
+        self.counts.update_lines(updates)
+
+        submitted = {(row.hu_id, row.item_id) for row in fresh}
+        result.lines = [
+            line
+            for line in self.counts.list_lines(cycle_count.id, hu_ids=unique_hus)
+            if (line.hu_id, line.item_id) in submitted
+        ]
+        return result
+
+    def post(
+        self,
+        cycle_count_id: int,
+        *,
+        line_ids: list[int] | None = None,
+        executor_id: int | None = None,
+        reason: str | None = None,
+    ) -> PostingResult:
+        """Post the approved lines and close the count.
+
+        Every counted line is approved if ``line_ids`` is ``None``. Counted lines
+        that are not approved are rejected. The caller commits.
+        """
+        cycle_count = self._open(cycle_count_id)
+        counted = self.counts.list_lines(cycle_count.id, status=CycleCountLineStatus.COUNTED)
+        if line_ids is not None:
+            wanted = set(line_ids)
+            unknown = wanted - {line.id for line in counted}
+            if unknown:
+                raise RuleViolation(
+                    f"Lines {sorted(unknown)[:10]} are not open lines of this count"
+                )
+            approved = [line for line in counted if line.id in wanted]
+        else:
+            approved = counted
+        result = PostingResult(cycle_count=cycle_count, rejected=len(counted) - len(approved))
+        approved_ids = {line.id for line in approved}
+        self.counts.set_status(
+            [line.id for line in counted if line.id not in approved_ids],
+            CycleCountLineStatus.REJECTED,
+        )
+
+        if approved:
+            self._post_lines(cycle_count, approved, result, executor_id=executor_id, reason=reason)
+        result.cycle_count = self.counts.close(cycle_count, CycleCountState.POSTED)
+        stage_event(
+            self.db,
+            "cycle_count.posted",
+            {
+                "cycle_count_id": cycle_count.id,
+                "count_no": cycle_count.count_no,
+                "posted": result.posted,
+                "movements": result.movements,
+                "stale": result.stale,
+                "rejected": result.rejected,
+            },
+            location_ids=set(self.scope(cycle_count).tolist()),
+        )
+        return result
+
+    def cancel(self, cycle_count_id: int) -> CycleCount:
+        return self.counts.close(self._open(cycle_count_id), CycleCountState.CANCELLED)
+
+    def _post_lines(
+        self,
+        cycle_count: CycleCount,
+        lines: list[CycleCountLine],
+        result: PostingResult,
+        *,
+        executor_id: int | None,
+        reason: str | None,
+    ) -> None:
+        hu_ids = np.array([line.hu_id for line in lines], dtype=np.int64)
+        item_ids = np.array([line.item_id for line in lines], dtype=np.int64)
+        unique_hus = np.unique(hu_ids).tolist()
+        ids, position_hus, position_items, _, position_reserved, position_versions = (
+            self._position_columns(unique_hus)
+        )
+        matched = match_positions(hu_ids, item_ids, position_hus, position_items)
+        position_ids = gather(ids, matched, missing=-1)
+        reserved = gather(position_reserved, matched)
+        versions = gather(position_versions, matched)
+        units = self.handling_units.locations_of(unique_hus)
+
+        counted = np.array([line.counted_qty for line in lines], dtype=np.int64)
+        variances = np.array([line.variance for line in lines], dtype=np.int64)
+        moved = np.array([units.get(line.hu_id) != line.location_id for line in lines], dtype=bool)
+        stale = (
+            (versions != np.array([line.system_version for line in lines], dtype=np.int64))
+            | (counted < reserved)
+            | moved
+        )
+        already = self.movements.existing_idempotency_keys(
+            [movement_key(line.id) for line in lines]
+        )
+        applied = (
+            ~stale
+            & (variances != 0)
+            & np.array([movement_key(line.id) not in already for line in lines])
+        )
+
+        self.counts.set_status(
+            [line.id for line, is_stale in zip(lines, stale.tolist()) if is_stale],
+            CycleCountLineStatus.STALE,
+        )
+        result.stale = int(stale.sum())
+
+        applied_rows = np.flatnonzero(applied).tolist()
+        existing_rows = [row for row in applied_rows if position_ids[row] >= 0]
+        if not self.positions.apply_counts(
+            [
+                (int(position_ids[row]), int(versions[row]), int(variances[row]))
+                for row in existing_rows
+            ]
+        ):
+            raise RuleViolation("Stock changed while the count was posted; retry", status_code=409)
+        self.positions.create_many(
+            [
+                (lines[row].hu_id, lines[row].item_id, lines[row].counted_qty)
+                for row in applied_rows
+                if position_ids[row] < 0
+            ]
+        )
+
+        weights = self.items.weights(np.unique(item_ids[applied]).tolist()) if applied_rows else {}
+        unit_weights: dict[int, int] = defaultdict(int)
+        reason = reason or f"Cycle count {cycle_count.count_no}"
+        movements = []
+        for row in applied_rows:
+            line = lines[row]
+            weight = weights.get(line.item_id)
+            if weight:
+                unit_weights[line.hu_id] += scale_milli(line.counted_qty, weight) - scale_milli(
+                    line.system_qty, weight
+                )
+            if line.variance < 0:
+                touch(self.db, line.item_id, line.location_id)
+            movements.append(
+                {
+                    "movement_type": InventoryMovementType.ADJUSTMENT,
+                    "item_id": line.item_id,
+                    "qty": abs(line.variance),
+                    "from_location_id": line.location_id if line.variance < 0 else None,
+                    "to_location_id": line.location_id if line.variance > 0 else None,
+                    "from_hu_id": line.hu_id if line.variance < 0 else None,
+                    "to_hu_id": line.hu_id if line.variance > 0 else None,
+                    "executed_by_executor_id": executor_id,
+                    "idempotency_key": movement_key(line.id),
+                    "reason": reason,
+                }
+            )
+        for hu_id, weight_kg in unit_weights.items():
+            self.handling_units.add_weight(
+                self.handling_units.get(hu_id), weight_kg, enforce_limits=False
+            )
+        movement_ids = self.movements.create_many(movements)
+        result.movements = len(movement_ids)
+
+        self.counts.update_lines(
+            [
+                {
+                    "id": line.id,
+                    "status": CycleCountLineStatus.POSTED,
+                    "movement_id": movement_ids.get(movement_key(line.id)),
+                }
+                for line, is_stale in zip(lines, stale.tolist())
+                if not is_stale
+            ]
+        )
+        result.posted = len(lines) - result.stale
+
+    def _position_columns(self, hu_ids: list[int]) -> np.ndarray:
+        """Positions of the units, one array per column.
+
+        The columns are ``id, hu_id, item_id, qty_on_hand, qty_reserved, version``.
+        """
+        return np.array(self.positions.list_for_units(hu_ids), dtype=np.int64).reshape(-1, 6).T
+
+    def _open(self, cycle_count_id: int) -> CycleCount:
+        cycle_count = self.counts.get(cycle_count_id)
+        if cycle_count is None:
+            raise RuleViolation("Cycle count not found", status_code=404)
+        if cycle_count.state != CycleCountState.OPEN:
+            raise RuleViolation(f"Cycle count is {cycle_count.state.value}", status_code=409)
+        return cycle_count
@@ -1,10 +1,14 @@
-from decimal import Decimal
-
 from sqlalchemy.orm import Session
 
+from app.core.quantity import scale_milli
 from app.db.models.inventory import InventoryMovement, InventoryMovementType
+from app.db.models.item import Item
+from app.events.broker import stage_event
+from app.events.payloads import movement_payload
+from app.planning.replenishment import touch
 from app.repositories.handling_unit import HandlingUnitRepository
 from app.repositories.inventory import InventoryMovementRepository, InventoryPositionRepository
+from app.repositories.item import ItemRepository
 from app.rules.exceptions import RuleViolation
 
 
@@ -14,13 +18,43 @@ class InventoryService:
         self.handling_units = HandlingUnitRepository(db)
         self.positions = InventoryPositionRepository(db)
         self.movements = InventoryMovementRepository(db)
+        self.items = ItemRepository(db)
+
+    def update_item(
+        self,
+        *,
+        item_id: int,
+        name: str | None = None,
+        weight_kg: int | None = None,
+        volume_l: int | None = None,
+    ) -> Item:
+        """Update item master data, reweighing the handling units that hold it.
+
+        A weight correction is applied even where it takes a location past its
+        weight limit: the stock is already there.
+        """
+        item = self.items.get(item_id)
+        if item is None:
+            raise RuleViolation("Material not found", status_code=404)
+
+        previous = item.weight_kg or 0
+        if weight_kg is not None and weight_kg != previous:
+            for position in self.positions.list(item_id=item_id):
+                delta = scale_milli(position.qty_on_hand, weight_kg) - scale_milli(
+                    position.qty_on_hand, previous
+                )
+                if delta:
+                    self.handling_units.add_weight(
+                        position.handling_unit, delta, enforce_limits=False
+                    )
+        return self.items.update(item, name=name, weight_kg=weight_kg, volume_l=volume_l)
 
     def adjust_inventory(
         self,
         *,
         hu_id: int,
         item_id: int,
-        qty_delta: Decimal,
+        qty_delta: int,
         reason: str,
         executor_id: int | None = None,
         idempotency_key: str | None = None,
@@ -41,7 +75,7 @@ class InventoryService:
         if position is None:
             if qty_delta < 0:
                 raise RuleViolation("Cannot reduce stock for a missing inventory position")
-            position = self.positions.create(hu_id=hu_id, item_id=item_id, qty_on_hand=Decimal("0"))
+            position = self.positions.create(hu_id=hu_id, item_id=item_id)
 
         changed = self.positions.update_qty_on_hand_if_version(
             position_id=position.id,
@@ -50,16 +84,18 @@ class InventoryService:
         )
         if not changed:
             raise RuleViolation("Inventory update conflict or insufficient stock")
+        if qty_delta < 0:
+            touch(self.db, item_id, handling_unit.location_id)
 
         from_location_id = handling_unit.location_id if qty_delta < 0 else None
         to_location_id = handling_unit.location_id if qty_delta > 0 else None
         from_hu_id = hu_id if qty_delta < 0 else None
         to_hu_id = hu_id if qty_delta > 0 else None
 
-        return self.movements.create(
+        movement = self.movements.create(
             movement_type=InventoryMovementType.ADJUSTMENT,
             item_id=item_id,
-            qty=abs(Decimal(str(qty_delta))),
+            qty=abs(qty_delta),
             from_location_id=from_location_id,
             to_location_id=to_location_id,
             from_hu_id=from_hu_id,
@@ -68,3 +104,12 @@ class InventoryService:
             idempotency_key=idempotency_key,
             reason=reason,
         )
+        stage_event(
+            self.db,
+            "inventory.adjusted",
+            {**movement_payload(movement), "reason": reason},
+            executor_ids={executor_id},
+            hu_ids={hu_id},
+            location_ids={handling_unit.location_id},
+        )
+        return movement
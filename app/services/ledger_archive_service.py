@@ -0,0 +1,273 @@
+"""Archival of closed ledger periods.
+
+``inventory_movements`` keeps only recent months. Each closed month (older
+than ``ledger_retain_months``) is written to a columnar archive file, recorded
+in ``movement_archives`` and deleted from the hot table in one transaction, so
+inserts and audit queries work on a table whose size is bounded by the
+retention window. Archived rows stay readable through the movements API.
+
+Only movements every incremental reader of the ledger has consumed are
+archived: the export, report and slotting refreshes read it by id, so a
+month is archived up to the lowest of their marks and the rest waits for the
+next run. The newest movement always stays, because SQLite would hand its id
+out again once it was deleted, under the readers' marks.
+
+A movement dated into a month that is already archived, such as a back-dated
+correction, is merged into that month's archive on the next run. The merged
+file is written under a new name and the catalog entry switched to it, and
+the superseded file is removed only once the transaction commits, so a
+rollback leaves the old archive in place.
+
+Idempotency keys of archived movements are no longer checked for replays;
+clients retry within seconds, far inside any retention window.
+"""
+
+import heapq
+import logging
+import threading
+from datetime import datetime, timezone
+from itertools import chain
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.archive import read_movement_archive, write_movement_archive
+from app.core.config import settings
+from app.db.models.inventory import InventoryMovement
+from app.db.models.movement_archive import MovementArchive
+from app.repositories.inventory import InventoryMovementRepository
+from app.repositories.movement_archive import MovementArchiveRepository
+from app.rules.exceptions import RuleViolation
+from app.services.retention import movement_read_mark
+
+logger = logging.getLogger(__name__)
+
+_OBSOLETE_KEY = "obsolete_archive_files"
+
+
+def _as_utc(value: datetime) -> datetime:
+    return (
+        value.replace(tzinfo=timezone.utc)
+        if value.tzinfo is None
+        else value.astimezone(timezone.utc)
+    )
+
+
+def _movement_id(movement: InventoryMovement | dict) -> int:
+    return movement["id"] if isinstance(movement, dict) else movement.id
+
+
+def _month_start(value: datetime) -> datetime:
+    return _as_utc(value).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+class LedgerArchiveService:
+    def __init__(
+        self, db: Session, directory: Path | None = None, export_dir: Path | None = None
+    ) -> None:
+        self.db = db
+        self.movements = InventoryMovementRepository(db)
+        self.archives = MovementArchiveRepository(db)
+        self.directory = Path(directory or settings.ledger_archive_dir)
+        self.export_dir = Path(export_dir or settings.export_dir)
+
+    def archivable_up_to(self) -> int:
+        """Highest movement id that may leave the hot table."""
+        return min(
+            movement_read_mark(self.db, export_dir=self.export_dir), self.movements.max_id() - 1
+        )
+
+    def closed_periods(
+        self, *, retain_months: int, now: datetime | None = None
+    ) -> list[tuple[datetime, datetime]]:
+        """``(start, end)`` of every month with hot rows that is older than the retention window."""
+        oldest = self.movements.oldest_executed_at()
+        if oldest is None:
+            return []
+        cutoff = _add_months(_month_start(now or datetime.now(tz=timezone.utc)), -retain_months)
+        periods = []
+        start = _month_start(oldest)
+        while start < cutoff:
+            end = _add_months(start, 1)
+            periods.append((start, end))
+            start = end
+        return periods
+
+    def archive_period(self, start: datetime, end: datetime) -> MovementArchive | None:
+        """Move the movements of ``[start, end)`` to an archive file. The caller commits.
+
+        Only movements up to :meth:`archivable_up_to` move. If the period is
+        already archived the movements are merged into its archive. Returns
+        ``None`` when the period has no movements to move.
+        """
+        period = start.strftime("%Y-%m")
+        existing = self.archives.get_by_period(period)
+        up_to_id = self.archivable_up_to()
+
+        first: InventoryMovement | None = None
+        last: InventoryMovement | None = None
+
+        def tracked():
+            nonlocal first, last
+            for movement in self.movements.iter_between(start, end, up_to_id=up_to_id):
+                first = first or movement
+                last = movement
+                yield movement
+
+        if existing is None:
+            path = self.directory / f"movements-{period}.npz"
+            row_count = write_movement_archive(path, tracked())
+        else:
+            # Named by the rows it extends, so it never overwrites the file in use.
+            path = self.directory / f"movements-{period}.{existing.row_count}.npz"
+            archived = read_movement_archive(Path(existing.path))
+            row_count = write_movement_archive(path, chain(archived, tracked())) - len(archived)
+        if row_count == 0:
+            path.unlink(missing_ok=True)
+            return None
+
+        if existing is None:
+            entry = self.archives.add(
+                period=period,
+                path=str(path),
+                row_count=row_count,
+                first_movement_id=first.id,
+                last_movement_id=last.id,
+                first_executed_at=first.executed_at,
+                last_executed_at=last.executed_at,
+            )
+        else:
+            self.db.info.setdefault(_OBSOLETE_KEY, []).append(Path(existing.path))
+            entry = self.archives.merge(
+                existing,
+                path=str(path),
+                row_count=row_count,
+                first_movement_id=first.id,
+                last_movement_id=last.id,
+                first_executed_at=first.executed_at,
+                last_executed_at=last.executed_at,
+            )
+        deleted = self.movements.delete_between(start, end, up_to_id=up_to_id)
+        if deleted != row_count:
+            raise RuleViolation(f"Ledger changed while archiving {period}; retry", status_code=409)
+        return entry
+
+    def list_movements(
+        self,
+        *,
+        executed_from: datetime | None = None,
+        executed_to: datetime | None = None,
+        include_archived: bool = False,
+    ) -> list[InventoryMovement | dict]:
+        """Hot and archived movements in ``[executed_from, executed_to)``, ordered by id."""
+        # Each source is in id order; back-dated merges interleave them.
+        sources: list[list[InventoryMovement] | list[dict]] = [
+            self.movements.list(executed_from=executed_from, executed_to=executed_to)
+        ]
+        if include_archived:
+            for entry in self.archives.list_overlapping(
+                executed_from=executed_from, executed_to=executed_to
+            ):
+                sources.append(
+                    read_movement_archive(
+                        Path(entry.path), executed_from=executed_from, executed_to=executed_to
+                    )
+                )
+        return list(heapq.merge(*sources, key=_movement_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _remove_obsolete_archives(session: Session) -> None:
+    for path in session.info.pop(_OBSOLETE_KEY, []):
+        path.unlink(missing_ok=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _keep_obsolete_archives(session: Session) -> None:
+    session.info.pop(_OBSOLETE_KEY, None)
+
+
+def archive_closed_periods(
+    session_factory: sessionmaker[Session], *, retain_months: int
+) -> list[str]:
+    """Archive every closed period, one transaction per month. Returns the archived periods."""
+    archived = []
+    with session_factory() as db:
+        periods = LedgerArchiveService(db).closed_periods(retain_months=retain_months)
+    for start, end in periods:
+        with session_factory() as db:
+            try:
+                entry = LedgerArchiveService(db).archive_period(start, end)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        if entry is not None:
+            archived.append(entry.period)
+    return archived
+
+
+class LedgerArchiveJob:
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        *,
+        interval_seconds: float,
+        retain_months: int,
+    ) -> None:
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.retain_months = retain_months
+        self.last_error: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="ledger-archive", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                archived = archive_closed_periods(
+                    self.session_factory, retain_months=self.retain_months
+                )
+                if archived:
+                    logger.info("Archived ledger periods %s", ", ".join(archived))
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.warning("Ledger archival failed: %s", exc)
+
+
+_job: LedgerArchiveJob | None = None
+
+
+def get_archive_job() -> LedgerArchiveJob | None:
+    return _job
+
+
+def start_archive_job(job: LedgerArchiveJob) -> None:
+    global _job
+    _job = job
+    job.start()
+
+
+def stop_archive_job() -> None:
+    global _job
+    if _job is not None:
+        _job.stop()
+        _job = None
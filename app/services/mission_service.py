@@ -1,17 +1,30 @@
-from decimal import Decimal
-
+import numpy as np
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.quantity import QTY_SCALE, from_milli
+from app.db.models.executor import Executor
 from app.db.models.inventory import InventoryMovement, InventoryMovementType
-from app.db.models.mission import Mission
+from app.db.models.mission import Mission, MissionState
+from app.events.broker import stage_event
+from app.events.payloads import mission_payload, movement_payload
+from app.planning.assignment import assignment_costs, solve_assignment
+from app.planning.replenishment import get_replenishment_triggers, touch
+from app.planning.sequencing import path_length, sequence_stops
+from app.planning.travel_matrix import TravelMatrix, get_travel_matrix
 from app.repositories.executor import ExecutorRepository
 from app.repositories.handling_unit import HandlingUnitRepository
 from app.repositories.inventory import InventoryMovementRepository, InventoryPositionRepository
 from app.repositories.location import LocationRepository
 from app.repositories.mission import MissionRepository
 from app.rules.exceptions import RuleViolation
-from app.rules.mission_rules import validate_assign, validate_cancel, validate_complete, validate_start
-from app.rules.movement_rules import validate_movement
+from app.rules.mission_rules import (
+    validate_assign,
+    validate_cancel,
+    validate_complete,
+    validate_start,
+)
+from app.rules.movement_rules import executor_payload_limit, line_payload, validate_movement
 from app.schemas.mission import MissionCreate, MissionRecordMovementCommand
 
 
@@ -26,13 +39,16 @@ class MissionService:
         self.movements = InventoryMovementRepository(db)
 
     def create_mission(self, payload: MissionCreate) -> Mission:
-        return self.missions.create(
+        mission = self.missions.create(
             mission_no=payload.mission_no,
             type=payload.type,
             priority=payload.priority,
             created_by_operator_id=payload.created_by_operator_id,
             lines=[line.model_dump() for line in payload.lines],
         )
+        mission = self.sequence_lines(mission)
+        self._stage_mission_event("mission.created", mission)
+        return mission
 
     def assign(self, mission_id: int, executor_id: int) -> Mission:
         mission = self.missions.get_with_lines(mission_id)
@@ -44,7 +60,147 @@ class MissionService:
             raise RuleViolation("Executor not found", status_code=404)
 
         validate_assign(mission, executor)
-        return self.missions.assign(mission, executor_id)
+        mission = self.missions.assign(mission, executor_id)
+        start_location_id = self.movements.last_location_by_executor([executor_id]).get(executor_id)
+        mission = self.sequence_lines(mission, start_location_id=start_location_id)
+        self._stage_mission_event("mission.assigned", mission)
+        return mission
+
+    def sequence_lines(
+        self,
+        mission: Mission,
+        *,
+        start_location_id: int | None = None,
+        matrix: TravelMatrix | None = None,
+    ) -> Mission:
+        """Order the mission lines to shorten the pick path over their source locations.
+
+        Lines whose source has no coordinates keep their relative order at the
+        end. Insertion order is kept when the heuristic does not beat it, so the
+        saving is never negative. The path length and the distance saved
+        against insertion order are stored on the mission.
+        """
+        matrix = matrix or get_travel_matrix()
+        lines = sorted(mission.lines, key=lambda line: line.id)
+        rows = matrix.index_of([line.from_location_id for line in lines])
+        placed = np.flatnonzero(rows >= 0)
+        if placed.size == 0:
+            return mission
+
+        start_row = matrix.index_of([start_location_id])[0] if start_location_id is not None else -1
+        fixed_start = start_row >= 0
+        stops = np.concatenate([[start_row], rows[placed]]) if fixed_start else rows[placed]
+        distances = np.asarray(matrix.distances[np.ix_(stops, stops)], dtype=np.float64)
+
+        route = sequence_stops(distances, fixed_start=fixed_start)
+        baseline = path_length(distances, np.arange(stops.size))
+        optimized = path_length(distances, route)
+        if optimized >= baseline:
+            route, optimized = np.arange(stops.size), baseline
+        visit_order = route[1:] - 1 if fixed_start else route
+
+        line_ids = [lines[placed[index]].id for index in visit_order]
+        line_ids += [line.id for line, row in zip(lines, rows, strict=True) if row < 0]
+        return self.missions.set_route(
+            mission,
+            line_ids,
+            route_distance=optimized,
+            route_distance_saved=baseline - optimized,
+        )
+
+    def auto_assign(
+        self,
+        *,
+        mission_ids: list[int] | None = None,
+        executor_ids: list[int] | None = None,
+        matrix: TravelMatrix | None = None,
+    ) -> tuple[list[tuple[Mission, float]], list[int]]:
+        """Assign draft missions to idle executors at minimum total cost.
+
+        Returns the assigned missions with their assignment cost and the ids of
+        draft missions left unassigned.
+        """
+        drafts = self.missions.list_by_state(MissionState.DRAFT, mission_ids)
+        missions = [mission for mission in drafts if mission.lines]
+        busy = self.missions.list_busy_executor_ids()
+        executors = [
+            executor
+            for executor in self.executors.list_active(executor_ids)
+            if executor.id not in busy
+        ]
+        if not missions or not executors:
+            return [], [mission.id for mission in missions]
+
+        matrix = matrix or get_travel_matrix()
+        last_locations = self.movements.last_location_by_executor(
+            [executor.id for executor in executors]
+        )
+        cost = assignment_costs(
+            self._travel_to_first_source(executors, missions, matrix, last_locations),
+            payloads=np.array(
+                [self._mission_payload(mission) for mission in missions], dtype=np.float64
+            ),
+            capacities=np.array(
+                [executor_payload_limit(executor) for executor in executors], dtype=np.float64
+            )
+            / QTY_SCALE,
+            priorities=np.array([mission.priority for mission in missions], dtype=np.float64),
+            priority_weight=settings.assignment_priority_weight,
+        )
+        rows, cols = solve_assignment(cost)
+
+        pairs = []
+        for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+            validate_assign(missions[col], executors[row])
+            pairs.append((missions[col].id, executors[row].id, float(cost[row, col])))
+        if not self.missions.assign_many(
+            [(mission_id, executor_id) for mission_id, executor_id, _ in pairs]
+        ):
+            raise RuleViolation(
+                "Missions or executors changed while assigning; retry", status_code=409
+            )
+
+        assigned = {
+            mission.id: mission for mission in self.missions.list_with_lines([p[0] for p in pairs])
+        }
+        for mission_id, executor_id, _ in pairs:
+            assigned[mission_id] = self.sequence_lines(
+                assigned[mission_id],
+                start_location_id=last_locations.get(executor_id),
+                matrix=matrix,
+            )
+            self._stage_mission_event("mission.assigned", assigned[mission_id])
+        unassigned = sorted({mission.id for mission in missions} - assigned.keys())
+        return [
+            (assigned[mission_id], cost_value) for mission_id, _, cost_value in pairs
+        ], unassigned
+
+    def _travel_to_first_source(
+        self,
+        executors: list[Executor],
+        missions: list[Mission],
+        matrix: TravelMatrix,
+        last_locations: dict[int, int],
+    ) -> np.ndarray:
+        executor_rows = matrix.index_of(
+            [last_locations.get(executor.id, -1) for executor in executors]
+        )
+        mission_rows = matrix.index_of([mission.lines[0].from_location_id for mission in missions])
+        travel = np.full((len(executors), len(missions)), np.nan)
+        known_executors = np.flatnonzero(executor_rows >= 0)
+        known_missions = np.flatnonzero(mission_rows >= 0)
+        if known_executors.size and known_missions.size:
+            travel[np.ix_(known_executors, known_missions)] = matrix.distances[
+                np.ix_(executor_rows[known_executors], mission_rows[known_missions])
+            ]
+        return travel
+
+    @staticmethod
+    def _mission_payload(mission: Mission) -> float:
+        """Kilograms still to carry, from the payloads cached on the lines."""
+        return (
+            sum(line_payload(line, line.qty - line.qty_done) for line in mission.lines) / QTY_SCALE
+        )
 
     def start(self, mission_id: int, executor_id: int) -> Mission:
         mission = self.missions.get_with_lines(mission_id)
@@ -56,9 +212,13 @@ class MissionService:
             raise RuleViolation("Executor not found", status_code=404)
 
         validate_start(mission, executor)
-        return self.missions.start(mission)
+        mission = self.missions.start(mission)
+        self._stage_mission_event("mission.started", mission)
+        return mission
 
-    def record_movement(self, mission_id: int, payload: MissionRecordMovementCommand) -> InventoryMovement:
+    def record_movement(
+        self, mission_id: int, payload: MissionRecordMovementCommand
+    ) -> InventoryMovement:
         mission = self.missions.get_with_lines(mission_id)
         if mission is None:
             raise RuleViolation("Mission not found", status_code=404)
@@ -98,10 +258,14 @@ class MissionService:
             handling_unit=handling_unit,
         )
 
+        released = 0
         if mission_line.item_id is None:
             if handling_unit is None:
                 raise RuleViolation("HU movement requires handling unit")
             self.handling_units.update(handling_unit, location_id=destination_location.id)
+            if get_replenishment_triggers().watches_location(source_location.id):
+                for item_id in self.positions.list_item_ids_in_tree(handling_unit.id):
+                    touch(self.db, item_id, source_location.id)
             movement = self.movements.create(
                 movement_type=InventoryMovementType.MOVE,
                 item_id=None,
@@ -123,11 +287,16 @@ class MissionService:
             from_hu = self.handling_units.get(from_hu_id)
             to_hu = self.handling_units.get(to_hu_id)
             if from_hu is None or to_hu is None:
-                raise RuleViolation("from_hu_id and to_hu_id must reference existing handling units")
+                raise RuleViolation(
+                    "from_hu_id and to_hu_id must reference existing handling units"
+                )
             if from_hu.location_id != source_location.id:
                 raise RuleViolation("from_hu_id is not located at source location")
             if to_hu.location_id != destination_location.id:
                 raise RuleViolation("to_hu_id is not located at destination location")
+            if mission_line.reserved_qty and from_hu_id != mission_line.hu_id:
+                raise RuleViolation("Allocated line must be picked from its reserved handling unit")
+            released = min(payload.qty, mission_line.reserved_qty)
 
             source_position = self.positions.get_by_hu_item(from_hu_id, mission_line.item_id)
             if source_position is None:
@@ -137,16 +306,16 @@ class MissionService:
                 position_id=source_position.id,
                 expected_version=source_position.version,
                 qty_delta=-payload.qty,
+                qty_reserved_delta=-released,
             )
             if not deducted:
                 raise RuleViolation("Insufficient stock or concurrent source update")
+            touch(self.db, mission_line.item_id, source_location.id)
 
             destination_position = self.positions.get_by_hu_item(to_hu_id, mission_line.item_id)
             if destination_position is None:
                 destination_position = self.positions.create(
-                    hu_id=to_hu_id,
-                    item_id=mission_line.item_id,
-                    qty_on_hand=Decimal("0"),
+                    hu_id=to_hu_id, item_id=mission_line.item_id
                 )
 
             added = self.positions.update_qty_on_hand_if_version(
@@ -170,7 +339,20 @@ class MissionService:
                 idempotency_key=idempotency_key,
             )
 
-        self.missions.increment_line_done(mission_line, payload.qty)
+        self.missions.increment_line_done(mission_line, payload.qty, released=released)
+        stage_event(
+            self.db,
+            "movement.recorded",
+            {
+                **movement_payload(movement),
+                "mission_id": mission.id,
+                "line_qty_done": str(from_milli(mission_line.qty_done)),
+            },
+            mission_ids={mission.id},
+            executor_ids={executor.id},
+            hu_ids={movement.from_hu_id, movement.to_hu_id},
+            location_ids={movement.from_location_id, movement.to_location_id},
+        )
         return movement
 
     def complete(self, mission_id: int) -> Mission:
@@ -178,11 +360,29 @@ class MissionService:
         if mission is None:
             raise RuleViolation("Mission not found", status_code=404)
         validate_complete(mission)
-        return self.missions.complete(mission)
+        mission = self.missions.complete(mission)
+        self._stage_mission_event("mission.completed", mission)
+        return mission
 
     def cancel(self, mission_id: int, reason: str) -> Mission:
         mission = self.missions.get_with_lines(mission_id)
         if mission is None:
             raise RuleViolation("Mission not found", status_code=404)
         validate_cancel(mission, reason)
-        return self.missions.cancel(mission, reason)
+        if not self.positions.reserve(self.missions.release_reservations(mission)):
+            raise RuleViolation("Reserved stock changed concurrently", status_code=409)
+        mission = self.missions.cancel(mission, reason)
+        self._stage_mission_event("mission.cancelled", mission)
+        return mission
+
+    def _stage_mission_event(self, kind: str, mission: Mission) -> None:
+        stage_event(
+            self.db,
+            kind,
+            mission_payload(mission),
+            mission_ids={mission.id},
+            executor_ids={mission.assigned_executor_id},
+            hu_ids={line.hu_id for line in mission.lines},
+            location_ids={line.from_location_id for line in mission.lines}
+            | {line.to_location_id for line in mission.lines},
+        )
@@ -0,0 +1,182 @@
+"""Putaway destinations for inbound handling units.
+
+Candidates are scored in one vectorized pass over the travel matrix rows:
+travel from the unit's location, distance to the nearest dock or staging
+area, location type against the velocity class of the unit's contents, and
+current occupancy. Occupancy and capacity come from the in-memory
+:class:`~app.planning.occupancy.OccupancyIndex`, brought up to date with the
+locations changed since its last sync. Per-location distances to
+outbound and the item classes are cached, so a request does not aggregate
+over locations or the ledger.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.location import LocationType
+from app.planning.occupancy import UNLIMITED, OccupancyIndex, get_occupancy_index
+from app.planning.putaway import best_candidates, putaway_costs
+from app.planning.slotting import CLASS_A, CLASS_B, CLASS_C, slot_proximity
+from app.planning.travel_matrix import LOCATION_TYPE_CODES, TravelMatrix, get_travel_matrix
+from app.repositories.handling_unit import HandlingUnitRepository
+from app.repositories.inventory import InventoryPositionRepository
+from app.repositories.location import LocationRepository
+from app.rules.exceptions import RuleViolation
+from app.services.slotting_service import ANCHOR_TYPES, SlottingService
+
+STORAGE_TYPES = {LocationType.PICK, LocationType.BULK}
+# Putaway fills a location without a max_hu limit with one top-level unit.
+DEFAULT_CAPACITY = 1
+
+_CLASS_TTL_SECONDS = 300.0
+_CLASS_ORDER = (CLASS_A, CLASS_B, CLASS_C)
+
+_cache_lock = threading.Lock()
+_proximity_cache: dict[int, np.ndarray] = {}
+_class_cache: tuple[float, dict[int, str]] = (0.0, {})
+
+
+@dataclass
+class PutawayCandidate:
+    location_id: int
+    location_type: LocationType
+    cost: float
+    travel_distance: float
+    outbound_distance: float
+    occupied: int
+    capacity: int
+
+
+@dataclass
+class PutawaySuggestion:
+    hu_id: int
+    from_location_id: int
+    abc_class: str | None
+    candidates: list[PutawayCandidate]
+
+
+class PutawayService:
+    def __init__(
+        self,
+        db: Session,
+        matrix: TravelMatrix | None = None,
+        occupancy: OccupancyIndex | None = None,
+    ) -> None:
+        self.db = db
+        self.handling_units = HandlingUnitRepository(db)
+        self.positions = InventoryPositionRepository(db)
+        self.locations = LocationRepository(db)
+        self.matrix = matrix or get_travel_matrix()
+        self.occupancy = occupancy or get_occupancy_index()
+
+    def sync_occupancy(self) -> int:
+        """Apply location counter changes since the index's watermark.
+
+        Returns the number of changes applied.
+        """
+        return self.occupancy.apply(
+            self.locations.list_occupancy_changed_since(self.occupancy.watermark)
+        )
+
+    def suggest(
+        self,
+        hu_id: int,
+        *,
+        limit: int = 5,
+        location_types: set[LocationType] | None = None,
+    ) -> PutawaySuggestion:
+        handling_unit = self.handling_units.get(hu_id)
+        if handling_unit is None:
+            raise RuleViolation("Handling unit not found", status_code=404)
+        if handling_unit.parent_hu_id is not None:
+            raise RuleViolation("Handling unit is nested; put away its top-level unit")
+
+        self.sync_occupancy()
+        matrix = self.matrix
+        rows = matrix.candidates(location_types or STORAGE_TYPES)
+        occupancy = self.occupancy.aligned(matrix.geometry.ids)
+        occupied = occupancy.counts[rows]
+        capacity = occupancy.capacity[rows]
+        capacity = np.where(capacity == UNLIMITED, DEFAULT_CAPACITY, capacity)
+        spare_kg = occupancy.max_load[rows] - occupancy.load[rows]
+        abc_class = self._abc_class(hu_id)
+
+        proximity = self._proximity()[rows]
+        origin = int(matrix.index_of(np.array([handling_unit.location_id]))[0])
+        if origin >= 0:
+            travel = np.asarray(matrix.distances[origin, rows], dtype=np.float64)
+        else:
+            travel = np.zeros(rows.size)
+        types = matrix.geometry.types[rows]
+
+        costs = putaway_costs(
+            travel=travel,
+            proximity=proximity,
+            is_pick=types == LOCATION_TYPE_CODES[LocationType.PICK],
+            occupancy=occupied / np.maximum(capacity, 1),
+            abc_class=abc_class,
+        )
+        feasible = (
+            (occupied < capacity) & (spare_kg >= handling_unit.gross_weight_kg) & (rows != origin)
+        )
+        location_types_by_code = list(LocationType)
+        candidates = [
+            PutawayCandidate(
+                location_id=int(matrix.geometry.ids[rows[index]]),
+                location_type=location_types_by_code[int(types[index])],
+                cost=float(costs[index]),
+                travel_distance=float(travel[index]),
+                outbound_distance=float(proximity[index]),
+                occupied=int(occupied[index]),
+                capacity=int(capacity[index]),
+            )
+            for index in best_candidates(costs, feasible, limit).tolist()
+        ]
+        return PutawaySuggestion(
+            hu_id=hu_id,
+            from_location_id=handling_unit.location_id,
+            abc_class=abc_class,
+            candidates=candidates,
+        )
+
+    def _abc_class(self, hu_id: int) -> str | None:
+        """Fastest class among the items in the unit.
+
+        Returns ``None`` if none of them was picked recently.
+        """
+        global _class_cache
+        with _cache_lock:
+            expires, classes = _class_cache
+        if time.monotonic() >= expires:
+            velocities = SlottingService(self.db, self.matrix).velocities(
+                window_days=settings.slotting_window_days
+            )
+            classes = {velocity.item_id: velocity.abc_class for velocity in velocities}
+            with _cache_lock:
+                _class_cache = (time.monotonic() + _CLASS_TTL_SECONDS, classes)
+        found = {
+            classes[item_id]
+            for item_id in self.positions.list_item_ids_in_tree(hu_id)
+            if item_id in classes
+        }
+        return next((abc_class for abc_class in _CLASS_ORDER if abc_class in found), None)
+
+    def _proximity(self) -> np.ndarray:
+        """Distance from every matrix row to its nearest active dock or staging location."""
+        matrix = self.matrix
+        with _cache_lock:
+            cached = _proximity_cache.get(matrix.generation)
+        if cached is None or cached.shape[0] != matrix.size:
+            anchors = matrix.candidates(ANCHOR_TYPES)
+            cached = slot_proximity(np.asarray(matrix.distances[:, anchors]))
+            if not np.isfinite(cached).all():
+                cached = np.where(np.isfinite(cached), cached, 0.0)
+            with _cache_lock:
+                _proximity_cache.clear()
+                _proximity_cache[matrix.generation] = cached
+        return cached
@@ -0,0 +1,259 @@
+"""Min/max replenishment of PICK locations from BULK stock.
+
+A rule holds ``min_qty`` and ``max_qty`` of an item at a PICK location. When
+the stock there drops below ``min_qty`` a MOVE_ITEM mission brings it back up
+to ``max_qty``, allocated FIFO from BULK locations through
+:class:`~app.services.allocation_service.AllocationService`.
+
+Rules are not evaluated by scanning stock. Every movement and adjustment
+that takes stock out of a watched location queues its rule through
+:func:`app.planning.replenishment.touch`, and only the queued rules are
+checked. The mission created for a rule is recorded on it with a conditional
+UPDATE, so a rule never has two open replenishment missions even when
+several workers evaluate it at once.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models.location import LocationType
+from app.db.models.mission import Mission
+from app.db.models.replenishment import ReplenishmentRule
+from app.planning.allocation import AllocationStrategy
+from app.planning.replenishment import ReplenishmentTriggers, get_replenishment_triggers
+from app.repositories.item import ItemRepository
+from app.repositories.location import LocationRepository
+from app.repositories.replenishment import ReplenishmentRepository
+from app.rules.exceptions import RuleViolation
+from app.rules.replenishment_rules import validate_replenishment_rule
+from app.services.allocation_service import AllocationDemand, AllocationService, AllocationShortage
+
+logger = logging.getLogger(__name__)
+
+SOURCE_TYPES = {LocationType.BULK}
+
+
+@dataclass
+class ReplenishmentResult:
+    evaluated: int = 0
+    missions: list[Mission] = field(default_factory=list)
+    shortages: list[AllocationShortage] = field(default_factory=list)
+
+
+class ReplenishmentService:
+    def __init__(self, db: Session, triggers: ReplenishmentTriggers | None = None) -> None:
+        self.db = db
+        self.rules = ReplenishmentRepository(db)
+        self.items = ItemRepository(db)
+        self.locations = LocationRepository(db)
+        self.triggers = triggers or get_replenishment_triggers()
+
+    def create_rule(
+        self,
+        *,
+        item_id: int,
+        location_id: int,
+        min_qty: int,
+        max_qty: int,
+        created_by_operator_id: int,
+        priority: int = 0,
+        active: bool = True,
+    ) -> ReplenishmentRule:
+        if self.items.get(item_id) is None:
+            raise RuleViolation("Item not found", status_code=404)
+        location = self.locations.get(location_id)
+        if location is None:
+            raise RuleViolation("Location not found", status_code=404)
+        validate_replenishment_rule(location, min_qty=min_qty, max_qty=max_qty)
+        if self.rules.get_by_item_location(item_id, location_id) is not None:
+            raise RuleViolation(
+                "A replenishment rule already exists for this item and location", status_code=409
+            )
+        return self.rules.create(
+            item_id=item_id,
+            location_id=location_id,
+            min_qty=min_qty,
+            max_qty=max_qty,
+            created_by_operator_id=created_by_operator_id,
+            priority=priority,
+            active=active,
+        )
+
+    def update_rule(
+        self,
+        rule_id: int,
+        *,
+        min_qty: int | None = None,
+        max_qty: int | None = None,
+        priority: int | None = None,
+        active: bool | None = None,
+    ) -> ReplenishmentRule:
+        rule = self.rules.get(rule_id)
+        if rule is None:
+            raise RuleViolation("Replenishment rule not found", status_code=404)
+        validate_replenishment_rule(
+            self.locations.get(rule.location_id),
+            min_qty=rule.min_qty if min_qty is None else min_qty,
+            max_qty=rule.max_qty if max_qty is None else max_qty,
+        )
+        return self.rules.update(
+            rule, min_qty=min_qty, max_qty=max_qty, priority=priority, active=active
+        )
+
+    def sync_triggers(self) -> int:
+        """Apply rule changes since the registry's watermark. Returns the number applied."""
+        return self.triggers.apply(self.rules.list_changed_since(self.triggers.watermark))
+
+    def due(self, rules: list[ReplenishmentRule]) -> list[tuple[ReplenishmentRule, int]]:
+        """Active ``rules`` below ``min_qty`` without an open mission, by priority.
+
+        Each entry is ``(rule, stock)``.
+        """
+        rules = [rule for rule in rules if rule.active]
+        open_missions = self.rules.open_mission_ids(
+            [rule.open_mission_id for rule in rules if rule.open_mission_id is not None]
+        )
+        rules = [rule for rule in rules if rule.open_mission_id not in open_missions]
+        stock = self.rules.stock_at([(rule.item_id, rule.location_id) for rule in rules])
+        due = [(rule, stock[(rule.item_id, rule.location_id)]) for rule in rules]
+        due = [(rule, qty) for rule, qty in due if qty < rule.min_qty]
+        return sorted(due, key=lambda entry: (-entry[0].priority, entry[0].id))
+
+    def replenish(self, rule: ReplenishmentRule, stock: int) -> ReplenishmentResult:
+        """Create the mission topping ``rule`` up from ``stock`` to ``max_qty``. The caller commits.
+
+        Raises a 409 if another evaluation created a mission for the rule first.
+        """
+        expected = rule.open_mission_id
+        allocation = AllocationService(self.db).allocate(
+            [
+                AllocationDemand(
+                    item_id=rule.item_id, qty=rule.max_qty - stock, to_location_id=rule.location_id
+                )
+            ],
+            strategy=AllocationStrategy.FIFO,
+            created_by_operator_id=rule.created_by_operator_id,
+            priority=rule.priority,
+            allow_partial=True,
+            source_types=SOURCE_TYPES,
+            mission_prefix="REPL",
+        )
+        result = ReplenishmentResult(evaluated=1, shortages=allocation.shortages)
+        if allocation.missions:
+            mission = allocation.missions[0]
+            if not self.rules.claim_open_mission(rule.id, expected=expected, mission_id=mission.id):
+                raise RuleViolation(
+                    f"Replenishment rule {rule.id} was replenished concurrently", status_code=409
+                )
+            result.missions.append(mission)
+        return result
+
+    def evaluate(self, rule_ids: list[int] | None = None) -> ReplenishmentResult:
+        """Replenish every due rule among ``rule_ids`` (all rules if ``None``).
+
+        The caller commits.
+        """
+        rules = self.rules.list(rule_ids=rule_ids)
+        total = ReplenishmentResult(evaluated=len(rules))
+        for rule, stock in self.due(rules):
+            result = self.replenish(rule, stock)
+            total.missions += result.missions
+            total.shortages += result.shortages
+        return total
+
+
+def run_replenishment(session_factory: sessionmaker[Session]) -> ReplenishmentResult:
+    """Sync the rule registry and replenish the rules touched since the last run.
+
+    Each rule is replenished in its own transaction. A rule whose
+    replenishment fails with a rule violation, e.g. because the available
+    stock changed meanwhile, stays pending for the next run.
+    """
+    triggers = get_replenishment_triggers()
+    with session_factory() as db:
+        service = ReplenishmentService(db, triggers)
+        service.sync_triggers()
+        pending = triggers.drain()
+        due = (
+            [rule.id for rule, _ in service.due(service.rules.list(rule_ids=pending))]
+            if pending
+            else []
+        )
+
+    total = ReplenishmentResult(evaluated=len(pending))
+    for position, rule_id in enumerate(due):
+        with session_factory() as db:
+            try:
+                result = ReplenishmentService(db, triggers).evaluate([rule_id])
+                db.commit()
+            except RuleViolation as exc:
+                db.rollback()
+                triggers.mark([rule_id])
+                logger.info("Replenishment of rule %d deferred: %s", rule_id, exc.message)
+                continue
+            except Exception:
+                db.rollback()
+                triggers.mark(due[position:])
+                raise
+        total.missions += result.missions
+        total.shortages += result.shortages
+    return total
+
+
+class ReplenishmentJob:
+    def __init__(self, session_factory: sessionmaker[Session], *, interval_seconds: float) -> None:
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.last_error: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="replenishment", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                result = run_replenishment(self.session_factory)
+                self.last_error = None
+                if result.missions:
+                    logger.info(
+                        "Replenishment evaluated %d rules, created %d missions",
+                        result.evaluated,
+                        len(result.missions),
+                    )
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.warning("Replenishment failed: %s", exc)
+
+
+_job: ReplenishmentJob | None = None
+
+
+def get_replenishment_job() -> ReplenishmentJob | None:
+    return _job
+
+
+def start_replenishment_job(job: ReplenishmentJob) -> None:
+    global _job
+    _job = job
+    job.start()
+
+
+def stop_replenishment_job() -> None:
+    global _job
+    if _job is not None:
+        _job.stop()
+        _job = None
@@ -0,0 +1,257 @@
+"""Throughput and KPI reports over precomputed time buckets.
+
+Reports never scan the ledger. ``movement_stats`` and ``mission_stats`` hold
+hourly and daily totals which :meth:`ReportService.refresh` folds forward from
+two high-water marks: the last ``inventory_movements.id`` and the last mission
+completion/cancellation in ``outbox_messages``. Each refresh reads only rows
+above the marks and advances them in the same transaction as the totals, so
+the cost is proportional to new rows and every row is counted exactly once.
+
+Buckets are UTC. Cycle time is ``completed_at - started_at`` of completed
+missions that were started.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models.report import ReportGranularity
+from app.repositories.report import ReportRepository
+from app.rules.exceptions import RuleViolation
+
+logger = logging.getLogger(__name__)
+
+MOVEMENTS_SOURCE = "movements"
+MISSION_EVENTS_SOURCE = "mission_events"
+
+
+def _as_utc(value: datetime) -> datetime:
+    return (
+        value.replace(tzinfo=timezone.utc)
+        if value.tzinfo is None
+        else value.astimezone(timezone.utc)
+    )
+
+
+def _buckets(value: datetime) -> tuple[tuple[ReportGranularity, datetime], ...]:
+    hour = _as_utc(value).replace(minute=0, second=0, microsecond=0)
+    return (ReportGranularity.HOUR, hour), (ReportGranularity.DAY, hour.replace(hour=0))
+
+
+def _parse(value: str | None) -> datetime | None:
+    return _as_utc(datetime.fromisoformat(value)) if value else None
+
+
+@dataclass
+class RefreshResult:
+    movements: int = 0
+    mission_events: int = 0
+
+
+@dataclass
+class ReportStatus:
+    movements_watermark: int
+    latest_movement_id: int
+    mission_events_watermark: int
+    latest_mission_event_id: int
+
+
+class ReportService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.reports = ReportRepository(db)
+
+    def refresh(self, *, batch_size: int) -> RefreshResult:
+        """Fold at most ``batch_size`` new rows of each source into the totals.
+
+        The caller commits.
+        """
+        return RefreshResult(
+            movements=self._fold_movements(batch_size),
+            mission_events=self._fold_mission_events(batch_size),
+        )
+
+    def _fold_movements(self, batch_size: int) -> int:
+        watermark = self.reports.get_watermark(MOVEMENTS_SOURCE)
+        rows = self.reports.movements_after(watermark, batch_size)
+        if not rows:
+            return 0
+        deltas: dict[tuple, list[int]] = defaultdict(lambda: [0, 0])
+        for _, executed_at, executor_id, movement_type, qty, location_type in rows:
+            for granularity, bucket_start in _buckets(executed_at):
+                delta = deltas[
+                    (granularity, bucket_start, executor_id, movement_type.value, location_type)
+                ]
+                delta[0] += 1
+                delta[1] += qty
+        self._advance(MOVEMENTS_SOURCE, watermark, rows[-1][0])
+        self.reports.merge_movement_stats(deltas)
+        return len(rows)
+
+    def _fold_mission_events(self, batch_size: int) -> int:
+        watermark = self.reports.get_watermark(MISSION_EVENTS_SOURCE)
+        rows = self.reports.mission_events_after(watermark, batch_size)
+        if not rows:
+            return 0
+        deltas: dict[tuple, list] = defaultdict(lambda: [0, 0, 0, 0.0, None])
+        for _, topic, payload, created_at in rows:
+            completed_at = _parse(payload.get("completed_at"))
+            started_at = _parse(payload.get("started_at"))
+            cycle = None
+            if topic == "mission.completed" and started_at is not None and completed_at is not None:
+                cycle = max((completed_at - started_at).total_seconds(), 0.0)
+            for granularity, bucket_start in _buckets(completed_at or created_at):
+                delta = deltas[(granularity, bucket_start, payload.get("assigned_executor_id"))]
+                if topic == "mission.completed":
+                    delta[0] += 1
+                else:
+                    delta[1] += 1
+                if cycle is not None:
+                    delta[2] += 1
+                    delta[3] += cycle
+                    delta[4] = cycle if delta[4] is None else max(delta[4], cycle)
+        self._advance(MISSION_EVENTS_SOURCE, watermark, rows[-1][0])
+        self.reports.merge_mission_stats(deltas)
+        return len(rows)
+
+    def _advance(self, source: str, expected: int, value: int) -> None:
+        if not self.reports.advance_watermark(source, expected=expected, value=value):
+            raise RuleViolation("Reports are being refreshed concurrently; retry", status_code=409)
+
+    def status(self) -> ReportStatus:
+        return ReportStatus(
+            movements_watermark=self.reports.get_watermark(MOVEMENTS_SOURCE),
+            latest_movement_id=self.reports.latest_movement_id(),
+            mission_events_watermark=self.reports.get_watermark(MISSION_EVENTS_SOURCE),
+            latest_mission_event_id=self.reports.latest_mission_event_id(),
+        )
+
+    def movement_report(
+        self,
+        *,
+        granularity: ReportGranularity,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        group_by: list[str] | None = None,
+        executor_id: int | None = None,
+    ) -> list[dict]:
+        group_by = list(dict.fromkeys(group_by or []))
+        rows = self.reports.movement_report(
+            granularity=granularity,
+            start=start,
+            end=end,
+            group_by=group_by,
+            executor_id=executor_id,
+        )
+        report = []
+        for bucket_start, *values in rows:
+            entry = {"bucket_start": _as_utc(bucket_start), **dict(zip(group_by, values))}
+            entry["movement_count"], entry["qty"] = values[len(group_by) :]
+            report.append(entry)
+        return report
+
+    def mission_report(
+        self,
+        *,
+        granularity: ReportGranularity,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        by_executor: bool = False,
+        executor_id: int | None = None,
+    ) -> list[dict]:
+        rows = self.reports.mission_report(
+            granularity=granularity,
+            start=start,
+            end=end,
+            by_executor=by_executor,
+            executor_id=executor_id,
+        )
+        return [
+            {
+                "bucket_start": _as_utc(bucket_start),
+                "executor_id": executor,
+                "completed_count": completed,
+                "cancelled_count": cancelled,
+                "avg_cycle_seconds": cycle_sum / timed if timed else None,
+                "max_cycle_seconds": cycle_max,
+            }
+            for bucket_start, executor, completed, cancelled, timed, cycle_sum, cycle_max in rows
+        ]
+
+
+def refresh_reports(session_factory: sessionmaker[Session], *, batch_size: int) -> RefreshResult:
+    """Fold every pending row, committing one batch at a time."""
+    total = RefreshResult()
+    while True:
+        with session_factory() as db:
+            try:
+                result = ReportService(db).refresh(batch_size=batch_size)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        total.movements += result.movements
+        total.mission_events += result.mission_events
+        if result.movements < batch_size and result.mission_events < batch_size:
+            return total
+
+
+class ReportRefreshJob:
+    def __init__(
+        self, session_factory: sessionmaker[Session], *, interval_seconds: float, batch_size: int
+    ) -> None:
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.last_error: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="report-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                refresh_reports(self.session_factory, batch_size=self.batch_size)
+                self.last_error = None
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.warning("Report refresh failed: %s", exc)
+
+
+_job: ReportRefreshJob | None = None
+
+
+def get_report_job() -> ReportRefreshJob | None:
+    return _job
+
+
+def start_report_job(job: ReportRefreshJob) -> None:
+    global _job
+    _job = job
+    job.start()
+
+
+def stop_report_job() -> None:
+    global _job
+    if _job is not None:
+        _job.stop()
+        _job = None
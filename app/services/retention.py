@@ -0,0 +1,40 @@
+"""Read marks of the incremental readers of append-only tables.
+
+The analytics export, the report refresh and the slotting refresh read
+``inventory_movements`` and the mission rows of ``outbox_messages`` by id
+above a watermark of their own. The ledger archive and the outbox purge
+delete from these tables, so they keep every row above the lowest of these
+marks. A reader that has never run holds everything back.
+"""
+
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from app.export import read_watermark
+from app.export.datasets import MISSION_EVENTS, MOVEMENTS
+from app.repositories.report import ReportRepository
+from app.services.report_service import MISSION_EVENTS_SOURCE, MOVEMENTS_SOURCE
+from app.services.slotting_service import COMPLETIONS_SOURCE, PICKS_SOURCE
+
+
+def outbox_read_marks(db: Session, *, export_dir: Path) -> dict[str, int]:
+    """Last outbox id every reader has consumed, per aggregate type."""
+    reports = ReportRepository(db)
+    return {
+        "mission": min(
+            read_watermark(export_dir / MISSION_EVENTS.name),
+            reports.get_watermark(MISSION_EVENTS_SOURCE),
+            reports.get_watermark(COMPLETIONS_SOURCE),
+        )
+    }
+
+
+def movement_read_mark(db: Session, *, export_dir: Path) -> int:
+    """Last movement id every reader has consumed."""
+    reports = ReportRepository(db)
+    return min(
+        read_watermark(export_dir / MOVEMENTS.name),
+        reports.get_watermark(MOVEMENTS_SOURCE),
+        reports.get_watermark(PICKS_SOURCE),
+    )
@@ -0,0 +1,114 @@
+"""Search items, locations and handling units by partial code or name.
+
+Every whitespace-separated term of at least three characters must occur in
+the code or name of a hit; they are looked up in the trigram indexes of
+:mod:`app.db.search`. Shorter terms cannot be indexed and only filter the
+hits found for the longer ones.
+
+FTS5's ``bm25`` ranking needs the frequency of every term across the whole
+index, which on a large catalogue costs tens of milliseconds for a common
+term however few hits are returned. Hits are therefore ranked by how well the
+query matches the code, which is what a scanner user is after: the exact
+code, then codes starting with the query, then codes containing every term,
+then name matches; shorter codes first within each tier. Only the first
+``search_window`` matches of each kind are ranked, so results stay cheap for
+terms matching most of the catalogue; an exact code is always found through
+its unique index.
+"""
+
+from dataclasses import dataclass, field
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.search import MIN_TERM_LENGTH, SEARCH_INDEXES, SearchKind
+from app.repositories.search import SearchRepository
+from app.rules.exceptions import RuleViolation
+
+EXACT_CODE = 0
+CODE_PREFIX = 1
+CODE_MATCH = 2
+NAME_MATCH = 3
+
+_KIND_ORDER = {index.kind: position for position, index in enumerate(SEARCH_INDEXES)}
+
+
+@dataclass
+class SearchHit:
+    kind: SearchKind
+    id: int
+    code: str
+    name: str | None
+    score: int
+
+
+@dataclass
+class SearchResult:
+    hits: list[SearchHit] = field(default_factory=list)
+    has_more: bool = False
+
+
+def match_expression(terms: list[str]) -> str:
+    """FTS5 query requiring every term as a substring."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def score(code: str, name: str | None, query: str, terms: list[str]) -> int | None:
+    """Rank of a candidate for the casefolded ``query``.
+
+    Returns ``None`` if some term occurs in neither code nor name.
+    """
+    code = code.casefold()
+    if code == query:
+        return EXACT_CODE
+    if code.startswith(query):
+        return CODE_PREFIX
+    if all(term in code for term in terms):
+        return CODE_MATCH
+    name = (name or "").casefold()
+    if all(term in code or term in name for term in terms):
+        return NAME_MATCH
+    return None
+
+
+class SearchService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.search_index = SearchRepository(db)
+
+    def search(
+        self,
+        query: str,
+        *,
+        kinds: set[SearchKind] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> SearchResult:
+        if not self.search_index.available():
+            raise RuleViolation("Search is only available on SQLite", status_code=501)
+        terms = query.casefold().split()
+        indexed = [term for term in terms if len(term) >= MIN_TERM_LENGTH]
+        if not indexed:
+            raise RuleViolation(
+                f"Search needs a term of at least {MIN_TERM_LENGTH} characters", status_code=422
+            )
+        folded = " ".join(terms)
+        match = match_expression(indexed)
+
+        hits: list[SearchHit] = []
+        for index in SEARCH_INDEXES:
+            if kinds and index.kind not in kinds:
+                continue
+            candidates = self.search_index.matches(index, match, limit=settings.search_window)
+            exact = self.search_index.by_code(index, query.strip())
+            if exact is not None and all(row[0] != exact[0] for row in candidates):
+                candidates.append(exact)
+            for row_id, code, name in candidates:
+                rank = score(code, name, folded, terms)
+                if rank is not None:
+                    hits.append(
+                        SearchHit(kind=index.kind, id=row_id, code=code, name=name, score=rank)
+                    )
+
+        hits.sort(key=lambda hit: (hit.score, len(hit.code), _KIND_ORDER[hit.kind], hit.id))
+        return SearchResult(hits=hits[offset : offset + limit], has_more=len(hits) > offset + limit)
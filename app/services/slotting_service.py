@@ -0,0 +1,393 @@
+"""Velocity-based ABC slotting.
+
+Pick velocity and co-pick affinity are kept as running totals, like the
+report aggregates: ``item_pick_stats`` holds daily picks per item folded from
+the ledger above a movement id watermark, and ``item_affinities`` counts item
+pairs of completed missions folded from the outbox above its own watermark.
+A refresh therefore costs O(new rows) however long the ledger is, and
+classification reads one small table.
+
+Suggestions move the top-level handling unit holding the most stock of each
+fast mover to a free PICK location closer to the docks, preferring slots
+near an already placed item it is often picked with.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.quantity import QTY_SCALE
+from app.db.models.location import LocationType
+from app.db.models.mission import Mission, MissionType
+from app.events.broker import stage_event
+from app.events.payloads import mission_payload
+from app.planning.slotting import CLASS_A, abc_classes, copick_pairs, slot_proximity
+from app.planning.travel_matrix import TravelMatrix, get_travel_matrix
+from app.repositories.handling_unit import HandlingUnitRepository
+from app.repositories.location import LocationRepository
+from app.repositories.mission import MissionRepository
+from app.repositories.report import ReportRepository
+from app.repositories.slotting import SlottingRepository
+from app.rules.exceptions import RuleViolation
+
+logger = logging.getLogger(__name__)
+
+PICKS_SOURCE = "slotting_picks"
+COMPLETIONS_SOURCE = "slotting_completions"
+FORWARD_TYPES = {LocationType.PICK}
+ANCHOR_TYPES = {LocationType.DOCK, LocationType.STAGING}
+
+# Free slots considered per item, and the weight of the distance to its
+# strongest co-picked partner against the distance to the docks.
+_SLOT_CANDIDATES = 5
+_AFFINITY_WEIGHT = 0.5
+
+
+@dataclass
+class SlottingRefreshResult:
+    picks: int = 0
+    completions: int = 0
+
+
+@dataclass
+class ItemVelocity:
+    item_id: int
+    rank: int
+    pick_count: int
+    qty: int
+    picks_per_day: float
+    abc_class: str
+
+
+@dataclass
+class SlottingSuggestion:
+    item_id: int
+    abc_class: str
+    picks_per_day: float
+    hu_id: int
+    from_location_id: int
+    to_location_id: int
+    current_distance: float | None
+    target_distance: float
+    partner_item_id: int | None = None
+
+
+class SlottingService:
+    def __init__(self, db: Session, matrix: TravelMatrix | None = None) -> None:
+        self.db = db
+        self.slotting = SlottingRepository(db)
+        self.watermarks = ReportRepository(db)
+        self.missions = MissionRepository(db)
+        self.handling_units = HandlingUnitRepository(db)
+        self.locations = LocationRepository(db)
+        self._matrix = matrix
+
+    @property
+    def matrix(self) -> TravelMatrix:
+        if self._matrix is None:
+            self._matrix = get_travel_matrix()
+        return self._matrix
+
+    def refresh(self, *, batch_size: int) -> SlottingRefreshResult:
+        """Fold at most ``batch_size`` new picks and completions. The caller commits."""
+        return SlottingRefreshResult(
+            picks=self._fold_picks(batch_size), completions=self._fold_completions(batch_size)
+        )
+
+    def _fold_picks(self, batch_size: int) -> int:
+        watermark = self.watermarks.get_watermark(PICKS_SOURCE)
+        rows = self.slotting.picks_after(watermark, batch_size)
+        if not rows:
+            return 0
+        deltas: dict[tuple, list[int]] = defaultdict(lambda: [0, 0])
+        for _, executed_at, item_id, qty in rows:
+            day = executed_at.replace(hour=0, minute=0, second=0, microsecond=0)
+            delta = deltas[(day, item_id)]
+            delta[0] += 1
+            delta[1] += qty
+        self._advance(PICKS_SOURCE, watermark, rows[-1][0])
+        self.slotting.merge_pick_stats(deltas)
+        return len(rows)
+
+    def _fold_completions(self, batch_size: int) -> int:
+        watermark = self.watermarks.get_watermark(COMPLETIONS_SOURCE)
+        rows = self.slotting.completions_after(watermark, batch_size)
+        if not rows:
+            return 0
+        lines = self.slotting.mission_items([mission_id for _, mission_id in rows])
+        if lines:
+            pairs, counts = copick_pairs(
+                np.array([mission_id for mission_id, _ in lines]),
+                np.array([item_id for _, item_id in lines]),
+            )
+            self.slotting.merge_affinities(
+                {
+                    (int(a), int(b)): int(count)
+                    for (a, b), count in zip(pairs.tolist(), counts.tolist())
+                }
+            )
+        self._advance(COMPLETIONS_SOURCE, watermark, rows[-1][0])
+        return len(rows)
+
+    def _advance(self, source: str, expected: int, value: int) -> None:
+        if not self.watermarks.advance_watermark(source, expected=expected, value=value):
+            raise RuleViolation(
+                "Slotting statistics are being refreshed concurrently; retry", status_code=409
+            )
+
+    def velocities(self, *, window_days: int) -> list[ItemVelocity]:
+        """Items picked in the last ``window_days`` days, fastest first, with their ABC class."""
+        since = datetime.now(tz=timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        rows = self.slotting.velocities(since - timedelta(days=window_days - 1))
+        if not rows:
+            return []
+        picks = np.array([row[1] for row in rows], dtype=np.int64)
+        classes = abc_classes(
+            picks, a_share=settings.slotting_a_share, b_share=settings.slotting_b_share
+        )
+        order = np.argsort(-picks, kind="stable")
+        return [
+            ItemVelocity(
+                item_id=rows[index][0],
+                rank=rank,
+                pick_count=int(picks[index]),
+                qty=int(rows[index][2]),
+                picks_per_day=float(picks[index]) / window_days,
+                abc_class=str(classes[index]),
+            )
+            for rank, index in enumerate(order.tolist(), start=1)
+        ]
+
+    def affinities(
+        self, *, item_id: int | None = None, limit: int = 50
+    ) -> list[tuple[int, int, int]]:
+        return self.slotting.affinities([item_id] if item_id is not None else None)[:limit]
+
+    def suggest(
+        self,
+        *,
+        window_days: int,
+        classes: set[str] | None = None,
+        limit: int | None = None,
+    ) -> list[SlottingSuggestion]:
+        """Relocations that bring fast movers into the PICK slots nearest to DOCK/STAGING."""
+        classes = classes or {CLASS_A}
+        movers = [
+            velocity
+            for velocity in self.velocities(window_days=window_days)
+            if velocity.abc_class in classes
+        ]
+        if not movers:
+            return []
+
+        matrix = self.matrix
+        slot_rows = matrix.candidates(FORWARD_TYPES)
+        anchor_rows = matrix.candidates(ANCHOR_TYPES)
+        if slot_rows.size == 0:
+            raise RuleViolation("No active PICK location with coordinates")
+        if anchor_rows.size == 0:
+            raise RuleViolation("No active DOCK or STAGING location with coordinates")
+        proximity = slot_proximity(np.asarray(matrix.distances[np.ix_(slot_rows, anchor_rows)]))
+        order = np.argsort(proximity, kind="stable")
+        slot_ids = matrix.geometry.ids[slot_rows][order].tolist()
+        slot_distance = dict(zip(slot_ids, proximity[order].tolist()))
+
+        full = self.slotting.full_location_ids()
+        free = [location_id for location_id in slot_ids if location_id not in full]
+
+        holdings: dict[int, tuple[int, int]] = {}
+        for item_id, hu_id, location_id, _ in self.slotting.holdings(
+            [mover.item_id for mover in movers]
+        ):
+            holdings.setdefault(item_id, (hu_id, location_id))
+
+        partners: dict[int, list[int]] = defaultdict(list)
+        for item_a_id, item_b_id, _ in self.slotting.affinities(
+            [mover.item_id for mover in movers]
+        ):
+            partners[item_a_id].append(item_b_id)
+            partners[item_b_id].append(item_a_id)
+
+        placed: dict[int, int] = {}
+        moved_hus: dict[int, int] = {}
+        suggestions: list[SlottingSuggestion] = []
+        for mover in movers:
+            if mover.item_id not in holdings:
+                continue
+            hu_id, location_id = holdings[mover.item_id]
+            if hu_id in moved_hus:
+                placed[mover.item_id] = moved_hus[hu_id]
+                continue
+            current = slot_distance.get(location_id)
+            candidates = [slot for slot in free if current is None or slot_distance[slot] < current]
+            candidates = candidates[:_SLOT_CANDIDATES]
+            if not candidates:
+                placed[mover.item_id] = location_id
+                continue
+
+            partner = next(
+                (item for item in partners.get(mover.item_id, []) if item in placed), None
+            )
+            target = candidates[0]
+            if partner is not None:
+                partner_location = placed[partner]
+
+                def score(slot: int) -> float:
+                    distance = matrix.distance(slot, partner_location)
+                    return slot_distance[slot] + _AFFINITY_WEIGHT * (
+                        distance if distance is not None else 0.0
+                    )
+
+                target = min(candidates, key=score)
+
+            free.remove(target)
+            moved_hus[hu_id] = target
+            placed[mover.item_id] = target
+            suggestions.append(
+                SlottingSuggestion(
+                    item_id=mover.item_id,
+                    abc_class=mover.abc_class,
+                    picks_per_day=mover.picks_per_day,
+                    hu_id=hu_id,
+                    from_location_id=location_id,
+                    to_location_id=target,
+                    current_distance=current,
+                    target_distance=slot_distance[target],
+                    partner_item_id=partner,
+                )
+            )
+            if limit is not None and len(suggestions) >= limit:
+                break
+        return suggestions
+
+    def create_missions(
+        self,
+        moves: list[tuple[int, int]],
+        *,
+        created_by_operator_id: int,
+        priority: int = 0,
+    ) -> list[Mission]:
+        """One draft MOVE_HU mission per ``(hu_id, to_location_id)``."""
+        missions = []
+        for hu_id, to_location_id in moves:
+            handling_unit = self.handling_units.get(hu_id)
+            if handling_unit is None:
+                raise RuleViolation(f"Handling unit {hu_id} not found", status_code=404)
+            if self.locations.get(to_location_id) is None:
+                raise RuleViolation(f"Location {to_location_id} not found", status_code=404)
+            if handling_unit.location_id == to_location_id:
+                raise RuleViolation(
+                    f"Handling unit {hu_id} is already at location {to_location_id}"
+                )
+            missions.append(
+                {
+                    "mission_no": f"SLOT-{uuid4().hex[:12].upper()}",
+                    "type": MissionType.MOVE_HU,
+                    "priority": priority,
+                    "created_by_operator_id": created_by_operator_id,
+                    "lines": [
+                        {
+                            "from_location_id": handling_unit.location_id,
+                            "to_location_id": to_location_id,
+                            "item_id": None,
+                            "hu_id": hu_id,
+                            "qty": QTY_SCALE,
+                        }
+                    ],
+                }
+            )
+        created = self.missions.create_many_with_lines(missions)
+        for mission in created:
+            stage_event(
+                self.db,
+                "mission.created",
+                mission_payload(mission),
+                mission_ids={mission.id},
+                hu_ids={line.hu_id for line in mission.lines},
+                location_ids={line.from_location_id for line in mission.lines},
+            )
+        return created
+
+
+def refresh_slotting(
+    session_factory: sessionmaker[Session], *, batch_size: int
+) -> SlottingRefreshResult:
+    """Fold every pending pick and completion, committing one batch at a time."""
+    total = SlottingRefreshResult()
+    while True:
+        with session_factory() as db:
+            try:
+                result = SlottingService(db).refresh(batch_size=batch_size)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        total.picks += result.picks
+        total.completions += result.completions
+        if result.picks < batch_size and result.completions < batch_size:
+            return total
+
+
+class SlottingRefreshJob:
+    def __init__(
+        self, session_factory: sessionmaker[Session], *, interval_seconds: float, batch_size: int
+    ) -> None:
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.last_error: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="slotting-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                result = refresh_slotting(self.session_factory, batch_size=self.batch_size)
+                self.last_error = None
+                logger.info(
+                    "Slotting refresh folded %d picks, %d completions",
+                    result.picks,
+                    result.completions,
+                )
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.warning("Slotting refresh failed: %s", exc)
+
+
+_job: SlottingRefreshJob | None = None
+
+
+def get_slotting_job() -> SlottingRefreshJob | None:
+    return _job
+
+
+def start_slotting_job(job: SlottingRefreshJob) -> None:
+    global _job
+    _job = job
+    job.start()
+
+
+def stop_slotting_job() -> None:
+    global _job
+    if _job is not None:
+        _job.stop()
+        _job = None
@@ -0,0 +1,64 @@
+from dataclasses import dataclass, field
+
+from sqlalchemy.orm import Session
+
+from app.db.models.executor import Executor
+from app.db.models.handling_unit import HandlingUnit
+from app.db.models.inventory import InventoryPosition
+from app.db.models.item import Item
+from app.db.models.location import Location
+from app.repositories.sync import SyncRepository
+
+SYNC_SETS = {
+    "locations": Location,
+    "materials": Item,
+    "handling_units": HandlingUnit,
+    "executors": Executor,
+    "inventory_positions": InventoryPosition,
+}
+
+
+@dataclass
+class SyncChanges:
+    since: int
+    watermark: int
+    has_more: bool
+    reset: bool
+    rows: dict[str, list] = field(default_factory=dict)
+
+
+class SyncService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.sync = SyncRepository(db)
+
+    def changes_since(self, since: int, *, limit: int) -> SyncChanges:
+        """Rows inserted or updated after watermark ``since``, at most about ``limit`` per set.
+
+        When a set has more than ``limit`` pending rows the returned watermark
+        stops short of the newest change, so every row up to it is included and
+        the client continues from there. Rows sharing one sequence number are
+        never split across pages. A ``since`` ahead of the server (for example
+        after a database restore) is answered with a full snapshot and
+        ``reset`` so the client drops its local copy.
+        """
+        current = self.sync.current_watermark()
+        reset = since > current
+        if reset:
+            since = 0
+
+        upto = current
+        for model in SYNC_SETS.values():
+            boundary = self.sync.page_boundary(model, since=since, limit=limit)
+            if boundary is None:
+                continue
+            first = self.sync.first_change(model, since=since)
+            upto = min(upto, boundary - 1 if boundary > first else boundary)
+
+        rows = {
+            name: self.sync.changed_between(model, since=since, upto=upto)
+            for name, model in SYNC_SETS.items()
+        }
+        return SyncChanges(
+            since=since, watermark=upto, has_more=upto < current, reset=reset, rows=rows
+        )
@@ -0,0 +1,126 @@
+"""Travel distances between locations, kept in line with their coordinates.
+
+Location edits do not refresh the matrix themselves. They mark it dirty on
+the :class:`TravelRefreshJob`, which refreshes it at most once per interval,
+so a batch of edits publishes one generation instead of one per edit.
+Without a running job each edit refreshes it after its response.
+"""
+
+import logging
+import threading
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models.location import LocationType
+from app.planning.travel_matrix import LocationGeometry, TravelMatrix, get_travel_matrix
+from app.repositories.location import LocationRepository
+from app.rules.exceptions import RuleViolation
+
+logger = logging.getLogger(__name__)
+
+
+class TravelService:
+    def __init__(self, db: Session, matrix: TravelMatrix | None = None) -> None:
+        self.db = db
+        self.locations = LocationRepository(db)
+        self.matrix = matrix or get_travel_matrix()
+
+    def refresh_matrix(self) -> int:
+        geometry = LocationGeometry.from_rows(self.locations.list_geometry())
+        return self.matrix.refresh(geometry)
+
+    def rebuild_matrix(self) -> int:
+        geometry = LocationGeometry.from_rows(self.locations.list_geometry())
+        self.matrix.rebuild(geometry)
+        return self.matrix.size
+
+    def nearest(
+        self,
+        location_id: int,
+        *,
+        types: set[LocationType] | None = None,
+        limit: int = 1,
+    ) -> list[tuple[int, float]]:
+        location = self.locations.get(location_id)
+        if location is None:
+            raise RuleViolation("Location not found", status_code=404)
+        if location.x is None or location.y is None:
+            raise RuleViolation("Location has no coordinates")
+        if self.matrix.index_of([location_id])[0] < 0:
+            point = (location.x, location.y, location.z or 0.0)
+            return self.matrix.nearest_to_point(point, types=types, limit=limit)
+        return self.matrix.nearest(location_id, types=types, limit=limit)
+
+
+def refresh_travel_matrix(session_factory: sessionmaker[Session]) -> int:
+    with session_factory() as db:
+        return TravelService(db).refresh_matrix()
+
+
+class TravelRefreshJob:
+    def __init__(self, session_factory: sessionmaker[Session], *, interval_seconds: float) -> None:
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.last_error: str | None = None
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def mark_dirty(self) -> None:
+        self._dirty.set()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="travel-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> int | None:
+        """Refresh the matrix if an edit marked it dirty; returns the recomputed count."""
+        if not self._dirty.is_set():
+            return None
+        # Cleared first: an edit committed during the refresh marks it again.
+        self._dirty.clear()
+        try:
+            recomputed = refresh_travel_matrix(self.session_factory)
+        except Exception:
+            self._dirty.set()
+            raise
+        if recomputed:
+            logger.info("Travel matrix refreshed, %d locations recomputed", recomputed)
+        return recomputed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.run_once()
+                self.last_error = None
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.warning("Travel matrix refresh failed: %s", exc)
+
+
+_job: TravelRefreshJob | None = None
+
+
+def get_travel_refresh_job() -> TravelRefreshJob | None:
+    return _job
+
+
+def start_travel_refresh_job(job: TravelRefreshJob) -> None:
+    global _job
+    _job = job
+    job.start()
+
+
+def stop_travel_refresh_job() -> None:
+    global _job
+    if _job is not None:
+        _job.stop()
+        _job = None
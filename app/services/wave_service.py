@@ -0,0 +1,153 @@
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.quantity import QTY_SCALE
+from app.db.models.mission import Mission, MissionState, MissionType
+from app.events.broker import stage_event
+from app.events.payloads import mission_payload
+from app.planning.sequencing import path_length, sequence_stops
+from app.planning.travel_matrix import TravelMatrix, get_travel_matrix
+from app.planning.waves import Wave, plan_waves
+from app.repositories.executor import ExecutorRepository
+from app.repositories.mission import MissionRepository
+from app.rules.exceptions import RuleViolation
+from app.rules.movement_rules import executor_payload_limit
+
+
+class WaveService:
+    def __init__(self, db: Session, matrix: TravelMatrix | None = None) -> None:
+        self.db = db
+        self.missions = MissionRepository(db)
+        self.executors = ExecutorRepository(db)
+        self.matrix = matrix or get_travel_matrix()
+
+    def plan(
+        self,
+        *,
+        mission_ids: list[int] | None = None,
+        capacity_kg: float | None = None,
+        max_lines: int = 50,
+    ) -> tuple[list[Wave], list[int]]:
+        """Cluster open lines of draft item missions into waves with sequenced tours.
+
+        Returns the waves and the ids of the missions whose lines they consume.
+        """
+        if capacity_kg is None:
+            limits = [executor_payload_limit(executor) for executor in self.executors.list_active()]
+            if not limits:
+                raise RuleViolation("No active executor to size waves")
+            capacity_kg = max(limits) / QTY_SCALE
+
+        pending = self.missions.list_pending_item_lines(mission_ids)
+        if not pending:
+            return [], []
+
+        line_ids = np.array([row[0] for row in pending], dtype=np.int64)
+        rows = self.matrix.index_of([row[2] for row in pending])
+        payloads = np.array([row[3] for row in pending], dtype=np.float64) / QTY_SCALE
+        priorities = np.array([row[4] for row in pending], dtype=np.int64)
+
+        coords = np.full((len(pending), 3), np.nan)
+        located = rows >= 0
+        coords[located] = self.matrix.geometry.coords[rows[located]]
+
+        groups = plan_waves(
+            coords,
+            payloads,
+            priorities,
+            capacity=capacity_kg,
+            max_lines=max_lines,
+            vertical_weight=self.matrix.vertical_weight,
+        )
+        waves = [self._tour(group, line_ids, rows, payloads, priorities) for group in groups]
+        return waves, sorted({row[1] for row in pending})
+
+    def release(
+        self,
+        waves: list[Wave],
+        consolidated_mission_ids: list[int],
+        *,
+        created_by_operator_id: int,
+    ) -> list[Mission]:
+        """Create a draft mission per wave, move its lines in and cancel the emptied missions.
+
+        Moving the lines bumps the version of every mission involved; the
+        outbox records each wave mission with the ids of the lines it took
+        over, next to the cancellation of the missions they came from.
+
+        Raises 409 if any consolidated mission left the draft state since the
+        waves were planned; the caller must roll back.
+        """
+        missions = self.missions.create_many(
+            [
+                {
+                    "mission_no": f"WAVE-{uuid4().hex[:12].upper()}",
+                    "type": MissionType.MOVE_ITEM,
+                    "priority": wave.priority,
+                    "created_by_operator_id": created_by_operator_id,
+                    "route_distance": wave.route_distance,
+                }
+                for wave in waves
+            ]
+        )
+        moved = self.missions.move_lines(
+            [
+                {"id": line_id, "mission_id": mission.id, "sequence": sequence}
+                for wave, mission in zip(waves, missions, strict=True)
+                for sequence, line_id in enumerate(wave.line_ids)
+            ]
+        )
+        if not moved or not self.missions.cancel_many(
+            consolidated_mission_ids, reason="Consolidated into picking waves"
+        ):
+            raise RuleViolation(
+                "Missions changed since the waves were planned; plan again", status_code=409
+            )
+        for wave, mission in zip(waves, missions, strict=True):
+            wave.mission_id = mission.id
+        for mission_id in consolidated_mission_ids:
+            stage_event(
+                self.db,
+                "mission.cancelled",
+                {"mission_id": mission_id, "state": MissionState.CANCELLED.value},
+                mission_ids={mission_id},
+            )
+
+        released = self.missions.list_with_lines([mission.id for mission in missions])
+        self.missions.record_created(released)
+        for mission in released:
+            stage_event(
+                self.db,
+                "mission.created",
+                mission_payload(mission),
+                mission_ids={mission.id},
+                location_ids={line.from_location_id for line in mission.lines},
+            )
+        return released
+
+    def _tour(
+        self,
+        group: np.ndarray,
+        line_ids: np.ndarray,
+        rows: np.ndarray,
+        payloads: np.ndarray,
+        priorities: np.ndarray,
+    ) -> Wave:
+        located = group[rows[group] >= 0]
+        unlocated = group[rows[group] < 0]
+        route_distance = None
+        if located.size:
+            stops = rows[located]
+            distances = np.asarray(self.matrix.distances[np.ix_(stops, stops)], dtype=np.float64)
+            route = sequence_stops(distances)
+            located = located[route]
+            route_distance = path_length(distances, route)
+        ordered = np.concatenate([located, np.sort(unlocated)])
+        return Wave(
+            priority=int(priorities[group[0]]),
+            line_ids=line_ids[ordered].tolist(),
+            payload=float(payloads[group].sum()),
+            route_distance=route_distance,
+        )
@@ -0,0 +1,143 @@
+"""Shared fixtures: a migrated SQLite database, reset before every test, and an API client.
+
+The settings are read once at import, so the environment is pointed at a
+temporary directory before anything from ``app`` is imported. The schema is
+migrated once per session into a template file which each test copies over
+the live database, and the ledger archive and export directories are emptied
+with it; the client is created without entering its lifespan, so no
+background job runs during a test.
+"""
+
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+WORK_DIR = Path(tempfile.mkdtemp(prefix="wms-tests-"))
+DATABASE = WORK_DIR / "wms.db"
+TEMPLATE = WORK_DIR / "template.db"
+
+os.environ["DATABASE_URL"] = f"sqlite:///{DATABASE}"
+os.environ["TRAVEL_MATRIX_DIR"] = str(WORK_DIR / "travel-matrix")
+os.environ["LEDGER_ARCHIVE_DIR"] = str(WORK_DIR / "ledger-archive")
+os.environ["EXPORT_DIR"] = str(WORK_DIR / "export")
+os.environ["OUTBOX_SINK"] = "none"
+
+from alembic.command import upgrade
+from alembic.config import Config
+from fastapi.testclient import TestClient
+
+from app.db.session import engine, read_engine
+from app.main import app
+
+API = "/api/v1"
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    upgrade(config, "head")
+    engine.dispose()
+    shutil.copyfile(DATABASE, TEMPLATE)
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    engine.dispose()
+    read_engine.dispose()
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def database() -> Iterator[None]:
+    engine.dispose()
+    read_engine.dispose()
+    for suffix in ("-wal", "-shm"):
+        Path(f"{DATABASE}{suffix}").unlink(missing_ok=True)
+    shutil.copyfile(TEMPLATE, DATABASE)
+    for directory in ("ledger-archive", "export"):
+        shutil.rmtree(WORK_DIR / directory, ignore_errors=True)
+    yield
+    engine.dispose()
+    read_engine.dispose()
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture
+def warehouse(client: TestClient) -> dict:
+    """An operator, an executor, four locations, one item and HU1 at L0 holding 10 of it."""
+    operator = client.post(f"{API}/operators", json={"code": "op1", "name": "Operator"}).json()
+    executor = client.post(f"{API}/executors", json={"code": "ex1", "name": "Executor"}).json()
+    locations = [
+        client.post(
+            f"{API}/locations", json={"code": f"L{i}", "name": f"L{i}", "x": i, "y": 0}
+        ).json()
+        for i in range(4)
+    ]
+    item = client.post(f"{API}/materials", json={"sku": "S1", "name": "Item"}).json()
+    hu = client.post(
+        f"{API}/handling-units", json={"hu_code": "HU1", "location_id": locations[0]["id"]}
+    ).json()
+    response = client.post(
+        f"{API}/inventory/adjustments",
+        json={"hu_id": hu["id"], "item_id": item["id"], "qty_delta": "10", "reason": "initial"},
+    )
+    assert response.status_code == 201, response.text
+    return {
+        "operator": operator,
+        "executor": executor,
+        "locations": locations,
+        "item": item,
+        "hu": hu,
+    }
+
+
+def create_mission(client: TestClient, warehouse: dict, number: str, qty: str = "1") -> dict:
+    """A draft item mission moving ``qty`` from L0 to L1."""
+    locations = warehouse["locations"]
+    response = client.post(
+        f"{API}/missions",
+        json={
+            "mission_no": number,
+            "type": "move_item",
+            "created_by_operator_id": warehouse["operator"]["id"],
+            "lines": [
+                {
+                    "from_location_id": locations[0]["id"],
+                    "to_location_id": locations[1]["id"],
+                    "item_id": warehouse["item"]["id"],
+                    "qty": qty,
+                }
+            ],
+        },
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def complete_mission(client: TestClient, warehouse: dict, mission: dict, to_hu: dict) -> None:
+    """Assign, start and complete ``mission``, moving its one line from HU1 into ``to_hu``."""
+    executor_id = warehouse["executor"]["id"]
+    path = f"{API}/missions/{mission['id']}"
+    assert client.post(f"{path}/assign", json={"executor_id": executor_id}).status_code == 200
+    assert client.post(f"{path}/start", json={"executor_id": executor_id}).status_code == 200
+    line = mission["lines"][0]
+    response = client.post(
+        f"{path}/record-movement",
+        json={
+            "mission_line_id": line["id"],
+            "qty": line["qty"],
+            "executor_id": executor_id,
+            "from_hu_id": warehouse["hu"]["id"],
+            "to_hu_id": to_hu["id"],
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert client.post(f"{path}/complete", json={}).json()["state"] == "completed"
@@ -0,0 +1,126 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.db.session import SessionLocal
+from app.planning import availability
+from app.planning.allocation import AllocationStrategy
+from app.planning.availability import AvailabilityIndex
+from app.rules.exceptions import RuleViolation
+from app.services.allocation_service import AllocationDemand, AllocationService
+from tests.conftest import API
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The process-wide index would otherwise carry over from the previous database.
+    monkeypatch.setattr(availability, "_availability_index", None)
+
+
+@pytest.fixture
+def stock(client: TestClient, warehouse: dict) -> dict:
+    """HU1 with 10 at L0, HU2 with 3 at L2, HU3 with 6 at L3 and a destination D at x=3.5."""
+    units = {"HU1": warehouse["hu"]}
+    for code, location, qty in (("HU2", 2, "3"), ("HU3", 3, "6")):
+        unit = client.post(
+            f"{API}/handling-units",
+            json={"hu_code": code, "location_id": warehouse["locations"][location]["id"]},
+        ).json()
+        response = client.post(
+            f"{API}/inventory/adjustments",
+            json={
+                "hu_id": unit["id"],
+                "item_id": warehouse["item"]["id"],
+                "qty_delta": qty,
+                "reason": "receipt",
+            },
+        )
+        assert response.status_code == 201, response.text
+        units[code] = unit
+    destination = client.post(
+        f"{API}/locations", json={"code": "D", "name": "D", "type": "staging", "x": 3.5, "y": 0}
+    ).json()
+    return {"units": units, "destination": destination}
+
+
+def _allocate(client: TestClient, warehouse: dict, stock: dict, strategy: str, qty: str):
+    return client.post(
+        f"{API}/allocations",
+        json={
+            "created_by_operator_id": warehouse["operator"]["id"],
+            "strategy": strategy,
+            "demands": [
+                {
+                    "item_id": warehouse["item"]["id"],
+                    "qty": qty,
+                    "to_location_id": stock["destination"]["id"],
+                }
+            ],
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    ("strategy", "qty", "expected"),
+    [
+        ("fifo", "4", [("HU1", "4.000")]),
+        ("fewest_hus", "5", [("HU3", "5.000")]),
+        ("least_travel", "8", [("HU3", "6.000"), ("HU2", "2.000")]),
+    ],
+)
+def test_strategies_choose_their_sources(
+    client: TestClient,
+    warehouse: dict,
+    stock: dict,
+    strategy: str,
+    qty: str,
+    expected: list[tuple[str, str]],
+) -> None:
+    response = _allocate(client, warehouse, stock, strategy, qty)
+    assert response.status_code == 201, response.text
+    [mission] = response.json()["missions"]
+    codes = {unit["id"]: code for code, unit in stock["units"].items()}
+    assert [(codes[line["hu_id"]], line["qty"]) for line in mission["lines"]] == expected
+
+
+def test_reserved_stock_is_not_allocated_twice(
+    client: TestClient, warehouse: dict, stock: dict
+) -> None:
+    assert _allocate(client, warehouse, stock, "fifo", "15").status_code == 201
+    response = _allocate(client, warehouse, stock, "fifo", "5")
+    assert response.status_code == 409
+    assert "Insufficient" in response.json()["detail"]
+
+
+def test_stock_taken_after_the_index_sync_fails_the_reservation(
+    client: TestClient, warehouse: dict, stock: dict
+) -> None:
+    with SessionLocal() as db:
+        service = AllocationService(db, index=AvailabilityIndex())
+        service.sync_index()
+        response = client.post(
+            f"{API}/inventory/adjustments",
+            json={
+                "hu_id": warehouse["hu"]["id"],
+                "item_id": warehouse["item"]["id"],
+                "qty_delta": "-8",
+                "reason": "pick",
+            },
+        )
+        assert response.status_code == 201, response.text
+        # A request that synced just before the pick still sees 10 on HU1.
+        service.sync_index = lambda: 0
+        with pytest.raises(RuleViolation) as raised:
+            service.allocate(
+                [
+                    AllocationDemand(
+                        item_id=warehouse["item"]["id"],
+                        qty=4000,
+                        to_location_id=stock["destination"]["id"],
+                    )
+                ],
+                strategy=AllocationStrategy.FIFO,
+                created_by_operator_id=warehouse["operator"]["id"],
+            )
+        assert raised.value.status_code == 409
+        assert "changed during allocation" in raised.value.message
+        db.rollback()
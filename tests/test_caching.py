@@ -0,0 +1,39 @@
+from fastapi.testclient import TestClient
+
+from tests.conftest import API, create_mission
+
+
+def _get(client: TestClient, url: str, etag: str | None = None):
+    headers = {"If-None-Match": etag} if etag is not None else {}
+    return client.get(url, headers=headers)
+
+
+def test_collection_etag_moves_with_the_table(client: TestClient, warehouse: dict) -> None:
+    url = f"{API}/locations"
+    first = _get(client, url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert _get(client, url, etag).status_code == 304
+    assert _get(client, f"{url}?limit=2", etag).status_code == 200
+
+    location = warehouse["locations"][0]
+    assert client.patch(f"{API}/locations/{location['id']}", json={"zone": "A"}).status_code == 200
+    changed = _get(client, url, etag)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()[0]["zone"] == "A"
+
+
+def test_mission_etag_moves_with_its_version(client: TestClient, warehouse: dict) -> None:
+    mission = create_mission(client, warehouse, "M1")
+    url = f"{API}/missions/{mission['id']}"
+    etag = _get(client, url).headers["ETag"]
+    assert _get(client, url, etag).status_code == 304
+    assert _get(client, url, f'W/{etag}, "other"').status_code == 304
+
+    response = client.post(f"{url}/assign", json={"executor_id": warehouse["executor"]["id"]})
+    assert response.status_code == 200, response.text
+    changed = _get(client, url, etag)
+    assert changed.status_code == 200
+    assert changed.json()["state"] == "assigned"
+    assert changed.headers["ETag"] != etag
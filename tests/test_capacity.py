@@ -0,0 +1,56 @@
+from fastapi.testclient import TestClient
+
+from tests.conftest import API, create_mission
+
+
+def _limit(client: TestClient, location: dict, **limits) -> None:
+    response = client.patch(f"{API}/locations/{location['id']}", json=limits)
+    assert response.status_code == 200, response.text
+
+
+def _new_unit(client: TestClient, code: str, location: dict):
+    return client.post(
+        f"{API}/handling-units", json={"hu_code": code, "location_id": location["id"]}
+    )
+
+
+def test_a_full_location_takes_no_more_units(client: TestClient, warehouse: dict) -> None:
+    target = warehouse["locations"][1]
+    _limit(client, target, max_hu=1)
+    assert _new_unit(client, "HU2", target).status_code == 201
+
+    assert _new_unit(client, "HU3", target).status_code == 409
+    moved = client.patch(
+        f"{API}/handling-units/{warehouse['hu']['id']}", json={"location_id": target["id"]}
+    )
+    assert moved.status_code == 409
+    location = client.get(f"{API}/locations/{target['id']}").json()
+    assert location["hu_count"] == 1
+
+
+def test_stock_over_the_weight_limit_is_rejected(client: TestClient, warehouse: dict) -> None:
+    target = warehouse["locations"][1]
+    _limit(client, target, max_weight_kg="5")
+    response = client.patch(f"{API}/materials/{warehouse['item']['id']}", json={"weight_kg": "1"})
+    assert response.status_code == 200, response.text
+    to_hu = _new_unit(client, "HU2", target).json()
+
+    mission = create_mission(client, warehouse, "M1", "6")
+    executor_id = warehouse["executor"]["id"]
+    path = f"{API}/missions/{mission['id']}"
+    assert client.post(f"{path}/assign", json={"executor_id": executor_id}).status_code == 200
+    assert client.post(f"{path}/start", json={"executor_id": executor_id}).status_code == 200
+    line = mission["lines"][0]
+    response = client.post(
+        f"{path}/record-movement",
+        json={
+            "mission_line_id": line["id"],
+            "qty": line["qty"],
+            "executor_id": executor_id,
+            "from_hu_id": warehouse["hu"]["id"],
+            "to_hu_id": to_hu["id"],
+        },
+    )
+    assert response.status_code == 409, response.text
+    assert "weight capacity" in response.json()["detail"]
+    assert client.get(f"{API}/locations/{target['id']}").json()["load_kg"] == "0.000"
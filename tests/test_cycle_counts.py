@@ -0,0 +1,120 @@
+from fastapi.testclient import TestClient
+
+from tests.conftest import API
+
+
+def _open_count(client: TestClient, warehouse: dict) -> dict:
+    response = client.post(
+        f"{API}/cycle-counts",
+        json={
+            "created_by_operator_id": warehouse["operator"]["id"],
+            "location_id": warehouse["locations"][0]["id"],
+        },
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _submit(client: TestClient, count: dict, rows: list[dict]):
+    return client.post(f"{API}/cycle-counts/{count['id']}/submissions", json={"rows": rows})
+
+
+def _row(warehouse: dict, qty: str, key: str | None = None) -> dict:
+    return {
+        "hu_id": warehouse["hu"]["id"],
+        "item_id": warehouse["item"]["id"],
+        "qty": qty,
+        "idempotency_key": key,
+    }
+
+
+def _post(client: TestClient, count: dict) -> dict:
+    response = client.post(f"{API}/cycle-counts/{count['id']}/post", json={})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _on_hand(client: TestClient) -> str:
+    [position] = client.get(f"{API}/inventory/positions").json()
+    return position["qty_on_hand"]
+
+
+def test_post_books_the_variance(client: TestClient, warehouse: dict) -> None:
+    count = _open_count(client, warehouse)
+    response = _submit(client, count, [_row(warehouse, "8")])
+    assert response.status_code == 200, response.text
+    [line] = response.json()["lines"]
+    assert (line["system_qty"], line["variance"]) == ("10.000", "-2.000")
+
+    result = _post(client, count)
+    assert (result["posted"], result["movements"], result["stale"]) == (1, 1, 0)
+    assert result["cycle_count"]["state"] == "posted"
+    assert _on_hand(client) == "8.000"
+    [posted] = client.get(f"{API}/cycle-counts/{count['id']}/lines").json()
+    assert posted["status"] == "posted"
+    assert posted["movement_id"] is not None
+
+    again = client.post(f"{API}/cycle-counts/{count['id']}/post", json={})
+    assert again.status_code == 409
+
+
+def test_resubmitted_rows_are_skipped(client: TestClient, warehouse: dict) -> None:
+    count = _open_count(client, warehouse)
+    assert _submit(client, count, [_row(warehouse, "8", "k1")]).status_code == 200
+
+    response = _submit(client, count, [_row(warehouse, "7", "k1")])
+    assert response.status_code == 200, response.text
+    assert response.json() == {"lines": [], "duplicates": 1}
+    [line] = client.get(f"{API}/cycle-counts/{count['id']}/lines").json()
+    assert line["counted_qty"] == "8.000"
+
+    twice = _submit(client, count, [_row(warehouse, "7"), _row(warehouse, "6")])
+    assert twice.status_code == 400
+    repeated_key = _submit(client, count, [_row(warehouse, "7", "k2"), _row(warehouse, "6", "k2")])
+    assert repeated_key.status_code == 400
+
+
+def test_stock_changed_after_counting_leaves_the_line_stale(
+    client: TestClient, warehouse: dict
+) -> None:
+    count = _open_count(client, warehouse)
+    assert _submit(client, count, [_row(warehouse, "8")]).status_code == 200
+    response = client.post(
+        f"{API}/inventory/adjustments",
+        json={
+            "hu_id": warehouse["hu"]["id"],
+            "item_id": warehouse["item"]["id"],
+            "qty_delta": "-1",
+            "reason": "pick",
+        },
+    )
+    assert response.status_code == 201, response.text
+
+    result = _post(client, count)
+    assert (result["posted"], result["stale"]) == (0, 1)
+    assert _on_hand(client) == "9.000"
+    [line] = client.get(f"{API}/cycle-counts/{count['id']}/lines").json()
+    assert line["status"] == "stale"
+
+
+def test_count_below_reserved_stock_is_not_posted(client: TestClient, warehouse: dict) -> None:
+    response = client.post(
+        f"{API}/allocations",
+        json={
+            "created_by_operator_id": warehouse["operator"]["id"],
+            "demands": [
+                {
+                    "item_id": warehouse["item"]["id"],
+                    "qty": "5",
+                    "to_location_id": warehouse["locations"][1]["id"],
+                }
+            ],
+        },
+    )
+    assert response.status_code == 201, response.text
+    count = _open_count(client, warehouse)
+    assert _submit(client, count, [_row(warehouse, "3")]).status_code == 200
+
+    result = _post(client, count)
+    assert (result["posted"], result["stale"]) == (0, 1)
+    assert _on_hand(client) == "10.000"
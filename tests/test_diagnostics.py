@@ -0,0 +1,34 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db import maintenance
+from app.db.maintenance import SQLiteMaintenance
+from app.db.session import engine
+from tests.conftest import API
+
+
+def test_reports_the_connection_profile(client: TestClient) -> None:
+    response = client.get(f"{API}/diagnostics/sqlite")
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["database"] == engine.url.database
+    assert body["pragmas"]["journal_mode"] == "wal"
+    assert body["pragmas"]["synchronous"] == 1
+    assert body["pragmas"]["cache_size"] == -settings.sqlite_cache_size_kib
+    assert body["pragmas"]["busy_timeout"] == 5000
+    assert body["checkpoint"] is None
+
+
+def test_reports_checkpoint_stats(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    job = SQLiteMaintenance(
+        engine, interval_seconds=60, truncate_bytes=1 << 30, optimize_interval_seconds=3600
+    )
+    monkeypatch.setattr(maintenance, "_maintenance", job)
+    job.checkpoint("TRUNCATE")
+
+    response = client.get(f"{API}/diagnostics/sqlite")
+    assert response.status_code == 200, response.text
+    checkpoint = response.json()["checkpoint"]
+    assert (checkpoint["checkpoints"], checkpoint["last_mode"]) == (1, "TRUNCATE")
+    assert checkpoint["running"] is False
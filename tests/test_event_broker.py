@@ -0,0 +1,40 @@
+import asyncio
+
+from app.events.broker import RESYNC, EventBroker, EventFilter
+
+
+def _resume(broker: EventBroker, after_seq: int) -> list:
+    async def drain() -> list:
+        subscription = broker.subscribe(EventFilter(), after_seq=after_seq)
+        await asyncio.sleep(0)
+        received = []
+        while not subscription.queue.empty():
+            change = subscription.queue.get_nowait()
+            received.append(change if change == RESYNC else change.seq)
+        subscription.close()
+        return received
+
+    return asyncio.run(drain())
+
+
+def test_resume_replays_newer_events() -> None:
+    broker = EventBroker(replay_size=10, queue_size=10)
+    for _ in range(3):
+        broker.publish("mission.created", {})
+    assert _resume(broker, 1) == [2, 3]
+    assert _resume(broker, 3) == []
+
+
+def test_resume_past_the_buffer_resyncs() -> None:
+    broker = EventBroker(replay_size=2, queue_size=10)
+    for _ in range(5):
+        broker.publish("mission.created", {})
+    assert _resume(broker, 1) == [RESYNC, 4, 5]
+
+
+def test_resume_from_before_a_restart_resyncs() -> None:
+    # A fresh broker restarts at 1; an id from the previous process is ahead of it.
+    broker = EventBroker(replay_size=10, queue_size=10)
+    assert _resume(broker, 42) == [RESYNC]
+    broker.publish("mission.created", {})
+    assert _resume(broker, 42) == [RESYNC]
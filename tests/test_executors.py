@@ -0,0 +1,22 @@
+from fastapi.testclient import TestClient
+
+from app.db.session import SessionLocal
+from app.repositories.executor import ExecutorRepository
+from app.rules.movement_rules import HUMAN_PAYLOAD_LIMIT_MILLI, executor_payload_limit
+from tests.conftest import API
+
+
+def test_payload_limit_is_held_in_milli_kg(client: TestClient) -> None:
+    vehicle = client.post(
+        f"{API}/vehicles", json={"code": "agv1", "name": "AGV", "max_payload_kg": "750.5"}
+    )
+    assert vehicle.status_code == 201, vehicle.text
+    assert vehicle.json()["max_payload_kg"] == "750.500"
+    human = client.post(
+        f"{API}/executors", json={"code": "ex1", "name": "Ex", "max_payload_kg": "800"}
+    ).json()
+
+    with SessionLocal() as db:
+        executors = ExecutorRepository(db)
+        assert executor_payload_limit(executors.get(vehicle.json()["id"])) == 750_500
+        assert executor_payload_limit(executors.get(human["id"])) == HUMAN_PAYLOAD_LIMIT_MILLI
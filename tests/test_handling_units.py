@@ -0,0 +1,32 @@
+from fastapi.testclient import TestClient
+
+from tests.conftest import API
+
+
+def _unit(client: TestClient, code: str, location_id: int) -> dict:
+    response = client.post(
+        f"{API}/handling-units", json={"hu_code": code, "location_id": location_id}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_pack_nests_a_unit_at_the_same_location(client: TestClient, warehouse: dict) -> None:
+    pallet = _unit(client, "PAL1", warehouse["locations"][0]["id"])
+    response = client.post(
+        f"{API}/handling-units/{warehouse['hu']['id']}/pack", json={"parent_hu_id": pallet["id"]}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["parent_hu_id"] == pallet["id"]
+    contents = client.get(f"{API}/handling-units/{pallet['id']}/contents").json()
+    assert [unit["id"] for unit in contents] == [warehouse["hu"]["id"]]
+
+
+def test_pack_rejects_a_parent_at_another_location(client: TestClient, warehouse: dict) -> None:
+    pallet = _unit(client, "PAL1", warehouse["locations"][1]["id"])
+    response = client.post(
+        f"{API}/handling-units/{warehouse['hu']['id']}/pack", json={"parent_hu_id": pallet["id"]}
+    )
+    assert response.status_code == 400
+    unit = client.get(f"{API}/handling-units/{warehouse['hu']['id']}").json()
+    assert (unit["parent_hu_id"], unit["location_id"]) == (None, warehouse["locations"][0]["id"])
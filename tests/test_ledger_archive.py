@@ -0,0 +1,113 @@
+import json
+from datetime import datetime
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.db.models.inventory import InventoryMovement
+from app.db.models.report import ReportWatermark
+from app.db.session import SessionLocal
+from app.services.report_service import MOVEMENTS_SOURCE
+from app.services.slotting_service import PICKS_SOURCE
+from tests.conftest import API
+
+
+def _adjust(client: TestClient, warehouse: dict, qty: str) -> None:
+    response = client.post(
+        f"{API}/inventory/adjustments",
+        json={
+            "hu_id": warehouse["hu"]["id"],
+            "item_id": warehouse["item"]["id"],
+            "qty_delta": qty,
+            "reason": "count",
+        },
+    )
+    assert response.status_code == 201, response.text
+
+
+def _backdate(when: datetime) -> None:
+    """Move every hot movement to ``when``, as if recorded long ago."""
+    with SessionLocal() as db:
+        db.execute(update(InventoryMovement).values(executed_at=when))
+        db.commit()
+
+
+def _read_up_to(movement_id: int, *, export: int | None = None) -> None:
+    """Mark the ledger read up to ``movement_id`` by every reader, the export up to ``export``."""
+    state = Path(settings.export_dir) / "movements"
+    state.mkdir(parents=True, exist_ok=True)
+    watermark = movement_id if export is None else export
+    (state / "_watermark.json").write_text(json.dumps({"watermark": watermark}))
+    with SessionLocal() as db:
+        for name in (MOVEMENTS_SOURCE, PICKS_SOURCE):
+            db.merge(ReportWatermark(name=name, value=movement_id))
+        db.commit()
+
+
+def _archive(client: TestClient) -> list[dict]:
+    response = client.post(f"{API}/movements/archive", json={"retain_months": 1})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _ids(client: TestClient, **params) -> list[int]:
+    return [movement["id"] for movement in client.get(f"{API}/movements", params=params).json()]
+
+
+def test_archived_rows_are_only_listed_on_request(client: TestClient, warehouse: dict) -> None:
+    _backdate(datetime(2020, 1, 15, 10))
+    _adjust(client, warehouse, "1")
+    _read_up_to(10**9)
+    [archive] = _archive(client)
+    assert (archive["period"], archive["row_count"]) == ("2020-01", 1)
+
+    assert len(_ids(client)) == 1
+    assert len(_ids(client, include_archived=True)) == 2
+
+
+def test_unread_movements_stay_hot(client: TestClient, warehouse: dict) -> None:
+    _adjust(client, warehouse, "1")
+    _backdate(datetime(2020, 1, 15, 10))
+    _adjust(client, warehouse, "1")
+    first, second, _ = _ids(client)
+
+    # Nothing has read the ledger yet, then the export lags behind the refreshes.
+    assert _archive(client) == []
+    _read_up_to(10**9, export=first)
+    [archive] = _archive(client)
+    assert archive["row_count"] == 1
+    assert second in _ids(client)
+
+    # The newest movement never leaves, so its id is not handed out again.
+    _backdate(datetime(2020, 1, 15, 10))
+    _read_up_to(10**9)
+    [archive] = _archive(client)
+    assert archive["row_count"] == 2
+    assert len(_ids(client)) == 1
+
+
+def test_back_dated_movements_merge_into_the_archived_month(
+    client: TestClient, warehouse: dict
+) -> None:
+    _backdate(datetime(2020, 1, 15, 10))
+    _adjust(client, warehouse, "1")
+    _read_up_to(10**9)
+    [first] = _archive(client)
+
+    _adjust(client, warehouse, "2")
+    _backdate(datetime(2020, 1, 20, 10))
+    _adjust(client, warehouse, "1")
+    [merged] = _archive(client)
+    assert merged["period"] == "2020-01"
+    assert merged["row_count"] == 3
+    assert merged["id"] == first["id"]
+    assert merged["first_movement_id"] == first["first_movement_id"]
+    # The superseded file is removed once the merge commits.
+    assert len(list(Path(settings.ledger_archive_dir).glob("movements-2020-01*.npz"))) == 1
+
+    listed = _ids(client, include_archived=True)
+    assert len(listed) == 4
+    assert listed == sorted(listed)
+    assert _archive(client) == []
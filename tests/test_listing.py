@@ -0,0 +1,44 @@
+from fastapi.testclient import TestClient
+
+from tests.conftest import API
+
+
+def _walk(client: TestClient, **params) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        query = {**params, "cursor": cursor} if cursor else params
+        response = client.get(f"{API}/executors", params=query)
+        assert response.status_code == 200, response.text
+        pages.append([executor["code"] for executor in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+
+
+def test_keyset_pages_follow_the_sort(client: TestClient) -> None:
+    codes = ["c", "a", "e", "b", "d"]
+    for code in codes:
+        response = client.post(f"{API}/executors", json={"code": code, "name": code.upper()})
+        assert response.status_code == 201, response.text
+
+    assert _walk(client, limit=2) == [["c", "a"], ["e", "b"], ["d"]]
+    assert _walk(client, limit=2, sort="-code") == [["e", "d"], ["c", "b"], ["a"]]
+    assert _walk(client, limit=5, sort="code") == [sorted(codes)]
+
+    response = client.get(f"{API}/executors", params={"fields": "code", "count": True, "limit": 1})
+    assert response.json() == [{"code": "c"}]
+    assert response.headers["X-Total-Count"] == "5"
+
+
+def test_invalid_cursors_are_rejected(client: TestClient) -> None:
+    for code in ("a", "b"):
+        client.post(f"{API}/executors", json={"code": code, "name": code})
+    cursor = client.get(f"{API}/executors", params={"limit": 1}).headers["X-Next-Cursor"]
+
+    mismatched = client.get(f"{API}/executors", params={"cursor": cursor, "sort": "code"})
+    assert mismatched.status_code == 400
+    assert mismatched.json()["detail"] == "Cursor does not match the requested sort"
+    garbage = client.get(f"{API}/executors", params={"cursor": "not-a-cursor"})
+    assert garbage.status_code == 400
+    unknown_sort = client.get(f"{API}/executors", params={"sort": "created_at"})
+    assert unknown_sort.status_code == 400
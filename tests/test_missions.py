@@ -0,0 +1,171 @@
+from fastapi.testclient import TestClient
+
+from app.db.session import SessionLocal
+from app.repositories.mission import MissionRepository
+from tests.conftest import API, create_mission
+
+
+def test_auto_assign(client: TestClient, warehouse: dict) -> None:
+    mission = create_mission(client, warehouse, "M1")
+    response = client.post(f"{API}/missions/auto-assign", json={})
+    assert response.status_code == 200, response.text
+    [assignment] = response.json()["assignments"]
+    assert assignment["mission_id"] == mission["id"]
+    assert assignment["executor_id"] == warehouse["executor"]["id"]
+    assert client.get(f"{API}/missions/{mission['id']}").json()["state"] == "assigned"
+
+
+def test_assign_many_rejects_missions_assigned_meanwhile(
+    client: TestClient, warehouse: dict
+) -> None:
+    mission = create_mission(client, warehouse, "M1")
+    other = client.post(f"{API}/executors", json={"code": "ex2", "name": "Other"}).json()
+    response = client.post(
+        f"{API}/missions/{mission['id']}/assign", json={"executor_id": other["id"]}
+    )
+    assert response.status_code == 200, response.text
+
+    with SessionLocal() as db:
+        assert not MissionRepository(db).assign_many([(mission["id"], warehouse["executor"]["id"])])
+        db.rollback()
+    assigned = client.get(f"{API}/missions/{mission['id']}").json()
+    assert assigned["assigned_executor_id"] == other["id"]
+
+
+def test_assign_many_never_double_books_an_executor(client: TestClient, warehouse: dict) -> None:
+    first = create_mission(client, warehouse, "M1")
+    second = create_mission(client, warehouse, "M2")
+    executor_id = warehouse["executor"]["id"]
+    response = client.post(
+        f"{API}/missions/{first['id']}/assign", json={"executor_id": executor_id}
+    )
+    assert response.status_code == 200, response.text
+
+    with SessionLocal() as db:
+        assert not MissionRepository(db).assign_many([(second["id"], executor_id)])
+        db.rollback()
+    assert client.get(f"{API}/missions/{second['id']}").json()["state"] == "draft"
+
+
+def test_sequencing_keeps_insertion_order_unless_shorter(
+    client: TestClient, warehouse: dict
+) -> None:
+    locations, item = warehouse["locations"], warehouse["item"]
+    lines = []
+    for index, location in enumerate(locations[1:], start=2):
+        hu = client.post(
+            f"{API}/handling-units", json={"hu_code": f"HU{index}", "location_id": location["id"]}
+        ).json()
+        response = client.post(
+            f"{API}/inventory/adjustments",
+            json={"hu_id": hu["id"], "item_id": item["id"], "qty_delta": "1", "reason": "initial"},
+        )
+        assert response.status_code == 201, response.text
+        lines.append(
+            {
+                "from_location_id": location["id"],
+                "to_location_id": locations[0]["id"],
+                "item_id": item["id"],
+                "qty": "1",
+            }
+        )
+
+    def create(number: str, order: list[dict]) -> dict:
+        response = client.post(
+            f"{API}/missions",
+            json={
+                "mission_no": number,
+                "type": "move_item",
+                "created_by_operator_id": warehouse["operator"]["id"],
+                "lines": order,
+            },
+        )
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    # L1, L2, L3 is already a shortest path: nothing to save, order kept.
+    in_order = create("M1", lines)
+    assert [line["from_location_id"] for line in in_order["lines"]] == [
+        location["id"] for location in locations[1:]
+    ]
+    assert in_order["route_distance"] == 2.0
+    assert in_order["route_distance_saved"] == 0.0
+
+    shuffled = create("M2", [lines[1], lines[0], lines[2]])
+    assert shuffled["route_distance"] == 2.0
+    assert shuffled["route_distance_saved"] == 1.0
+
+
+def test_unweighed_items_count_a_kilogram_per_unit(client: TestClient, warehouse: dict) -> None:
+    response = client.post(
+        f"{API}/inventory/adjustments",
+        json={
+            "hu_id": warehouse["hu"]["id"],
+            "item_id": warehouse["item"]["id"],
+            "qty_delta": "590",
+            "reason": "receipt",
+        },
+    )
+    assert response.status_code == 201, response.text
+    mission = create_mission(client, warehouse, "M1", "600")
+    [line] = mission["lines"]
+    assert line["payload_kg"] is None
+
+    # 600 units are over the human cap of 500 kg, so nobody is assigned.
+    response = client.post(f"{API}/missions/auto-assign", json={})
+    assert response.status_code == 200, response.text
+    assert response.json()["assignments"] == []
+
+    executor_id = warehouse["executor"]["id"]
+    path = f"{API}/missions/{mission['id']}"
+    assert client.post(f"{path}/assign", json={"executor_id": executor_id}).status_code == 200
+    assert client.post(f"{path}/start", json={"executor_id": executor_id}).status_code == 200
+    response = client.post(
+        f"{path}/record-movement",
+        json={
+            "mission_line_id": line["id"],
+            "qty": line["qty"],
+            "executor_id": executor_id,
+            "from_hu_id": warehouse["hu"]["id"],
+        },
+    )
+    assert response.status_code == 400
+    assert "500kg" in response.json()["detail"]
+
+
+def test_payload_limits_use_item_and_unit_weights(client: TestClient, warehouse: dict) -> None:
+    response = client.patch(f"{API}/materials/{warehouse['item']['id']}", json={"weight_kg": "2"})
+    assert response.status_code == 200, response.text
+    mission = create_mission(client, warehouse, "M1", "5")
+    assert mission["lines"][0]["payload_kg"] == "10.000"
+
+    executor = warehouse["executor"]
+    response = client.patch(f"{API}/executors/{executor['id']}", json={"max_payload_kg": "8"})
+    assert response.status_code == 200, response.text
+    assert client.post(f"{API}/missions/auto-assign", json={}).json()["assignments"] == []
+
+    response = client.patch(f"{API}/executors/{executor['id']}", json={"max_payload_kg": "10"})
+    assert response.status_code == 200, response.text
+    [assignment] = client.post(f"{API}/missions/auto-assign", json={}).json()["assignments"]
+    assert assignment["mission_id"] == mission["id"]
+
+    locations = warehouse["locations"]
+    response = client.post(
+        f"{API}/missions",
+        json={
+            "mission_no": "M2",
+            "type": "move_hu",
+            "created_by_operator_id": warehouse["operator"]["id"],
+            "lines": [
+                {
+                    "from_location_id": locations[0]["id"],
+                    "to_location_id": locations[2]["id"],
+                    "hu_id": warehouse["hu"]["id"],
+                    "qty": "1",
+                }
+            ],
+        },
+    )
+    assert response.status_code == 201, response.text
+    # A unit move carries the unit's gross weight: ten items of 2 kg.
+    assert response.json()["lines"][0]["payload_kg"] == "20.000"
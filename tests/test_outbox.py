@@ -0,0 +1,97 @@
+import json
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.models.outbox import OutboxMessage
+from app.db.models.report import ReportWatermark
+from app.db.session import SessionLocal
+from app.outbox import OutboxDispatcher, OutboxSink, build_sink
+from app.services.report_service import MISSION_EVENTS_SOURCE
+from app.services.retention import outbox_read_marks
+from app.services.slotting_service import COMPLETIONS_SOURCE
+from tests.conftest import create_mission
+
+
+class _ListSink:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    def send(self, messages: list[dict]) -> None:
+        self.messages.extend(messages)
+
+
+def _remaining() -> list[tuple[str, int]]:
+    with SessionLocal() as db:
+        statement = select(OutboxMessage.aggregate_type, OutboxMessage.id)
+        return [tuple(row) for row in db.execute(statement.order_by(OutboxMessage.id))]
+
+
+def _dispatcher(export_dir: Path, sink: OutboxSink | None) -> OutboxDispatcher:
+    return OutboxDispatcher(
+        SessionLocal,
+        sink,
+        batch_size=100,
+        poll_seconds=1.0,
+        retention=timedelta(0),
+        keep_after=partial(outbox_read_marks, export_dir=export_dir),
+    )
+
+
+def _export_mark(export_dir: Path, value: int) -> None:
+    state = export_dir / "mission_events"
+    state.mkdir(exist_ok=True)
+    (state / "_watermark.json").write_text(json.dumps({"watermark": value}))
+
+
+def _fold_mark(name: str, value: int) -> None:
+    with SessionLocal() as db:
+        db.merge(ReportWatermark(name=name, value=value))
+        db.commit()
+
+
+def _mission_rows() -> list[tuple[str, int]]:
+    return [row for row in _remaining() if row[0] == "mission"]
+
+
+def test_purge_keeps_mission_events_until_every_reader_has_them(
+    client: TestClient, warehouse: dict, tmp_path: Path
+) -> None:
+    create_mission(client, warehouse, "M1")
+    dispatcher = _dispatcher(tmp_path, _ListSink())
+    assert dispatcher.dispatch_once() > 0
+    missions = _mission_rows()
+    assert missions
+
+    # Never exported or folded: every mission row stays, the rest goes.
+    dispatcher.purge()
+    assert _remaining() == missions
+
+    last = missions[-1][1]
+    _export_mark(tmp_path, last)
+    _fold_mark(MISSION_EVENTS_SOURCE, last)
+    dispatcher.purge()
+    assert _remaining() == missions
+
+    _fold_mark(COMPLETIONS_SOURCE, last)
+    dispatcher.purge()
+    assert _remaining() == []
+
+
+def test_without_a_sink_old_rows_are_purged_undelivered(
+    client: TestClient, warehouse: dict, tmp_path: Path
+) -> None:
+    # The default configuration: nothing dispatches, the purge still bounds the table.
+    assert build_sink(settings.outbox_sink, settings.outbox_sink_target) is None
+    create_mission(client, warehouse, "M1")
+    missions = _mission_rows()
+    assert len(_remaining()) > len(missions)
+
+    dispatcher = _dispatcher(tmp_path, None)
+    assert dispatcher.dispatch_once() == 0
+    assert dispatcher.purge() > 0
+    assert _remaining() == missions
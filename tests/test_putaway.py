@@ -0,0 +1,59 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.planning import occupancy
+from app.services import putaway_service
+from tests.conftest import API
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Process-wide caches would otherwise carry over from the previous database.
+    monkeypatch.setattr(occupancy, "_occupancy_index", None)
+    monkeypatch.setattr(putaway_service, "_class_cache", (0.0, {}))
+    monkeypatch.setattr(putaway_service, "_proximity_cache", {})
+
+
+def _suggest(client: TestClient, hu_id: int, **params) -> list[dict]:
+    response = client.post(f"{API}/putaway/suggest", json={"hu_id": hu_id, **params})
+    assert response.status_code == 200, response.text
+    return response.json()["candidates"]
+
+
+def test_slow_movers_go_to_the_nearest_free_bulk_location(
+    client: TestClient, warehouse: dict
+) -> None:
+    locations = warehouse["locations"]
+    pick = client.post(
+        f"{API}/locations", json={"code": "P1", "name": "P1", "type": "pick", "x": 1.5, "y": 0}
+    ).json()
+    response = client.post(
+        f"{API}/handling-units", json={"hu_code": "HU2", "location_id": locations[1]["id"]}
+    )
+    assert response.status_code == 201, response.text
+
+    candidates = _suggest(client, warehouse["hu"]["id"])
+    # L0 is where the unit is and L1 is full; the PICK slot is kept for fast movers.
+    assert [candidate["location_id"] for candidate in candidates] == [
+        locations[2]["id"],
+        locations[3]["id"],
+        pick["id"],
+    ]
+    assert [candidate["travel_distance"] for candidate in candidates] == [2.0, 3.0, 1.5]
+
+    [only] = _suggest(client, warehouse["hu"]["id"], location_types=["pick"])
+    assert only["location_id"] == pick["id"]
+
+
+def test_nested_units_are_not_put_away(client: TestClient, warehouse: dict) -> None:
+    response = client.post(
+        f"{API}/handling-units",
+        json={
+            "hu_code": "HU2",
+            "location_id": warehouse["locations"][0]["id"],
+            "parent_hu_id": warehouse["hu"]["id"],
+        },
+    )
+    assert response.status_code == 201, response.text
+    response = client.post(f"{API}/putaway/suggest", json={"hu_id": response.json()["id"]})
+    assert response.status_code == 400
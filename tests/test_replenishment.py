@@ -0,0 +1,64 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.db.session import SessionLocal
+from app.planning import availability, replenishment
+from app.rules.exceptions import RuleViolation
+from app.services.replenishment_service import ReplenishmentService, run_replenishment
+from tests.conftest import API
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registries(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Process-wide registries would otherwise carry over from the previous database.
+    monkeypatch.setattr(replenishment, "_replenishment_triggers", None)
+    monkeypatch.setattr(availability, "_availability_index", None)
+
+
+@pytest.fixture
+def rule(client: TestClient, warehouse: dict) -> dict:
+    """Keep 2 to 5 of the item at an empty PICK location."""
+    pick = client.post(
+        f"{API}/locations", json={"code": "P1", "name": "P1", "type": "pick", "x": 5, "y": 0}
+    ).json()
+    response = client.post(
+        f"{API}/replenishment/rules",
+        json={
+            "item_id": warehouse["item"]["id"],
+            "location_id": pick["id"],
+            "min_qty": "2",
+            "max_qty": "5",
+            "created_by_operator_id": warehouse["operator"]["id"],
+        },
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_a_triggered_rule_gets_one_open_mission(client: TestClient, rule: dict) -> None:
+    assert len(run_replenishment(SessionLocal).missions) == 1
+    [stored] = client.get(f"{API}/replenishment/rules").json()
+    [line] = client.get(f"{API}/missions/{stored['open_mission_id']}").json()["lines"]
+    assert (line["to_location_id"], line["qty"]) == (rule["location_id"], "5.000")
+
+    # Triggered again while the mission is open: nothing new.
+    replenishment.get_replenishment_triggers().mark([rule["id"]])
+    assert run_replenishment(SessionLocal).missions == []
+
+
+def test_concurrent_evaluations_claim_the_rule_once(client: TestClient, rule: dict) -> None:
+    with SessionLocal() as first, SessionLocal() as second:
+        services = [ReplenishmentService(db) for db in (first, second)]
+        services[0].sync_triggers()
+        [(first_rule, stock)] = services[0].due(services[0].rules.list())
+        [(second_rule, _)] = services[1].due(services[1].rules.list())
+
+        assert len(services[0].replenish(first_rule, stock).missions) == 1
+        first.commit()
+        with pytest.raises(RuleViolation) as raised:
+            services[1].replenish(second_rule, stock)
+        assert raised.value.status_code == 409
+        second.rollback()
+
+    missions = client.get(f"{API}/missions").json()
+    assert [mission["mission_no"][:4] for mission in missions].count("REPL") == 1
@@ -0,0 +1,60 @@
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from tests.conftest import API, complete_mission, create_mission
+
+
+def _seed(client: TestClient, warehouse: dict) -> None:
+    to_hu = client.post(
+        f"{API}/handling-units",
+        json={"hu_code": "HU2", "location_id": warehouse["locations"][1]["id"]},
+    ).json()
+    complete_mission(client, warehouse, create_mission(client, warehouse, "M1", "2"), to_hu)
+    cancelled = create_mission(client, warehouse, "M2", "1")
+    assert (
+        client.post(f"{API}/missions/{cancelled['id']}/cancel", json={"reason": "x"}).status_code
+        == 200
+    )
+    response = client.post(f"{API}/reports/refresh")
+    assert response.status_code == 200, response.text
+
+
+def test_refresh_folds_everything(client: TestClient, warehouse: dict) -> None:
+    _seed(client, warehouse)
+    status = client.get(f"{API}/reports/status").json()
+    assert status["movements_watermark"] == status["latest_movement_id"] > 0
+    assert status["mission_events_watermark"] == status["latest_mission_event_id"] > 0
+
+
+def test_mission_report_default_query(client: TestClient, warehouse: dict) -> None:
+    _seed(client, warehouse)
+    response = client.get(f"{API}/reports/missions")
+    assert response.status_code == 200, response.text
+    [row] = response.json()
+    assert row["executor_id"] is None
+    assert (row["completed_count"], row["cancelled_count"]) == (1, 1)
+
+
+def test_mission_report_by_executor(client: TestClient, warehouse: dict) -> None:
+    _seed(client, warehouse)
+    response = client.get(
+        f"{API}/reports/missions", params={"granularity": "day", "by_executor": True}
+    )
+    assert response.status_code == 200, response.text
+    rows = {row["executor_id"]: row for row in response.json()}
+    assert rows[warehouse["executor"]["id"]]["completed_count"] == 1
+    assert rows[None]["cancelled_count"] == 1
+
+
+def test_movement_report_groups(client: TestClient, warehouse: dict) -> None:
+    _seed(client, warehouse)
+    response = client.get(f"{API}/reports/movements")
+    assert response.status_code == 200, response.text
+    [total] = response.json()
+    assert total["movement_count"] == 2
+
+    response = client.get(f"{API}/reports/movements", params={"group_by": "movement_type"})
+    by_type = {row["movement_type"]: row for row in response.json()}
+    assert set(by_type) == {"adjustment", "move"}
+    assert Decimal(by_type["move"]["qty"]) == 2
@@ -0,0 +1,48 @@
+from fastapi.testclient import TestClient
+
+from tests.conftest import API
+
+
+def _hits(client: TestClient, q: str, **params) -> list[tuple[str, str]]:
+    response = client.get(f"{API}/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return [(hit["kind"], hit["code"]) for hit in response.json()["hits"]]
+
+
+def test_partial_codes_match_anywhere(client: TestClient, warehouse: dict) -> None:
+    client.post(f"{API}/materials", json={"sku": "BOLT-4711-ZN", "name": "Hex bolt"})
+    client.post(
+        f"{API}/handling-units",
+        json={"hu_code": "PAL-4711", "location_id": warehouse["locations"][0]["id"]},
+    )
+
+    assert sorted(_hits(client, "4711")) == [
+        ("handling_unit", "PAL-4711"),
+        ("item", "BOLT-4711-ZN"),
+    ]
+    assert _hits(client, "4711", kind="item") == [("item", "BOLT-4711-ZN")]
+    assert _hits(client, "bolt zn") == [("item", "BOLT-4711-ZN")]
+    assert _hits(client, "hex") == [("item", "BOLT-4711-ZN")]
+    assert _hits(client, "9999") == []
+
+    response = client.get(f"{API}/search", params={"q": "47"})
+    assert response.status_code == 422
+
+
+def test_updates_keep_the_index_in_sync(client: TestClient, warehouse: dict) -> None:
+    location = warehouse["locations"][2]
+    assert _hits(client, "mezzanine") == []
+
+    response = client.patch(f"{API}/locations/{location['id']}", json={"name": "Mezzanine"})
+    assert response.status_code == 200, response.text
+    assert _hits(client, "mezzanine") == [("location", "L2")]
+
+    response = client.patch(f"{API}/locations/{location['id']}", json={"name": "Ground"})
+    assert response.status_code == 200, response.text
+    assert _hits(client, "mezzanine") == []
+    # Counter updates leave the index alone but the row stays findable.
+    response = client.post(
+        f"{API}/handling-units", json={"hu_code": "HU2", "location_id": location["id"]}
+    )
+    assert response.status_code == 201, response.text
+    assert _hits(client, "ground") == [("location", "L2")]
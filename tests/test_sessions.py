@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from starlette.requests import Request
+
+from app.db.models.operator import Operator
+from app.db.session import ReadSessionLocal, SessionLocal, engine, get_db, read_engine
+
+
+def _session_for(method: str):
+    dependency = get_db(Request({"type": "http", "method": method, "headers": []}))
+    return dependency, next(dependency)
+
+
+def test_safe_methods_get_the_read_engine() -> None:
+    assert read_engine is not engine
+    for method, expected in (("GET", read_engine), ("HEAD", read_engine), ("POST", engine)):
+        dependency, db = _session_for(method)
+        assert db.get_bind() is expected
+        dependency.close()
+
+
+def test_read_sessions_reject_writes() -> None:
+    with ReadSessionLocal() as db:
+        db.add(Operator(code="op1", name="Operator"))
+        with pytest.raises(OperationalError, match="readonly"):
+            db.flush()
+    with SessionLocal() as db:
+        assert db.scalars(select(Operator)).all() == []
@@ -0,0 +1,56 @@
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.planning.slotting import abc_classes
+from tests.conftest import API, complete_mission, create_mission
+
+
+def _location(client: TestClient, code: str, location_type: str, x: float) -> dict:
+    response = client.post(
+        f"{API}/locations", json={"code": code, "name": code, "type": location_type, "x": x, "y": 0}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_abc_classes_follow_the_cumulative_pick_share() -> None:
+    classes = abc_classes(np.array([5, 50, 0, 15, 30]), a_share=0.8, b_share=0.95)
+    # Shares before each item, fastest first: 0, .5, .8, .95 - the item crossing
+    # a threshold stays in the faster class; items without picks are C.
+    assert classes.tolist() == ["C", "A", "C", "B", "A"]
+
+
+def test_fast_movers_are_suggested_the_pick_slot_nearest_the_dock(
+    client: TestClient, warehouse: dict
+) -> None:
+    _location(client, "DOCK", "dock", 10)
+    near = _location(client, "P1", "pick", 9)
+    _location(client, "P2", "pick", 20)
+    to_hu = client.post(
+        f"{API}/handling-units",
+        json={"hu_code": "HU2", "location_id": warehouse["locations"][1]["id"]},
+    ).json()
+    complete_mission(client, warehouse, create_mission(client, warehouse, "M1", "2"), to_hu)
+    response = client.post(f"{API}/slotting/refresh")
+    assert response.status_code == 200, response.text
+    assert response.json()["picks"] == 1
+
+    [velocity] = client.get(f"{API}/slotting/velocity").json()
+    assert (velocity["item_id"], velocity["abc_class"]) == (warehouse["item"]["id"], "A")
+
+    response = client.get(f"{API}/slotting/suggestions")
+    assert response.status_code == 200, response.text
+    [suggestion] = response.json()
+    assert suggestion["hu_id"] == warehouse["hu"]["id"]
+    assert suggestion["from_location_id"] == warehouse["locations"][0]["id"]
+    assert suggestion["to_location_id"] == near["id"]
+    assert suggestion["target_distance"] == 1.0
+
+    response = client.post(
+        f"{API}/slotting/missions",
+        json={"created_by_operator_id": warehouse["operator"]["id"]},
+    )
+    assert response.status_code == 201, response.text
+    [mission] = response.json()
+    [line] = mission["lines"]
+    assert (line["hu_id"], line["to_location_id"]) == (warehouse["hu"]["id"], near["id"])
@@ -0,0 +1,42 @@
+from fastapi.testclient import TestClient
+
+from tests.conftest import API
+
+
+def _sync(client: TestClient, since: int, limit: int = 5000) -> dict:
+    response = client.get(f"{API}/sync", params={"since": since, "limit": limit})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_pages_cover_every_change_once(client: TestClient, warehouse: dict) -> None:
+    full = _sync(client, 0)
+    assert not full["has_more"]
+
+    seen: list[int] = []
+    since = 0
+    while True:
+        page = _sync(client, since, limit=2)
+        assert page["watermark"] > since
+        assert len(page["locations"]) <= 2
+        seen += [location["id"] for location in page["locations"]]
+        since = page["watermark"]
+        if not page["has_more"]:
+            break
+    assert since == full["watermark"]
+    assert sorted(seen) == [location["id"] for location in warehouse["locations"]]
+
+    location = warehouse["locations"][2]
+    assert client.patch(f"{API}/locations/{location['id']}", json={"zone": "B"}).status_code == 200
+    delta = _sync(client, since)
+    assert [row["id"] for row in delta["locations"]] == [location["id"]]
+    assert delta["materials"] == []
+    assert _sync(client, delta["watermark"])["locations"] == []
+
+
+def test_since_ahead_of_the_server_resets(client: TestClient, warehouse: dict) -> None:
+    current = _sync(client, 0)["watermark"]
+    page = _sync(client, current + 100)
+    assert page["reset"]
+    assert page["since"] == 0
+    assert len(page["locations"]) == len(warehouse["locations"])
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.db.session import SessionLocal
+from app.planning.travel_matrix import LocationGeometry, TravelMatrix, get_travel_matrix
+from app.services import travel_service
+from app.services.travel_service import TravelRefreshJob
+from tests.conftest import API
+
+
+def _geometry(xs: list[float]) -> LocationGeometry:
+    return LocationGeometry.from_rows(
+        [(index + 1, x, 0.0, 0.0, "pick", True) for index, x in enumerate(xs)]
+    )
+
+
+def test_refresh_publishes_a_new_generation(tmp_path: Path) -> None:
+    matrix = TravelMatrix(tmp_path)
+    matrix.rebuild(_geometry([0, 1, 2]))
+    published = (tmp_path / "travel_matrix.1.f32").read_bytes()
+
+    assert matrix.refresh(_geometry([0, 5, 2])) == 1
+    assert matrix.generation == 2
+    assert matrix.distance(1, 2) == 5.0
+    # The generation other workers may still map is left as it was.
+    assert (tmp_path / "travel_matrix.1.f32").read_bytes() == published
+
+
+def test_workers_publish_one_generation_after_another(tmp_path: Path) -> None:
+    first, second = TravelMatrix(tmp_path), TravelMatrix(tmp_path)
+    first.rebuild(_geometry([0, 1]))
+    second.load()
+    first.refresh(_geometry([0, 3]))
+
+    # ``second`` still maps generation 1 and must not reuse generation 2.
+    second.refresh(_geometry([0, 4, 9]))
+    assert second.generation == 3
+    first.load()
+    assert first.generation == 3
+    assert np.array_equal(first.distances, second.distances)
+    assert sorted(path.name for path in tmp_path.glob("*.f32")) == [
+        "travel_matrix.2.f32",
+        "travel_matrix.3.f32",
+    ]
+
+
+def test_location_edits_are_refreshed_together(
+    client: TestClient, warehouse: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    job = TravelRefreshJob(SessionLocal, interval_seconds=60)
+    monkeypatch.setattr(travel_service, "_job", job)
+    generation = get_travel_matrix().generation
+    first, second = warehouse["locations"][:2]
+    for location, x in ((first, 7.0), (second, 9.0)):
+        response = client.patch(f"{API}/locations/{location['id']}", json={"x": x})
+        assert response.status_code == 200, response.text
+    assert get_travel_matrix().generation == generation
+
+    assert job.run_once() == 2
+    matrix = get_travel_matrix()
+    assert matrix.generation == generation + 1
+    assert matrix.distance(first["id"], second["id"]) == 2.0
+    assert job.run_once() is None
+
+
+def test_patch_clears_optional_fields(client: TestClient, warehouse: dict) -> None:
+    location = warehouse["locations"][1]
+    url = f"{API}/locations/{location['id']}"
+    assert client.patch(url, json={"max_hu": 2, "zone": "A"}).status_code == 200
+
+    response = client.patch(url, json={"max_hu": None, "x": None})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["max_hu"], body["x"], body["zone"]) == (None, None, "A")
+    assert get_travel_matrix().index_of(np.array([location["id"]]))[0] == -1
+
+    assert client.patch(url, json={"name": None}).status_code == 400
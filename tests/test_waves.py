@@ -0,0 +1,51 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.db.models.outbox import OutboxMessage
+from app.db.session import SessionLocal
+from app.rules.exceptions import RuleViolation
+from app.services.wave_service import WaveService
+from tests.conftest import API, create_mission
+
+
+def test_release_consolidates_drafts(client: TestClient, warehouse: dict) -> None:
+    drafts = [create_mission(client, warehouse, f"M{i}") for i in range(2)]
+    response = client.post(
+        f"{API}/waves/release",
+        json={"created_by_operator_id": warehouse["operator"]["id"], "capacity_kg": "100"},
+    )
+    assert response.status_code == 201, response.text
+    assert response.json()["consolidated_mission_ids"] == [draft["id"] for draft in drafts]
+    for draft in drafts:
+        assert client.get(f"{API}/missions/{draft['id']}").json()["state"] == "cancelled"
+
+    with SessionLocal() as db:
+        messages = db.scalars(select(OutboxMessage).order_by(OutboxMessage.id)).all()
+    [created] = [message.payload for message in messages if message.topic == "mission.created"][2:]
+    assert created["mission_id"] == response.json()["waves"][0]["mission_id"]
+    assert sorted(created["line_ids"]) == sorted(draft["lines"][0]["id"] for draft in drafts)
+
+
+def test_release_aborts_when_a_mission_was_assigned_after_planning(
+    client: TestClient, warehouse: dict
+) -> None:
+    drafts = [create_mission(client, warehouse, f"M{i}") for i in range(2)]
+    with SessionLocal() as db:
+        service = WaveService(db)
+        waves, consolidated = service.plan(capacity_kg=100.0)
+        response = client.post(
+            f"{API}/missions/{drafts[0]['id']}/assign",
+            json={"executor_id": warehouse["executor"]["id"]},
+        )
+        assert response.status_code == 200, response.text
+
+        with pytest.raises(RuleViolation) as raised:
+            service.release(waves, consolidated, created_by_operator_id=warehouse["operator"]["id"])
+        assert raised.value.status_code == 409
+        db.rollback()
+
+    mission = client.get(f"{API}/missions/{drafts[0]['id']}").json()
+    assert mission["state"] == "assigned"
+    assert [line["id"] for line in mission["lines"]] == [drafts[0]["lines"][0]["id"]]
+    assert client.get(f"{API}/missions/{drafts[1]['id']}").json()["state"] == "draft"
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models.operator import Operator
+from app.db.session import SessionLocal
+from app.db.write_queue import WriteQueue
+
+
+def _add_operator(code: str, *, fail: bool = False):
+    def work(db: Session) -> int:
+        operator = Operator(code=code, name=code)
+        db.add(operator)
+        db.flush()
+        if fail:
+            raise ValueError(f"{code} rejected")
+        return operator.id
+
+    return work
+
+
+def test_a_failing_job_only_undoes_itself() -> None:
+    writer = WriteQueue(SessionLocal)
+    writer.start()
+    try:
+        started, release = threading.Event(), threading.Event()
+
+        def blocker(db: Session) -> None:
+            started.set()
+            release.wait(5)
+
+        first = writer.submit(blocker)
+        assert started.wait(5)
+        # Queued behind the blocker, these three commit as one group.
+        kept = writer.submit(_add_operator("A"))
+        failed = writer.submit(_add_operator("B", fail=True))
+        after = writer.submit(_add_operator("C"))
+        release.set()
+
+        first.result(5)
+        assert isinstance(kept.result(5), int)
+        with pytest.raises(ValueError, match="B rejected"):
+            failed.result(5)
+        assert isinstance(after.result(5), int)
+    finally:
+        writer.stop()
+
+    assert writer.stats.groups_committed == 2
+    assert writer.stats.largest_group == 3
+    assert (writer.stats.jobs_committed, writer.stats.jobs_failed) == (3, 1)
+    with SessionLocal() as db:
+        assert db.scalars(select(Operator.code).order_by(Operator.code)).all() == ["A", "C"]
+
+
+def test_submit_requires_a_running_queue() -> None:
+    with pytest.raises(RuntimeError):
+        WriteQueue(SessionLocal).submit(_add_operator("A"))